@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Thumbnail pipeline benchmark. Times every stage from G-code file to display
+# commands for the files in bench/corpus, and compares the encoded thumbnails
+# against bench/golden to catch encoder regressions. The golden files match
+# the output of the original ColPic encoder byte for byte, only --update them
+# after checking a new encoder against that.
+#
+#   python bench/bench.py [--baud 115200] [--repeat 5] [--check | --update]
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from PIL import Image
+import lcd
+import lib_col_pic
+import thumbnail
+
+CORPUS_DIR = os.path.join(BENCH_DIR, 'corpus')
+GOLDEN_DIR = os.path.join(BENCH_DIR, 'golden')
+
+
+class CountingPort:
+    # Stands in for the serial port, counts what would have been sent
+    def __init__(self, baudrate):
+        self.baudrate = baudrate
+        self.written = 0
+
+    def write(self, data):
+        self.written += len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def measure(func, repeat):
+    # Best time in seconds over repeat runs, peak traced memory in bytes and
+    # the result of the last run
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def extract(file):
+    # What show_thumbnail does to get image data out of a G-code file
+    img = thumbnail.read_gcode_thumbnail(file)
+    if img is None:
+        img = thumbnail.render_toolpath(file)
+    return img
+
+
+def encode_str(color16):
+    out = bytearray(thumbnail.ENCODE_BUFFER_SIZE)
+    lib_col_pic.ColPic_EncodeStr(color16, thumbnail.THUMBNAIL_WIDTH, thumbnail.THUMBNAIL_HEIGHT, out,
+                                 thumbnail.ENCODE_BUFFER_SIZE, 1024)
+    return out
+
+
+def write(display, chunks):
+    display.ser.written = 0
+    display.thumbnail_key = None
+    display.thumbnail_delay = 0
+    display.thumbnail_chunk_size = thumbnail.CHUNK_SIZE
+    with contextlib.redirect_stdout(io.StringIO()):
+        display.write_thumbnail_chunks(chunks)
+    return display.ser.written
+
+
+def bench_file(file, display, args):
+    img = extract(file)
+    stages = [
+        ('extract', lambda: extract(file)),
+        ('color16', lambda: thumbnail.image_to_color16(Image.open(io.BytesIO(img)))),
+        ('encode_str', lambda: encode_str(color16)),
+        ('encode', lambda: list(thumbnail.encode_thumbnail(img))),
+        ('write', lambda: write(display, chunks)),
+    ]
+    results = []
+    for name, func in stages:
+        elapsed, peak, result = measure(func, args.repeat)
+        if name == 'color16':
+            color16 = result
+        elif name == 'encode':
+            chunks = result
+        elif name == 'write':
+            wire = result
+        results.append((name, elapsed, peak))
+    return results, chunks, wire
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--baud', type=int, default=lcd.BAUD_DEFAULT, help='baud rate for the transfer estimate')
+    parser.add_argument('--delay', type=float, default=lcd.THUMBNAIL_MIN_DELAY,
+                        help='seconds the display is given after each piece')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per stage, the fastest one counts')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--check', action='store_true', help='fail if an encoded thumbnail differs from its golden file')
+    group.add_argument('--update', action='store_true', help='rewrite the golden files')
+    args = parser.parse_args()
+
+    display = lcd.LCD(None, baud=args.baud, thumbnail_workers=0)
+    display.ser = CountingPort(args.baud)
+
+    failed = []
+    print('%-10s %-10s %10s %10s' % ('file', 'stage', 'ms', 'peak KiB'))
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        if not name.endswith('.gcode'):
+            continue
+        file = os.path.join(CORPUS_DIR, name)
+        base = name[:-len('.gcode')]
+        results, chunks, wire = bench_file(file, display, args)
+        for stage, elapsed, peak in results:
+            print('%-10s %-10s %10.2f %10.1f' % (base, stage, elapsed * 1000, peak / 1024))
+        encoded = sum(map(len, chunks))
+        pieces = sum(-(-len(c) // thumbnail.CHUNK_SIZE) for c in chunks)
+        transfer = wire * 10 / args.baud + pieces * args.delay
+        print('%-10s %d encoded bytes, %d bytes on the wire, %.2f s at %d baud' %
+              (base, encoded, wire, transfer, args.baud))
+
+        golden = os.path.join(GOLDEN_DIR, base + thumbnail.CACHE_SUFFIX)
+        data = b'\n'.join(chunks)
+        if args.update:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            with open(golden, 'wb') as f:
+                f.write(data)
+        elif args.check:
+            try:
+                with open(golden, 'rb') as f:
+                    expected = f.read()
+            except OSError:
+                expected = None
+            if data != expected:
+                failed.append(base)
+        print()
+
+    if failed:
+        print('Encoded output differs from golden: %s' % ', '.join(failed))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,553 @@
+; generated by PrusaSlicer 2.7.1
+;
+
+; thumbnail begin 160x160 6332
+; iVBORw0KGgoAAAANSUhEUgAAAKAAAACgCAIAAAAErfB6AAASVElEQVR42q2dEXTs0BaGc9YqBAqBQm
+; AgUAgMBAqBQqAQKAQKgUJgIDAQKAQKgYFAIVAYKAQKgYFAIVAIFAKFwIXAhcBAoBAoBAYe57618l4y
+; X/X27uacs/f//3ufc/YRVeRJ0I+5qilT4V+ZMuUVLmUqvqMsSX3rU6aim3ziX0UdZ/+/reFPRn2W8o
+; zNe1a1lKn9q0GZcuUOm6t1tfj/isgfuVJzP2CT1WGmmlvM33srwea9iClTnRpi7n5URgvsfi+HaDlV
+; qc/yTyVlyriwKFPaOxbQ+w+MCmVlhjeI4k80NUKtoT7LjgvMSWUsdPa9TpkqasxHnT8BZUpov3tsCa
+; WKMqXc2JSpYWViA7zFSKe6x2DGmWRoUQ8zFIq6w+RMkGIjtN5yTHIfFIxWYyynKHbLJYjYByOvDD0M
+; kwcHC51ux9GqjM17kmOJgHaHiSzzOApoMeyWu7+6wqhCfseYwnIwpnBDTEWm7xjZp7czHEv0P1Nj6A
+; YsoPUbrHbhfmGOlVTYEnqnlDLV3mDuLjQH8yy5wkKnXGOKNDQcjClyLB1vpYgylb9MUaFocm0GVYRY
+; QKulhmHDtseyph8MZsoNNsDYXI4NQv07Eh1ug8kZc4WlOuY1Ziq74LChwsogeYJhg+UUYw5Ol4usMM
+; JCx8uwyq3ZYQQ2PGNpYXOPBbRxMyMRENJhapG6J4zAhgHzd/cbE1nxGstPtA/KktR/YqaE9otlq7VS
+; cgGNQZb8gA1QLTGmCO6wolixsycLHfEM6EjkBFvCC2wJ9Res4KD6OWUqVbGcIj0jsxdyPxpS94XJdy
+; 3AMLk5YKa6HeZYSY+5e+hh4GdF5lhFXy9f0VTDvKGtMS6sHjFMrl4wTK4esIC24hnuLoxmSmRlvx4W
+; hRWmk90dFtDaEVORQYUVCbxrTL2L6g0bYbutKVNZjNXXBgXzhuQTm/fkS8FUZDmVFopgzjcrKUdgGg
+; ZZ1QY7SlC2GLyXH1jklMFyxxKqPPoOfc3VjL4xTO6esSMc5ie3hLdYQNtf2ABzZzTtooyXS0Flq1Gf
+; NXBV7vqAfVXyiYnbwcASMO9nBn+JqLemPmuP7aY5K8qSpERY6IQmBjPqDeYNsoFpW+E6GCYXHLxHKu
+; bvToNhw54ritk65g37JJ5c4HBGaT7WMc/K3rDE1z5hBOZamDf0CaYii3J5qU7U1SgP9rmkwg4sDLJ8
+; LAEzsRqw1KrYPY8qx3zU2o9MieyMGxZGxl0/eU+xgkPLXUZKEsqUbmCZfeTN8AahPUxBZdtjmGzWWG
+; qv1JjIUq4wWvUtTIJ4LxhiibzGahfNChMOWYpNVnfETOVrTHLHdwFG9s7kAlvGjMCSjxH1WcYNhn7x
+; i4Nlq7eYj3YJ5g31o3JGBJ9G3JBWmAjJub2m+ICdhWtyjClKG1NGqoMFtDm+MCeCM44d2T427+GAZU
+; 3dLSZu5Qhj6P0Pdxpkzk6M0C+nSgrZJZYXSgqmjKwGk37hI5YWyjpW9VMeMKYQ0hrLx5MS40LFwaIw
+; DzCmkHtsCTUJ08l6MHm7ML3sZ/j7Oya5Ve6QpXHCJiu6xpgi4cg+/VgOfkIZXxIpdxjb179YQCcu9l
+; XBDeYNzQZbQvsVI/voOK5kWZfL0xU/5C7tc/mJfofJGYm70u51XEVlziEcYcXplL9bXF74iXFhfY+V
+; /WKuNp23WOKbbDFBKooTt6uTYqb8DTZZ0l+sNN1wZJ9+YZFjTt7LFWo9A4WKLRaFUZ1gS/iDRaFqYY
+; 7VX2BRqLnLqVCEryNAlx+wm1vqI0ZgvoFJ7ugzxaKwx6Rf84GlJ7bajDn4Z/ncuU9YFAZHbISlhi1h
+; cocFNHiGXvuekY4LS5rS+t0F15NFwaoEjYthstFj3qDuLQzec0xFCqXlup9cYgytHjACiwoM3r0rTE
+; X23EXFKOomVfT7DGU4+FgF0dvmlCmZw+QCPGSZYTsx+9vl21Yi+hgBS/CMBbTDtaa1NSypKEvMVHXD
+; 3XK7xtSMfjs++C6FyyOp2mNAmkUKhn6ug4VOgcFMMGCbx9EcbBCdNUVRxgP2WfKXhqX23OXxdIvBe8
+; R1EO1+a8qUKEzss3quk6XD3dWRuSuBvorBu9ViX9VMnikW0dsMRa7Y2O5Cf+I6WRZYQHsx1+P73cNM
+; vS2HGbH3RoDeYZmO5HBdAvUtJm4HG1OR0T1W5TZiLh1f/QPR98sHnEvYZAVciTTm0C/74K6tBhitpn
+; OiULQvU78d7bARSj7mpJWGwXtcYwM0uPs1oYz5qPAdLi+UsMQ3+cQkd+hiNaPyAmOK8g5DLP9psoWD
+; ps346CDFqjPOBaZBUgPzBkXBYKZxsIA2z1Dv4p9EsL7ClrDyMZFlBlwXjr/YJmZ9he3EaI8WJkhX+W
+; iB7fKMFf3FdnUcmWuI3mOyISuwKHRVLHK6yzkH37XJY/IK94DN0HMNB48Y2Ue32FclakCZ2r9g21bC
+; WHG9cC4xILV1zJS7xWDG5JpidjLmo2WWTxY65gzf5d67MAws1TE5ZeTVmPQrygQjnT/LmUIoP6MhWW
+; /cEw5f2Agbg2ukYmApZpFgyqjm2l1I/fhZHedtudatHzHhoHrYCJ0EU1m1iSVg6bOBDXAzZ7vQnqxO
+; 1B9YGcR2sBF2Gwwb6pbrJ+thTLHXFExkdR4WhcmBS3xPXCfLBhugP+cZwP+RrT5gCZj1HExGcDbDWR
+; Ku7acUcb1BwBZzMobJRcYd/Txjl1akRTn2LExG6lwO3ZgYrVY/GJAW3J5Hcp9j/PU+CmhR2sv5rO8x
+; qtBrbITWK7d57GKkE79g3hDMuQMmpjGpP0XYCFcYZOk3WECrHcaFxh2GDbmFUaHouD6+5SUWhfEGq9
+; U5XNP++AlTIE6NuXuzmvJRYaxnoFAcck3FLrDQkQ9YQMeP2FeVEcYUobVcGAkjGHGDusKy1bTF9Fpz
+; iVVu+xtM+iWxhUm/S26vafwYpehXy4WScxlgn6Vj8K6uMemXYC4quXeYyBqGGTAjNHUKdb2Ya98VYu
+; hXcQ09PIe7INpgZXwzwdS7kCpssmxu/7/9wY4suWZCmTLeMGzY32LSL58cnxjsGUSScAd6mjdsCeU9
+; 9lX9NxY6Zc0Vbv0zKlnO6wg5I4mrIHKvM9oRtyXgY6ZC7jKSfcTIvrkfv13o7JeTv/aBhY65bjFMbj
+; EfrQOsdmFxz09Kv3MiWJk8smNxDdEN7pBl94mVQSzu3QXzgB3oKY5cJWt4wpSRv8Ki0L7FRljcYwMM
+; uOJMUWD8FSbZpIrezPhL5i2WGCqPGBfuMbkm2SZWBskuMHi3uzMeiFaL0Zp5XIrpSlhS4Q8YrSpcXT
+; P8xDyreMLScd0dCSORnnE6ROVeq5PGD5GfFTo9phvCDRaF8QdmanidwV/CrSY9esfd6owwU906wrKm
+; kGuk8heTfoWMUaHwciyZ0+6wEdZcw0HrA6sghj8Y6ehXnLsX1iQHr2b8Jffe4vITTEaWXxi8Wy9YZl
+; 80nPY7o/O48C/H2WrHjbDGgDRQsfykCR3sqyrMR10OZrLjiHOFfEaXAuU55ZwUYx3nAwvo5ozXs//1
+; Bm6vqTvMieD9w5TI0jts3u0D93g8d1q9+MBoVVMxU23KbRcmX1gUpiqWzBVP2Aj7BmMKiyP74hmDd3
+; 3yJWYxXMzwO+4BNilUsBHuFawMEnMnI/sv7kbFql8ewWYxOlVZvWI62bji7po+Yp4VDdzDdxVGq9oa
+; G2CQjVSkCJ12OTiYGOuUjYGZOmKmIu6mfRJipip7hjASQzIFSlqO7eoMGUarzicmbvMCy1Y1rtVZvs
+; V8VGjcxpzzzfWMLLkS6RaT3HaPRaE2587f/8gpbvzJQoc0g8CbE9dkycb83f3BviqQMWxwv7Aqt31G
+; q04R+KMsQva4d3x/sfyE618j5RKmIvMVFoX7g4aN0LLGC3yzXAq2B4wqigCLwtjkTorZPWXK+cHUe7
+; ibETkisaZ+2+NOpJbcU8yxg9Fq+4EtoclJbv8agyzRPGOsE/gY+kUWZsr3MS7s7zAfTZ6xJTTiyTNZ
+; 7Z8ZCxzdcF3T3lrKVOhxPrrjzgYNnAT5Wu5Ywr0bTxbYg+ib0yAydiI1esXUe/TG7Xlwnf2UixFTCO
+; mMw3+DXmKh88g9Hu9hFcRCwTC55NLxeuvNiOBq8nnZhNsQNVysNB2VmDfIKyw/aZ8wmJF+uWak+29s
+; 3rsdBu/7DYYNXoRFoc29IJpxbx6np8mO73I2QwsEl5jIkp+wJdRvPGyy/nJt4XLM3bvP5V8lyvfRkR
+; 27w5Yw1zF4bz+wVEdtMPQzsSCUZAPz0coe8Zco8uUDLrhuP+Eek9wyd007fMbmPauwtFDdzDhGJ/TJ
+; K8+BhhXYNI7sh88c08kXGMyoF9i9Ju8V20wTLne4NXGwgLYkB1NGW66BTYwxRWYEmCAtlEkVfZqjDN
+; +x0OkHLKCLP9wj5jvu/j9Xe7d/l5sS/xR9jQJrfJfccg89WliKyV3/l0q5xvSagVGhE4++SihvZ8iZ
+; KwxnijUmZ5pnrJKlOhhimVwXKU+fodeEa08Fh7vCGLroLAz9uMS3Aa+0n7C0Seau8YmsweZd3mG0mv
+; WcMiqxgoP6ijFFecD4q7SnHEs0rzNIN/zFyiDJC6aM+hVXx+eaYqp9iQ1w058Rwclo/SsDC2j3GjOl
+; PmKhkwXY6d32MqVMGTbmo2Y7flanPi6PpOyIzfue21v1a2zeJQNLdZQcw2R/N6eFQ7+fmtlUw7ImU0
+; koU/GOS8cxNSOpXNZkcbu0opdazN0PmClzzu2M6Z/gwAX0LQbv+QHLxztryt2FV80g8FrHlrDcadgS
+; cv01Qb02XGEBrb8vl34isEde2e6xpEI/Yt7gxQ7GhQ8Gt4QYU2TcucFi3DVNWKdgORfGGJAmd1gC5h
+; 0xU2nPubuOfdV+PSOghdpPQWWaY8mc/Mgx9AkLaMfFltBXMFNDFGEiq+ZCJ+KOJQwD5lh5GVCmGo4p
+; NAVz9709VUAU8ZyHNbQcIzDjHssLtUeMCxPuqxruJeZ+s1y9CycfZRFVjwV0UHHzfsKiMG0xcatp2F
+; f13C6m/T4qgwjljM5n7if2WckfDJNVCYvCSsXOqHgWNleDOiOzF0Y3Vctx70POSbHQiTdY6cI1FMpU
+; +8t1F+bugAmPe9qv4VpnyDb2VYaNlZ+GFHN3OeKuQVxN9skK5jyXbprYZNU1VuUeuHOylo/BzBBhO4
+; /t5oyO7/H4rXH7hjscZGJnEM0thn76NXYqweMOOEQ3GGLpbTle4DOuMpg+ljWFEYZ+CvckcFJjmb1p
+; cs1+tjMSMOGupxYp9bnOEp9YUmGsOFodUsrUnmsQbX5xz+o4G67gcMQw2eO6OocvmJpRHjBThoLBjF
+; 5OwYzIA2uGBrnCDg6a3NO0kot9lfGXu37yjY1PC5ZHjmik0fob1xgXZiWWNTUn7KsGO8e4kPsqyeox
+; xPoZpSfCcpZjhfON5eN9hsF7kGKmfB8TWb7HLeFphilh6lMltGzAzifXXxjrOFw7I+8PlkM7ryWXQ0
+; eYyGoqbiOa2xDtyZfAsCKwscXm3bzE+MuffPVTuLsZejV7wdBPU7FKlvKApTqDz3W57bkM84xuq0Iv
+; Rwl484nJSHnAUh2HO2SpYH4ludzteIe7azqko/REyPnyelvVY/5ecdetlBXmDTrXhqN9wyKneJpRFB
+; PTL56Hv5gG0bacnFlrmCnu3EWjYlGY32EwI+wSG2Erc88SRC2WrSoYzAS/WInUeuYuzCXW1AIX7oyy
+; p3uDzbvrYt4QVhg2dGBxRsXgvTSWT7vwxk/b7XtMGaXg/Uluz0O6zjEfrTBMVrleCd59Nk6T7OWZT/
+; CI1S7Sv1joyO9Y1iRzyqitMfDbzzl0JvpkioP9BmOdpsIwuXzGojAxuDcjJSwDs74wdxdJhs17YGGm
+; 3D8R5liXmDeU3CPmrYExdDTZDUI41zMgOs6wjeiYqziE3xgXJlj+JdkSNleJdMaZLGuMnK6E+Xu2xg
+; 4OVg8YU2QWphvik4UNkGuFEwQjbSuC7+UCtQwxOVMfeix0SiwR8CJsgA53Xdj4nmFK6JPPvJ7Ti/a/
+; vAGTM4OBLaGsYKGTbLAB5tyT9qKTMQKruXdGjFcsqQi5zeO4524QcS1Sw06ZWuBsNcOFFe6xhOCIaZ
+; DgB9s8brjT6mWG1S50dzk2CHc9EtnmG8Y6+gXmpP0991w49+K7y70GoXHnBt3NaAWFsl5OQkaKfdYQ
+; Y8V3Q8O8Ie0xhq4/MHfX3+a0cJAmn0No9iUmI3VMg8hbLF1tuYNUbYzlcnvuouJ/ABh3itfcOwGEAA
+; AAAElFTkSuQmCC
+; thumbnail end
+;
+; external perimeters extrusion width = 0.45mm
+
+G90
+M83
+G28
+G1 Z0.20 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.40 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.60 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.80 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z1.00 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
@@ -0,0 +1,488 @@
+; generated by PrusaSlicer 2.7.1
+;
+
+; thumbnail begin 160x160 1256
+; iVBORw0KGgoAAAANSUhEUgAAAKAAAACgCAIAAAAErfB6AAADdElEQVR42u3dy24bMRAFUXKg///mLA
+; JoYSuOrOGjWbeAbJRV2GUrR5w23FtrvbWr9d761frVeqmXz7+p+bLauL5P79H638TPP758/+UB/85H
+; uwyGrdtaf7RuMGzd1trzO9h+wLrPt2j7Mes2kcWuK7LgdUUWvK7IgtcVWfC6IgteV2TB64oseF2RBa
+; 8rsuB1RRa8rsiC1xVZHX9GkQU/o8iCn1Fkwc8Yjiz+GZORFXHkWGSlHDkTWUFHDkRW1hd0GrLi3q6i
+; kJX4iT8HWaH3OSHIyr2tS0BW9F0sHlnpN+1sZPkchYws65KRZV0ysqxLRpZ1yciyLhlZ5iQjy5xkZJ
+; mTjCxzkpFlTjKy7EdGlv3IyLIfGVn2IyPLfmRkGYyMLIORkWUwMrIMdgdZl3XJW2lPRVuXudlSGVkW
+; GjC9ssiy0Jjp1USWhYZNryCyLDRyetWQZaHB0yuFLAuNn14dZFloyvSKIMtCs6ZXAVkWmji97ciy0N
+; zp7UWWhaZPbyOyLLRieruQZaFF09uCLAutm956ZFlo6fQWI8tCq6e3ElkW2jC9Zciy0J7prUGWhbZN
+; bwGyLLRzerORZaHN05uKLAvtn948ZFmoxPQmIctCVaY3A1kWKjS94ciyUK3pjUWWhcpNbyCyLFRxeq
+; OQZaGi0xuCLAvVnd59ZFmo9PRuIstC1ad3B1kWOuB742NkWeiMd77PkGWhY/5f+wBZFjpJLb9FloUO
+; M+mvkGWh8z5xvI8sCx35efJNZFno1NuCd5BloYPvgv6LLAudfdP3M7IsdPw97g/IshDhlv5fyLIQ5B
+; nMS2RZiPOE7TuyLIR6fvoFWRaiPR3n/QZw675GloWYmy2k3wBu3ZfIuixE3kpj/AZw64qs1J+gFFnw
+; nUORBd85FFnwnUORBd85FFnwnUORBd85FFnwnUORBd85FFnwnUORBd85FFnwnUORBd85FFnwnUORBd
+; 85FFnwnUORBT+jyIKfUWTBzyiy4GcMRxb/jMnIijhyLLJSjpyJrKAjByIr6ws6DVlxb1dRyEr8xJ+D
+; rND7nBBk5d7WJSAr+i4Wj6z0m3Y2snyOQkaWdcnIsi4ZWdYlI8u6ZGRZl4wsc5KRZU4yssxJRpY5yc
+; gyJxlZ9iMjy35kZNmPjCz7kZFlPzKyDEZGlsHIyDIYGVkGu4Osy7rkrbQ/Lv9Upz8KZiAAAAAASUVO
+; RK5CYII=
+; thumbnail end
+;
+; external perimeters extrusion width = 0.45mm
+
+G90
+M83
+G28
+G1 Z0.20 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.40 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.60 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.80 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z1.00 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
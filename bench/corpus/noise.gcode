@@ -0,0 +1,1789 @@
+; generated by PrusaSlicer 2.7.1
+;
+
+; thumbnail begin 160x160 102780
+; iVBORw0KGgoAAAANSUhEUgAAAKAAAACgCAIAAAAErfB6AAEAAElEQVR42gD/fwCAA02FM4EU9H+lIM
+; vYkNjGgfHzOXZ1idqnYhLsFf0z8iIuaXxsQwvuyl9ZazXhzl2BQ1+eKzdrKQ5hFRZ0klLOwirCSye6
+; DmrthILqy+7H3IDoseIsmGgURdX4FmUAH9RCdzq0PRdb7FQXTDz0aAev+gqC1uzp5J+iAEgCok0V1b
+; ZpBsV5gWeN6r16U/SreAVKN5MGuspTacXyhCnOvf5Pv6YinIbt+y5e6USseXj2xFERIWPoJZZ1Kh3G
+; I2+yKKwcuOFEWlRVM8eyPp/Cqh7Yy3krJ+U270J5vz0/jSX3yV/qBxGneVJM5Qw2bwwAWQ7cxwN157
+; 23zDu+NZp3zNrq5kBnDC6ar7+wNsNeG38zX5G950sERmFXHqZhm0k84fwT8itizBAbeM2fpejwJdJs
+; Of1AT/7qqb+TB+fHqwP+H/l8bn9cct1soQ/+TWb3uZ0DkAS97Pgvd4Bfv5kMMsrhjkFfAkRi0gbQcr
+; u0VEHjXcTk3uZYNPKFGxY8EzJR1T3exRv4MY2Xk7E3sN++nSDwl1aimMIeBJXCip0k5Gbd91z2fqMe
+; wJ4j/IwbLJ/s5wtyyXd4S+Tjwmxi1q6/o55tH1PaWU8+Q1ThBmjff4iIsCm+uBlz7ynWUlVM1sQJWD
+; TYugGLdB5TC3PLH+wJXV1vbY5Oloc3Tvom1SN90WPPBRTpQGkTPFD00elqguk9onXfOOzmNakNMGFg
+; qF7GEFKGDckuv07LxNYfJybH+PKdDuhQ+zDQwqW4MS4iYQs4GbX6XZioYb+OwNIKTFTBA8OgnmwkpQ
+; yatZRBQUwdH/0xNfxrpGTI9Z1PV9qEy9ggiBLbJfRmGh9FVtIPLvu5/3W8m/5jEt3wKAPzn4238iqz
+; AauSYR0nGgHkQcCc/LHXtvjnnDuIyUHdoD4M2bRr1W962EHwkWRNBJGtlOy/fUj7dMhJAlSvsM0ezo
+; fmvkId+CsPpwHv/3N9uKILRObHliH8HTY10E9udj53yVsBK2JwW/CVREj9KBD2fjkvspAephY4dBiu
+; DYYA1GPl3t2wd/1JA6ayj45DKGT0G1Li5KeZvJzUT/QlArshEZKQ7Zdrn4i9xfOJMZvm0U1nUn5qci
+; /1F0thDDSy6GIfMk0CGpcq6/oACMDRnXyADej6S60V7qgFYODDuEWMhxe3w9ewX+MsWYemfwM2m7C6
+; oZBoLkAK/iZqw+Z5XQiYLKVNeTgT1J7jWSU6xNyfj7KmhNp6hyXHXSvXRSIzScFoDlWndlz0Nz3OBl
+; U9hS9IbAB/TzupV/PQavEDygei2gt4CVw7a+KH26iOEb5RBmkK+X9Bd4RXdyHmr6JNNd6Tq4Wtl6q6
+; 3m+RE4wzNK0sA0zxDXNWHfuK2Ry3wKg6SHA0/7IinMsZ1rAxdWGjy0RpeL3aTybeRJMPYIwIrn+sf+
+; qBFPsgf4EcCEMXXM5JJj3IzsLctGS/uMGDkhJfMjg5l8Dtkqg7T4lC6/m3eXKgfBupITtjcUib7kIq
+; YzIA/6RLFP3CvpeMJJoNROHoAoPoy/ynA+aFrOns0SAvhjdTe1/bFUp7N2SR5eacVeU0mF/rpCEC3Q
+; uUAh3/gVRbZkOe5nwZT2mGMUjbqnwTwyI3v/rYMrmWpNhs+OgzD3DUcl8MNXHvqcdI1gRMdsZ05xSy
+; LnIWlz/zWZzpsRI6FY0h4rYLNh6qRXE2S+BNDUeQHe0UXkmYUwjO0izo1BIPqG8NPjRcJhlf7CMv/t
+; WBlwTDY0nLw3Lpltu/VTyP79KqlUoZAmeFUZ+5QbOkhazS+HPxUywTx6iS+IsbMpyEuI1dNWeUmG6F
+; OSxReDxYeJS+yjl3O/h+VL2MYo+f/cJc9SbHYBJAs5W8CdwhphS0/JMU+i1HlEY5/c9oce9oAtSqMv
+; V+v4W7PuxBms3f/JpItIEb5lFqZGwZ3+HO7qZJAJN9XPCSl9FiKLXKABpDSZBZ7menNTXWOcDi6yTZ
+; Z+2nP9YcZd9Ay4zLF5WHJbb8gz3QklTW8RVYxfgGJQgI1y+gSHHGBb037+bb+4l0ktt+iwS/p9pZ7S
+; H5B3o7qQGcAilRoVbDD2NeMF5cAeBJ30ulEcwE0Xqwg0ZZr+8kFTQDRabW/ak37/GPof8mcI8MnFPu
+; Ao4trICXAf5iUp44oxyxUCmWcGAXpBfqHRuHgOFJDQyjPt9y3opsSmDlHbGSFKBOskY3bwy1GT460p
+; rw7/5xGXaaHAmKWbsYiWBhhyT2WHeLsaVygeCMmwMxE52edF5nYjjZe27GPFZDx1Imw5bGZJG7U/Ds
+; gIz4RcFtwk9+Vxw9cDPWBIhsPJAEdzI1/7FYNg7jvGwzYaTba9fITpN+8s26qemR9PGrSguCS40HIR
+; cZx++jhVSu1dOhhNbrnE1L4wVEgT/ASx2HOrQfAgwOpF1U8PyrpFk9i6r95p4CV0GPLeoIY04ZDoT+
+; QyH4M7ESGr+OJPJmJXDh7BUuVMBlVAsHuK/FG2M8C6PYWvPaTCXRloKBJYiyqQ1QA0kA20CA4qoF8X
+; oLJPETPKcDcG71isBAzeUHpOO8LhtT4e7rIFZhZBntdokCPAi+jZ3l1ACplVVuClnF8QxKQ95uAiu4
+; VbJDgB8yogU47nRATwHAGvjpo3bgiDWIpksxhiQQ9EqnH4oWHg/kwJ0iH6plkvpI8qraHJ7IhTxD/s
+; /d0Jf/IZP1/sB4nrCTPgzJ0XOV33mUS5qxXaU3gx6uMCf4EN3qPGPPEnDBBasQh1Z2TXNBphXIB/Me
+; Dn6qRMfseMs22zuikuwvSkpmoHHClqV+Cu7n36Zwdq4atqKmfHMZ5aHfMWczbSK0HK5PScoHyv4cE+
+; bA7YkfdoqDya8MCSwXkt8tz831yMOUje7oRysXIcB6V5Zjz1W9ZjQjy7ysMSI1Y9XSMARH5dwHYw4Z
+; 6FmUdMpYGfh3oO1U49jPA3/2+GrYVxkKFR4Fxz4ij9wh4WFld4ZsPmYaCyoNukQkTvAGY5cIhV0GJa
+; A4gpRtoVkhOHGDhXkGwiT5xcZ97ZBxOcXRXdzU50Y167iHP+QizpxFSFtng6aLY79pSGAM0JOLCaB6
+; /s99ERUTFa4r7qbsP6bwwze3TvY3Hs/C4BPl/yVVQ+iS62C30v/Qe00Akf7eZt+HQ6Uw9su9so299B
+; mOhKRgW/AvHCEBDaLxc39a9MNls76kzd3cf9H+wUVDvPMbkeLPmiud+uaykAIcC4Px1b+9fYwD7mgB
+; cp4YkYok8SmezNtYto7tx7x9J55FMEkSdR2IjBQ/qFJxWIOyhlK9xzb/qT/3Nnc279FuxnJV/itIxs
+; xy9Spcmz2xxUuM5bASqQZeV83PjtgbtYvTrJhgnlr+cjdcjNxMoFTdvTaPaL8AIt8/n6ST9UylZ8TA
+; XedNJYkuD5nnoQzf9Pq4u6c85IwWHSKcISbeimByyF/Q31TyF6r9DK30U3W62D2I5b6xtr1WweKEle
+; l0PuNgp0QC0xTuto3HAJ5xtoIIqjM82VZcrMwuXTWfZ5WeR2vbIBDgSqeQmMg7MuVNivK+RZdNo0Ta
+; vThaBZuF91UaqAqXCZN7NyFy1ZHc4ptN7PGk07LlSSrb3eENI91oRi+6sSyF+qtjHnltfecXR/g1uC
+; 0RJ4PUUzN1Nc/w5OnVgfzVR5umUjnPE6iefZcBh8+mKB4kaOVT5Sf3Lrid9nXe42m+2Qa46anUBf5h
+; 0MUeaXYX5+vFvqyKLBs7wOdA3OarDXd/3aNz/dC5Q5rGSYMNifcg+ytvecrXCylYc9z7iuub+coWd2
+; JlzmQSApQbsQYH9lw0QcU7IzHM8OQJUC7YEz3WIweKbi9s9zb6gRHu8kELcn7F5QMmLodbAOLj1bBq
+; VYTbTxzl+pPrAqn9trppRSCGNrzj7SCJKzKra3D+i/PLzf6ZXnKn+pFh0xsaCL/P9sdO2gq6FkTJ2M
+; /rkY7Gs4G/yT3nBzzTlv1TysyJWiDAi10QO9jMNrryVpUFJjjv8Tf22ISPZkt/mc6WoCtpnpHZcrbz
+; Gp6cpjmrGM/peCFid3RYy3SxRa4DJe7XHsFDy+aP/jnZ7TvpY6+8xStEcz+geViQdXA4EAbHkRHr3j
+; 4jFV4zuWmQcuG5+Mkms43mrU8n0yp76hct3ezjeJ7WbPsJZvF4Z5thH0RKsVWXoX16+erpSQUPY4aY
+; EcPQ88f7akA58SRUoImTVxQl70YvbkToAsPh0AzXp6gvYpXk1u8lPRdaejF285Uv2aQGr3m1jzIOsM
+; dE+srJGCcisF/64JlcyM+QBmeQ3fGcb3luEPecpKbl/YmsMGlkaDG2P1W2V2JtkER8r0OhXzl8OfeQ
+; BihQ1q2kTJcF5FMT3yVav9vdf0Zdta2tH02cZkVYn1JxlbKD/V3ZbgrRp1De4iRaWGt3rLpdQCf0Sb
+; sYDNXDjBhsrPsmonndaW/5pwjECd7BSgFc7D/aQl1TGAv5wEZy6WLYv0LctqJRWWdD96kFxg0ooRK6
+; R2TBdS3LvyrNj3X80YzsFsDcw8ldVAS7omImOYj2q5htKFlMpJx/k76CxicKJSoxt2HD4+GFhQXMkn
+; uF0VJLO1IyfYpQ6eFp8ciYf8sc9oeTUkTi/SN+krGFMx3uSWdZTi5mID/IakkDh3uuRPuK9wEGWOvL
+; 1/zDj6ktv4JAQq86nYU5cblPgpfvj13fjj3i9JkQCqnB7SqrguqtTFBq+AiDeZKQTM/8D04UbfW5Bg
+; criypS0hwA5stJ4EDqUaChYLrdHsLvwEXC94r7E6eRKi5yo1Q5ZShd7st3FR68C+PVyZSII7Ut1u7M
+; OkJQgkfKORn5E+3xph/sRAYULkf9XQSdIR+PzAkEbOcvRdhj5PrvBdYmXiZqXoXIkzfdYQW+a/w3jd
+; jjVirkYwC0B5RlXd+SjKWjg4oMfeCBX9/mrIj+SgHxcAz176qOK0+c5EEVog6wESJC++57kmlZK4Ri
+; r2YotlxCNPbZ8dkaKtIA/gUHJZPfh0JcPlrCNjmzhfas9TnaiLXGX7eXxz4sy2ewsTycol6IXcBN2s
+; vYssueIVJwjLiUtngBcC7mZrYSoNwpPHqBirirNqg6ySLbAbRRvu1d71r/1M/ri5cJ/FSi7c2TmJaZ
+; AoclG+aQ5HC1oBG1s770xYf6z8WDy8xQWZ3RSjs/1zVly8wDPxvmnpmQhFo+gM4pYITs0sjvfcI/tX
+; pk0BwKry7KlhXEUcGJkFQLL5r56Vv2XLBPNmMWG66W0k9/t15oO3dWN333QvRePbFd1G2R35g+wQ6s
+; IaCmDlLkGUvP4mvQoNUwo5TEXtNqC+xLoor2sgSrNQtxShSwWIHQxD4JqtNZ+cnXrUAPFrVx2uHbFB
+; IcwHA2m5Wp/TxzyoUvN6ovDpcXO2l6R9AeHEnlT2WR6+rZ6pXBAkTx+jwaUfbbhXYE/OwsZjQnteML
+; SI57/gYv6AJ0Ved4PovCpDsVKohL0cR6EOiqbP5XO1OtjoP08ZPd+rRJXZFF55OtpZ1/whVQceM4/s
+; 7AJLNXIj5P6prS4hMgis0v79zy6FdELREYBuUt16hYA3rLeO8aC3NiBO0sJCrPTZScgmVLVBIj/Mk9
+; ABCOAjTid4FF4fAqbTg8Y2dVCQ7yhkbtHFfaQfDIqj+Kr9XB9+I4zuh9MVqnGkw4nDgWDrh9qQTRhn
+; bJT6HoKzx6JeE6jJnhsadfwN+WBsKL2q1erzwJW/c5f8oyLyiy5UQ3V6GL2HOR0r0p8wnExHFMu394
+; 2X7DnOrX36/S7g8H+f6rR5rTqG/VJpPV8wWj7nyK74fC1ZoErHIkCTiNB549AFDXAu2lOhucMKG2UW
+; U82DukRfOqv9KlHNzneJ1oF4yqP2dcOKH6wA7jZkZxBk2HMcDTOmVpqCt4vtqpeuR6e6AFLINpQx+P
+; tPobFm16HHgVdHYjQbw3qkKnOKPI/eXFAjnNdr+vA1KVd2vWHij16O41gBJAhrLbHKrDcfOP0MsfXE
+; J+lgqyCExlswUejbadlSevn62lLKTeMODbDnK4ZFDWA9k0OGlZk5iaIPULIGyjAB/t9HSKpXiUNQdp
+; jG9hBoREmawq+5brVaXVDZzYlmdmhWkGS95nSIpBldRL4ebacZ8bcEyDxxRgP1P7N/kGn7Yjf7xWAi
+; wS9uk3ZnPMsQZxe8dWw/6rq0romlb/Tb69qIUtcqGC3Ur/4el5LjzU/thqN8FXDtT+oDxCZXkT/+NX
+; Tw/M5g79pNZzwd2u/FF6HxCi0ENxXwpZr9ZBb/2qt4xDJA4OImQP+KO0P5AF13zNXITa/2JddNMFvW
+; nxpZ10tjrZvU2zW44Hxl+ttw3EfO0wbnZCDRq9sN8IYMdfV28NuhXBJw0mxIZaqgNZ7Qre/jEF42PG
+; maaW8s0JnTkiBuTTLqlcTYNJAOCMlm9150q1OFCfDWbM0bz32a+EWcb6vz10nhmn4urat5qlzXBWQF
+; vPqQQlp1uMZ58pJrAvtcLZr728TaQnEUOCiixmYplaYB4DPvbHOBGqoVOy90dWUM7vmQZWoKgogCts
+; KksCDZXrF2xPAnYLGSfg9otPIciqgastUtuZ2lVBTnhFuxRI8kfW0vNcKrZ34w71vze0O/KoJejYbv
+; iDbgGheH4jDzoBygtRS79ckeNKNFw2xgu1CahI7dSgoBrPyu7VK5RKDfondf6ZQaiLliAoMPW0D0tT
+; o/kuie7jMllK2zLQxVta+u83D6xHUlBNXUZ53VZTpVolBSXeDUaxb3AsyKIDFFp3ygXIEZPRKbFsvq
+; MTLmmBHYj0YEMoQp0q4BQ3NqbIStFIYBz9Fhx7Ew/HkjpisYS2dJuzdPklgSoSaJTZATXCHp2/HfkG
+; C5sRyjF+RYIJ37Fl2tSWT3lxpbwDBD2YasNOy5/PE6+JreoKAuhI6Wrx5w5bNsj88P3B5FPU15ILWG
+; t8geK1yuBWmdytb2bfcqof1xj+AOL14UH1Z+aymlmVTDQCmBwVWhqMEZPMJS9KUwGCDOS1AA4xRGxb
+; 5EpWOv2tENHJA+5LK4FPB12kyOmDBCcElaxzW189y7aKYLqUGhEFSZ+VvvggwAft0CIUE2SctTePiH
+; UnKLGe6AWarHxqFw39X/cAm5yBiKaX5lB6BhJV/hQK61haQcTzqmLr2PstuSmtQVUUr2PvQPLFpRYQ
+; C3pCAG514fOEnyBjANtA1knqPMciw3ek4+Uuvy0fpT1udoR9mUAyBqlw01uMawmqTgQu0ICYOS8AMw
+; oeL84CYghIqiMFVK2VfCUlAZEPZh29MS6svhs735sFWSsFfSDpysd8k7W22v+fJnWLyHdCkQcBVI+X
+; 9DN7LxFsLLXAPhjgP3ln6Qs7eW4/OKkEVMQKMzr++uQfogfeql4JlfPNKGQa9CJ444XEe8iHkOW8TS
+; v/4sd/fO8xvYFz+UCMaSqs8CeCDMWbPSOSyQbRcC7S7jgdymrLtsB4Bs+QcCpoB4H2D3Ja3q07R3ZO
+; MbBhgFOk6CTYOHlWKWBb8KCpz0GFG6rFQbTcLd7QJfDmJs65MaCDybd6aIq03b9n2Gc9/9PORWoDEf
+; gREo4odiWvpw5f1miiEfD9nRUkcaBxFZtEbyj1KgzplYWdKHjJh1ss1csTDzHfpdm/2Ab/9EFCdjjg
+; UFH+d1ol+ygsNVxCFaUkcp7Z8tXH6CazOWBB0QmM1PcdeXtTLM94s69aEdERyIftM/Fieots8jycYg
+; 6yayHyjPAde5sbOyMTt8pPcPkO/jvFS1TfPx+LAKzz861I/FqIRexSqt/ZF25fTRp+A836Qc2S69dm
+; oAfGc2IsGiuVVgA8z92c/6WeJZ9zOKjy2PBya0zZANQcO8jwHKsqGteG0Fmz+Te762cNflzvt+xHC9
+; lB+NcaxwJOezB9WbP4BXtpjBIT6biXF93kD/v8WHfdyDZ3pkdgViGpnt5jyoEGf8h8khG51efCvXEs
+; WPuNgmnbJ3m7KvEhBcLzgKBVe0K0gg/XA8kqUCV0ZcAuUNWFYah0bkUUNGlLKAJZGMxzgu7VX0i4pU
+; JS0fCy/sQiV2f3/H53KHiVRK/CZlQ3uevhQQIm6JteKPAkCbjWQusuiChhmbrXRZmDliPPD0nThYZ3
+; TGANk2ZA3Kvxqd4q7QYeWcrlAo3PMkFtjemVFR6a/QHRAB0LeC1VjliPjaIu1qJ6y/A285rU/alfOA
+; uZcKWFeQWXC8xxpF1Tngl1N8Rntjwu7GottfC+8LcOJ4CR5ut61HKV11Pl8s5jShO8KsYPZvZWdsuJ
+; UMEPI+85ocD+2pPZs5cIai2sC8PYsIIUpo7OluuM5Ev5yJazOBYeKFVoraWLMxsBPCxwSoBvxjdkoN
+; jFwV1FSl19/9UJrqTqrrg5MABZvC1iWz6nulMlR2JsmMkAIh/mWcJNywQfJvaqxn2sWrXWNuSqmwrz
+; A77uv4gWsnfwTtQ6KJfH5RIiyZ9YnUIYb+ocOOPgpftTj56LC7ZvR1+UTVINqXagpPDwpPNggQJ5ig
+; /HE8GDD5QfUMhKMsTeBvDalKt+JFdy2XPDvADwTMKN9tSlbAIq07D24Bs3wXr5MwkdkBqqMfjSHnQS
+; GoOEAJdY2ary3OXOKH/2UT8IMQnOGdoYIfXK1KUPwlAly3wV/ov3zsugBt7Jfc47eOHmNIg/YRd1dE
+; E9dLfIPgJGGrSMfAC/1TiXoQuzktyVekpHE+ZziuBmpv6zlmLYXkjSYRgv+Rg/kwPCdGLFWR3epTCP
+; ABJFMjyKyds+CJE+Il66qO0r/CtzT14ttujXZvG2KRcOfP9OCIgHxWAJfIVTSNNfIma6FDmc6GTbjG
+; 9bTxPdncgXV7JJiaXiKB65QMIiUZNJubKXjjFLHBomRF2e8sxpDpTiWdFH8yu0zKrkI8cFG1fps93t
+; eGZ5rs49zgWP8bqWklqfR0KShNJaYTBizgKJ97ADUZSZIGpX0ul9ramUuM5S5+2o0MYg7yj/i675Fw
+; LO1RFupa/XAJz2x3ZvQlznQ/FJAANg5dGJQLz3Xukd4w+mZsjnjmTXdytFgAk4k1rluJVPVQMD0oiS
+; f4tC7e4gQUhPRoiazvf2yjjKu8XP+quvmgOeKYeUa/y63vX6EMVrie7s1avWTGwt4RiNkmyPsMflQx
+; L8pwo76clOCRCyvQOhYcg8PS5h3a/Q4fLuivLdjpDC/Ip6EZjoVUGDku4C9Bjp8XuOOvbulGeYEL59
+; PlAHZK6w/cJz9YANMw6vlh09qZYBx0MMqcfxeC05ZqiqTywjmomLR14QurAf5Ei2K2Y0N8dYK6kOfG
+; k674P8ta1n57K8GG/BIZFbPJkfx/Ri1rBHk8Vv4XmmCUwPgsKbpf+PihrYlKz+OCJV4vmfEr3F0LkC
+; /Z8TSiO+nolhTtCxqRvEpV3WGUttWAR4arfYq+YWThH5Ho4FaHbg/3xPn0whuiYlxc3wY5qX6zrjWN
+; YbFNAeOqgtFrSfLBbd73u9BF1wOxcWEU8QbSlGIMzMaJfz/XKBVFgrp8c6Ql6QmRsuEDVFmpHqLl5t
+; 7rdDrhbCQLRtWxPyjuXWmLjZ4N40HM8LePheyY3ENPOw759BEiyWbTRyLJHEecNMCn4yIUdP5cpkHD
+; oiCoRU594dt7D/L3GV14gZkeaC2mQpZthwo7Phh/eiRx9de7szfzfRH7UN4DMXqGpNBDhqDOIQNA2F
+; rxqPLdkw3y6SAQ+fsqq1m/lByJLfYAiBiEv5A7kengt+3Gr6LWkVMaIDBz6z1RKAiA+/C+hUvab09S
+; +AAXgfhgi2DxEjTswwNHQRNJNIJSmDbypy274R07n9Lp7c5pDLdKrEFH4L/5I4uqC/CH6HTOyDtjoi
+; HR8Cus6Tu/OyQj5nVkLbl/RAVwhRYa0OWNPQcKSqqNin+ZIR97ERgVs0vB7ZVhTUW7AJ7vApbrsj7m
+; ESX7t9HbR3YKYFIdXXHXzy5OyDW4Nz6XnHyaeiqplO9MoTiB/+Aiiopwq+iwF5tCNH7FdeWdZPWM86
+; 94aLWQWfurq3ee1DdxtXM4MCYWjTfj16g34nFqyZD8xe8ddv8USeUr+ok2hZz3vPrhFy/UWotG9rh8
+; BE2q9HFXuqUgV244ZDi4H9sEY5MtabYpSHUK1AGF310L4B57q2qMFpSUl5pn16zxrctpaBDJNtHv4y
+; ioCUjKopKmTjU7n0nws0j6CxgUY7Nuks/PVjOWY79SMbf/jbAg8EW/xeqlUvJz9EeevNBx+ypodvM5
+; vLnpfFT4sh0VTzs69/G2+Bhvo34iSHu+HgE0UumqgqEgx3Kpr1WD08FP8jmjNFQn00qYBbCbRrFAo6
+; ahXYBYOaPUhbCJcH9njPkho+t1PSOwMmda4QM/OaH/I8OmOI8adId6BvztUT3zNJ2NClTR495azCs4
+; Cb76ulBcZbSNE49iyMeUpWM0H4E4/fmi7Sr5Rzee3+vb4DM/cHRcryEoBh2WRbfc5iYfKiAgLlj/S3
+; sOXKrwHz5ObOcSuG8rfKBaO8lJ9iq53xZ5KiVGErP/7UWgrPl9EG80hEsHbOOAwLl+QjF910v4Nk17
+; bdcAw0nqTpiu4oDe49ll3wcruqIgHL1Rv9sDIYYUvpluNwGlObrhM19l6c0/D/6PUd9wMzS598lBce
+; 2A580Kq5T5IpR8kJWxxZoWIvLQ7MIb/2X5QifMjmvoLYouoA4DpNJtvlLoiHrYXTLwAD83dzRAvgTO
+; mvPiYEUmVIEnB9g+w0ZkUmIg5UH45AsMSWF3rQQdldxEU63PbaAhDhw9CmiKR/EvAT8in55L6gCuIv
+; SgNvMnyVggko07TyWapx4iIZLlFqXbVLz1PoUpmYjc3IDKB4WByr5DAEZOWMDDvS2yTXXoUg/mqwiw
+; ZT59ww3Pm0B3xfm7ayxVIrw1HoQfkuILPLDwoYB5aRVDjqXu6/gbvQBLEhY17dexd9WCD9NpuT+7n8
+; D2rLkdDDARHmwwJ5LVFOb24ZbuREv5CqAQ3Ua4Fc0K2boEgEKMnDPwaSLvKVXEf0OGVJqSZ4ikOUCG
+; 8Q7AC6nHoYubc7TeOsSiEa/d0N1i3vSOLSGXQWaTA72A4V8bjT4NuusuhV+WWGIYFydcQfUn18qpPl
+; 4ckMSsaB++KRbYlFRuURWSNQybiWJ/lIpeRVbAkEPbW02LBQMGSop4XEkCi3NAmxcXhWDX0+WyDg6b
+; E9y9PDyUYRuMLT3U5wxQsWzL7K3cTyimxO0YxAMwgdPn0nGDtyHLvCw7kmg6VJJpDlRhsJs5MYGKU9
+; MkIbDnKdqq4GDMitNu6JFPDkZU2GLw/3I4PUQ03TsSbtiCu1+CRAU6Eq9Jeeax6D6s2Pd+WluSESnk
+; QFJA6KDZjuhgQGf/+AshSV8ySd3ovUStiWO+ox6XXyR4y9IluLdN2Yh3EX2P2IprQBjuZoa/3Y/lQ3
+; XPPllo6P9gDXV1pMq24IYUd9gLwNQ5jL766v+oTesVqhlrFOZoEMJLrEqtuxI9qTUfRn7zU1d7b935
+; Kw7wQwuXU8GczegWY18QiM3xD+cogkfDD96Gn4Z58AHnc/5/yiktNaZ9C5KKSXc/6yj0iOtk5s5ri0
+; s8IvZ+Q2//OJ3rfNvtSHAeAm5KrGqS++wwRxZeA3ZaTckCe0bHVWCXfqTCrIFcXyArm/iPbiMVerRN
+; s19kETHrMcWD7xKtiu1zFcO+/NeX8riOPSNutJPsHO4eMALEpVm9I6iKYU29udWrwOVIcAUHqx4Xsp
+; 9CT/kFCHlxGQxsUNgQwTQ974Q3JFPyTScXyXu1AEuYQSz2oDoehsvtEpvppYL6fcVgq7uWwDQeJ/gO
+; U/opkUnV35/mWKmffoj1cOR8fLnAFZTGVF4BDN0oRPUdxYEDBlQozArfYx/h1qwEVAMYWw5EyZm+a3
+; LjzpwTst/jYXtPaO7jp0r30Aq+zePJWxML27wiljPRqRyDtIzTPJjv6SYLRgGEYdyqp92YGSP9KBM6
+; jrtAF7jKYymzL1mqb3L6Ax3lG78FMRSQzePJbQUXxVFF298SNImRenVFdSXDVu+k+1CP2zT/xS3Pku
+; g6/v+pUH5a4yLD51gt5QFMxQfXRqMvCGCiVmIn4Xh7JuCBOSrmMOJ1g4Y/qw5dH5Li38GfEt0fwle3
+; j0lhlSlIxL4F3PNgSxS7PVErqAAiWcmUkhEqbF2AU23b1+xqkQfJCT/1h4anAxz/mXFnB2/uS+24tD
+; eTQmpRftFQrYlGdXUWuYmID548jDDJpaOQapQcvT5mF8br8G3wS1Jo4PdIRsQJBuWZ4rlDxLkBLVhS
+; HZTAHIJ1Ue4sDtm6TADbnhH3m93oLeIwoGWpQ9gh5jQGNoFA5J+bVaTtnA64wlYOD+2fpRxtf38P4J
+; pG/qEvM/VUYtSswpB1MsjRcgogzRzF2nNz6leaoLZL/BYRvI9s9LNunaXsmXAx7PZZlqjcFP/CHSJ2
+; mWThmMAE81JZu6IbUG1pTsmZfkNypOq7KFxJCXX/8QTOUTVOt+Kar5LxHxNh09S2uT4+rPavYkyzCZ
+; 8VoND5ZRDuC4/7qd9f1t2tlfiM91/CDx2wEMyXrIQt/EeG/KUyuxMmXdDchFUG6WpnukAvYp2kQAy5
+; Ka0SSseQVHzThbtnTjmj9KUuTe0iA3VIGMTySbFI+ZxNWLX3juebm5Wck9bnOv0gB//kPhRPJyhR8o
+; 7BAY1vh2Z+Dyq0H402OU71BkMbPx8UwohgkwbE1VrVnzW1WLU1Zuu8sWldGqNJd2jjsli6KCS9rlMg
+; 14F1toDCxl48xJoOQCv67Rz29Exic9cfR7CuyaN6oftjsjNU9WD8byB0mXQ5dkm7b1FJ6gHj+G0Wut
+; OurUwYHIe0BDAeqszNQvouYdgxI0pjXpCFqjSLaDmSTaKDIep41TCLgXeVU+RPbAmEfomdNUPfd4PL
+; YQQlUgRazxMnEFNAGi+qME8yPq8H/sJOjKVZDG6QebTNAGjQ/a26hNo4Y9bD/NJHhmY6tJiWvr3CQj
+; M0TNi1qrrKzRWIbo7H0/Q+Pd1pbc3KfcQM/A75tl+K+t+MsMWhiGVeT0vKFwNIVllvngBmmFcy0YR9
+; cawewdqbwfxX36GPmGs5VrXdFgzfg8FYWIOG9jMGiM369GbT0Yf/UPs+A2GhvZvSjeD5pUNVA2lUJi
+; mrPszCH9Vt3d6fBh5bomofhdjOUVddnOV8F5YRXy1EgxubqzJRVGQwTVuA8bULw2YkI9KguBd4uMgj
+; g1mOpQ7ZsZSDBXX556m/OWqDsggfGzvyOFS6G5j09S0p38EXqyIVKiq776zCW6Qvy8FFu2bgJor+1W
+; bk58aeAIuYDeQpbPYIDx0WTSNaB6WbhkyCuLPVLiOnJKMOMaCBZPjCQNTjn+/NQNTveO+UsWI/iKU9
+; Jel59Z0x7lHvKcBGakvbrEN8REDrBnVZD5JNBoQ5cBY/N08W7pwjP5A3qc5KtgZqDEoaTXF7BtXYdF
+; KO6oKRYjU1oFaTJtoai7I2KiDGE/AJiOZ8yimcS4F1lxSnjnYD6HaLUyYHtVO8P6Svdw4ZsBXGBHvy
+; 3fyzEUJb3aWWXAIkGIruY7Cjzg4kOdXG2kBeW/AgOlMH7NlSiiFauJ4XfvqqIYfVM9EEfiRuXTjBmm
+; 2n7oRqCpoh7ghbXFfJKvCyQj/wcLXZCK5F4w5QrOIfeqSFuPkrAPFWgg4W+1EK5/SaH65Bx5IXOnz7
+; zpf/Dw1rFTHvOPDtjWShVRjxY6FO536jqvLxssLfvTn8xomm/DsS63wRUEPUkfVAizGChxP1wvDp8h
+; 30IDInN64KgzQppKGgYJ27kWsXQkMtS7DcPfpSq8TMhZA/M+Ydb6Wug+fb8C8WIZUDEu3ZO+Ii0Ma2
+; EgeagLscWqNwdfjLBKrWxfMi9lYLXABONxUT3NPWs4AAeXioD8cMAcZbKsYFPJgNHXAniwDvclD7T3
+; oa365ktxYmasf+9y+jb3PxaCcZX3o/dO3+bcVl1eZwrYoTW+TdPXCsIsUCmrAY6zlTdOTk3c0yAKZw
+; yGProkt6KQsJ7AXeO6B6nKzbqUxN0Uh2TZy9swQwCbRtmNYkJyOU5SCM+ZADxoG/w9m1S4R5Ih8127
+; qQ1MxVHeoCskbcApAoFM5kQ0pgj29QtGCcrCNTrjDoy9kwaaZrOVUZqs9co2R1GBlQG4N8P9R6UONt
+; WS3oHajyBa//DyMnm7OoAiGII5pSw+Q9eRyjg1Ttp++iPJOhLdn0qCrgJZZmemcHs7x4RVZ0bfwDR0
+; SGaDJci6LwRZMFp7vWaenAGADk5NiyAnaCaAIKAZNmPVJAcWUr4F/ODb4WXLoygvjCBPnuBSX13o4Q
+; MS3EeyqzzqaYMvKuXCO12oHOGss/6yDc06PcGsr3DjNIE6MGBVBRiK2aIKBIz4xqgRADGfxPSTkvIO
+; aYnUEi9Iqy5PtF3lmFC0crBMm7zTSx5lOcJ1WDIYp7Jr30OG4EgymT8Om6LuIZUeox2joWRc3dSYey
+; Bc+fGawziKTp0JGaK3YzO0ZQyqWKCfoSxpwnk845YymJ6KBiRR1JpvA8VMlmu+16FHJFNnzfTvLAXW
+; 9dL+/fqnudIEtaeCdDYHImMVBChChAtyby5BfiSdPE5gaFVdL8DezukML3PGYKTLFUvuAoDyOJojWb
+; rwCMNHAWyuC8ZFDIkC+Oywq6Qo/pX/4TMRn+mwTLvm/LsWuDMDJj7RDyGK5jZJg3+m0q2fQgdCs7gx
+; Esjm+fss0j+c6urJty0LUUvXANMUwGhCds4yfMrxcreL+sszQwtjCFEA0TvAodflRn8/3KQzn7pMjd
+; 04DSHsF9WvkjcXgJ4Zs9aWDFsNBWGC9fpBXbNG4A6YGdBUZfWXAYX7EKKmN3n4hVljC/IDhXMAAIqL
+; wrjzeu2CFOKMMDbOWsZZqApBgDvQTtCjMxwKe8nVbl7MbkKtU3R1FLozA0rlugASYoVIdFVkxkxAgi
+; mSk18nlCiBVhNFrONCgM0SDtYyTEsGzPkLUv5/8ulDG28Dta/+xMCTgnZ50U/UaMdEQbxMCfB/pCdF
+; tV6pMQDbGWbnY4aaj5MekkIDFZT/bEbIA1J14igWuH/QHKO4JsZQMv+sfqbpVWRBz2we7BEqdGbshE
+; HLblRW8ytjGnxQsWcW1ubXPyDErdJG+R3B6QE6Cu2mWnQuHTa5OX3iAXj15baZV/8m/f1k83FqJlbQ
+; 3Ng9RggJTteuVYknqst598FDhj0Z8iT2AeJBFp0V6S5Wt+f87jtqvQ0bVvDR3R5qwRKu+Rw6YBtfj0
+; 1AZQr29hTHdnS/fNkfomdyhlp2DdVtMmxk/s4BMYiGoPr3g4CRJR3pueBfQON7NOBdrN8WIwPv7Z5Y
+; bQAJ+T9Y6Smg2PvzsgVMjD9aAwkNbY61LadLQnH45Ifrex/0u7oVxQNyGFTUKXAOpPeIrExsFrHMx3
+; Ebu/1Zu+ruiZu58yMKuIxW3muSk1xzTLbIpdE17ZUYL4fBk/5rMN1Et26VN1IQNo7mnHP1t4nsnJKU
+; 5MI8aLIvLktTARfS4iJ07C8VHMroJdK16rq1P5sYmH/St0xh/BOcHKYj5Tuiow6YqEomdRMmodPJb2
+; hIEqr63Rl9rcL8K5g2lGJ3Mx1ZJtx7wroabV71EwEdGbC17HUOfBFh3tCgZqp/EOaSYJ4AsqAqr97y
+; OZ61RL2ZReASXBL/6Uf6p+3UeS8hni0d2UfKlGcoQ2qm1ifO38/c3OGaInEksRwh1GPhP11SHpJQBR
+; 71xUNx2owCQudyt5PwdTJykp7XpqBhj1zt96nm87jfOGJmAA7yXuzGuSnd7N6Vi92cGC0aG80XU/Y3
+; UZ4P4yQkZgaoCxQ2LmPn1Akl7etrlgW7auh01ZRN3lPVMe+2dlZ7IaiSIwGygEwOkANxWOvGePhre/
+; kTZYNF754pLlgnb5k2w+kTHLMzygPlFaYlKPkxov3jakeJtKTOQ6Yp9q9Of6WAETVSopBYoT4GlCU+
+; LYk6Hx0SYjIIDy+H0kVSo2NX7aCBvBj9LZNkZJ6FQOYF3Kxe8B91xZG8uruxrj1pdN3KbXpWVc7a6D
+; 4VWDAgA1XnXnl4JnTPfs/ezV+9uBoZj3JLn4yNiqbBMu6N8CDzsHfiy4Iz/Q8PoCWKsobPSJ1b6qOt
+; Q1LdXacTJwUFYBZQt7uE+Sflml+oPQEP9caKuf2J3AZhiLLMUzP66nvoCqNashPtA2rFL9KapHAiHl
+; VveszEtGcYltvrXETvgACPC4fohQIpbkB8Kpr49UtydGi6v6pFtMQIVg6NqJeIEH93PkiEKKU3vMql
+; Rn6r8S+Of0GSW5ZJ5orPcQC7UDbj5gMTyIv/SYGKPVPLuXsAi4Kw0zkDF+6tCkakaJu+4BWfNtfEfy
+; vjou82I0q5Av4IXvA1WfqEW/Ca0HDf3NRL+8ghMg5INxL1swF69pEd7wTgW175Cb1LV8JvIAMs8/8L
+; 3CRDYHS9RG7s9swEjJ897MN0PvJWmFn5zxHHZOl/a8Su4nqPkR3fItPpllUqIXfDD3Pc85zEHpxatv
+; MazWkaHQ2TFzXALh6DHQpMbFzyBXUwizseUs4lQmGoc83qmlIc8Yqmp7v25ENMuTs/K+CEy+Jjvk9L
+; jadwRv9rC1HqhnHrjN9f9b88O7xRKEpGgNxYZjhfjDPviqkxZ/dAg4+l0FI5EjyTBGmQMWmxwTrAkX
+; tZI4yZj9/L5MWZjUPS8Xktw5brvj7+GsVguPSgAPg3Kelrfd/mxlhJ9yepKNryIQ/OBO7R9MrFNSDe
+; IwfxRJ2pdukQX5C9n/BPCtcFPuOJgV7J/cxA+wOmle+3OpIBMiXMqcRIoH5mXp7fYxhuQd3+vUPv3q
+; HjQXsCaBkHj1/lOsEOBzR7nWaOvABgfuvqc8RRE/Ht6AwHX3Y0O56FFaWPDG1Ahrvu18QSG92Y4U8A
+; huVVkYxKf0FUF9WUq8JSxdHHKjjcN0mwFzwyPzjGEXQOJHvVMP3V6B7sZ0zw68Vf0l+AG1sNDQeWP/
+; Bvap/iKDFyhhmNtdL6rQlY0PzwAJYhz8wmDZz8GJulTMt8LVdgw3bo0prsoI30pSL9NCmOS8v7ODM6
+; YNebLu56/zbWmeWlm90J1/h5/x536sKlgTn1yQuK99wuhdcCC0LKLVXRIOjFnBMhPXXig49KW8mRD6
+; TtJNfW3+z8AhJo9mrmldB6IuJfTQuB6IOuKAhd/tlgUtH2BDfIeu5dx5QuvJvM4tmlwex6/4nK5B3L
+; gTmq53NazD0adHo+wx98fbX2XUIm7Un6nMUUGjQFiG/rpD80i/1JxVRADxn2i3qFlr/Se6I+LA0qKn
+; aoA4UV/4cO3AIPMxovJdiQ+LTMRtv0xlHu4Tc9sNlK45T/ISwO3HGQWh9rNgxegSm7Zz6qZjXMCVzE
+; yv3Z0oRmBINWm7UTHsWwU6BhR1kiaYY7u/8sIMLdVDnOn8DYB4C8YroRLTYo6kBlACcnC05/HVfmH2
+; +5TnfRT5+6Eeijda9R8Llj7LQfoG5Zog9BFno9brB8BCiv5fhrzforUjkb2H67JENE2Ubvz3iq+u+M
+; G8m3HqfqhxhrvivLcHVb5VTlXMj4/PiC/sJNKAy/cnSLCJTA+Xb4HJCp7buMZsJuqcEtL8C68/fxes
+; i/+8ndlErjgyg/7WaFea4k1BPIwmm+IhyButcxLcnORjf5kj73HWansXRYJ+77Apr/I6l8RAzfa/Kd
+; GbKceo7YJdku4qRNAPyzPQI/l1xLSdJPewy1Go7qBCJmh3Tvhu7micNq2za+kI0Gqvl5BTh4qVKKMQ
+; IwsB7l2ZknxFiLMcL5I9X+AiOhwz4GH6rcvGa7StskP3wnvWl1y5RAcccS9jkMJl1HuT0Vq9FlCxgz
+; pRdrZdHDN937Lzsmh/Uc2y1po+XBYHURsH1jXg2uraWvtjGay7KwqQ3DxfwuZqZI1BPhSpFq/zURiM
+; ZFM2i/qp0+T0JDBFNB4haxzRvkQl2xsNRcltize1F7iDPjuHq0hF0ZGZ2KUFqzCa5Dp0FrnPk2Uh/p
+; Viqf/N0H+uwzpuSbds73+3JFVQV+HKITXAMojUVErCzK+xg0x0D92IrMXrYL+ldW1cnNEfvcqhHuvm
+; ke1ADk/eEfiBO6zw7sRfxCY52BKde7J835n1oIEtU45YahoRhX9BQJO4ydNOXn6f3W0Rm55PQEulXZ
+; QXFSOfLrQ6QTqXeJAmNBxoorXBECGhSOKvEsyDPJEFe5xBOX64e0XBUkkBLGzQvX7ZzpAKOu6/HsWW
+; saARx9xjUkhO+SgbTscdL7kX3hEaqsGIpdTt/ZZJ4XpxxNebAlwu4GOznuTrxVvBVbjPWTO3qdbIub
+; Ku13C6vk33AXTq3Qg6Ur3wb0HfxwUTFYzxDpacAWRDNh/Y8Mosb/Y1aEXT9g7fYlZhcYzuiIiOLgSg
+; /0L4bBpGvO04kwfwZ4jvZafr49gKAL6umsRG5qI4QoI2O9MkHu4314tigWIQbFFxwPsRXQ5h+wS72J
+; 1kwyvkNRq4u2dewwk7f9i+VtFdru5Q+tzQ73RXUgqgxc9sEP21+IXoqY+PwHFYoxl642jvOC1edv44
+; sVZJWHURZfZ8MUU4Vn/mvoTr+VltTzKnD42QF0QLKh6mIlH9V9PpNcUVHJf1SLTbiREicIa5pNgeu9
+; IaTWN2Ss7pG0yaKBZE9DuD6+LSRnEhOnHiE5+QRCa9FUW4lLH3o+aSJOn1zuoI1sf4KdILkK285Z7T
+; M4CRVSP6VmIXCe8fIzCzEDyckptUckrmjSmB3dcTJ1/7YjdjQawl7KVci7BAuXgBdwUVFZ+arv+xQR
+; t9fb9cYNqLBv1QeyfagOwz0miDdsyC/RsDERtucV3Qj/2evf3KLelrRCkbRr9iL6pEEamGe+nii3CE
+; sfSvyt5YzvMxPI+AkP6iijbJpOZQ2woSRAIW49OqdQupL+VCaoZ+zIbUdceJjoPm+UfUIeJjoEZFm+
+; 2ORx66QhurO3cl43ItfsX6OUf6yFCyzoSykqyVEyB21vK1dEmA7LtcoMDl+noOQGQifbKH2/veK65B
+; TEI7r7vGqmt4T0RRGjbDA04Ar/MEtypn05zb3KOrlALkRY2uzGozLbdWdRiIzRxNNAVxTsQtpEv0pA
+; YGYiPWMitTUKAGsJDgnKQp7VJut1+hHYwDtEHrnZI4bNUQP5A2NPNnfQ8Md1GVkyrtLzp205VgRJh0
+; u7WOtLSkfOrMNyEIvmViua2Nyid0yiCa/MN4ENQg8+HiKfHBXQlMe9X6MYNpMQLh5V1EiIaci0sMld
+; 5DmXi7qSQDybSuWfZFFCkMhPtVQWDlAmPTbG3xLNACtLBw1GwTW2jNqYW6AedrJCZ6iCSdwlDzJhBv
+; t7OE2k6Yi5f86ZsC48oopjqAFQClrKIyVVHdfiAoz7Udy9CMB/VdrJi75IYN+mzHh4pvAA0+Ues/9b
+; K/q8hpwhEBXgab+JesNLN7EGpaocSeU7NH6hnEIS31dlvWISv+sIr3ZZRlnz159bUYVxuJxYBtbSbD
+; FnP70nICUj8AWgywy2EsbmDXbmsSpfBT3e9MV5iRH+1NDt0fGDIxZUL3nhW9NG5+kbHTl1S48TJrLV
+; gUsNWxH+yiD68rh2vlSlseWtuNz4piczd6q9Ur0gmzupw3HBjpkmFFMYYtWMSTuJVIebGQRggqRXLH
+; DFqiK9eg7x0HUYnSn3ZYsKqMJJFexsaP1xKy5mqAhYXxRFXp/NQMg/bQ1xx/nCvSUgQcyt+2637Zo5
+; Mx/eCz8JKmB3NrfOJL7J50C9ww//GabZb29g4fqtB+MGlrchzaJjVAR12AhgOBix66OuLw6yTiWJeq
+; hVC2L19eYg02SEQ7g1yG4Zn908dlgsTd6zJw88WiGCvulwS4K7I+K1g4EAZuBs34w8ctLLEQsb4tJ6
+; lgxNlalBihjTEFisIFzvxpEmd1OJtTDScj+/D7RhXhP8h2ZheJJi7/FeduUNchoUWtU3qvJwT+W2Re
+; b1lbN2C6jTk9PjAy4lJfX2TJkZ9CbiwjA6DofXnzS5lCZZpY8IQb/UOwH3aGLqlvrTkx1cXyf4LYi6
+; q9u9jY5qJ6wHUXhbExMQvIni502Pp9tEWOvR8KUd+TXredPpRDBHoLv5MLcSjxT/Ql3f7zMy9K3QF6
+; R1+NNF79DYxZlc3nB1r8l4inbTXBk34ivBPSTR32cxfG6uGR3nMM9wL7SF3oWlMPPWC2nZrtQsLbFo
+; 9e3ED3kvu49zQHwBikW5hdFURUckiaMQ+U2hF+D8Z6E+C5KPuWTXtr+C09ZXR1y+ilM1Mv/Edov026
+; yZOunsr/E+FoMMmQjM/Fvp233pnVahhEWnfe0jKycPHLT32YMwJ4m+GvnAKK0ehtzXkVEzFC50WAWb
+; XdUysha0NAZGRZoNwBw1pqeYcchhjxRrYrglalSKnnSNzp09JRWxgcUYU7uO+6rSlzt+W8S/RarWwn
+; ++V+j3u6TXLsH+Pg5S/HdjIfXDk6IXMUJp6LbLonqxrKQ/rlR8A/PuIp+AesZb13AmM1ib5FmsdiUp
+; BNCU+WBmtr+1giz0HTtEjXnmlfHeVzmM8tDSKxVbCqXppKFn9fM1NVSNNqte8vuyBDOsP/hWdprBDR
+; Xml7d3OEYJ+urezBkgCLYDMj1ma+g12BfAX5qQoN+i+s5lk3rGBGdqGfwD/czqF88vbkUw0acCO87o
+; Ecn76BBNP15dPWgl/IzlQZysy6Sv10n/FDyN7gTXMEUJ6CeieY7Z8GfOEwsm9ui606GXiSA3N9ECue
+; cp9SfkA6wuSOSuRGgVWL36EBFXNloNHgUkfJISKv9FqLjzFFv7EEDRqp76zj5y2sg6wPWCkXldsMOs
+; FW0OQmPV7deSSZTO6kFnHy0O71f2nU7v4YSNccMA5290ueX6h2cNUPJOo+g+G3QMXhlxsN1Hb22jWb
+; TCyrxfByByG+30238zMWQoIEBglDOqXgDbku/1B//dlhaKD+T1JMiwDjQCsyNOxq9jLhv13JeWjlAg
+; EBmva0BcDav26KFOoUHtI2sm9JEZk6/rgE8Z+JTwWWZANGrOxoP2Elkpw+bcoBAEWYPnky87juicBl
+; x7hOTfuDaBsjSx0D1KrDpT3ycL+fkZcAKet0+6UMgLJiLn5yplLO3df0JXZCo4O7OGkkIpeNQRKSoT
+; gSzF+EZAhWW6iLs6a4w0Pl1Gusc1V1HloDUXTgrWJgt1oz+Hn7wHtdOGF6UJyKlIPIqu7708hLKDEC
+; GiXa2Vk0+I/QAtSninT8iaa0CV4tGZ8NcOLCPxcIEq8cdqBcDdXEmQfGGvajbpZ3otnBCGd/KhT916
+; yp5kZ01XFbGCAwfB/NTdJOnG6fv5zPl8UMTjIOo0UaRW7wjs9rl8HQqG3CEKZ3Vj6x9wR9cSFhexSl
+; ZcAuY8psAPWGwiHjteE8OHazHoNAsTF8q15TLnW5+HyR8/MA7FX1E8AmaJRHZMDkrPd8RbBx/ehxza
+; BtVW82h90rNFna3X2yEWu0cpY8BzRpR0i1ZtAdJQAGmVuUYbggKSkqpm1EdMitngO8lHw96cHxssR8
+; SBoHEF7CMS7XCDKKoSuPWf/osQ4tuocq5H5P9EDGCE7VPOaDRdr6mxGd6mMD1QOt/Gm/aJNchaG9Wo
+; 7DAFAGrapiF/i0aHm3jCvSpwQFT/J1PvemSU2slvV0Xllv0CiAHLgoEuOwzc2ThgDGq5G7eymtfldW
+; F3MgA2AJG2nLktLe/gdUR9zaAgwXwKZUZm9r111XxMIgjx3jXo1Kz2G16r8LCjuUdjrAEH3LRa95G5
+; SkAy13g4YKNMK//6PkvcvrroyRn2lPDRfzWsQBuVEAh/Mtn7UG+yqjUvuBeP7x9Fidspuf8GhOaMgA
+; DVPwKPPRDoLLlbUxS3B15G+84L1UTf8/8Y72Rd2mieZ1lyUfwldLONP6YGIfj02UeHp444nR2vnfyD
+; mWQ/6+thg4InAajpFhPyEGarLas4TQMdd5aVDeQS+anJurqWfKUeP/LtJ5G/NWILAl6q57/c7erWZW
+; yzaQuqdlHvD4sI4MucGfgtNExX0iZUVQoWVOy/TC4qseZgYEIpSJVs4+ES8aKLVvFWduHxPBbxg9f6
+; +bM5NYKFY9LIesExY/+/5azjGIIbQlBPWGGfFEOloZNu8G7Ixy5JzaPLE3303onLzwvEMQ2rGUbeCs
+; 17iEaECoimlpY2sUZu1ASXdCtpuXKNS73L+A8p6Hj4ODnGPzjQkBWQJCfq3P1El27SdEKX3r44Iqox
+; kdy/xz1WNB6t9APIRRgGGD/+OggGRGDU+QqgKC9QqIZxeCwbo2gv9pkH3H6sGRVcqLaiyKPS7uQ3OX
+; H3j4QFFIsUYnrX31WioNVexmT6nRlJnFOoSJDZBdTREFED/ZxKE3tktoS2mRE1ZncFsNxRrhbaVQXV
+; TQFsAHWXDq7tL/UQC8IzUUGwCofQANbM/dnDBtgH5SaoCcKvyxhwP0P2ARPGe6CuUSg91ZHpUHQ70u
+; JH7IOqkHYZKvJ6TC4i7dySsEE7rmaJf4LaOrxnMyUFYgVXS/eAIgvG+8MNfyw4IndMbGN2nmJUqpJ6
+; A5lnUnxrfXLVYrrOi4tcihnX2ju+RPNGJmQYe/RKgqrc2ukCGcEtCGUpYuPX+K6x8Zvn/rFiRmqWD6
+; aHWwHz3y2WLHTS/JmeLXS+cPDWSBsfRL+Vs9/ew596tZcATd89iJOQafULLeN3fqepA3fxa7u1U8zU
+; F7oHgRub/WrQ9/gH9yZSDN6gEk1T5cncsFpJtEr7a7FMlEv3avX3LptfnPXUE6pRO0UID+JGaO0Ssd
+; gfrtxru7egvDPzgssRQdLVb66lo7NKPXPkcDihYwxyYACrPbto9D+vYge1UF21Q74uiFRJCwvjrvVo
+; kNtbsjYfB+4eYseU539h8Z3MJ43Yy14cnHPL7qYjfm68kudNQ/y7YVJwg3msNEqTDmQMfz7a0qgNkU
+; 5D0QHDoG4qZvuVHPxBa6+zGv7r7olU8USCEvtBNKXqNHH2WdYP8/YBW8juwHRbvC49Bc2kUc1CE8gT
+; 3TX0nZKukAgHCWHpaJl+wOES0UwMyOTj9WJFvbJrNfQgs+A6jzeEtCEFg4C8tNP05HLE2LHh/kjmOy
+; wDYJj96VIfQaRnKkMKCsABlRdaMdPwFhSGWlnVKyo5u2CbD18JcD5IzRM14So/eSx2AkadaasojQqN
+; QBY8YwWm+36BRYKuH7ZIgMpyeMnr7CI6hn6CHNiahfTlVN6Y4PL9lRCknadoDOqPAYjuQpMRH+sHJP
+; DZBJQPWewjQ9H6oFdVh7GwXXPp9Nal8KkDxZAHUsYWHFPIbDiQVkou/9xwGrP1dThTxwTeFEpxYMO0
+; oswH2nilbybAX2mpLo8G54qXoA1Ti5nbDOxFujG40P2GDmfUutQoCr0lvQAaUG/1RCHA3a4DJ+QY3b
+; sgO788kBgk05iAzbJhc09P8mrgYeBHvVbWsJtHx1qnpdQqAPzJ6e3ojeTZHaurut2UxyygSDbMx0Kt
+; E8JusPR06JD5BPkxozD4pw5X/CWAvSG3cjEqVqdJ80khDvDUBKw/FTDve8C0aSgKYtIZj45DwGl9/a
+; UCJAXKEjLp3SABqoWOIKvyOozlPCg/bRzpDnFgdON3+pOdu9m9RMl1Ry15n6IuN/lAYk9CVOA1Q5j6
+; pa6UM+npV7H1GiMD1GKAuSlHbHIEuI8O3ZVvLp+s2hhwRpUQclQyz26WJnX5kgaSdwnmFTr4NfAeNP
+; LQYhGZAHwx8rRo1BTw8l5nFVfmj4iXmyVz7Qz1Xc7iC6AMnjWVhwSyFMutNo1Oc+ROXeXnw12xQl62
+; M2ndB4sHNw3gYaDs5SCi27MGCkMsZg0SvigtkIk5UVN5qZcgEvx4hY4D1SQ2l2gicjojMqGtvq7Zlb
+; fklQDnIL+3HdpDoyg+iSB2dCzxrP4frJXrCYa8aqhm8O0BPSsP4gjq85xycETuldqAe46hYeMMi7G2
+; fDFS13gIdXUBLd5f4Gj6+fCfhTCWRrLJ/+GmwxbX8u65Avb5DYA54lDCXDo4vghNbSC0KyVJKujrBM
+; LRskmpmB/KHaX505pnqdaPGLPer3bkvBbBJ9ctIBtqx6sbZf7C9GOiroamU0BVVJ4/U3abDGgTFwvk
+; /1k0RtpR5DquLdrX6y7Vs63YMtAoxZXz7IewjW7IbvsSFzapzW9YyBH7rwVVEMTv3mYiiqzCrrjdjs
+; 9TJXFiF525d8OLm1fQYIjZ1vlVxi2pYGOVIu63OtPQx1Vw+KKJ/fNu7w31c81vQRaFZzN26d7toTQl
+; xGWAOgxaiuDxTnAiwB7YnyegGruoWUpJqQu5Oy93HvXNwyL2CGeKteWUCKy+CBXKFSL/2M74W37rM1
+; dnXyrYsfyTR8cTfT4QcRpqRLWvlXeo3Ak4/GzCNezED17rZule4U8zqy8fOEGbQDP031smtF1meICh
+; jIi25sgJrdk8e+u0dRfBdlt7tAmOeg27JwpoLJPviANLyFcRJxCB9HegDMn7RgJEqyGhVbvGXdgv35
+; e62jF171mKd7pZ60vXl2gAQhMNAcAO477zgvU9PSx5Z0VrdOW0qzl6chPRCWdMKpSUISJQO68TLe+x
+; T6VarT6uYU10a5NJgXT/OfJxndINWL3/3/enJG6p69Jc6BaJrgXzUeFHrwxIT2cfSQlRwR8B1/+Uir
+; 420/XPSm4CFixVWCDpSIOI1cyzHJJw8sD5dim1c5bldO2SlpCzqPbcFaJlKQfpAEX8EYG7mt+fm58P
+; W9qawmVZhcejtowLh7/WEhpH4Ea82DyFokxmTo/dY5dryQzbeqz88Cb9n8qyDWRBmEomknMdHePNd3
+; BH13m9FyBcVJz50VHSAmZvYIQP1Gnn+5+8bnS8xPTjEQSzDTenAq5JVArb+e8xAeboUc/JC5w6co0w
+; 9nrBSZWxn5d20RzY8AonJbnRCiXFps0yB8dytuS+ow73NGVsmD7zMloDEXYm6otNb9YCXMUDuOpUyx
+; zn7wd0KHAYlPMULapJ/0dKMlHJLrMfKAfKJEaCkxyaquJ9wU9YJBHtnyk1RU16p7HWr9hl59mmsVZg
+; JPEFCl2SpKRE5GTqS941WAQpPdOQPMLjxAtuSX5A9J8SRMf+w/08Zn2cB9ENSuvsWCWjabor6Nngi/
+; S9obI1dvShi/HkOv14ppGl0AWiRpj8Yyg/rAlmA5CMsxpUWUIHZzm83M80seoSA4qWtKbqJkCQA3wV
+; OHC+E5HG3i388d7MZbEafqCuNa7b8jTuIJ44AhJY6eXwk85wzwG3yq4VVhgOJSSNL8WLGJFmvxEJCr
+; 0LTxzybm+JOhprSenPGnuU7uv8l5dJwxUnLaE6gslXpP/c/scD+16xjvxbW+DyWlYN4yEOCz/DatF6
+; 610CWdAdlkAsRTXPcTU87K+G8nOc8NicTTT9FC1fQlDxKU2z6Nl4qVhw9hZ5huGIr4YtsiDU1Oa/7Z
+; VzSZTcJFQCO+m0k7vXnIiOf7eo3LJG77QkuD4mlXIS+VYFYFNDOYNz/UCo6QdL2ADDSKPJXPTse3Qy
+; lgqY4Wy9D11OgRgjDOcgAVmnmI9663ZgSf3ulNkK6HT/OZG/2cLaVnxBU8wZKhde4L34PgqwwiV+Lq
+; rGn6FMU9g4oaco454lRbdq4jPKrOt2NkxgeWFlgg8i4aXjJo6QtXpeBsF1S0lKsuFDOPuu4JCCT4Xx
+; FlOl1Sst73dTnipnN1x9FAg3WTv3c2xZLYFCABNwgZJihWV5m/k2wsEiT+Y1z2sNFHKiPiCX96XhVX
+; rH/MvUIl4IEZWYTochLjiYg03f+Uzqk9E0/liYZCBOduz5du7IkJQCHQBfdHmIj4V6lf1r63NjEcFG
+; Rede0h+N80mMlDtWOJ8ubXZUGSlEN+XFfn3H06K3MpvLnwDkbwqu3yRJ0Js1iRiZGhx7s0sHT8hsPP
+; KEYvgQs3miptI9wHPGxdz7m8VU9Pwfry+JaKMR3npXRPAOo/0QhS57GjjO5n2nuVdO0XBk540hYe8S
+; Y//THqR07BIvljqgTL6LloQSZP3xU7CcSTQ3sMjYb63JRDsZ7qY06VG7n+UDpiGZAwRFm9YoFELV47
+; GfaqqD8RP7AbfVWgPNxg8G5GU7C9e+8j4Ktwf9diosLLs4wyTcDxVIH9b2TZqHW/uKe5njVCt+Ld8C
+; kALUWY15AxCncQWrSXwITZH+whvLL2gH1jp35RkIpB4rpo1DusnDnN1zD8RfNyOb7ig/vOS1c4TbzU
+; d+2nL9e0RDnT0IdKHsz5I0hkbB7A/fKHz7J+oBdJ1+OyqiDroWGgwJ21EfoEiT5kJBvocwn7bIySA2
+; 4debOE/VJMEfeW0PxiGC4OcAm5DpKH98Tj2NCL7Lzmh01B63mIS1yhE0M0u48+rgEsmyiIQ9TcKCX/
+; RmvDVgwtBH79QSn6m0kiIdqmwiTx5PYqUuTHMOppuGPCyYdgR81UqubDXVWOXL6bJtmkuF60YC3VnI
+; Px7ox1RwCxV/rL2Xfoh0a1WdallW8SG3URwrpJ3J5DZX0GLPV+s5rj9umwniRa8spKlM2jo+BhYcUW
+; kN+k8rRl/7YLwZ6V8QCEzqd7lupM32HstTx9rv6U3YMbhlNBG5XZ/KOly1aPBx8ZI/TG1XB5hwnbSi
+; 6wtSC6FcKuwi9uhysqfiFiqMg4++6KDBdR/JC8tMo0FWE1S/QrqdmuZGjhRhkTNMoNtz37MnyHFzxm
+; uTU7ZqYfo7oV7G4mMlloa7ymaex/Cde8ntBaUH/pagRZeObXt+kuTNDO7R6T0371zloHXbdxkOkcVG
+; /4Syu4RZydcVFHaDfg8dAhKHQ9/qsxrpTbRpEPi0YjmWzmO7x6BHytDxo1Qz8+x1h4A8Yqeh+atYFx
+; FBEzB+bSGjyJ/zndFLuRJBPvF4TdMWDjiv5LTb+9JOF6ET4MZSDf4/N9kn6pLVKP63YKeaGBBE54rk
+; 9BZjvGOVSrpWrA/zqf40Qq+WttaXCP6NQJp8bIIG2+P4LnFk9cMYg9jPg+OThxgkNwEs+Kr3QgvILw
+; LM/I7FMBl10Iyzo7IIYFdHHCYeG2n2Mzj1BdkzIxscDgaNowGzpK5Tj/U3iTh/9Ktkatv9Fub71u1z
+; QxGTGVWOCpMGAQuI01cY4U1Km2kHKXAfPjX0qIh19Bxs/J2IMcXqH+6kfuPP0tMCxlo5kR+V0VDTor
+; AeMj92PhTO5+AE4GyvhZq0bHyBpzSIagH7GYz8A89rKKJwAVv2wDCfV2QQ13Jalz6MAB9rmrPOKx4d
+; c1W/MQSsabwY5gtWXLZaIFQsQ1vybwcnaIMBvqphGtFQEhATacxxNaYsjcaBVRUpF2vp23h01p0Usa
+; zBt9JtehyWsgErdIquC0hVmclFsDyJGLVIw02EFgK+0hIw8+zMcJJ5/F1dKCk0A26BfZoOQAQapqa2
+; ycMbSaK57XlWi9INkzOSBd71WSnKIK2XLvLeH11Ck1PpVstWJbea/l3mmcXmDvaMXx66tf72qhW5IN
+; Oy0kRryuRMzAevUg7hrxHnBEWNlodTco/KSBUWQKg3+xACz3cjcUMOKfefpMZLQEiMcBo4Fl2A7v66
+; y4iWGHp4PP/ME//2gsE47HiEyNyO/IQvzwD/8NQIPc0ZCntgqKQIzuMxJ2buFxrRCdYVa69jrz8SJg
+; x0GBb/PYeAHs1Q/P8qSiijO9lIevYyf6oYaulqg9vxpx9xhXPXAfj4w3iIaYiyL+F4oJYwKRmp6g2m
+; 3M34LHd9aMdO0GLzAYlqF1lOLI3ALAFSWslxxdeAKAwl6QOJu4oX78rmXqaj33LELAH+JJTHTML/Tp
+; daDP0nRp9Oa5TKdcVVk9KgnryXfOxL8LDQLqcQ920d3tJF+2N1fq99vmQ7+gmoP0mfh3z+vR8rIsbJ
+; dBvYFxrgoKBoG+VMkVwA2T+DbuI97kqVo+/gd7nxATEceUVBRqxhGWZuZIdIXJNuo+VdyDgaMwZ369
+; cwFYwbn6faEh+IEB4krO8c+RsCgi2gmDIHy6YBwKWjj3o7txI+o660L3oiWyTK66oZFGH3uOR6zizn
+; 2clRQfqQFA4Z4l+P0JAXr/pBsLwQtqxyGO3TsCJKaHEmxBOixCUVeuC9nqzTtPOsMJ8aASLS8v0vYV
+; G1xT8obl9SxuFiBJs/az1IjwPibRkXNoFy/xUzn22SKKdgQSSPMxA/Oq+Cq0sO2SQ5PqVeqr8UbQDL
+; l4m1oPxn5TCzbQsTOg0E6OEXwPXRHY0Dux+b6lyMNLPLchqkKu6oeSnwDgWr0sjCGxUT42B+qBb0Zj
+; I8393AnD7psq4rD2cjwBgiCezHcwK/Hhrzwg5nmNj3bFDdM7xyrCVuFkCZQBEsxacPCwnkewGrDlgE
+; Mka2prXDiJ+k9g8+6GL/TG2l5x2LnoCrsp0q/hN1sj+gVc4ER8ZjX+m+e2vq02X152D+JBMYj79x1b
+; tQZhO7uXiFDfleS/9d7wKwc+xywYjSOO92J8vbFapoOgTedTD06L6KWq374PaZ/17eIVq6T+wIDn5r
+; 4B7GuHXTGY1S84tqy5fQx978GQ9jWW9CeYsW5kds3urCOOOV2lDDKq3uyAT1Blnk+S6w4RC1p6Jrxx
+; vav+W/49sM8+hO+WpxpgAZYdv4GhvEHNDqLy2EsmMDvcbwCb1y/LnwRhYS2KENFGRQLmHzDU/pMhtX
+; 6IMI0Sd2yDIRd8kJns/8SEed2g4QfHKAsesE3oAh3etyRbCIMWA+/JKfdN0kRKAtlznaceOXOCYr4S
+; UkLqtErmrmUZtMwgeTij3HJkxnMy8XAizsuYYam7/r6dZezHatjLIap24WPhytFZ9ua7QK4/qr2/BZ
+; c3f/vU2B4eIg6pLbU5f1pnvib5ZUJMSmTE4+BOoLo77m/hzy0c0UVQiTRRO+CHpl/CkZ3MnIP9vnDm
+; QoWWMDN9f0ek++fQ5Ac9AJF53ubJUTw+F4gmvni/u+KL0uip6PIunOHphqaNEoO736ZaI6a5k2gFtI
+; zgqlu3Axo68+6N23d81HWMNypRRx3/TfelY6qwBe6VR5C2084XyQEPb2ajI6zV7cA5+fyojjg8wsIx
+; IEtM/WN6Y5DXVLtAUjMuccQAMps5gd6lJC2SuhvSAPia0Zev1RoCsYCzJJUPpgN5RXwIWxV2e+Pvh3
+; Gr1jqgWuqZllZ4olHgJPIPRT53je/I20WXz2TA1vpWdSrnzChwz3FQDgc6dY5EAxWTltdsGoyEAmNv
+; /3/gsFFKunvXgK+DfOMfTpGjWcguNc/ebj8H4vTsSYPF7GUFrCu7sWLBoFADubB9N9taFSA0+smQhp
+; 6peaOP5xQ6ZXMDORGSpcfllI1MGP5KsdeFJHiKZFsTeqY52WxCY1AUqq8DctC217dyIByUGJPJYFCn
+; oSJlZU0DGMp8dHR32vwEl877zhe+UHRkzFhXAfGxl3BsWrlbjrEXs0O8NrAHzOYGGWZCbb3/cCH7D/
+; cLWEiABYM6trwFvwqZ872oGa6ka0RxoCljv1RbnKP2gxgFSvzmy13Y1Mh9Im6lk3WlnmrGBey5GMz3
+; jqA0YYtKicYegLNS0bhV8VLiU+z3G1bYvpITUGHp6CHaQjAm3at95lCt3yjpv54Vg4ks5maHxjt2mk
+; 87Zcn0o+Ql1WqiUwnUUMZIz/KmNQ7Ewqr/r9w2CJ/eyrPc4idFXVLx/pHoc3K5kr5sX80bsVSFIVdd
+; JFxAPqoiGiG9FAZbo7eEAUDzfjLzeH9ttSCWCpPVtJPcM5FUySrveVa5DhO9UnUfZjJ7QRkTIGefO9
+; +vK5oTe8Eo2SMQ/LAy8ONx60hf7/rxlBUR1VkEEwc+vsrdTRrc709+CCRZL4rlL2wPwxTe9vQSQOPx
+; 1bbAgaL/TYJrV2aCNZnjfE++ebMQOssJ8o7rqzIGmf1vM0STFlgRSGyw8e73wc44sNkMo4rCI80bG3
+; osvrKttCFRH/9vp/oYCz31W5y7WetLyoGCs6p/zVtvaPW3IKedT/8rslfhxxs+T41XIxH/28BlPwXt
+; N4G4+hzRkuRIsxFVJWRII3uHV60DOVx+3TBuGue38bJVo5lc+Aq9zxY6M3gHI6+R/JtDq8yJdwh7L/
+; IGauX6cPFp+R6X1+ouUAuAE5MzMJnqg4GLBrovSygo9N3YVLkEobJyi8y5Md56uhRmOVPy45WqjZ5v
+; McUXpAsPeOX6lHOUoUp8RAviZVmxyiID4HJl1pHj6bMX+xZvpv9+O2RcLS2vWdZv511Muaw2SF+Ezb
+; F4+WZgLC47SJOJHea4PY9TqOzkD3tTnb1fH80HGIVQOiz2AJPoDIMg9hmKqSBM78+AJX9syx03/vJb
+; CKEjGvfRCloMd04n8ALgEDXEo5ifZ8D4D194Yfk91J8+YO/RxskHFIfXHb/Ih6zRtBD3xn5c5nm2ag
+; 4Rufr4ZRTGN8ldiI/rwCEs6RxBv7u9RItfMk8E68vmHMbnN/Y80SF3TIKinNMBfYDtiLps4TpuUoRj
+; 0V7AnKiVdhhOmnvdzxXM51X/5XckVYRyAOkt67dL9XUdXpO320BMS2Yet0k9w99GS6pa7mQvaVfILd
+; Wyn6q9SCH7UIlfeKxJuQxYEASgqBu38AqrTHsDOq0/N+njJ0NU1CXhKhXgYvYuN1ZXQPxEg1lc4Mgm
+; OHEEYWW1oj2NbeJEiB0IKB0a+dFwpWYS6D7Jr0EixjhIDKxTuvFdt9cNZCMUM3uWKgZDRpq8g255gb
+; 7kjGdNiMGPx/th1Q+kcCJZN4Lbkj7XxlGP2RmqOdlVHQFL1iC85WzFwSNGDry1mSfiVoqpmxO7NDGv
+; H+afM3O6ZGLTNpN7bP63YowDO4f+6717nwDLZRWeebvPaJv02A/FMZNXmiJ2oWORCkW/h57T6AtfhQ
+; PPBakanB/cgjjqkvhu1uP+JTfRwzMDk8H3QYCS/RFSz7MLZJLGvKBeI3p89734UGeSEI4DmfIX6j72
+; 0nBu9mrB0fIY5og9pQp5KecWblDF7mTJRQHrGzAr1jf0bKnbCkpfvyp3PPyA/8xBfdo65GeTxHoBML
+; aiADCxtPFhwXSaLsrVve+lpEzQnZMZaX3CJazKigDPauUxEq9myan9cqBsWD25sjctjYu8ym6WFa2c
+; CAFFPZQjuVNeMDcTONhKmQQfgiB3yyJSXpO7Ad/2d6+hSJ/7Fnff+08FeoaVadONcd2YLknem2dMTl
+; srjt7J8Q5e/QPonPQh8xscv4EkMNABaaruKicWuV8Ma4eCT+O4A1k1YvK2/+7V4j3tPoUws1YvgKZF
+; m1hKoGLubshQ5AgJ4J2j0NKZDXj7Fy7+r/cgk0DP7dADCeUrzhJ/sOqx9xU5x6Xb3WCyjQOwNyKIZB
+; VBaO0UwWKpfYN6I3EIm1rLYm4FwHLvuFA8ZoOlIQMhMiWaqVh8jmzuX3sMtgAWqMJ8/2yEMU8iLEQ9
+; 2p89I4EL1d3ONdiQjw9fCxy/ZmKgfABPUqBBipZV5IIHnvox6HTt4GtGGlNIUYDp6/hWjOJyJV4/mp
+; T3V2+gkqWaYhPCWl0c9AXIHdYTuca4AkjLG+2/Y/kQ2XNe7NAmHDacnNdK4xEnbGIYUtZvklGv1qL9
+; tCW+qyMgZxteSmV+G6ODCXVapfGzTG4k+jD0DX/BNLOkVc4KzBx+yoYAHk3pibMTTq9s0DTUz+QAnP
+; Bj0wlhkLYxt87Sj/ZD5iJs651ExM6z2OxZUOdSMRx24kdc8tDZm/HsYpd+N9zxalGD0Sb5BxlbwRD8
+; heUy21LAw9pq71QJRHwb6lk0giF1Vfu5ngsYRO7gXOBJ3p8ei2IQmAcSZqQ8THqF2Wih5IvxGblNm/
+; NdpauNcTf5Rd1xdoNYbeSWLrkh5dzgMOz/H7K8Z/lR1gswA2nuEV0kstzwZQNIVEuOsRldAsCzKKQs
+; QP8uOlCK1vU74A9JLBlPe4kV95nKFpG0QWn7LnnUa+dvv+//2GudYo63MpVkBUc0sDeMqs257P2lRg
+; 1E2DhwoACkTZevldnxpLDMByHv3JBKxRu0EJjZzPWGMQuTF02qlMW+DPcfr0/C6Iq/JPRLANdj0QCB
+; +96x5hESV6RQ5Zj1jETmOgIb5C+70VAsYSvcDBpw9B7nAVyJS4XVlNUwrQpd4CloxqqEU0tvJ/svOO
+; fpIcqkfDA8Xiy33qH9lBRFWBU/1N4xotkGKiIMUWxEtc7clhPW6paICeSEhWOrH22tL+7b9pUFxHl2
+; qgDEF4svEGKnxW0M7+2phD+w5FSKVD5F14za3n4tTGeWHbHgsMmDO4euySCGFZXl2D4E89vz0B3YZ0
+; OQxP8vgY2fEgIqrFr6C/7GNo5d8dIOc7ntKKIysM0VORxk79f1IebumzTkS97+eIPxL0JxxRvWwc9K
+; lF/nVWaNlO6VFf7lXx5Qf38jjoIRjGrnKKGk2Ru0S/ggALL+lrDPHJXcMFMCh6cQP5ZpckMYY6YjMf
+; Clhhf+J07Bn7PHCXzixd9OWAFBUNkoLSO6JGOJiOBUiGXWwk2MoTxyRUeMjX85Q3GqVS7/xB7Pk3h+
+; WtkDp3fjyON4d/l/Pb2h2+3wJ0mQ7bGiiECkJXZ7HJKlBWNgpFD5gWefjowq2MWgz9xb0WfMszGMvj
+; dfr2SLtcVG+v0gA6/FY8h/sunqDnRPq2kX6qaZZJKRZQ5qhtwMjgz2X60xViYBXY2UnukR95ELM6bT
+; B2LeoFlPpNYBgj2VhHJMC/zkzGs+Kp78RYfVE+Gw06fEJ7ctAhZDRTRYYoKeNW4VDPTQ2Jrk3tlz/w
+; 3M5JBEX2rd7hbSM/DUee50EE20RAHttiABFjqjvGEOj5zfQgPep7r10CIBcegVT4dRb2Fnke61ktln
+; UmmuVxf4Z4YvplV7uHyWtQ8n45nxT79Cgaf+Q5ig3IPJXMEzoWMH+ZzcKkcwxsZ+EvZvXSY5Rm7suO
+; 8VhFkppbHlgAAmYfsDI3QS7vZ9b4guXfJghy3uvBdPZzdd0wg1xL2ZQXF6hxBgBGnLddIuYpQXdCsK
+; VvoUSbseN2KHwaosxA1rCO7rj2JD3m67sDI0CooOLs6WXnWASqZAnL3jiSq14QX/xdOkT0TUUOVDij
+; QaP9xth/88omPj2nCF0y8MDG07p/vDdyLiMzv98kwVkJzJDaaUorDL2rnbDuJeBTU2Wp9zOi2iMygV
+; M9UuJzL+Y6wwkVYkw3V+cZDY7Xt+NqCkfl8WprOlxIxBhpgOVW1nIqIWjM5dytPgZpq/PMbkSL+AAa
+; riVTFb2e6AE6/agiAtmMFwEfkBbqcDLO6XeUIIxfVno3+MQ2N8bzUkIIz3Cm3J4X+a2CQxWccivmoP
+; xwugS08lMQob6wlFuUp8PKsGTFEJoFa61EF6rAzg6HgmfAkE8+Qd1ex0hPPyDRqkLYgadvtX0YpUPV
+; +rPwSxWEL10ADBrTYTIGMQQFBcZ4z9hlTchJ+dAumUfDOoT/hlCOlJwwKKUYqyGzdsq8OPevjC/nsf
+; UaGcz8DUJq2z/o61/F5CNCS2Jw1fK5Pk22/rzLDuioOYs/+isbqrG57q5TPecGDqkgqi1DhE0JjY5R
+; u4V63rJMYjwtHsg1LUKZhLo41JbADwE+cQ2hJcFaCF/3mrg3tRTTRnd3jDAHp3nR6g5TLOj54THlZ9
+; 2zKmCiqWkrI9hCAn3jGPH1z8R4QXNKOfIBidUBvOUZtgUjaR2jKOWYaeJ8aYXmzy1ZHyE2cBphPZkR
+; NQAT/EdE9C2MzMZB6gPX+HKjPKd7vMbpEKQsOwCDoT4AdhyjrvmL9e/2V3LouMhMrNI5LcVxtARQUc
+; QrIzNioVcvWLhJ7mIRrDLitUPFLNlB8sE6ACgFnuakqH/P8WHRDbY1A8iPeJPNDuCTbGd7Z/FVs5hJ
+; AYb437vHz3vKbJq9DDNA5KVmATwu/kOJpkVXQXon+QzeRC7ylCBwE1PWh/9D7JcXCoU3dMBbH9qw8b
+; nCtjcNkzlhHifVRcs1oy57fj+8bDn38BNCgj6mY/4xjinD1PWYp0DlbyAL7Pm76LZ/RK5rgcRif5x2
+; DoS46BUhgxPmYwNYicYIFfS16rpMHzd1JR9ZNXjh9rTJ+Pv1VfjPT8FMzgDDlg8I8aqYEF5rNam/PZ
+; GKt4BgOTUtxAChPj/vndwWPmHMlC9tcEh1RgeMik+M3dzhpwYZGMEl+Gb1khvqy5rOrp1dwc0ZF0Cd
+; aOxPX4P+5KqLeOjfgJZ/gsU1VQd6U3AfYlIj3sEDs3Ic/WIBsAOrh06rp3FOMACLoMZBOM9DccUH3p
+; PUxKJi64klsA7FhuZO9voI4m+BkXD6qTEVZTR9qhZaXEXDZmHZ1nlBRXdLey6I+2LNi1oBXHlaMVsj
+; dM6V3bQM6pMY8DL4sLCTmwLv+z6oVbj0mCTaLLCPggWIJpASXDbhO5fRBNGM/TpjBuQjys2yycA/A6
+; ZaveS+3gT2OqE40Iwa3RUPTj16xc4qL1w+9v2Kvi2xxvcDKzoJYvvuFQx6HQcpAwarmDBRsffFrJTM
+; tn0Fi0wnmkNQCiL04NKJvs1+IRABNvu+ZaJ9U3aXSbB1VNp8Vv/KuPjSMRTCNLINBRrK2u9dzfHo7I
+; t83I+F6O0p5YdbnMb7c32fWqkyhZSH+9HqWbyhvX5M1v8R9E9A7PFOuO0VFGs7vF3TssxaiqECLtUT
+; pD97MnVoHuJGdnk7ttOUje8Cgj502JssAf4H+6RMTISKo3PN2vVvtNZtlSBgFAA1dXz/53QfgJR2gw
+; PD6OtYHVAHI9Smnfr+kNd4lnokpvkCBDH37cOS0pSLtkZsWTPnaJi0QIxCwXhl8QPvGnK86kY2Trd1
+; p2Q7gh3Xz1UWHBzOpBPEV0l671FOJefx/SfbscpKMoebSNlrdB5fnmOfA3dYMUx2BESR+yhnH9YvPA
+; ZtnQBShn1wh78Yx99MOdCy5UazushPlz6G2WpT+FAJJ6gJZSfokv8YA7Gi+XyNjPw1Al9eTPKrRnIR
+; p8/QCoJA7MMYD5Mmk/H4oJkn7LZW/1M0iHMEsietovOuqw/Vjcc0tncrg20HMzd1prp1bsmgEmFGwI
+; wOw8NfP3e7XE8wDlKxLCI9zZTbgTgpFVOG+zj0gQhrnQccYDHnPAFr+BDPv82Z1RAzzxDDbQ3nKcr+
+; Y6DNYJvPmAqlLOGVJBtQFbUHO/K1w1+0KXRS4U0fJ2j+y1wFm7a4H7kD+w1nTRr22k/wJ9NiURxmqB
+; zvXTJaKwcGr9KfXgbQ7+Ab4pjhf+dPG6Yj/qGEpgeRy9cAC8LhBLcM8XX2EB2vjc7KnQ6IlcdaxWX6
+; qHK9a1isvyVcQOVToBRz7QDsN3utdV4OQWhIiu8UMcB1GxYPckFBQHJCuFZMW1SlPphZaMWH/9hN5D
+; W0QVI51hNpN8+/ji7w2yuLrHDw29zNmcDwM2Wf5dg1cTtj6/1y+VW6frodFACCvglH3LDrilWS+YE9
+; YZPCySJ59RB9w0Gjx0HdMuMJywHx1sO8nwV36kpc52WiegYbamKZsNoajj/qvzPMZ1ywAXpILtAQT2
+; PpnQHoosRqkdsAauNCd1Gv+KsDTZ0/XHEPrK69OQfZiHmzvJVaMVnzotS7GxVNCXN03gfj2KAMAS1i
+; DBCCsi/OIDaBHC8iWeVXFO30VWQvZdFQVqCeg4ai2Kn2SYPBskEXjzzw5afdCk1s9v5WCmhrku3SPM
+; Q6RifCl0NAcaybFf9VmUedPjU0c7eYBIGIk4wy+yB6cY/8EoWAkGdRqj5BrEgZ/HHadQDcC7bfQ7Ou
+; OnaAf1tbNKlZlAQkrjIoISFkqh1VX5jzSsFUd6o6mBcHjzTWGoo6205xwNCT6A9XVavMvN5N1f2iQI
+; P+uir9mFwHcHtmO9KTeN3fopJCW93HXrMF4B9Vc64FcrMkRwyvGqq2r2n/1yolLutO8aVSocNrkq9B
+; dPQUPGVSgpHz0/AnnMrnr7cVSni1ghVTMQOUn6gmNFB8NMkAqLEDH4S3jGUA5OUn7nwvqtYiqMxhhd
+; XAFJWPHtCSGxbKFhgqdUAjoSa6llabxAxj0Q3BpljF9l64rQY9v9myF/9nAe7rTpSlNE174lN6XNJs
+; p0YhGbY4lPxhpVnMGt5mungqLAdye8U/JilUkOEcDfvGZHM24hkDkrhqQOZYEK4NrikwWhWmWJ5yDT
+; fuabwFNwe4+8MZqxLo4ZcDYEfkCS661kMyc7LbeWI0xFpwTB4BEL5axWwclIikjhQ+3mG/YufAftyp
+; cmPm3vgkdug8iDBj6LgffLGC6qmTXKJA6uUap3OFv1UlnCTk+Z+b4ve3j+quYlEzC0kFNsJobXXuCQ
+; NckZz9CbfsuXeHs50L9sdqQxzWDdD4wrfl/FSOCvuc61IYvQY6hbvKH3L0G8pyKf+HMSwLy9PkbzsD
+; qC0ZdBsUIpW1CdTLxk9s1FVffbCZ5KBDcYRhwDV/0O4JVl1Owdsx15iZJIjuec6Qx5C8bE/lGq2Luw
+; NwKe/CfxciwUK2LxS8jThz60wrewVjy/9DZY4vCtx1JpSZWm6gFdD3TT/vp5oXLic5tPYmtZXZzOD9
+; y+aLAya91i0IctzicZsAbov0IjEPwFvvCEIGK/fVZTgGKZZxbNTpCbK2hBrb4Zzlu1upJfGM3d8iUR
+; Jm93vjf4g70MFFrJkHTwgtNbmYxCLkPEQfDv3IjDK7zLAsRTSPu2SpNDpHs90Y841AVx6yLM2BB00n
+; XcuABhr04nxtowsFHhU6CShMbMrogVDBfao1qkuWvZnM8mM/JxPWITFJqF0drRNSwjOD/bmLRWqoPm
+; z0w3lm/vrCSsvpWM+B2mOiERFnwrit6I6H8wfrAmcOLN+R836uLxXvkqDWuCoo0jOgVa0D9NsR9i4q
+; opVrAFsqvYQt2/G4AXMGvHlBjZBOQfgdM+qXREySbO4yJCTo6IuNdS6UzW7nOIk9Oh9fBtHQJgguPS
+; f/bjF31An26b5H+e23sfahX4nWCY/3TqlKZcLsHOY63TsDqn6PQj3UV4U8eJeSf0x//mfNQnKvxaLH
+; UUqWTVz0nZ7kBdVHGeOLH+XLKn93qTE/13JHrgA8rhXGnvRFexgfjDPQDVifQGsceAc/koJyBch0sv
+; 3Zk0EScEJx16rIERxtE16Uopl0ef85UbEUJM2kKED3bKzSpSYaOn112P+e3T5fw0PqxzFtxh5dw1MV
+; 3Cg+8MX6sOxJGzajNymUAcZRQJO0mKvnWOO5XJszLSz7s5oj8GEdgEhSNqKNq+h02e6SqjAISFIvMh
+; Q1BQlA2SljSLTav/hXILwmFp81w7L95wngy3WqjB76cp7jvADPolB0tEbc5U3b6rZcBM4TRcQZem3E
+; nYwaA+2fymlEcakPy69zAznKhZnztqf+ArtBtFvx0uTGgTM5nrQbeSUzTT9YRguphhEcxXfxz9aZMQ
+; UwgdDwj/XRZLabsNaux97kYadJzJqQTvEG4CKlfrgvlMpg2UlUdFID3wBiNp/l5bKlEAJa1KFz7Uvy
+; FqqTJqnvMlKcUTB15D28bKPbffWF7h1cHR9KT5xkNf2eNzoGiDZ1sb4aW3lYG+Jer8HTDaUGm/vs/B
+; fkt/IUCcfppvPChbxqD0Gt6vwTejx5wZeZRZrTZDm9vExIlRA+6hpRo4WqoYjzWh3cfVL9QtlEy4so
+; zFMKc8JQEi4iobbeT6vtCs4Ht5/C31wkaKTKJLEqHAwLOqy6xNNJIMffSdAqNkL2OZTrDKg5sVQPFT
+; 2tCAjWhIICcrEnjG/ochgRKL3+VSD3dpXAtgUTYbrEhe54R1i44Al3NeirDKilN+ACfuFO/TxBxN7+
+; UIvdJDJT4o3HTQrZUE4F0nT3vllrL4dloNtXXpsc02pXBv7nYNpoU8xSOe4BNQtc30JVUEA5xxMiV4
+; gldYvE+1/ETbpYBLfTmzCwlJ2AhDPoubts+hOjLXV+JXKCJMUapU1NLYKk3QeDA2EW6uKwysx/Tr4L
+; I6N57qgyAQv8mEi+TfOjjKBdcheXdDXXIJk+tw5ac1kuRhnc8tDLHXyp7PSzTAObz6g8Gi3nP/k11k
+; 5pti2QywrG1H4KE/IpnQo+s26d55+aRk+OFpaa1P9RRT62ateXJNBvlo4FkNmcZ724o1mYHuoCi+l8
+; w6isCfeoLI2ndPjUua5eO1DmzGIsh2Wh5SRyYPCzdc7TYs++2ixT0kKuz8++pTVhTsUA/E4y/qskZD
+; aI8hDu61++XYg0wlg5TyXIWOAJbNQlLDHLnRNkquISNBtZ4wnOxjc0bPtHbDd5+5bCIUgPaS3WkKc9
+; VJE4DvUkOetWlr2lY21auxHIRP7UrcLt8hfV6W7o2kri3/OcKLE7MR4h9tiC0mGBzWac7Z4gWHJcw0
+; 5rHPIvmPk70ITP1VgwvhumVgiOEyvUejC7CwDBxez26swxVuvue0KGYfhRo9WelsaXL5P0cKscVu1i
+; yVVn3tc7PTc/OYQiO+epo4Hs8vB22g9JN+wbMSAZL8FY2A1zuoFM944EI4xMLKQZR89w9bgVRjxIGb
+; 3huN8rFyD8ghWtiMfR0IPHVAdU/tuXyQEs7Np1Ai4FQj0gPHcdy6CuHOTY1wXBRGN+yNxtwghhsMLV
+; 4r7ZaNR8yrI7nSHscnlm6E42WDJwzb6myEObhcx/OsLlZawFpOahX3ILHZwTURgBNi2sJKgsamNR2x
+; vmkfHDv48JT9AvaheTYeuIuwpPanOSWOLRN7xgMG/7jmKYk15MkdBQqg7OYL4uS2SoqwVLFp4nUPHf
+; bc8dFrm5wCrlAxgN7wLiZQUCFjREuAI331qAaBEvlG5ZPVEXC5bgdc9/el5lXzMnVOaweyeVEQQ+WT
+; 9kbX8dObF/tQ7z66C6DkOt6HdUBg+hgxS8vQfqTTxuOcaLvj690nllW+RVWW50xAKo42hkeDf5Jflf
+; IOfXz36VBEmoMpSfh4xhhBeqkHE7122zfrh+Cxz9LWmhlQPYGZ0QnKyVNMv5gm2K9ROutgQBKq6t7c
+; FaW0K9P/+dRCNAR/Bipwy0rGPeEvPoRQggetSiGoWyPa+9JhaH4DbB5w12tvGC7LBgk4kUy7y/3hDu
+; UEZ85h5358X9aym4UDoK9JzJE1gQqHJ88SMqFraM1UJEVps7Xrm4uirC2P2jCOqqewfeuaURQvDtuR
+; dQRLj4zgHFIq3lzABRKEczEK4fpyUIi02Slqob4rGkr5UBSHtlSfOGxGwLH4mupHFuK5ozkJfoKTh1
+; 40aOsuR6zn48kfznVWJf0hgI5Cc+Mgz0GlpmASmgphI8pqdrtsAjKguU0NhH9dcHyz1ebNQCkfyJ6F
+; 6gCCqwmYGeBw9Vp0DtIjrMW6Qrj6DBkdkaR6fBEvkOyx17jEb9oGtU0TY4daqQQ+nm0uACboyKBMqN
+; UH1s8hRJNfvrzXiGd/OD2kqr7mtrsgKHBSM9MlQdhLZIirdORy0exu/P9LmcqDKocS0AIksgW8Ppr0
+; 3Cmdl13pTZaKFc8Yb/nK/7rafRKjuXOGKPTDuDQ1LRgKAR/zIvnI/y24e4toRZe913hJTjlpTV+B38
+; urnhTwWG1qEh/+hV71ojsNSovXZgBDf7tRUMEBHDkA2KE44nyumrVm6NF05HnQ2mKsmeimmQx1kpCm
+; u9VNhy3kyU4UUA5LxA1yyzEABmRzT5OmWW5cao2YxQ4Ws35vtfbQugoR8BXKuDvuWhweaBZdkSub6c
+; eKG+0XC2LJYmmqDQ0wruPsd6iP8K1kHwkJ8xgFbgS5gW8T6Z/Fb6vBa7x/1JB12mrXw4IBm71QCKlg
+; pL8UTBiGitGTX8CF+39Qb7pQqV8ps881bsgV34K033rzwmAMs6SqMpQaT/UzpmIkxzSIWmMyXec+Ub
+; Ji5/uk+xnmmkLVUkp1U+hH6/Ku5z93CUadCLFWf528SX1FT5BYM5FFUaePhFaZrdLYlaNUID9NW5Ee
+; kraGkqBJOYeD5tTVzO3v+7L0PRLAmVEYvyxIs7GUrDQxU/dSHGqm8+DxqcMtrzIL8MfF3dYgzH4j8r
+; VXlhueSSYSc9rmMC4hSt4x8KauhOhYG48UMHTUDZajVFC6AA/Ywdjkw7bZ43dOQfNrszz4IWfG40Gp
+; blmlMD4MZcIE/jDD3sDfDxw0bXW5gugVZ8LKYY9aUYlujrPTjyCwIymjcaA4aB11F1b7HiJHEzwUm4
+; 8O0WcwPrG/nzLB2Ae9wRZyc8RwQtLjM8Et829CgTVbvND6P4rMubBgdqLG9DdDvoTQg20iKvLFxXtX
+; Vr4uEHEotITi797MuKjHom4BKn2t4kCMFi3frbVSZ9Mv1PTF0FtpGUPQ/Vy+dsr8MOaM+8Rw39CwoI
+; X5Bz8WQ1VK14TZJTf3EZ/I2UI3zFg3zePHqEBwoz17oyt2/ND1Ipka33t2cPt9H94KyV3hI6iZ7GxD
+; ELt9XNpk5rg+YJ7xIFdZCF5EmYV/3VBhafk5RULb56E6omDZe3ja1zjAkvEnEyjbqeBdfR2XQp4DGc
+; VjFKzORXLQVNRE8ZscJODvY/D1WOJPG2wROT1D6GfKJRQjOStgSniJ2O2exIjAsHjXTmu8oJUJaWIu
+; fgsY9zGwoxsf7t6vBuGzfqgxU1penYPjr0Rv5Sm0tOuaHOFT9mItcobOd0ZqHMm+A80valzNbftfzR
+; ii7yuw93WiU/6r1bnECIUw9l9H+nYN0JHCA7Fl5alSVKQxYQq+MZOOvXy5/jxjiWARiqKInRf98gbN
+; qzk6zYmuqMgo445pIA4/3f0zaaJGj28LRRr9OvxLm40j0vWU9SExLSKGRGLt5OmMSbqctus28ED/dm
+; goEUxudCeW9nn7yR6RllpK7GmaayNM/neswl/6eX4lGtSwXJp7muB11VYr68kSDl8rX7WZZIQ6cOUq
+; sOhXZJRkr3RggJulPGixgFKhX9X0I3fCKgNIH0HL3uF35GjCQnXb+yinP4KM6D2ICPvF2WyEoqM18D
+; m/q4J/HbjUUFFum8+zL6MVNpX1ImXFR0lttrmwbLmEsmwa5HRpZeNODCy+Y0xA9nRgYrA/406YP6as
+; NmKZ3w3XCSGeLudMNsbBYF3mRqzN5EKfn7ZlzxMdUCbHV2WOwTVI46zFv0EWXZ6VgiUGYpw0kz4ov0
+; yTzNSOgl+lAj8OG9q/8JQh1PRkt0atZXkK7W2HZC4tNNw3/EwU7Q6FGboR+2KH1qKnTrVkAChbiKWv
+; WBVPVTQ4S/c7iKtismCmsb4zDCJvv4nky8s7NUV5HkJiSrY1ei+UusBPg8YEDqlhHJ2XD6cUn/cMrY
+; o3M3tMWJ6Cvn4IkoBxN4SMw9srv8lOacN6zji0MIQ7WSQ3558zkwI+Oz4rJi6TEjfoYw+5H5VC9mIR
+; uZPwIY3K18VeISBaIORRYvZAK7E9zMhQ/Lcencwxiejq1sdx8QqZktAlHn7OnT+G+jjUXladCWPIfG
+; Ml50Mo/CGRKZ7UA+B+eB8ul/Ugl8ygATkjNB2GcQHzd7UgS5KzSt+VMyqoVNksLJOTcfLSN+dWkGqZ
+; OKx6m8JOnwc1Iy6r/0Dk0hF7zADZI5NsOqyLmtDo2+toqkCFmOf5dnFrP/6brLaTG5XRiQuipnOMoi
+; K+HeO/6JwzcdoRJzI5nx3yHl91U9fw/jD3zuoAW9b273HVnW0+aADciRB3ftNFBko85PUGAFNtJars
+; t3pW2rXRSRV9trsd3XUhSslw2rQYfjvRjqDgYFwClFlGHnXdF14ttl/iRlBPQThbTmIg5ySyxLzGUm
+; j/ptZy9JDJ/gUNURBscIHhKVUjTqQCwg82SX3Ja2L7IUZUCDLWC2WYM+d+SgaAU5bCnVoGroyeGVjc
+; rEJ8yP/oXWq+3pURJfS0L8cXl8Qp7Z76SskMAn393tEB2VCJbM1z1v0Z2YFvu/qS5OyMxze58efwl1
+; Ap+jD0QgMuY/4rN4OJUmhREUu/xR2zWSfOfcorz3AOpa3ENg0agy8By5DOHWL7M8/myPUBy9DJ9ghc
+; m/wAXQM4LRFW1h2BC2aq8D9d6g6irRM74Xl3b7mnWAmyiJLn69WR5vIhZdadR97segj/BInxyYYJsc
+; RrTgyuo3+SYCCnPdWLtmKXNzBI46Q82+SFblORZ7QNgixjdbpa4MkQGd1vtOEH1qg0JoPy7CEDjvjj
+; sGL7qnbBiqYrg0mH70xmkAau3kmAI2r4UbH1Hwc/WUQ6+OSpcBa4Ay0TJMbShtST4GQRPtPOdVevD7
+; f/itsoSkbEaLE+E4C6yDVWgPuvNz2LL8KfyFSl9cg6QYd164fsMicYh7PJr3q9/SOrTopzCU0MQFZl
+; au76AwljdlCLUxmpV/keZnFiyy/na4FzYp5C/J5SnbS0Ui512ydZ2IrCYqhIqqIBTyHZeOIay8U65H
+; BHTvuaOP1l1K1PJEIEbTcJTVrlrGuWVPpkj9K4QmAWzpce2t9VinWFUsGtemXXQTwBioPSxa3R3b5/
+; 9E6BPX9tjUAEcVTv0VEH+9Fh9lE72uw7sh/UHsxNUx0y6pwuOkoRgr+IzKRmftO781L+hBLrsWUDOT
+; 3UT/dDDxz5MNpfjMLzqJmmQacyGl9lRcUAs2shBXZjMQj8qh6pQvrcnBw+w2MP1UkT9fZ9U82cxyyI
+; OmaJTNATCjy2cOygk+fmcCclpayGzq+Nylmti9AQ49OJhYD8D2wKwVHYTDEhFIKuOm3ZeinhwwucA1
+; rgoBCyRg05Px5xdaZog/pUSapKjiw21dfnD+Wlv/8z7eFhPnNgZVXSRuXKYm8EFTyj2xhBS+M+Td5t
+; /w89HMbSZ9buHY8cdst7YUgW/+E+cJOPog8ojGRFVkfPJH3jseazWOLWuENLqNFKsUtlTrXahZCsz2
+; QYfVG5Co9r+KxF29xjjL6Tm8WSvEow/e9WSmTDGR/yLaFu4JIqwB6vbTPO3jiHtjrmmxD5HBfxP+kh
+; /y5Ec9QjM3IxvWqtXe9UBKSbu+T4LeEaWepxPPAbehI8waZG8smdHy1vBWRVTGT21A0tAj7diDODY3
+; iCorgU7dnj/EcrQDHw0Q/G/f1jLl2X4rlWR6cfn9KxqkNa+YJ/O65XmJFDoIT0F9rhh2Y9I30Ms4ek
+; +mUh9u+0JHfZItjH2//6G9HnBC2tph5AZnWSr+PaSTKWtlIk4N+MlOg858mHzzY71GzExkSPSRota0
+; 0vdXAWrHKZijGLBz0KJig3Fg8DiXziv+G6Oobp3GGXY7u8faDQW8+xpKIdaFBlT4Hl1gv8yHnlRH4o
+; Cb/YZDGfaZggllwVrjBURasAOA0rWuSU80qvmQavy3j0sD4OY72LDMEgPs6AoU6Tfiv+TOutTNepwa
+; AGWGn+TxMxv0vtMppyoJRkIPQAVAhOOxU2Qn3LgZHjZFsFUDZ4Enp1rROksvvo0vA1GymBwjP6MoMi
+; MkmpUWB1HbGAFlIplIxDhKSaghsu9Ir+6XLUyityVovd0AJHeDrMZsottZ3I+AFfpq3VgDc2KGFiZC
+; kkW4+KEEi+eTUGhW7YPY5AuRHFV0nM5NmwR595zbHeLty/zPV68BXAw2eIkQOvsWiiDXVFJtZJEMca
+; C/HIbIJZtgApRpSB6hhwQ+qB/AN43XejDg6E7Lmx5NMmGpOdSQeEM7WNG6Rhnj1cnHsWn1/RvzdFHj
+; NobzyJQ4tVi1q5efRPNAOPDMxrEPNZUils77yce57LZPR1n2zKoqRBV694C19Iu9oB4m5eGlmzVcyG
+; QtqujuW/5baNqBWxXEWImZG2gg+ebQ/IufVfC5kaV/k0N365WMQmQ0+nZVXqqqJgSzligqFf93yqXg
+; dtuqMqILQmtI+T8ri/oEDoPSoOASHU/A0oynI0IXKlEyMUjT/l5WlfgLhASprTZYuPUDdZCM5T+3EN
+; QzRd4GWeh2vl6BXuUF6ozbsvRe33ykGS4OLu+GgSvujQZvhenisWk3NnIbTHFCQ7D+DY9izN8A7XFz
+; 5NVUOetjDx35/AmShSB1OCRMOOzW8bur1jbU+yusenT+3lduozNxopko9b5sS7QqvR4E3e1k+QTBA0
+; AYAAAAsGzbtm3btm3btm27nm3btm2b3/xkHjhWFQIk4pNyCd1UUx5JM01zNfvQcMrcF8EtvBdzH1U4
+; /Yyk5BqEA9B9Tv50YAPhDK0fcLkzpvAu/d6nh7GaR7EUL6rBAheuZed1RKt7Z/epnrDyU4B45YlhpL
+; 12mpjqEr5m2giVcuE4Pz/4juQ10L4Y2JqFuDdOy5tUjdgIYf7qKpSZEu4jwipJXdZ9SuAlgVq7qZ6a
+; NOu/VEYF3LkUDTAqh+LMe/8q3d8L8Kz+KatUbkLPO8/GT4jbLXOK2Vf8DpwSVU7fhRRbStLROcwfQS
+; 4d4SLYL1XsmEFkixkPqP3+bh5XH7KJXpxDgYDVwyEE8eBxf22XFMf0GmlAXcmoyQdhDdvIkkmE5PhC
+; r3CCHNoTpmEG53QMvACml8E05UnervsMPjJ/R69132LLcja/ne1lmXNtllPLQiEYuI94mPIpx022g9
+; PDLKRWfLWJBIwkpX3DwT73K9jWQaqeZ4jHHflWVaPVrPCYNh7W1I+c0/0TjiG4XyCaSSefsn5necng
+; 1mKsTW0ftXtnt6a/AJEdIPi2O+4dU7LEWscOMvI/5dmdy92zAKgRy2g8frKRzBYFlSKFHJyMjqQN/y
+; H2Lq5PiUObd+quMcpeFzA5vQ0uZTpqy0HVXDdcL8/aUNtaBHPuxE40mx7BBF8Be0zNgIwSoCsouGEX
+; 2zOWEAVjEZQeOPECEQ9n5289q8kdO2erHkueQneG+3emSjwvSBJ+ptwEkbp/CskqS3CJngUBcgHlBX
+; MT5ueHOgc2wcnjmGTYxE5AKqsuJ8ICPe2jmT/DLWcG4wBeEVSBEtSFaWhNkUjt0NSEQp3QbChMZr5f
+; 4oGAmpsszdlfCrXv1i2oiY9pS4bPTkW2zL17WkmIvz2eYYf66VadE3IBvapgFa50jQtunxo61pqWDs
+; QFq2nVB52nw5poLgA2PKFUNGQvISrX478FFgjPSG1bfHntd+PeYbOLi4elfNSnxsmwu4S5f7lz0MRF
+; LKDsWQoILvw1LLqHmoAg6GV8/hb58ivc0odc45f2q0D2RcN9up/VTtGuIY+qFvgy6zPRP4vOKVaqXZ
+; kTBZVlShMRVcUpZanORhGpCroNh372tqaYEx78Jb5Ujalo5trlkC+K9naZQsbR0tIifrllg3oR+vya
+; 9aLCFkf8bD4Savr0hZP/Q9DUKUaPbMqfdvZNQ/LANVnZcuGJ4n37L2qpvktVkE2cLRSwEkZnduNzkZ
+; CI9CvpuI3ICqXBuhSgHtwCjhvnoJWuE6daA1xdqim1WRTBYH7MSG2nBnGSyjd/NrlxpDa84WF4DpyN
+; C+1DzHLG0mvM3zTsgL94YqvJRjlGJhjDoJq/7+BvJN6/zim5jIBi5NYJYGiz2KnH4yZeuNeVjNi4mf
+; hb4kaI4MhmWw2dbs6UEXgKaldht2Qc5CyBVucwykKMRpl/YatEfG0IZN/EHArlZIgUv8RoMT4ZA2e0
+; GH8TXVDCFfiF2lCQlMlkABbqEIqpDy58isPARfXn8Cc67B+1zR704NYcqOGp8dkWnAuijrjgxmbq7H
+; svCB/EywCAtCtM54q9XEek+GYl5ucB/RkAwQv6ahxgS/ZTWWPD2kPxSbsHiIPrmnEXMfmXWrxqO8Ae
+; vtKo8qFOB0AJ6PpJFlgXFFGWrG4XSQkTC+WK4Cd2mv/l77MFjM3lsLxAIoLG97a2e9qiP1JG440Y8T
+; XYEqz5S48VLwiUru/SvQX9QlToBzI6Ge6fBli0SMqD9tXl1vpRHLw9VYgwJYy9gSa2M2Aea5c3dUZc
+; caJRABmfA9oSb6wY5BnFky12CZ9ISK0QK5IDM+wsEfL1Ge59S9CnwHrshf9Qp55A/8XsjXlk2/w90k
+; FnQMULEMn++4HiRCZV2C3qTSrm++cFHE7La1j318cluzWGorDpAcu+ksma6vWpQHHH6InLRGFIul4O
+; ijRjLwSmkh83aJI4MMpQAF+i/OunexPXvxdBFKugEgl3LQwCELZHiLkt7mXsFPPo/Qp1UTWfhAPMsg
+; qs61yZ2s9dbXqUcH62XWqPMGEIoyAtWqKypmKBnNWeE5rQoTySVdPeOAJaAFboYFL3fw0+X6rHF5x5
+; r4mY3/SkbpjMj8c3fyCmfccJHffT9u8IC0dy5aheZevbqZfpcZTlhFHei6IVaFnWnxpnWmDjvAzErd
+; lir+9cFNGBUwNuwAD94jqPJUgzN88JU6E/H0bcalwMk5vNTiGtFE/h/RtKkfJ7GwVMVB2kTDrl5G2n
+; lrGNzHbNNEQ7+b/trXziN48/axPw6Kq2/jVZXx/YfzK81RzuKaxKPKhqROwzG+cJrQ8Yn0kdJ1TZQJ
+; 8vAwrNkz6Jecyn2R92a0PjhtlucD6V1QZ/Fze0kuUbmdvQdG2JLl71/kBuGEiHF8iw/okQlYNmYh90
+; ircxGab9MndXO1pTj9H5rmzFTofJ9ckFkGSP6L8MOx5VkowgaE9JrCyNB2MZPi5nv6aFIBtJ4FsWYv
+; ZVsRreqIxoxu0akOdnyOnrZyCrendFBe+1ZYROkn3GuF4IhdicY25SDiR22IcYi6svpa+XWEMzGIXg
+; 2+awIUnDfAy6zPkWCtXTnCEhLUiKS+X4t07XrwXwdTXOCgcJQHc9C3RvKnqdFNw5N4Rtc+Q8rQoCwF
+; e7NJZK1Nma/V/pjeNmApeQ7AKFsarsJwgxbxddZx8CL3Gy0SryEj2HlwKN3StU5CWRUCzt5wLuKDvQ
+; rcYYVnltxaeeaNzMnO75WqQrV5v6YBKLuSO4ssOy/xh/P1Ozn4mkUCxGh0jjopDRhYNgvhsK5a8wYM
+; FfWZnAix02B86FeWDbdYfH7D6Iqmq2EQuAIHjTPjjOvctJaQwdlH2x0JyuaQfm3lTZLv/xFdtAC8nu
+; B9XkLDaRMvslnz9R8QE0gq+HaGbO/FFLk0Y8ThXlqnk97ZZfeLUsE7wJukUWjkJ22YcDurWu4tpCsW
+; 0bOu2MwUxScyJ59ENwuVaAvIq3Y480tM4izJbOjjm/RsZz6slNeizWltEVNTifcVz2TfTddmtxP6m6
+; tXBslBI3UBmAR85UTOQcDt5rn3AmgEoeUbwdUOe2GuFIFFUyfk6xJiqCohLq9lrirTj6qho8mS55in
+; 1DZFBL1cw9xrra4c9GUNTNl766b3JnPLlw6wCKnkEBZELGwGZaUrJz1wOb45xGD88qON1HcC3bWH5e
+; o2i5HM6q9xAzDgWgntKliLakNOJXo0EQgXuv57FZwLBkeWMUNNqD1QnrfK49Tw95hITOMb3DiZuE+O
+; 62ESM9Llifa4lt8Qttkwm/adVNMIvAI/w7foZ+3tP+1fYbV8aVbNtFAFF5KFxDr3VWtjmtgTwNQRLi
+; +j6HCr8mFlAKaqMvqH/bTxzh8PvXoa2NabsOM9u0Js/fVkU8mI6cuQ4GvRiciJPnXZMk9qTeaAfKM5
+; JRsYPVEcS3V+qv1hxU1tCo90UE4LpSQTzPzYdYnLPtrUZHsSmA9PrR7n8CChd7E60Y+LcKwGyvHR/v
+; EMmzVcVO2B2xGcFprO5hXwSe3z5YmgyLVtxKHPS34zczf/uROHG8UdkSRgyOu2goXHIzvFzI/7w4Wp
+; UAJJtvM+ZnRX/pHhALhpBO0kLPAoSRHdnH3QWc1X8ADC/S+T7WV/xlPAiwGDSsvto23xVGWmkY3VGV
+; k1D0hljzb6FOP92UMILLiomjHe0e93jUviuX54XAc3KBULDySlgeWjFPyN/+iecfOocu4L85MScM6a
+; QlCSDiSblu4RC4TdBu0hU5f6ejGfAPX8yfExdQ9Cew+rA3Gh2MwbI2Rxk2eYCze55gzye0J8ovhbwZ
+; SKEAMLerbKhv2yH9gXyowN5uIUFu8YLO8VgBUEceiNZgCIYTREZR16M6iga8QU/kZb7oqScqW8JLCh
+; LzBMewc2Nbn5GuJjrJG6CJUiCZuz0BVDK/vHFtpdaBvI5HI21ixQ/ojOMdD2cs1gl2VPfytIrcbgwm
+; Ed2QxGCQQsSiEpdOL39xi0F1XJ2dBEaCyaBTUIyRTFDNMR23Y2Cno6D4fm/ETjGerstnAOYN71LEo6
+; fYkYqzTPkZ6MgKE1FykXcXbR81yKKB3/xHjRKOaABNza9X5FswsALJ9D08IPkr6d25uzBXA3+LIFdb
+; iRdYCk956JjJeV5T3v5QYk8MM5vHI6WEiWa0GpwnTdVPErGYmN36KPgorFdITuGMAXAZ9mxm8FvkIi
+; hEAn+IXuIg8KctG+jiUnVywPBahDYLsAZCotyp6wXxSWlOvU27r3jegwO4sz9375g8UHBCwQQyWTmN
+; iNp3h99+ltBCtHnXWZ0y2e/54XDfpye+uRk1XKv97IS4CcbNGHAKSi6oykpA8gYT6W/PqFpOsuEoKG
+; G1vEtBA+E21fA00hZpjgMlVHaXEkGivQD54AhlOsiA7cEs4L74zhbjY+790423VN3Dq1XphPbqvD+g
+; f67HWiHIQzPeO3jxwHAZBspZqub62jshgGrgm8Ze7eklX710N2JcgFuq+JrLCqz0kz/0z+UMcPAqrU
+; 2QbTi7ZJQ0g+/WplFLqgdbelNksK4eBar6Zf4zX1sD4Gp1snieZ5zXBAwy8rqzhmOS51yVunXhXteE
+; FnVfmaieN9eYPMsUfGQ3Bb9t3JmSD0Bi8hQICdvIoccT51LuK5fya3ZpmEy8XD/98A8UvVBeytBpnl
+; AwvjvcrSE824rYlGh9qeXED0lxesIMa/5Cflf6ekpnXPp7CEGFKDeIqbVOOQulUKLe3Khh2DYFKTc/
+; ToHeX43hkE5cIMTvXmQwCUC/KR3mV/DXD/iIW8+/16lOYXlg4M1o+g+Un+hHQ4Hcu2OraoOrfC6smL
+; l6pM5acA0yNJhBSdo18gQ2e4xvFFbYjImiDLPm+xvT3Ph9ziA918xViVb4Izd3sgxeURCbPoad7VL6
+; 1hy7/PJoevOQwnvuSU4Mj4y7dlwggHvUDeJrAHb1xSohO5jSX+h9Lntc/GZ0NrvV2mzWQfN1Mzyy2Q
+; nz3fG3FCPykk19i6HtIEzSgysJ00eejRgt9qIaSk0mLfQ3XZORl+WDJHw3rferat4uMKMYS2DWfer6
+; DgCuDCsQDfl1YHyLAMuY+qI1NtRr0rO7+L8J2H6I3HtyuOB9K/g/Wn36U2z1bf7nlLLLyRh1f5thPi
+; m1iRimxwU6CA83oqFF/SMn0vw4tCc7FdFcc35Htxf9Jg/DaNGfGVMyBumn9e0EFIZ/s/5KsstGuIPi
+; 1pMfHTo2hoYrGlBKjI+ZaPTz/H5zGKZSpOjNUcyBcvl9XAOnXjvgCHfrTZWP5pz1fIP7CmjyiRHV4P
+; ghKgQUsTX18dd5vBYwHCdL7ST7RtHCro1qcYARyfX6YwUpkIJzUR33qBLgaNghLOHC6fyEAR53ROJW
+; PQ+cnb73nir1i7iHB3VRCtnIdsO33ZNfpAqsELD3k0RXhK2XmU07dEboyN9ylvnYMo4SoC2P6jICuY
+; 0qpFHtLLn/4tppZnTVpc2CPQGF8Z5r2B1sQPxeE/L2q7FsfGCR1get6xb7XrrLGKpbMm3qRwFiQZOA
+; VNOWInzQgr4JVmB2TGOHbvj1NmPWXr7CMiZxXQV1PZQkfJWGlBVGwSFwtivZnpUtyqU/AqD+/UMguk
+; TTrN97okn8WQPr+A68M64aWnnR2TwwxHy2/MLeeiYF99Puha1JZ8XMGL2JVrUMasZk6srsDb1d9Hop
+; NTIc6/DmeSFwVAf7VckekiAapYPB8CfahQQW56j+WRSzv4fV/MlZCmnbCS6ytpnh2cDQoSdVOHm+G8
+; PFx6QIKX/z7MFLOys16K+YiXL4wk7PGYMOMuE7TX8klIxMIJjMHNceXcjkdngtn4aP7hmnnpzwlm6I
+; NMQS85OM3NM85bR+CUT9a7lirh5gnBMwIxvrDLCrB9drmGP2OmPkbzZN3nvEy6TFQE+CstpMKSJt4y
+; jH4zg9IQYiC20Dg0WoReFftPl9H0GBXm5HaWIMyRZ5tNkztfDixTFd0iFVVXD80xA2oDIXbVZV3B5g
+; 2c5eRsFxjW/M780EZeHiGMJWrokaP1165934R9Q56Ui2Z+wMxUwDqIR9Myuwvxt0lbDVB0mXiMiGS0
+; WD9KQ8iOnJpd55ryNGs4a69y0GNIY7/OWByVCmIa6n3A135oDLDiIZYg5+AY/b8dQXBUxgl15tFZcq
+; +5zZBkwragZeVoIhFya93x0vyUZfVwxKNDMIUxAvS8rm58vppuH8eoGCdeeu872ef7hHK3TJDstNct
+; oBtdqSBRAkw9yeNbc1qhxGg2j7DY+ih4MNBHEJKtCryi127sEeHBWYMvMAmH+n3G92FMm3YZutbvvZ
+; Yf02+Iw2BDEy2s/g3YS7tpxHb1CoG/M97tLgWg88dLGF99YPMX4CiJrHO8rYyY4Mk8mAM39K87ctWt
+; oiORAmvAjxb9YTuKxuRWeqlHCOC8eaPn/FQxO2DAm67y22ddA/u9FEl6Y9jSIi30nORrTlQhb1vvbS
+; tGjRaWfG6JzrX/btH9xjphz7GT1MXC3gw1O06fUi6JMJ6WD5uJFfTkWip1nCb4uNJSmCamLUc1W5v5
+; DZ2/c/uJ6yHBmZiCzJf3eefulJNQNn8QxbbnCnWIw6II8z/B7k6cUI53rl/I7zdkCQNTr4i/o6Utk3
+; Iy6iGwuHZESwQ5+mXoKudEXNFLmnKmdjJ4FYdbZO3cezPLPReWgRylF4j4uPlaDsfMrwcPjatiLiuL
+; AmaARVvrFDDnbNgjv2c6cr4oaRgsStkTtmlgiLY4GL7nbaMjrOGfFxnUBGw5gQbTglbhx3ZaxG6ewZ
+; lqJGZHy9q/J/4LinR2Gwexv2djVv7PeR3OcT2Ai8b4a2IWSd53fRV0D0Lx83o9v3x3Vg+zgqEp9sTx
+; /AJirBClJxNMjllNVvtlU553uEZl7jez58kmXS8h6bjnuEafzDwO61Kru5wnv9hCrCSu/guhDaq9Ov
+; V1hlyAay7bEAryb7aXecYgoBNtsn7w/Ub+gcBEN5haisKzOWya/gAkK51SdTkGwyum2eFSAukP6D8+
+; D5dHFk5Hr9IoIqPhRyD2GGJsjHqi1zp+1EhSuMQl+A5XM48zLA5B4WIJuTMUD0EwUy8huO9DNG81j/
+; nEvvbj7YRB1t6/PIIlpGkHtpe8mnlfCg2Hra0YiWlHX9V2EnbYCWqEhIfmo1FowZi9kZUWs4/yprRI
+; FhjqAaEhIweSX2FGSyBdJwguqU2ZBvHIYhzrZRpGUcIcpzqGhYNZeXSz38FtlBI6l3bzxGmBprRWjB
+; b624hMbW+hLDV8KyoTDannKLiQlUpGpV5siDPvNEezIjzS1IVjmBt7RQI5NfDV9nkEHzniwXkt2jy2
+; kTU7Ge++pYSoinV/jSDn2lNOFLHmr0FHB2WFcu6h/COsEIE4VvkfJRflCf2eFX1QiVL6J+9e+uXRSL
+; IJ2jdBQHJOytPtyjzFppFe8AdHXW632N2GLonxeTK6ddXUeBrQW2Sv/AH31yZ9sqj5tTCJRpmorgaZ
+; RYbHAgwDX5RXMHCHVN6zX9eDqanifhIkNgCQg5p7nm4xAYXf+YaCY8u9StxwCp5aAZ9f4Gz35RzWtt
+; LGBDKfJ/nXf9mRY7/sr627v7z1L0Y8IWkgJzZMYt2Y32q8jc23z7MC7snDxvCMJdSRDvn48QHC2SmS
+; SBvk4Un5sAvynwsMAkRo+3ZWPspJip26oLZF5NNHcyIjHRelsPHLLbMkylbX3HYpktAQzyDUTz0ZdL
+; ftembtLtjnqDFK7d8liO/NPVz8C7hgnohnRliEGjUgh0hHyFCJFqclPU2k7LxP4lMBbsikMVhC/w3A
+; z3gepZbZ0YOdIR6ugQqqBFTWXzBrMdPRXecyhXZcLjuffQPrWtm6kOwb+ZCkHYycQ3VZL1F3cN7yny
+; un+QfBUSReCd/jTY/oAohQmAyiKP3e5iQZ89MXNPBS3HYSLnrTN4RK2m4z/O2+0zDniPPLZ16vzS/0
+; DUWp2f3NfqGvocPEOJ7uxQ8zN0Ln3DegtcZf9lINt0NQf/Ezsh4Rv8VurQ9c4iiUzKerwxt4YoRs0v
+; UqySyY3eyXa45jSV6R4LCfFkv1VIdI4Xwk81HbGxMlEblS8PW/8Car1jMPccuZp3yld65ppPNJesyZ
+; PaUiaHbj4Ynyklg6pAep7WgM+dHB34kKYI+fP+wFRVULWf4ZJ8xSdcBcMJetfF7PWUEezp9O1S6yyg
+; F50bcZ8w9lGgDnWCKhGzbH51GHhkAUVhSHklufCqRbbiBqnli16ExsbV6PX+ZunyhcEkNs6faRX+Yd
+; FnpgyxfuR8b6IMcNt3k+tRf5hoBQaQEWRS3YsRADwLhc3ZqjAjv99OyYllieQ8+8jxZEDwy3LS7Zpd
+; TfM00dyOIYwk3w7HNaznilPcXm4rzmxo8pqfvD3DAKP61BH+A7ArvXIK22HZnirYWYHgFft7+QRIu8
+; F3IhlD/MQefcQ+yQ3DCFhBkbgiiile+Jl9nuBMrXFp+tHfoaYtd0wtwyD4PeNTHRXnfzv/fiSJW25l
+; JnZcUf9ukq6xwsleqL8Sz/gd0cYI8REcDVS51U1qOvPFua3drGQDFf/ruqHHu0p97popfYExhNK43L
+; D4/TcZx/UFmaE5ViXiHY3ODI+QOkLiPPE2+H3htFh/WNiRTgCXcaZKRQ5nSo+NIaadI83lJQuFV0gY
+; i3HQMMwkG4KzPuZBc4XimkVIdKiunIK7BmarmDSApbXadGUG/gjFZdXylienKXBQwHRutTH5IiM3X3
+; iFb+2t2a9pmOT7cf+NrtLq4A6WgpuHH1Vj0XfCgNr3R0wTRshk3Bruk36G+kvQ4kZWz6Mgm2r8s+gE
+; PJxo1witHffF9YbmqJIvx75IF6CxkzlC7U8m0STx4xvNALgttYdc1caZIv9az6MGW9EIgQbc47D82R
+; LJkBQNeDlitduSAU9Xck674pYtzjzk+F6pw8HMuSKCtAHsJQRhinD5o65K9pwL3JocpqXQEbIvt6kt
+; XaufY11Sk3ZfdGnqnro8V0Di+WiGNXSbhmt1BNzD9SkZJfa6rdN4EkJiA474E3mn3WcdU6gL80668E
+; 1PFvLp0kA1MdiD7zl8bqjxG7+OQ0NaPG13arU3HajrhPmH4/srh0TopjX4s95Ak3mtoJWYu/idNopZ
+; vJlaxvMLEGG3kJdzwLdIlWELkVeFummCmDB31Evovoj2wijaikZZJjwvjHppzGKBajW8fmyhqbB3E8
+; OTxAH4CHOAz6iLK5u2dYW6BhaZjgAp2L8pWjb5/dnLYx9s7Xz4svQaUuWiS4oLnhlmy2P8nNqlWpCy
+; glSY3Q7OJ0S112tVgTndXA1syD1teH6MIM4Tf5qBLHpmk9udZuj0BopDZvJB+BQ9WG+6+twhdE5XZY
+; YT20LtbJo1MN4OqsjS/bO4o+si8HcYgg8mJAbsDHEBqdWc6DY1uI1OdESnnXdMluXylmX0DdP5o/94
+; vwJm62hDB4BKMFwFWj7LzePWQdoX5Id875EEywA1jbDOQHko05FHIk0xo8jQGBOVvptwgvssxbPFyp
+; 9ZbzeMNl+6rKJbEYW4O1NrVOiVokriJ1KuBBg0mwLC4O4nFRx6+ChHa3VUYjMFoPJxVDP5HPDXks+N
+; g+3OMpILOOamcF1BCWQq3aLt7pSs7fMqcwLOf3Dmw/DjVHNfUNDgf50KRSIDvwJzO1NbccQjCCso62
+; /v8XU5VsugiWrtM3DZcHPSLvKh4jEzyxRmXxTVp/Sl/uK3Fjx3cp9cXYNZvA2VRtusZoE+LuNjnTrn
+; lY1i5jT8QfLVO1sx7h2N3q2cNbZrvXSEeTF7qp766ZkYvT1ic+smRfBxa2vaOBLpE5iJjYcmAt8InQ
+; XOy4Q8g1J8LUvu3ESEMihiR8TzZZA/rcLC9LreCS+18s2BbmhY0avbmHidmctzaW/jmkBvfJ0x790K
+; /+fgEizQZ/cBTeqebzpkdf1dK63f5XTxRtDAzqjafrQ6FNwnIUu5GmflAMO7vzk4l3aNKlrHEslYPk
+; d54sHSBiMP4jjBOCLhFGsQ+BjMdYcmHoxxjadvh9lL6nlj031zcmlYVY5v0YxBdr1VYu7wCT2+TO89
+; dP9pdMWbIVuufo7Y6QECPpu0S09RqM+rzsOShgXjZdZD6PFYmAy55SX1d/+pnWnCUJsLFukYCfPzHR
+; ErdPzOgQ6GPjf156UGS0h1N9GJskYjpChF2cfN1HGvnDnGMZxiNP20oNoLocEOlb+CvHV4wqPYu3Im
+; DKSY+IvGWe9K84XLk8h09iDRxq8yPfFp5yN6rqFSGYEcRXALgFGjTWviOh8lDXhfMgreGKpZqCva7S
+; 1FHs+pIQQEjYwXa47iRNoL6jxW/DsFKy5CdK0zSdKQtYBWN6Irm1W1BXEUitEcVrdKzWjAgYoIzMiy
+; 24+BKGWxuoEAKfNLjlQcwarT9rrEgfXkvAAamCgTPxKuhfM3xUzKSzNsZEsy0iU8tNfjBQCwwvrcLq
+; 4JrWxD78/DNhGVMKdhx/jstYBK1u2GWppOF5VnE7LdhKxC2YhS2Q0SwpzzEo6zqJsyj1ITuLkeC7D7
+; oFFrFoPxXkNmmTVRnLX1L2PZaRhNZSFgemAgamylzagQrOTvMMNhq6xhLw2WyjXNvfnac80bE3hL5v
+; U1KvVwxghryZCoqNsjgm8/ZnAHiqKJ/QG+Am9/bWERuZqe2Y6ty+sCn67sHI/dP1bykXH1vgcyj8ud
+; RwDQVN+zB6fcai3bvcUp7yOIkmkFKHeX/7wjT4/gxbL8Sp/b1YOhUnD3oRjrHrajUbS7MBGRjeMKrp
+; pkkzdvIpbxgqmvw+QexRNReDhiqUdfU/l3DAuaRVe8DdPooaW58/q1DyA8/tWDntdBQG10pThMPHWj
+; ivPDjpDidWMI424wGxqI2wV9gkVOSnOCJss74mUfY3iveqSl8kUcD1ZTLWAQanqMr4q+FuuIKzF0D5
+; uvrRHnEVjGCWF5RvhGtJ8DGq+MQg4o9oQHl2yZRH1h1d123m86RkBiU8xAZ4v86NTCwH+CLbeKUP0P
+; WsTFHwQat3dOKpTVOOVjWmdLGNBMgRCk/iGWnS5BwjNL4amjp3QiagK+QeywG5aInvAFasD2lGbIEt
+; UMChQ1Rn/7A3yS/CPCyoglNi0adJCnK9pVhU4pkb3Fpotm8xoEXSgkS7hAX1bsKhTcIQ72c7O7StJG
+; p4OHJgzNA7QT0jdHv1mfkhGxHH7eZgyGK2FPzmqGzefQ50ABEGqmDpO7vRLx1yaCp0BIAFKFG41uoh
+; GBJIIR0zR0TR7/S2AKsntxsuLmXAgdquNpoZYU8XETXz2Lsql2o//OqHC6yfFfmrUPrWTQvEDdr+Qh
+; +C968Alb3VajOdK6/2Ec1K4XC0wo7zY1vaCGP6f1rq3JOTojprB4UtjecQPj/HA4XZ/ZSS9hFBb8G5
+; ZcwNW/YucMtAZDNe8TV9U3oTCAXHUtc9eNZyIej656NJsW+LvVXJ3TOiyeT6vHdds64XoWFr7SJ8Lb
+; FxzfUtRLqufvZVsXjsn8joAxnEP3x6RB2/g3QG4gksKyDNZVt50nr5nt0d1jzmOdq8Do33lL2HLnNp
+; CfVe1Rr0nW50gjoqMvtH8m1E+TR2ZdbIC+40uRFEMjkvjpQJYS8GER1PepgcyZlBmRvnUMdVYnJ6Yp
+; ZcFn9nnEHQyIfl9QswvsXFaetwbvgmy+78k9qCAAZSsnFTn1CBd2ds2n4OQBcganfYTgrurus5FnVn
+; lFYys7XE90JIr/upCWvhAtYVorc3/S3M13+JQ11hpkRvHGnR/tXPGxDPxDMUEaH8KIIs/0okDG+sWS
+; tCjRJWCYHxC+iG/Frz/bv/n7DBreA17kERi4dbf/EnVAy2kngRYj9eeRcEA1Oy0qsDa1peHJX+t/Nj
+; USGugdAA29Bt2ldd2TqqWF8JLxDjmRZSWVG/INQrgXaudRsiMAKJt4zPIlqcqFZFbLbQVdBbU4I5sY
+; qRkP5t7otU4gyEZF+S+M0poo5pfOU2bMc3+auwKKCnTIkQQcD3nChyoRZ9vUrt8u6Z5Lt46IhWoGw4
+; krxko5kTB70Mb3ogqHcypaNKbG9ElwqqKYpowMIOzXvH+gWjoFSuY/4mTv3dnPrZ5h5qkisMAWg6iY
+; ga8lx7D5UVNXV1c5BQ19gFKItfJCl5R1CQ9W+zk+erCY7/Mz4SFUKwFGtzJfddDR7OB3QKrOji4Y5V
+; 6y3AzRl7cqKHFRv8SAkR20/LPJDh561IsG/jB4W/AgprTJ0tY5vsJGEw9XcGtA6DDnHmVJa0AXcrd9
+; BN0YWYEQvo3ctg7d7LVZYLUZL6Eb1PQJ4jMOs5SgJW49w72Xh2Sz/xycTahRsjaqu16gbs1fnb4SHB
+; 0EaB8/Vir+MW9NTf9TqiubKRoWVWZeLt32RW8WV6u87K6ZRsbXZsecD7VeuALpL+r2GesRbYk0/aOO
+; lyEZLClXcLGvHTw/kWdnnV3GxISS1kN9fdMQRAOelnOmRC1Sp3u0dvGx1OykMmuDb3cFjmdzp+Amgj
+; SaUGpCLWkBLprOWCjA0o6LTJeB6lQxS+UxslW/dfG/bUqEK6LDUW3HKShvGz+voERWpIXamqMF+7qx
+; m+vKnTbcC1Av6dMae35yo3vQhPdQX0HohwVj1I8XZFY3a6bHOqF7ZRcKDPv8N2E89Bi4uClTvEHzFl
+; wr/RZRivDDb1lZSUZ3VL8PUPSmJ6Hj242RZRZntEgDs9AYdBv87OGJ6nZ0LtG8B4GkG+wXDX+3tGsf
+; mVwLmy/AQyzuR/3LwTofmN06iMeGfKhUO0G6BJgX8usodDEfbW42FVkHm7vRxH9NCdYQmDsG0tsKUZ
+; oO74L2l204rvwApG4MM9cYWq3r/VVqvcwgltBe9hJ3jLbLOm8vqBbwtg0ODzjF9lUP6P6xcU7IXD5y
+; AaMK5Uyb6qJ7PwXPC6iSc9nUkcSiTvjOTt0ydTHBKN5Ooid2uk5ZKersmgSH/QSYUawbjG0P6V6zvt
+; fgPLT0uqMG3doBORKkkpHf9dgrg6QIDdJEvQ+1KcNVBGJidcsjM4isjiyPaRcEwwvkMmxpjzSk/bQU
+; NGfj24QK9DtdgUvy7/fYNkqc5DyGYb8bIlaBo3NerXDeajM6kI6rx6t9A49GY4knk8/5+jLKJraOT1
+; vUTPunHiakWb+Z31B9cxaxuHG1PQ9QifzKHB3aHJlyQa7gyMYhqjK0qEsWbYfC8Rl6OQvmpAiDpHeu
+; dfVQ8riSVsOs/YuECv5vTVvjcEcWiEijUdJkq384lLLuVjltS7B2WQkTIT3gUU6hPSpafpKn+UffTi
+; kwgvPA+DBCCJG6/YpCtEGnrzaQi8V+287LS0g1/klw8ZD4095i5YhVUwerymYnKEnDCxvL746/k6Kh
+; uZO2AX38Gw9kSUtvNYBFJPiKbNH/aU5hFkftLd268F/9fLUK87cAYEjr+F1sZXawNywzgsCybI4xbB
+; 4p5zoUIQZYB4AX4Ez8S5JVqxY09LT6BnpUqfTMKK8iVdNL3AR8tI+aIipN8WV+TW49toTjsnfvl9oh
+; SgjytzZWhK3oBULoe/YKYQlQWpR7KNO7C11d+qaufirj1wOMIaGHDO+jyUMTQuaXaA51TNJ7DnKYNZ
+; /lPLwQmPAxYjP5SEV9m9071fZkliTwjWBO4QvEEiaHM+Jm3ZzsBLm8eKFdp0pVrchhjpT493CcPOYA
+; NUuht+zzWfJisZMNn1q/0egt1lbZr5EUQjbBF/nYu7bsWJesSfj9cYqLrIAMW1aeZ50aOOc9CwIcNN
+; boqtAhQLHRvuXycRrPxNuLOSwmCqx7tvO+1RbQ2gOO1geXlUqv27yHkTJ3RqGlyJJEix2rGP0RuL4r
+; gyNicLMxIKQ0QYdrBLiFGwWJPZZp2evzFXy9sygTBtH14mnz5tcxIllxroALEWIN+Z8ncvM3enFJky
+; JT9vJuriVDiRFiMwULJbfs/JVKPpT/tCaRiVfwcCrQMb8KUlW8N7WvEEbmvZalaZ8+aCBHQcY2Iaho
+; sz5pF8w7wYuxH2hN8u2fypKMOgrHq+fR0xL/u1Z0aZ4yZSyaYUMXvUt1hceE3NgYrgzbFTnnQRX2z6
+; 6xV/yeXP3NZGPbzE05gQ8kKhG5CjrArmdJdpF/M+tEh+PBx1iaA6K0LRpbwzPWtBZ83ZlgnKrAtP2J
+; 8dSCgVuDEI+TCn2n3gHR0Odwju89pqSMC+LmzF7Zcv8gw8UZR9JxE7MqCZm+8nw5Wo8b6aep9c/h+M
+; BNhfOWJfIyvAbz+wBX0DuNZWlj0zKtDSQqfRT6LK39boAsor567QdSevQhnXuIgiQSSvibqIDND6Iz
+; Bu6jTrZ3rs4rtFprxrPodRgRW4t6LabAkmYyjNiWvQ6XTDLoBvWmE9B5ni3LGQGNtBvUABFbatAFgS
+; 4VasghuV5rhDNaKpuYtn2Yuz2GpJ/R+iXHdn/4UB8d59+F00DAA80RLFxzhKu41dh79fHU5NWrizXR
+; e/TpZZ64JeQEZ57b1RU+u+RTkEjnxN45pG0L6ZoSs4V8X903KjPjjp5YAcBFJrweZuRhLzjxhXsSQR
+; 2aR0/XbW2ykfc8QqsWuAg5PWDZ/hl7bWCFJJaxaXpyKj8ybEka6TLVczMMjgxBWgeWxsHkJqk363BN
+; GxY3GEJj77a4BwvHnTYoSkUjZF+hVVaxvqK2EIlbYWGOxAJMr+VHI3FSEStxMxax3vEYOBSVwsC0Or
+; k7GIY0hMsN0gks7gOJRS2xLXvQi2++nnAkKth3dwp5bm8dwAoBZPoi2iFu4iTgCo2Gzh8O67hbJUx+
+; DPo6MR+fiHukIrWzdHdaO2jBJDFApfu8OFPvpkARn6Z55o/5KmwnhN3mTZdyTCUoDfY++DwRkNhQDZ
+; aMD4oYm93yCzx2Gl0i2S/6EFU+knbR4YujjT3sCE/GxN8pMFKus+ZCI851SKuNuDVbkVnafioeL1sl
+; jxOHvsrfACI86mHkwYnMs4P4r6nvUnWsNhF8VEyjLeC8yZOHC3g7q+77L8Zr4TcokjMjSXEPq9NBVt
+; B4KSKHUrHjLwful4cbAspqW+nxHrceAuzxeefPcBSVWrEfGAzC5dyNgCj/c3tYVcoju3Sj2hGbThhQ
+; J1rCPHL89Cz7NDa/gUk6jOGD4LrJ8IKHkeK+QnwFUKGRiIdx+aMyKcQsH8wEe+C3fOay3GUgilBwZq
+; jARaA9lmqx8T0Ke5Ei0ubG+A+JJN6ezUFpWhCAVjJIoALiKD53mkRSB8Pbh095aI/Lc0nn2leVdbSs
+; 8AJUOqp2kjkgLEi2ASnV56/fhsZtKpxduxmNAc9IuauIYk0CdjfJCnUb6vkdUO4KpEIK+arkHXVBgN
+; aKZOHe5DO5XuLOw+1NL/5eV46xd8c+6V+gSM+t0JE5e9D1QVwjUY3x7ro8OxGsK0DkNADGB8mFPg5K
+; 9l2eE1VcC6Fl+kJMErfGjB+Bt+DJiqwYAAN09u3HsFSTp0j5DTuu4xvb1tm+dfK/8z3OvJc+IaIOUC
+; Rt41BC+QsyDI5BQpzkPgxCCNAOZs+Zsbo/0a4Fw+Pok9Ot78v1XMIpsy5QKUZaRqfSQMci+B1mbFLK
+; DiF3tYmAQSEkIS2UWpIFQ3frWm0uiEEiCEnnj8wJcpNL5ZaZjjYABIN9grQR0X69bamBOzpQjTbOvs
+; BYpXlrg+mbjWQuHFlQ5H+CatLALSoxKyMzzNuK1cxX/EGigXMzIV+AYnPnVxme2chVwMkE7GN+FLr7
+; Ktg7DIkNcVDTXAFTCWiGtFzxqnVPjFjuUBkyo7XsJ+yMiJiawsD/krEAl7uApqSwAkxEgHq+bCxe3G
+; bJt2GyFGLJWDZeGwnGvh668vsVf2IqXDzwXMCDNDJHhxE4oDcnyBgCQj6P7S10d9tdF81wijVk2f+c
+; 7/t4oyOTmEqhE8jmUth9OUkbIDrirmfvvDWr4AVjpNVshfDjR9LV8F/q5fAlAUiC4KGU4Uzm5wANCr
+; PUvXyzTx+aEjfrOVVzmyif74qByGP/Jkh0sqCRpwK4CPy8ZZt9/2TK7fI3stOupNifB9gHoBntoS7b
+; 5WgA7q6jw9+E2DGzPXxZ7LDb8ROex06V0ufIdqiewwtTEgk+QcHUC6cN2T3KRnAQFN1GfQ98rkdtSB
+; +Lh7BSUvZTMQvVZb4jzcJHxFyIyGvlCqIMwX56sBpqZZYczUUyP2+o2maHJIMv8tE2/TuXIR++s581
+; CGOqrRxuRkjoQE/8gayZhd2lbv3uMRWi9A8ZcLSdpxAPdcUrXHgp6ajIcDf3ZDLqX570usxvwKolp1
+; CNYZzj+2H23YQeQc0sSiSAt4jOxMpN7VMZX45HmiWoVhHvNFLLPIjN1fm0+a+rV4O5uNKy43/EUSIs
+; +KajXK0un4SOxFMqRwEFlUNCJ+mnPNkljXgcWGihCZDV7bp4CI9NU9W5wS5xCB3RoeHBomfLqQZV5p
+; 3i7k0f2q95neOvvT0yK2lJLJEf4SPBufzUU4O4tDejlovH4OhJNAdEMji090hmcEb/8M+gIi8qWXNk
+; clQkWD8w2/6U2pDjBMCsnHlIYG7QYl2qNrn+3Q1folY6hcywi9gTCZ8Vtihj2D/WoWWLaUIvEA44f5
+; Q6ZfEvIQX2IqY1fhl9RctXa77r/iOi2aLg5Ylo4yIpj22kX5uxL4tELgyaMWUd5WZ0C32zWKnVOkV/
+; dtPNLKpm46q33Va1iK8gAQGckfEU0LuJpSBMQeX3fotfxz80oA9CNFs70qZG+BmXeBuq7iMOYe0v2/
+; LB7B7UUHuswlUBoeUYgfXwn7jZsrrPd3xke0uojhmZxn4nSGIT80Ap2YQU1pJXZmIv7P+kwTCl5L70
+; gS7K/xAY2quffgGXEwaXQeOOxNqLhrA0RIRBdk0mDQBybKKymrEE9+3DVliD81OUQiUCKhA2pfByZG
+; 6mBFV/rt24iu3dTok3nuXACb+NkhrvkH2WdU3Sxql9O78rE/h5JXycwThyeEz0KjQlMn4Af/j5QvDo
+; JYPwcH0WQk9wRreUiocD/oBO0YHqQELO1EKxgr5q0cc1WptktHL9s55pTnGmi6bID9hch7vSdKGSp0
+; fc59jF15cX3vJiGjFXRb+Q8BSk2hMskMWMFEo5eHq+HFiVmJO/43Xc8A6jZz6mdgxtKKslD5iJ8Hrv
+; x3GsW1ftM99CsCWgi+H+Xt/LzGiawej5fBZ6WhuWNOG30/wDm0FIJX+/y7mZYfcJV676Y2CKxrqoh6
+; 30/zV2zPnt3y1bDdjf703DQSGQtuFur+YwxB9wSszGPF9wFvMHkq9gXxTcybymgAbeya4RlPjnXOKj
+; /XTfU4z7FyXER/vyNZar765rCN+5zoLmB+36mgfgrzfr6N+gfrX3PN0AlFUAKkT2eC03rT6aLPpBNE
+; chvvbPuJHO1wHjGkW6eiQLqYcUE698ZKKUYA+mvFCfhVq4EGuoYVNbf0eWUpSv7gfXFBYj1CUf54uv
+; U+qmGVG/SQriuW9rymhiqRUIqR/xo4Gc+J0iwPs8ia0bQ41dJCXbdon2I3gMZswFEcNeGw+dy/PG+j
+; lxTOHM7koFk4cchka+pC+0fjmx0b9s2dPUpoyLXw/DmqxkviPHXZirD7lXcdkmANXu8IeS7Rz+HzKl
+; oiZ4+acofNJ2I3ntp3xuboS/lMCTX64FylhpVNPl13Pn3m2LvrqFvKT6OSjjMdcXjVuJAZtVyFcuHX
+; Ec/vEoLLnn57/TjaPw4/e9nU62cam8yAQrm89HgF2PbBZtgCoq2sF/0AIhsOO56Vonysh+xOSvHaCW
+; 5ZyFzMcc2Hw0m67ral+Q5X23v7hESgctMch/P8LtQEOlC74gHv/ijVRbPDiDFzQwlXsp7/CGSDGRdr
+; h8w2PMvjDqpDsGiHjiU8aH/9zLjsTiWlESQE+73z1FoAsiUWck2UXH4FKeE5rNukgviKj3pZzkkagn
+; sPkoALWKFcIGInRn8ryw6wK70u2QermI6ms2U6hFgn7dzqb1zD+/txgXAf+ybU8TRMCmbZp4BhMFrK
+; 8BvSlvj3qH+3XBRJpxrKJQ3PVh27KTobhoGgvX8ue/IBjWod0ufHxGmE52qF+buUIdEwTW/fDMPnzV
+; fC/Gqj0nTz36AkS9HPD96wo/ULPBTFBg8xUQV7vhXzkmgE/Ojq9NsCIYp6BoZ35YlyQT9PiH/uThZR
+; ju+RV8uMz89oyaSSSQu4T3SiRPfxyrDW/3LgHRn80vcAoHaZGT+ni5qiDeDSneYYrHRMdczQ3zMyyW
+; ANF3eSeE5IF3Z6EyV3VFfR7yM/yM65RRClvMdXK5h+fFdgmYNBz+CWm3C3Dj/wznWY9RQ+A7SIJcpC
+; wFrU+8bX4uwLTl4ZonHGJcMH31RF9JXl2GvM9sa0yMGcB3S9WhfwPVztUsXbU3/jPBPzCf7hTK39eI
+; boag938VUgNbWknolXo4thO+jGPiWJ03g0ZiA1e4pM7lRmfBwCuwHTvu2KnFahr1qU6NUtW/Nl5Tw5
+; XFEF2zvlayCpCkVx7scCwLp/d9r9XGIOg6tnfs2/XE3kgU/GgYQCClfRESU1o+juHVY18WLM/EV2HV
+; Owb+8cqeoXc0/QgOLmPFe0yqXm6tsrVcq3mntxeiFi+fitCmrbkhZMUaPw+Cr2MYEt780zgtsgDYGu
+; 5DQ2imy3zyAK9QHbmjaAWDuiCBOKIogOJ7ABPHOJI7o83kooSHVYYA9i6aRP6eG3vN28huPX+0ITvD
+; hXsH/05sNn/xbKQH7a0invnJlSXpAN0DEbuN2rVf2vSUbLxfzxcBnJL+rKhSh+sA1I2anxMjVACWIf
+; AjhkpScrTtAUwopzgNyaKOUynfAPDC0JMFNo9Ftz7Zf8nSRCsxzpS21hBRPQEYZb5YU9KCXR7HlSmh
+; 7O405gsGB6Y256f6+fWC3bGuJZF4T7Q5wTiFafvaO9iCkmkx8zFIyS3uwmzB7+s6bgJvHQ8TGeBJNR
+; 1eQB+uxsDhACjSGYBIUvqablSsT0MMosBYRadnxuiRFJ8VxGzbPUjxd93nKZsWaw6U7teObDP03l1V
+; HOFYKr6nA2Kmh/8D8CU2sfgZ36xqeo+8lyhyWX2hJ/EBAaIlQ7wpQ9GBiH6Y50g+6cJxRF9QLXBKzP
+; HbH3iWrq4l6Oj/CTZpLbRQn1o977ZVETQXR/RGrONydLTllKJlQR0uElvtsqSOwUX4sqQqb/r+/Mle
+; Qqr/HupbrEeq5GvmwX73OW1c5m3KtWwgjdBaIMT+SF/2SZZQITojO4aWcNumi01cLVdX0eo0g/8JTf
+; HZudD8UBIxZz8HWe64tHmDJM502dFj8h4Upf1dts4RDcanPgYl0n6h5p6Gr+LnyTAlxzPcSPKVI6j4
+; NjflzOXRqkHeAAfLSczh/Wnhvszz/ivZ6Fk2P+GDLjJxezXNnJQ5ANr1goFT3eQ4pMhXlznlcXTIzZ
+; 1cErEPmjBd1FC+n4SmWvS2u9S9vEUT8ni8p4lrb2qOuLAEvRp9l6T+vRzust9/NWcI1vLPUejWW0b9
+; dKoVkkDi2IRGMh3MxXaRl6k8qS1Ys9h2LVrH8a6+13xfzrJTP2VgfE2ywOKbqc2QtTux/FIagzOslW
+; DVLEqsCMrwjSLDlE9WEugy88ETBYx+ETiyqUAbEQeg/wdRx7c3WQQSqXTgEHGfjPKBL2352H1mNsHc
+; FDLeIY9k1AjcKD+Mj4nU/Pb20DPEjElE1x9McQT/HMw1J3+SJdkfJVU2G7jNPnakuVO1NktfoyPnxj
+; huCZjO4VjYVHkmcIDDHiZ5LlTp28iapWIQsolkJqCjCorukPZt8dDur5wAOsnvl8AsgfK5JD2jDhM1
+; jcTTRS5gfng2kHSbuKBnZkXeH5tKYBgNGiSv+YLEn33/XkhqLPZSF7i2AYhg3IkxFOaeSMOggY7e8T
+; HaX/YVVLXZ6kgCiuO/m6Zg0O/6Wr2+DLAxW5Q5XX624fuN0j8IHdCNnWFGSR0HDC9exrmFt5bxkTHw
+; kQwLckHlnz9v7Rn1S7S35TY4P1m0iZ6XdigMnQXkZ41XBeb++3sRz96pQQ3Oe4KaEeyEzoYoh9SXY3
+; Nrrsan3nlmCc6j9yptTpZPYwpO+Fk92aclQFAKPH5dyvpELCuiTt+KWyZgpKerZPsEjXrBA3pK78jx
+; mtGtOP9r2XXG9xvOKzHtRXxJHgknsBDBFT2n9BpdARSuSzZ6qnPGP5ich0k8CRwaPkJm1Y9IwwuW8K
+; rJLRH2MIE1sL/aZleBW3VmIcvvkIEx3XzGhUSnUgYkoBnkbjk0otpKrCrMpojOj8exFUtJtDkOe6eb
+; s37qwSv8XPAEbzb/AAsqWnB27rWgalsiwz5rycGPRb8vxx5ZfIBaRxsaMceR2kF8//qE6/5DGbITwR
+; BfzPv0VyL4wy6B9DqIX65RLSVAPBWCGAU1zATSaWyxgTFp4Gnjgr1f1yXhXbF+vS7g7+bFoQoZFZlb
+; s5YE6JYKhAVa/50FCQ/OqRfBz9zmLXTnMf0GZodIn/0u1W0VN0CqoWBfwkH3YvqWV5tUic75ValX+j
+; lX+G6cv41a2D7bEucevlceTOTwHee0eqIcNb+JnintAvAp/QXMAaPGsUnAN7wXpyJA9K/H2CP5nzfk
+; r2Y2NPtJ3tXZbugR9BcpsRNnHIsxVkkQ5BwjpxAHlD7TqmBlm3R9+DxBJBlcs1DDHinqCWufY1RmkV
+; Pp+Iv8vzXai9staMYxUkDwuezqWCvF9Q4j3UxqiVr5uOLuTHrRCM9iq9+OS9YbbIMF9JFvMbczf7oz
+; 7/3hl2SswocJL3F++VoTvTvHJ5S/y+/jW2pxd82MdVWNRAVfv8u+bzNhg6NfZWR5qhoGMjlKFlj6C+
+; XUVOwyyfgwl5Yl1BMuuc/PwOFB3W6kW+ng+3sgrbKDSmF+FKJ/PwXXYxBtk4WfyTkRqXxIggUY3V+g
+; 8SnVDnG7d3VLmIfgg1GLV44u5DVwwkFa4GENYtIYSKpPZQLyG28bb2CrOoi14BMT1dzcwm4h8W2eIG
+; zcp1n5Q/rNBaCCoy2PypnJ3znlrUmj3NczfW/EDeY1hDQiP6vs0yLlKHKPH3T9uCkd4BrisMDFYBTX
+; tc4+wG2iqdo+a4+ZwBuWWtZu1wrC8KqHtiWHdPB9T9OKNlmdGGYvaK0gu/QOeCCRI0hMM61Czlkyn6
+; /qLP8YIZ62GomU2VfVKX0EBV+IPSv/cffE86gP3k7+zhhkZt8+s5D1tC+Bq/G/bgRAAgLNcuEL5RU/
+; 6CqZ+4y0m/gtrhwNUyNwgf3GMTlT2JyynmUgzqxnXzCRi7RHEN1XJN5J4jVCCdi9cQgf3acJzHyvF6
+; KeNZc3ztFXzsh3LJFFWz9VPwkJLrXwC85cZRpC2RcW+Z4ULH1iIQ4UJ8OA6g0vy3uLncpncEVedeBg
+; ecoTwyS03SRfXuFnFUcFxZifwaiwA2Zlog7sb0fm8bMPaIfR5dEAlA2lTzX/+8JH5/GCw7riSn2om2
+; tO+dhT/ZBC1BXnD17fOM0/YM3bLON7hgfNCtrcPjY1TeDHNNjl1q6RUA6omyr8J02KGTWfrc4MOVLu
+; FRUIF4r3Jts07L6gBjkyxrZMGQCVNkpDBEsVQcf8Y3vR4PiMuxQhVyRSCzP8DIpMuwr/q21MgChB8+
+; m+6D7h8kJ+bAeN//L4gN/UKbStrEsmzFI0BgE+787rsij5KgobtvsPxhIukuZBqx9ccmyI566fGDvR
+; ztLiBVN4PniMijHozkD/FRXKH6RqpCCif/YkolQSl/9wxgM65ue4Nb5J69Le3Knnt8kowJBUpyfWGg
+; xHhWoTiYgWRtBhwmqBWjzwGRWpkh6jEJkw47jyEp7jbY2fGqS0MIIDM1JLnBGksf4QPcm09cz6Gr/M
+; BiBdbAx4dLa+VhbogEZGPb0ZPuvii2b33Sw+y9AUfy1mUvjgVNrywjN46cYNQxH18zxXyqSrWkfdir
+; IG+RCUM/a33laUTcDNVGrn74qkrbZZCkj8caklT5tYNs8Bj2lzKkdvH8qtEybKE/v3NgLPMDXKA0tJ
+; bWTs1gnvm/T86ZijFW2SJVPRSxEkcWnTwD2P30wMkVtx7HGyatReAIG2qxBhidzzHoVaKfaHwTL4eK
+; C5W6VMq+75bntL+OeQkKEYknj4H3bwoVyqD7LWMPPXsqBKkKaLSyEUbEd1h7Nqd192O5f25KuiQu7y
+; 1onSD/yty/14dqZk53POlraIVBIce2ONHRpYDSaaFUwrS3PWwdg9EDyOgm0kgf3K7TmoWljWL9fW4O
+; wh6zf/MRjJbLtOZRYs7t5yl+w5TsATSnfHFHS77GnewLPSXpGhBMJL6sQUP43q03jhzAPbMUGRiAWi
+; G8EG0nt5CSBTPN5JdroVVhUw+tVPvMFJoG298PxOr72/6qVx4I6d7TwxE6IbZQUzcQxKDxtpFfZhAS
+; kWUIUnvbuydxIX9DyDDdermtKmm+4G6+80aogNSJESCmX3v3JHrq/q6Sj1BYvj/o38E/Yx7rWx4VUT
+; j1VYtZMqy0g79xcfdlPaRBhxQGgPvcoiuBB5P3SyXL503zbP2tdJJ/gzQI/EvfhSXphe19LZdhow0l
+; b/eIT3FNtNIDFtIbGYNlXCJ7NccwYGMGJrdE3dhj/ucNXaS/F4U29HccVPdY8a5n+q6Gc21TQdBPSi
+; pEXyq6QymrYRH1Cx+RsHq1ZoNMJSnI6+UsLV5OxopwJd0S8QAfDcd9LUXqjAQMx08Nm9uGSTc3TsdV
+; iYQK8d8F+QbBjGqPDgwyFIMSmtp0b7VYnDUcn4YzWVONV+mY/YTR3MtdfCpjmDnsBtiSA+rFxDJ8/i
+; LeZNVEVLise7R5xS+aOHuwpSpv0Md85k3UKNvRIXZ7rQN/arb4XvtvM1K6UgyDlpDgFp4vaxcESGoK
+; EJgpcMepXUb8+S/z4hQd8dcEt+NpIcSq2ldHQEtCZYqLZifZ/KWRZMqXNxiS8EFL/MNPS+30ikHkVf
+; YpFzL4HaA86XEqA58sOBcN9wKRmn7mjEa591Uw5x8eTD+Ay/HUikgUHtLVMjvKP+GgZEo1C43/4ZPm
+; QRQCOQwLigMiFnYpB1DK68cPXs+6JkkLPXkHeZPprSbgXpQNXxMtFUtdoO64LOeSPkRBHLhaMDO/kT
+; J7W+idBFYZRljkLauZEtYrmb3fBIPfmeQSIwgL/SYAARDs9mLmhw3g5cZMIA/2wAjZvtg6Oopl4sse
+; KELxfzVSHjk5qFzYbidLc6RCK5aqODZ/OIGFFinMdIY/G/EsXu0Tf+HViph3JIQI6vdxmreJVOPFOS
+; GvIWIAbCnlEzHc4pkKGYZnHa1qX2sDsoznEkdEkArAI8NbtG93KqSb1WTpUvQp1TcrzY6YgFnBaCpR
+; i3uwbAHi2/exu28HceYbCyLfj6slCPFftv9zTypu8cMWGLUo8ADVtr3HpunvhnqZpAFoOsgk5vFq39
+; 6P9Ahnho0tF0rl5ftRTTfHcecuT9lRZIahcBS2UPzQy6+6iXn1rzQRXvOp3fKtRlFn6PQHr2H0MTF4
+; 9JAokHZDo6wcvSQnsLICQM5pltud3Xa+XlBBwcnbKNSA+K8uq/aBP2zjnUmDwJSI2nmxtt/gx2q3eW
+; qQe5YjwM3YZU2RvSlL22cokGO37DrxMj88Te37uG9g6cXaK8VfPrgrWEpLYAtyNwkhWSKBmhSE+uJd
+; vjPZ5AWgkOevZGfSiv+iWhPmtbBjx984apFHBjV+hbI+Tn0cIRd1V+z4Bo8R5y0/D3YfcufV9cFFgM
+; Ea7LFeqIpAxIoShr/urs/TKMxtqeFTMcU86gUf2K+B+5bcsc51GKsE5DzswATsuLYuC0e3oHq21+w5
+; xRYQaXCL7hrG4SH4yh0ObJDV1vmQANALhSU20NWjqZTnH6UGjWVd9XSjC14g6ITOnykQ5ePpPFfkGM
+; UtwbwDvB17guhAZvElBE2HqeQi5GeV9jkulM4yQOg9vpNj8jtxK6OqYkGLhAzQqsSZD4dk4+ioFyXd
+; Mfi/BkvpVpykUXYAlBplyGHEr8AZaRJ6Oem+KUDWNEfXjTdbQB8b9icrafuublRxs8NSOukgfRaNDR
+; FXl680MS2dw+fN1LOkzpvPypv2e/00GbhywozbPlkJivX3L1fudlGq0zHKbuMDWQ4PpPooOaLbeMq+
+; rmh1mYStpu+BAzlDyJbLrSNiMf1PuLhTxl1s1APlz9e01XLpx52P77pCK7uGTqk++m06zx6ZKXwOMA
+; cH+tPTCdhmDYpe0LvFFykypPoWW3848oaRLen1co1AQx92ofQ5BXU5aiiU8purg0Ad009sPIXKX+Wy
+; tSxNgyk8BjSFONWwXXEzIZrg+IG736UCnXB6O5SAUlKiIe6E2h7BE4M4UI0mTM63KCenMxp56dVtgU
+; BaG8wGW0eS6wa+mRajTBk+DttPXb+elP1pJpnVvmCWU+UAdRs1EfY1tCBFbGWYaxoRZfQ5CmvK64AA
+; B9W7kIAUIakrjV9UvzIlDmaam5UXuxzn4kM/Zc5w8gLKpUUH/ekQl9EuPi9XNaEB4ZMEPP7apECItO
+; mjFSjWaLZ10PRN0gSOFVe7YnpnQjABfP0Te+aTkOWQiCpdcI4+LL1kvaYV5Fj0BFpv7RK6xqXGCkra
+; erv8U1sFNPx1uAqlRz3bJhouFp9pxY3L4UHL85UHcfQ7cJgxsH0tyL8mx+/vguFF9zuKh6uAWnkX1D
+; T7lFU8IN6Z/WVU0yMbzknKB6JUKhHRyCpq1Px8cEEngEM+QWlXTG5TQisqC4P8T4uB5WoZL9K1gIPm
+; lLqhFNl3sUDSbNXZK4CN5996WGRBDtxI2MFKewb0pJ+6gcTdkPQzleYfynoGGrvv5t2cRYFEeFWPoC
+; pAHSNl0rOUIl5KDFnDNavfIMe1YRWmVCiqZjzb6nj1e0A+F1+2pf1Wuqp/jYbbwDzuwycLhczAsIuN
+; /5ZL7aq/yyR+9ilpKh/JrsTQHP2s93cIaFdB5AeM+F9XbGkJO6RC9ZBJyMjabi3IpVMooA96ayX1Lo
+; IfysCHs8nyX75l1hZKpr4LypfpOTY2kG6Farik7Qy+30bJrK5A0+fAeLTXx2vMgx11tRtkklb5eHDV
+; TL+TVO60099qDadA7IhYJClCLAuSpfNy6GQg++eC/eq2Ctbag+KyNEmsiABWG9yocTAJ6kM9hP0uZU
+; /tOJiw1VxqoyRTf1r5SrByNm9ZghS6pl2y2V4fwZdNdr9NUu9n06347FnQccSaATByTdp4ARXJyVkj
+; mW2s6U8/AUpGMpwaymMYhzIW2jpm2ALusM5GxYiclL5/td6UrRo9BD488UPUTAq4D4ssbFp+s0f5OX
+; KnNEvWju3485Rm3e3zUGJbrKTDtaPpqsfywBRexm+yFaaZ6RGd1zzTnT9yLizJwrUxjypgpRZLKjWh
+; oDVHS6NyMvVZ1XhPHTdTQgPxWRjCyb+Ez9LAwDRCXhAxg3020MYq+cdghWaacRaiVcPKZsltTYPHkE
+; rxRJST1+RybJjs6nqn/U3To6pxfBPvNV87jDH9D8fdEfUV5w2fvPVtLFeM998fBHGebj8bXteF/naV
+; O37vHZW4CBMfRH8sUmHW9T3+KwPzUjJqUDx/YHGYWjOmJGjB6S4LBMBH6PM93vdESmOfSXo5Ft2Odu
+; dh5a49uMAsNW5jqQHEzf4mN7Y7uowDC3sjFsnD9e93TWH9egz+/qjLBIW9Vw8qTOhZtYmmOUANxLVq
+; pv1EcrFmuC+F2uCD3fHZB74olgjoH3CbE1cPDz6+rwpRU3NaoQH9lQuf1A6F1yXgzigbDIcRKeEFme
+; Pt/K4xNhJofqZwtZG81hOwRo69hNmVQ+F1m0DfWNOFxefBteftvoyqf30yAenmvGq1Cr+EdGwIgBuZ
+; Vwm/9owJ6vWFix/gsSQ2pPTNcNw0766k0oOqjPJxkBwMJjyYl/bhYpBM64C1vBfvGFgVUerjoriVGp
+; 8QbzUKY5OgDN12HsNet7T562ZgdZrfAAiGDrZfU39R0sk9RphSL5eSNdLVz6VtYRNlWUhQa9VG3brD
+; 80JQzuu6PrZ4MGtFGC/bJ36+EPDN052+NlFgeuC1hdr/kUgkHx3WpqDX7AedS6NvJhTfIUQJglgiHF
+; Q6BUtCxYohtm1GO7HKG+hcN6ZYmt8fAq0MyH0s7l27em+rbwLxpP6nFnYrUdtMnpOJdIoSAY1kZ1cz
+; 9Ya0MC/X3Xa9TALxFzMVE0p+i75maJUKbSWJnEDQ2GtPHg6HhKL5dvqMTp3GqegtfCYjKJJxPvWkzt
+; CtJ6RN/ozWoOwbSvdEqtAeqNO0mVJvLgTA8UOfe6/Yes7jzRsFTBReWm2wpWqZTlbw59L8OL1r4EyV
+; ArYAUQhFJPGuEEhYNb/q+aX0evwUp/vHQcQeldxgWdSY2rT4HiIEhLo95fOAScIlshcCSpmzbrZy4K
+; k7EnmOYKfxJyr0MUkFed9/YV9mr8yHhpbs3itmDS5GVU9voJ19ePsdqFkd/dmboszXJ3Yhl012XCn4
+; yJ+PUDdt02nAox05Q/Dfp+geq70MpCeL5OSvLefe2EJFPYzwZ7vWrJ4c65++loqr2Z8g5s3pCJ2ljS
+; hqhBx2VFzUsTTmi60pCYa8vbi+krAo8tfJ38+T103VXbBD6xtW001dkOkKnhYMqCa2f0hc2vzifiYg
+; EIIrECA9TToQmoruznyVDyZ1/HhBmyB2QqAXncyYmoId9Db1PfMzoESsvrw5Tm5PeJPCQCX3QDq4vR
+; qoYXfMf192AGOtrGN8BoEqITNN+9Ffj7huozmLDFCdIPcQE6ZT8XanuPqs0Pj4SiYpqYa5Xgj6Amuv
+; NEaf45hAGONtorRXfmXcuhCmf3u63k6MZQhT+MqpZOi3LgXwbpWgvm0M68Jfv8LrIKmlzRTwQHm68I
+; 5BGJFtjqcTGtRKLySQLipr12Ju7VCPhEmsL7tMUSdK4e0PK5rU3apfTrd7oOOo8htZ9H4rkkmCM5qc
+; V8TH1lui3hAoB44nMymIUYIIet9TBS3dxIqnn2F3DiygGfgQBJbX/OctvWOlTQTsLcwTfwCZfxhMj3
+; Ls/LKO2iVKMsjhwS+pkU6nxnNKt1+M8ESWDvqcZHD8QSUAbUtj+DwnybhJBMtBNnimBOw5Q1KGQVQu
+; ip04igb690Ujzb6gg/5sDdtIggqUsLRzmz535oqcuKPY/fq4HWSYY51PlZtoFbpTFeW6wonlpuZWYg
+; 6Y143vjLKwfvlLQ+cSkQo5/flsvR6YX+hO+qeiWnLH+5G8H1Gvgwz4UJogS4HT5d3i/2J66CNDmrH8
+; JFWT/BTB1o1Dp2UB994DopyprQmOLOt84IAbu0mJNpV9BRI5aLvyfB6/wTTIXURtkKfSaFAz3MPWwn
+; 7kj5N6QJitY8GzsV0yU+VQfTBRB+FBkF7jB6rrgxkngLEOZ26EhyzsE70tW9sn/CDt0RBrXvn4d6Du
+; Pl5TH2YO+tQ3LW5bkdP1IaZopHRnI8BLM93IDp8YMP+I35vwj8YYFKNLNSRMZEfSuQAPCQnX+tj6tI
+; LY/woAcP3OxlhF4/oEgFHvX8vmKb8kjHr6+/egwRLPDINOXBIjANkxEZZrPRiKp42IDf9lEonyoxbY
+; r62Q8N8fbFzsTD749J74TtiufN0xqfH70IantlfZ/h9dHwpllj9NwlATMGMpx0bPUiC3Zo4h2wQEE9
+; U0c93oAqQNkz9ertOnGa717MAtA1sUnn8pK1zug0T6ue6U7DaaJaDLkUWW1YsbodE8l1ElbkwSZ1Lj
+; U2YTM8fJCmW05j3YP2ob0BTFfg94RvF6jg3B5y/D7LNN7youZ+c373owfmBhG3KJs0P6g6ZG8KHuuL
+; XoSobaKBDgvI0rp8d5Xcnqti/pMAgmjyJLqfLmTEfPdWukYsNrGZ5F4S0i2A4P/07hwyhw44t5GD+L
+; D9deNlCngjN3ldC5WfNrNbuBZTyjLvVHQfdfExccDkR53oH9TxdV4Jkq6URHpo5nXGaKvwzXNs3qeU
+; b1A++q8yfHBGE723e/6+5co/pOlYSHHQRPPVofiLwAkFM4xIIaYgk2OhOMZ0KHxWkg6feWAELu+I2i
+; ivRTluZQ5+7qhRATSH1bERoIIbDvEVEyKvok5EKgq1ORCAo6pYHY8UwiQloVqNY9J3sp9Oaqu9P2GH
+; Btni1ZH2vKSsrCxSTgxZnR2kGcx+TfETN0BbRdWcL9iA8azbv51emdDuTyl1AbQqjrAjYPXeHqta4X
+; 8Dh1KH5Z5Re+isGR8gIarBNPaMjNNgOQ4b8VUoiajhTawZ/vJyV/eFgDpoyPO30+ZcRCdkCLhJ/LpL
+; Nb7bnAAWGXcHqI/sx/DRdV4E1gGgljLFryRYANemSIMvSoToXFJQTQe3sjAx7B12KZ7Wa+edYmOO4R
+; HVunmdJhkkqpH4PlA1KC7Rh8ZtA94+saZieWdNMQqMVx+aXZKg/hDSDnm9pgZBFT8wNL8uNEIlzPex
+; CAhwY0YgrJaN2iSh//pkPE+eUPVF9mvA5JQHgF545s2BAdP+1r2NRnYH4L8nSDFKZ6N6BAHdjCJcfk
+; jSZ95a+hmzd2sQDuP3vW7zVWG4meIhCuRKyPjJIfx2Nu56SQ9e6C9rjoL9rK0rbmoHYtQ2K8zzsjF6
+; bBnxWieZlaRLxjf5aF2sUCrWU4xVuut6dmSmF8OR6OO8DCGfpMv6La1FKrqAJLUfxI+lyMnK2EO61Q
+; O+H4Rk45Cp3B3l7SvwmeCvAeIGq9B7ap6PjlhecJjvn1tkEM2rMDwvAF8+GiS3woSs493Zx5JGecTt
+; Y+sp2W5x7fSE/XCLlOsWvo41c4iOYS2J1XfV6kBHDJ5NdA+l3LIx3WSrEmMLrbg4QM810F+72BaEhV
+; bAQKUJQGuwQ3OZd1Sq7KEpstb1tGurtywV0wt3JuZ2tyqUBDbnOD4/k7ToH8XiEjt9iMwVPcnXr9uf
+; dOObiLFsEudo1PoJq0wJz145AJkvGRyjngbvUtdY7guBdKVULPCfq/bu4W7qvl7BgyYX8Pdfg7PuHl
+; BfJv4FdAseJtmQpUEWk3UqJL/8vg2QnifNOjPszvDVt9580NL9W6Dh2FCOSInV3j5hhEgT4Wit360V
+; zHtvgZ37B9LcEswrkoq+JjyGG8f0IcJ7bDBHPm34oR57swL62w2yVF27SdqGbN6Cc4H4Bivyc3YOeg
+; pInya4BrDZn6XsvA2oX16hCkMQLaJBLEMqq4xKoZG1Kjw+vNKZX52u60UigyjJkoyauK0ZH4EchRkb
+; GxZnnplbHTERnMjY9r12UYLbyJSdfa5+labeKR7dBfGVevShnRB33oL6Y4aeYTMNZoM63SRzpdpx25
+; 2/hGUqYdg4PGn4pUH3ogYXL+LDZvym+31OLJQ3F5T8cnpQ9AMOw6ge0gmlKLbmMr209xbWhH7dm3ZR
+; k37/+0DXr6+Klmwi2vPVyMzNQlfeUsL2JqyCjPAxH7bvtsATrnMx/3OMj7KzVDFDErEU8XPVZeSI43
+; mLXU9ejbjw5TD4tdSkRCpQJIoD3oUnmahTl+NcJLFIEOpHpF9cyyL1pK1CL+gBgIqxTD0BuuQuy1rC
+; 3m2azEiE5iPUo9LUkxTZhuReMzp+M9uDnYpgZbBM9vgCtTv38fjO518PAvf0DqweaLupEPnONmS2eA
+; ACgfRi3XYj+yX5J2/LMDNSBD2v3Kgyvgsk6jW5R0r7dlapQiK7PrX96XdGWlP5Ar9VFNM5Owhi5Suo
+; 8pZ/alxRg03Giw0/uRyuNXyiXtAnPKipa8tCcA8fy1g7FV93AZn67D+Ccu1b4Fc1AnoltbHRrek7Vi
+; PKETsYy+T2e4Dc1RS8QHt/KvfNKvVRC26yESWGFKf2UUflVnrgw+uD0+iDqghIiLYsdVmJWSe1Vb/m
+; HkajqP0c7uVlsSZqgwyZ8L0xoiZzqj/eeH+bBbBLSaiAFzYy/P274C7IgPdwDm7x5B9eki85kcpu7h
+; pRAJd5HkmLcUdhBZNIvlQ02cV35LqtKgdZuqkGm3AZXLwNLAQgrG1R6hxBZqJnbEH95NruujVCWYOv
+; TZEGeSV16bwyqVIQCcu64gqH006K/KdRqg/5CMPr0YIQmLHd18hY25qI4hqOo1Mlfg+zdDnidE0+Il
+; 62+XlU/p0pFx8Mc6x7K70eBsu8vYBgx90nBgze/12cJb70Wb4pQrk87ufVw2qVC8A0KAvRs9oAgi5O
+; k03nnfqaB1bsBesowWbS4gHGTbFqi1l7hVgACi5JvmgGPJnMx+w5mWOmtNoZGjjJJXj8OptbcrFdKQ
+; 60oXO3sRu6hm1FRwQw0o2N+K/9+fqDPGS3ejU8Z2oKNllQmMG0u9fY7vh4eZh0TjfwlOToqcyK7hzJ
+; wLp6VOkuVLUdEgOr+CISpBkSThcDZfj0dNC2m1lhKutioz+Jc5VhWeQI/DzBVh4ugWIBZ999cwVfB4
+; F0+Jx4JbRDKGACOyIJEvGGt945cf8RPH864Iz3NpoFFEU129VhlrxdqgZNS9IWHgXheXDdSUG84IKP
+; NeYe5MKrQA0EgMRuWY8EMzloIJjVx5J/vAwIsk6fo1S0TTR/7rJlL/rpXLwG/BPpfBYMH11amwpj+1
+; e8MxBZp8vHrRpSAVO+zxOu4PyA9oaumMsQSFp70ibcYQOcZf1bO6XRjweDWyH39xc0BUMllzPJIutA
+; 1sY389fGkvhlpzxEDICY+vmYb9i32EP0+IiEAZpy8bzxenqUMrq+MTIryxyjjeTCSQ8PVgCqlOJscq
+; HangBzTme+OS8cd6rLkFspGwcuZsMftorVmgxuyu9obs4MLHZRfIhE/2qORaV7uh9IyqNvdTN8Mfbb
+; YCIHPw3WbHQPe1XYzyBaIhE01rc31SxCUg9guy3PwXK9ktPKUEh7HcDHD9tbBagTPR42eyMnK8kwBy
+; NFwvp83/G3pdUCEvsV4LA8N3A6BsdA8llfrcRcx2s3yrTYpIIrUimnPT9iPCsPwUNUvnjQHJcVHMNF
+; Wj4/uEpRzSGqwyAlkAOo1wWBihO1TNPzGTdmdz+yF61s/6OAUrPk5E8LuOLgnRDYLYo93e0hCWP948
+; AXngdbfpqTQ2TfB4q/2mkgh4L4ba543e0k8QMTQG9JA6sqAApGweh3gRFGPAWZAlLGcvVlchqpXx+h
+; UH1spCbd3J2oSZFGeEKh+B1UDQede6h6DAYOq3O4gqeL++CE/VOh/oFqODM1VykNAkNBF5J8TOfAuM
+; aeeQIKhbv66wDUsgRI7VRziEpFUbCS5DVR8lGCIw6KDYl4P+068Yf7MzW4gO8HOV/dF0fVzX45yQ8a
+; mvx4pGCN/u5lRBwOF6tlAEBEyH3gCn1bg2Xl4nsAIDRTCoBtNPyxx1yPj7A0U2JtXAZRJpX+l1y5Fk
+; WXcf5g+aZ/ktTz2urWM8mq+V3BdJW36/deCM12lveZbAJa8qH8PIiW/Mf3a9pLf7+EQwlCqItSHCcn
+; uxBu3C1TZsm5ZLuhiM+xbXy6c76qug0Rn86+kbL7Brc8ksEhODmnK/qNEJygPlztRwtqToJjFVa+wk
+; jGaO532rs5/iINmtI+2xNsrxcW+8l5HQeqH0A8pRLrZheqzVYY8Rts0l9rjnixjdjrs2Sp1y0btJAm
+; Rh1/jt/Ot8ArVUh0H0b/+i52jy0ooAL9Uo+ZMUSNYUZpthH2GJ6hwad36Qnj+VoAtJGFK1lFGMq58u
+; KrAXAfUcqidGbSfSMBFfb3tjV19kIlhnGAJAnoNtkSZs9WGwphSLndywNUIJCf7CA5+uW+BnPkKNhl
+; dBMfahTJPYNc/WOvSk4w1iQKlHXn6tn5V7JGzLf80hFJjUhJX2BosasWy4V2zTLk3xH/rBWvzqAVuh
+; tTBQF3zJRhk61F3xx9LE1jxFbOGylUzRZIakG+kp4sOk2ePRh6UZUEFWJ/Pwkg2n0QfsjPel5N9eAz
+; AIjh60Hqj9TFGuw5+JMaMUa8sn2LOdxus7P/NccdaSsJOpzLNiH629sbgI4aliFmdrg6cB6GuyjveQ
+; 1F7G5HWez3vO2BYoGjGY6LB+AttFC7zNAclvoiHk9R0ApvyRfAaTh7O3lJk/PLUxrDO8rUJbw0E0zc
+; uKncgTtWZVM/h8OvhG+il0kekMr8/pCF+7X6LB7f7B77ShV4yjoIeWyiCp6nR+Mk4rfbZtj8156zoQ
+; RNRj0HZM0jESrM2icf0YHDVrIGitjG8uC43yUH4OlVtUv3tpFxRBFQAKVcF3vxqJUs3MRrJsw789kB
+; ZURMC3Ft5zvESm8iiuTem868e4B0J37NG63sOCxRzJ7WBy8ElFeTMd/jOPVNOEYCiBDFdOzH0Iqe6s
+; 60Wyhjf/XpPnprUW41qiKvTiTYr4UnQtTD+sRMt0XqPS+Qx1BEVYKNQ/B5UDcRkjvDVz/XFGq5DpRw
+; pj2ZfY98GSU9kWxnO++QRzNmmPcfEB27Dahn2So52VcP3CW7/VdoSSQaNT1oPwYudw6tJp74/hjQ6A
+; RnIIXS+hm9ZELE5D06TKAQ+zWXlP9ixy2kO0CJjeTfCAh809Bt+CxKvpTjIVTMq0c6d/m29SN5jmy4
+; Km/wXDdC7DazB79Qi5C1mJOMFhvoGcUDS2zfGbP7deaaUBpNRyxqJa3R5v44STLeBvFwmlXn50SG73
+; imDErzYjGkozJW8PKIH1TnZxI2/+O1xd+Mu8MjfYJb2Ux4+ayEXW+bOtM0yPCpg3BBObQeI5HlEuwl
+; GyCpOflcnqxcqwdDj6m/qRqjkU0A2JDKxYUO1Nxgn4QJxlGmOjzIJps9khFbppKU/uqw0rEuJtJVSV
+; p9OEkP6e5vmgq4GqpsqaopPt/5nhzGhk4pAVX8RacPVBeuGUPzrhwBx6SkvG/qEcxm3442iHcKxxNa
+; Pt1cnopO6A9LO/XExLDscASWoPYr3GPk9b/DBhOTj2fziiiGdW1+tluCLB99u1TWPqn1fRYx/N236f
+; PnpL3Bm3b42XhhCk1/EdS2NxcLHbScDSnH1LxqzTdRcbWw9yotzi0FzrWC7g902Ymv67e6uXDs2wgF
+; koNLc00B5931jqHCqGX5tldq9GEKJXABldIxPuibCAeE1sqwaB9dkFONEJhQLFMMRlweeu8yREmVld
+; AlouULy+KAprjubpWUgKm/cFcjEgiaGQ9AiHa81npR5m8y1+pLkKo9hvzSZ4S1rAsB2ZVppbcKAkOZ
+; pfUimJIb6s/vwunAROLtafvFwbrZWMnwDfiDH7fPzU2DHC93vBbncqJ+pVu0zX3UzGptpe4IiKFlKM
+; k3Df6Fyo9/r11w/WOosXjbA6cF4zl4I3xFITsRLDp+4Hmvum2BstMAASRYsPwYqEE4st+UKHQR71Gz
+; tYPNlM+zxjgC483RJmsMlFmaWqupE3kTEGHRAXZYpUTI1qs41Jo2wycYswktn0jcFFoUXyROUIjtzT
+; sILdM3KOe3wDzABhoBqRRhfXdvarqI3SrWW4E1VbL+xZHRf36pB8v77WYw8pMCdpWnGZAbjF1I66or
+; DgLp35S19gBl1nNuItRs0TK4zSJ70K4o1m8+AO8EncGJoo8WSAK/25gQNiAIlF6AcE1dDS7LNwvM4I
+; aZbBxb4h3+37Oetq0vMFaE7gqGcUlzyNGOYXfkL9BWhlSkbgC26HF0yMouosIZU0nCLqnAgpwy6ijv
+; NBqi/KPrMzVfA1DOmKuMsiY96gsIcD93bLhWJ4WdzdMG5PSh02CKm+wE+VgAMMSK1onZXV1dOlb81m
+; DmeRfczs9YyuvaNXOnQ1Rq8hwCHVOs7OnHlwmEH6GNXXkiMMIQC5Id4EEn+UcBiJtEMlB7HJwAgkEw
+; kYRe8ZgMpL5qP9hmxE2QtTkCnJ8HE2rtuS7DHjd4+ycwwC8tCAcbuvD9HV5NdWghG6cFJ/30my+Tlr
+; O+N3pUVwze7yvj4pM8TLRK2Ovsx+hwjkRFrXMaZwvsoPu9jDxyyjl49hFlcypsV4m0145yifOo6fPc
+; 5bADkq7tj72hNKq6tPSIRf/64ZHueLvtKj0orZcOxEUGE4FHm+C8kxXh9Hdbkm6PxxIKboFV4a1o9J
+; YRdgEXuYKMW3AIyL2EyooSequPYAF7y4hIwOr6lBf+kffAiRd94RxBlsckb+mX08zgHR18w0BSkD2m
+; 6XeDBW46iwR6k+2aTu5+xccskjGDEMEcAc56/2ltak5uWx/fvCmmpO2yjcCOd0CbUrvHMJtlwlktTg
+; SopuLnbe3UdVOScBXStL7UqdNtx4k90Q/FJeLzlrgy4R54XJXrNDogEj8F4RAjSOXA34YMrkr37pVN
+; 8+UW89RZJ6tvQ5sCWlAkT2Xm+wxWX+0DKKARLHzkkBi69E7sH1XYDUXK8G7Po3MMrstu0UzD+RlZ04
+; bDNkS7gxmgIzRrM+16VzwE8H1okbWVL6z6B0gPZE6OxvKtw1hrEmIULDtsChOyWHKO3gIEK2BxS1oq
+; J0TFKJLMQu+Jn2qtZCsvlGIJLMi+3BLmk4aKQKZTtnJ/OPJPnCSgKBI04iLPsm1QPsFDHEilun7dU+
+; CtyWoZFYDwJ+HC2lMsYcLNQjpmcejzdtFCtZ7Mabqyk3M6f3JBDqBc3MzLc+6TMUPMBUahFHaBJtww
+; nf60yUPkLpC+HMbwVT8G3ino9njfzuHWo6Bi+gzB2vTnfszeMYCV5TxXGcgGPTi3vRcJyD/xNGbBXK
+; 8PrJNJS8qeb0zJULyvBlWD/ZrTWFY2WO8sAllOA82JKWiYjuZGqo/15x14/iz1zjAaWDq8O65MdX6P
+; o4Bg+SyNcCDe4ZLo26VbLfL7AKNHXSS7EfoTnfP1R78qA0AAWC40II6rnzdzKrGTLkV1XhfDKn4eAW
+; AdMULLbr4ijXJWUTncDOyC70TcqxTWf7NOAUKfZ+pPaE3JaqiErc2Qt7Tu8d96YtDnnr+XSys7bJIm
+; 5z0AohH1bZbuITc5VB9LQzdK6QbnOZg4RI8qhS0zUMTGxYNhIdP6ERyEFRoJZgq4TdL1LRMrHg+Ycm
+; oaFZXG2dJsucI/NFiNSPRYUSAKBybkt+/vfXF14aTZqg386ELA9CNJBCXK4qI7fuw4VeyGHIZtXsKO
+; Uw9610y0YUiyDdpuiJ/UPtgGI/I8XTP5VFVKGlmNLfQAlfG+W/Xp7fgXWogYdRcTJ6BLTWAcap2PFh
+; qb0GcSlr/+ThmwXVwD+xtvjC2093Az/kTtbzctdKR6UhseJ9X7HTuc1qtGi6eGEWZuUpYHJcrBvQjn
+; ZS32pFWJGHSsAAktti2zoy7jRihUaw70vQssuQnqtxKIldkASRTPlSRsIkjmVRfgYlFZsGeD4PUQtt
+; 7gpHnXxuDhG7BkEy3aOHwPCBlWGBytb/vOzoWnAcBo2wjGIdzElAqPTRwfXFSkuGdXfT2iIyZEobCi
+; vHJAmikwWEj+bUPRGSNjjX7F9SwxHcxM30cwo03urpo2LYBLuCwT8R1qX6SglAHlir+GAJM1E663fi
+; 25zMlLgT8lXfid2VQt6xhJYr4CuJzrbh/3vOXnv0J621ggkZK0vi8308ixaj1f9yYJyR1Wik5K+EVI
+; lmAIKbq+g/vYV57vr9BahHoN05xCKqO1Iwp/1Xk22C6gtl8Z6zxI3PXw6KJQt5s5IeCaEM/mdosnHJ
+; wTH6alxCbm3ZdRMN80jDaG47cn+Tz9lcHfms2bAvT3xS6baA+rfhNTKl4xfhnAAnrKFZfwwFBOsw3r
+; 8/2ua9zwlaVVu1yPSe8Vj3cVZmwqCWIpL3aaJXfgFCGL3ePIRQCcIeACYWZmGqHO1F/jfoxPaaXTMw
+; yG2FUc2IBTkqa0EbOiww9nHAEcrg0pxbsGqA80e6VwVF5o0ss8ALwAa3AiY7lVxtQwXChPomvMId9x
+; h1iu4DVKxhnve90slLTQQ+L8ZOUX7eW6pmAkA8k1F9tV6L4OW3PMPLHsiC+XGbMEuhFOkIDc7xNn6T
+; 1AeCT7CaJrAQj5pcPDE2bCB6GIxGOfhzdE1q6dwenXb+eByKG3HCFd2x42AEuYteyJl/5DU1lwDMGR
+; 6uCIXOkPjP4+p+IfrWGE8I1aiJLoc/pdkRUikamknQCPY5O7Vpw31VALAXQR5a8DhM6YxjGFvq2zh/
+; IGLs3gjD7Yckhg7VNsLfqFdpQCywPCSuQXhjXvmfBvEb4JbTXdKDb1Tb5wM+3cuulm0P9JeiBdqhOn
+; ZOiXxTu8UTK3SJft/LCXPz60nr9KrWuGQtW+AtvOHUa5A0fiNH/1rafJ2E9mPmxb3A9TvMJ8pMmC3E
+; RSp+XfSDRZ+EJFBNmiWqgUqdCAgJNgiDfUnhK0OoxuyhwlqjZQHuSGoy474gMmL07pGOGONE2NIsUQ
+; Mkgp8Lm0io/yERIZSZq0EcJn0QfEjojNQW/G50EAnq00jSTf8ZwhreSXwpSfs8pcojKKMRAs8mHCPH
+; H1m1X47fj7IzVN9Y9nwMReAtFqTXyN573sYx7HjqxsYUj2gQm0eF+DSMZJ7QrAl0H+iUBHqia1jUsi
+; utHK1eMw/46bvQEsB8PcmJbvgJ6VJmlK5x+FmhUj6LUpPEoT4spAEx4B3u9Dxzg5GwA4Da4l1CK2xV
+; LgiPVtkiBs75ynZfbHWuH6PPqHrReWTHgScOX5UJuT2A60ugE9wVMp2grIb7ULfKUE4gL1dfVyw7G5
+; RUa3POqxUCtQWXkbuvPo8w42OJXam1YwfzdkvxXADdVtcQ4j6Fc4JSSQR3Y+UIqtQSkCuzNwTMgTGl
+; gdMOfgV8zWELj447TBBnje3PED7sS0KXobOlYuEYPcB5B/Ln89FHJQzGTD5iMqF8UyIY4AgtygOOxF
+; sn3XiK1wYi23C/5dllUKM9w7lrLY86IfKpIKAv7tOAW/RIV0SQTFx9qT5TsFf+zcmrNSM16yKogE/V
+; L/92DT1/KSsT9baYxR3Bq22n7hpIPOH3+QzulCJa9q/a9XNXLfHT17C5rvAkP49WNrAa4kuRyTsvhk
+; ON3YsPbCVujbiUvcK/+4ABkIl/MNOQ9wuPgVq8tHfBAS11/9nO/BX6lbAlHCtqRj8e4dipZR87Diub
+; MSLHC9hyXKCeJqUbFdDBo7RsIjB/7iKmBgRETKkrkfGINS4ZDnE26DDFiNO4LJKc5lebFiaMyTehu5
+; Hu5O5oYUSGAFYM0yxWmlhhUcIzJTuR4rs0ZgzG2Gm03VJhvT2Xo8Rvqd6sYQWJy8cpm5VHAFp/jtR6
+; vyWL1K3K9KDSExWk5wE6OS9N40jT3qhPy405Zr3MxNOvkivwCcWJiWZj5pSSfYwpOMHlWcfcvmuH/p
+; Wtt7tj4nnuQG5EgMwLgMkCbZPl0e6y8ED4QrtgeIkBjx4+25e4gzjZx5idu4Fv1hQ1dhRRB8JthJka
+; R4bXrtgz05By0CrcNElyAuznjM8HFCNqusnQkoeBWICwSiCvGVHlqOrKEntNu5P5ZRszpxHvmocT29
+; klswZdaZ3TJlH1J/TCzhAwIKzmgtpiC73SyZdHftKO9Dzfr9PY+qru+YU2n+XeFfgUmfdh93sg1YAF
+; M45J3Pn6beyAgG7c96kXC/7R7EU39CA3XckjLFlyNh2vZE8sEQyDESkMfYomhNR8S948vRp7ij8GAr
+; Qy7DJTdgZSX0oXhGZsZGF9JbMkz4bbirlt1Aj+FRY6ZSVsCYKBMtw3DrMb5niZtHJ8GYP6qiNfcPFD
+; ODlGAd2CUR5rFrwYeqPL4f8x5FNcKpB+gX795PehHgBfs0+I/qusqxvUX7vWZjQmhOM3EmZxpKVxG4
+; D78WFpH3qqDecQMBM6FhLP03CaCls26Wck7TVKIKcc1PyqA4jEhEmfK+qC/U0SByCVc2ufkSBGgqxl
+; 2+EZWl7xhmXnJxAgXU7zPL7Mnc3OKcINhGPZhHWYOs3LmL+AgduApJh5dXXMMGkgzMAVadSeOiSw3k
+; NHUrT5clqvoHYDP+c88/fpO6vU3VNZQLU2GzkjdnnMBa1rm2MrJ8VYNoy7UoUZZKCg4UnCP/ADyolm
+; MZfG4zgnml10qxbecll5Z4iCvRsow15Vl6ibbgXOqD+A03kVuZTYkVIBUiFN8JiX976Ufx7k/eL+KU
+; 8sv7TO33ogdm4ckZzjuYD5pc4IHZWfKwqu+1Y5kEFiJtELdMK2b4zcn7v6tfW0CbCZFmZf+kyLZuFD
+; eESZMxNYZSJfbm+JUgO0tEWz+dPHWvLfAEYI7FhN5EDS72tjrgBnOFJaHL6WhG6qa6Ae4O8diZAvuA
+; OCZ8QTo2+KdqyC4GUnJUsS4gBQWk8UzJfqNJfOSdGebRnQcCOLUHCl4HTpExGDhm5AiWeKCQCbqx/S
+; nbk6ua0BC0/JROKy+8ix+35i4GPjNGyOvvFGQ1O/i2W1SWmP0k3yaU+yT0XMw/jDjirDCG5hFwoVgE
+; 2IFilHTQF0ZoiUUsQB+M3V/iQt7+0jwxNdDTngxH5WuNZHXn5jDWgGXYGA5eT2xZlzsIv5WhqnSHCF
+; zzyqoVuv3D5WoVe9NQzYNtYFOWCjbYITnEVTLxwiyvkQmdnpASGIjviHct7N0tQpEWGgbA5FmhaDYF
+; 2vJH9PY09wLl+VDgoMMBvv0Mcpj4Ms/gFFAPhoMbLSHDJUE4zBxlG82WvhUFSfGUx9sVOAtR7qikl9
+; cg1WhzFG7akUXAk72sjz/icSnFJG1QbZSjulgRRm26lX4ixY07U7SVsmF4aZJd6pVQLYvl5YGdN7Ee
+; xau6okf2x9obJI3h5hJv6CqwAXn851+APFSmj7Zfo9SGoAKn1B3OYagKPq113mMZXp3O40veMaAFlw
+; 9OFtOTf7CPfsQbssXTeT3Rkr81NlaaqkPWOhymrfDnNMjFoUJArArNiPpI0RBBl1Ogfk5PFKPfXjwS
+; 6NU0cUfdsHmEh3ceFDg8AU3cjWzZxXg8gV1aTAV8P5ZUcSRyAt5AVeCqXca7XxMG3UyxljTvWWCxBs
+; CJpi9kG2xQkT+x2hmaqyRJGSG7CYhBf1Y0kr9CXhIdwnYrrraIxPkvkD6K2Kt3MNOoBkO5yrtbHPFk
+; 2SeyBwUupE8Ictm3HIHf+LLC3tZMl4qnl+2+xBIsARYXWwq/IaLGTSXwzDiRCgtuvhJwSBa9Ej2L6F
+; DIQHWOdX5fO+9Bixzxr0lwya5mQJo/zuKj9Mx9Yh3tQgfPkNaTAYALXBTle9lKnQlmqfWB3Um29ud+
+; eP+iZ9uPrebtGcbp03ohkCLfl2BkHpAhYFyPAVbxZL093JHp9zy/efG6h25jUzaM1XteBYe39hGfdn
+; dBEkmInQMV/TaX6sLSImQ9vDsUb5GtIReylTRxXrTJeHAS3se+fOnGk8cvUe1luS1mALjJtTTAvJV6
+; 4s9Aa+62GJqB8hTO19akoTQF1w5DxbZX0BlOlvO14XTrcvhEa6UoPok7MCH838W7rk/n3+GfCdnblV
+; 6mo9End4NvwgYm5PkJiVeq+cXsKvwqp2QLeWauF05M9iSLutN9r8qnfxm3k+zNeXqt15pPqM9xrXmJ
+; ai9UBiuWY6cUSACRwq8/OblyVfPa2g0Qs1JQ8RdP3MMd/7zScgWCgUGtH7T+Rr1YnNCZH7qEeSFiKL
+; 24VgUctci26/VJ/e1YZR75dpQocGKx1bFJpiaN6w+GQLnCCKuYAn29C7014xQz95UwqTgEcWsszv/+
+; puOZa2o+4zBRqWMWt9gQCrR6ZY4ekZlNfVMh6b3lPE3pBM+nzgtlChcq/2yPjnHYDhZBztRNPNswwV
+; bCtEOuamCOAFisQEL2E1ixfAyfbIadvdTQCLyRQ5EZGAcBAio29PoksDOvSo7oLTesPR8i7dsdCF+6
+; dW+IqzlbV6Og5wLVbqLHZGJNf8WZiop2IsYfXjufQb0nqQe1xnxbB5aU/DE6zAaEL/ol+WojQGnzjX
+; lFrMqCrGUMeWXM8CRCViC/3t6rK2RZAlrArLODgKR7ikJRhzGe4NzbsjyD2NnFRHjqCr8o1hZpmf/Q
+; jdU8+MQLLNnOhN3M7YkXPYzEqaaeQbDVqYjMEGNtEY3oZ48k0W+mzybaEHXPFJX/pWrfF3Sv9HWvZV
+; gH9BgNwVaTCp/t13It99rky1ZzXAeRsDuGvKxsSwvI9JCjv2kFWXWb8PkUf6myUG5z+xIxWp09P202
+; fXhUQ50l1IxbNzaZVZLir5n1M/bzCJeMfVcqo26ggMF6uVUYtLDIrNtkgNgeh9yNDcmCvKu5olv4Hc
+; /oMfRNV339mIphPqKHKXOe7M1017/2PjGL7Kzw5VVc25NQHr8RlVpzJTET/Aub1H50CAcJY9vBPEXv
+; uzlQPt7ZNaYBux+GK6agBoImaU5DJ73Imm5UK9p3hwfl3Rn3IlK7FVyBZT/D/6HI/YnQIiUvKKm9jE
+; mrznjkvjid1VYo+xEi5oK+hSH8FnVgLok4e0Z3OSVXhaV+w1L4ymKWTCQrNmAAAeko7ZPXLkuJGE7c
+; EuX5Vgg/2EyrpB6HDlIFzE6j3gE5h8AjdbS9K8vMiXWOcY5pit8iF0iY+GD9wJR6/QSjQDhXjhFe4b
+; HcNRhPiRdTDTxQVv0ZL5KprJzxmhGGUBQria4ozoQa6tkjXqQFWtI+qIykP71LBwWLq0DX080/wPRt
+; oI+B6QvvsWepaxBxjICwOhH4+WDcq5fO9LmXi/qMWTxNpgOqnwwx3F82MltQ/ijLqJnlkpX/BhrBh4
+; dPD9v4OUqmE4tK1zYGyF4wqp2StJ494tX7O8efNn513AxgPhueNFKbUjI2sdyyWx7nU6+ArpPqOEIi
+; yaFNtBr8RTd33lxrDdTmI5s5sRG5evSfaZxMhk8NX5yx9BGq6mDB1SrWqO4ELz7v5a1D+3RXymimWc
+; l3CK0hWs4wlL6k/1NAAcfv7TdemFjAuBW7lz50/VrUR2axVdsg1HQsbvHR+e3cQx+pUpHIiahmWuS8
+; dMGfdf5AQSWyrqUoBBXp2ozlCk0x4ztSli3KfnA+2CJRyLSPc8jh+PdGo4kF9VsRcWXZvQGFRpA+9D
+; BZM2cBfG3dlZd1sT8VsOa9hTEvKOKrDK6VaC6f3ObBt6anjXSYBhQJJkStz0MyRDX4pNZChOFqEIY4
+; B+h9TCf6dPxKQCdPTU0FAcIvUVL1KZ775vV6XvVOLnYoyjVaEzxKpPcv7YUWlSD2mZzQc7RCD6he5Z
+; cZXOtFIc9iwlwdrALAjC43bC9Lvdbj4+lc9KFSMs55chmPJZ8dEXYWlPvEZNqq/T3w4rYNa7WoTSFk
+; FWaZHCHGXB1wDa93JxBqlW7KhEv3RLw+TM5nccP4wwVVAlx2Q7qyFPl68JAhRRIWBMLWJ8fModRTp5
+; uttbZ/Kg7Hgu4vg+z6XT8nY+XzERFgmOknRpiadQQ24XJt2HK9lun1EBhkxsHHc68wQbXF77sLHKRJ
+; NXjVmWxy5Eq/XCEPGaxOHla8jG9N/jlMs+VsePuRAfsGQum5lUxyTFiwCP2f8ti5pxYkPfv+b1jchV
+; vpIob+cCyg3IFmpSWnGCLbF5dPDCvNm3NuGxy3gNcS/v4H/oHKlH1Thl5217I5enSgtUN/CMJKezip
+; Gi6je+FTwD4Oug7U3EO8siaPCLKZnRgU310nVl0tYAV9EJo8SAzCIvOb33Dm6UZJXu3L6ZdSuf3UYm
+; ixC8su+3cXgzyyd9T9EO0Jn2/harZ3h+wafrjaDCzd05lx6UvqzjhWpzeUG0QJJrwkJgL1Bj+qlc/2
+; 59zro3K4M8XM/u58Jt8xfpHTmD860g+3g1YxuXKdrAITCY1yAUiQQKyZGaWreeeUtpgICxXv4jn/6/
+; lNO19NKDSYZkOQKAFpl30Xi46/MDRFQSHN7tJEXYG0HMiLdvMeihHhO6DL2KEALW8z7a1P/3cWbwea
+; u69zxrUSHlIbiLJ8eV67xEBQQnMSXVjjryJGbMjzojC90wqqjGmYjvdeefykdgXrvzJL081m9JwGXq
+; dVRmBtdgEWRcIsgxABgDtPQMU+em67txdDjNAwE69eqrsOY/+LsPUYyN+C/oFSg0U8DPuO11fUsJgp
+; LJVmA7HTQF7emLMkZU2yImENu6EpnTdl/uMG9bloAqTJ09sQ5gC+sXZcjkSrdHQL2kdrg8H8rDQ38e
+; wfQFzaHQym7AMwTc4Xmn2e0/GxxJ+xf6J2NqKKR9ogiFeKO+gN+2f9bGNtY4VVkzj4vlQ7rQ6qjCDx
+; Xcg1B64c6e2Ic5d0wssNlWAX5JTIfIoHatnh20rkX/jpDOZbaosyGdG3QPILiyXpHOWR2kwKg+wrUK
+; nNypLfCq2BVA8e4vgXw4AK9qQkOaYgP31HryaldD5fhpvQOX8s8f7oywb0HZ2MVsB8iyxm4eLfsMsv
+; HBYiwT5IUhJZIv7BRe+2Fgtq/EUDPCADyAOY+bGM1pcilT6/tDRebSzi40o6Za83ulcwh9gj4UlYjp
+; o+2pL0f8lNZ8ftdzc8Cim1INTEngqLuukgQSKcidFeL7wQqcBibd/x69M8RvsXQxVihm5XjD4ulazE
+; f9qgM5lK6dfW9zW7ZVqxTfV2ZQQQfwzctxnCodv+7duwz/jnFlkHq8cfe2xFb/F2i32PTaG9oKhQLH
+; PZgCQSxJYZkZpg5Ow0EDSA/qc0wn5wiDCwHsUnxh0IfwloQGHrRqeI3C6e0hfx69e0kzgwybPaeA5J
+; NnrXx3M0/srcxew/+MG/l9D5x4AIlTlAbR76iIf0DVdDLnFwhqdhW/SAUISle0BZiy7tuEe3OyNme3
+; AajYsAZqlUc08kMI4cGEt1fRIot7qnpyiagHIKv31YRxkddhBl31XbFZQIGwhJV0L2hSBmHIZ9PRWU
+; pgW5SecS+23KNQoDApAKLAPk10+c/5JfRI7lAvR45l9VPQTJPvPAzg+tfLzlz56Krtl2TxYB/VYVC6
+; QEHtvIcsF3C7vzo4P1VTwO7McEuJu624fdUicWlgS+YyO8NnqB3Il+r+/GkqLHgpqzWUap6fc7ze4w
+; iOPA25uZ26OJn7/85FfRd9O4DNLbBwuA9wZZgKfiDqQjwhz3kB6bNHU3gSYMqnR+z/1RO/Gah1TTQG
+; SlQfSEHV7eX4MnV7so/ft8Hdlx7ug79XW2a3mHDOmTc6Rcpw2xtCiIRVxQVqADsRrInjK5QtLlw4nm
+; GSRJYaaGwaF3Um0qVb7tH6xkxa3n/hVI4zQq7UgJQTUHAR2qn8TdQF244vncu+Y3nUYVk8HVeXXRgk
+; lOsGxCS2maR3ELaoXa3rqWG7VtJAOKgdBzkyZUAEhLubMsxCaRD6vVXvnJefAPdeF6B6LibalCP/I3
+; g3gkdPQ+nhb8Cj6iObsCfM5GX+IvlEQKF4TPMql8sgQ4VAw6v5FC6zI+3pcVwvHrkhhZxEABBsx0W/
+; FmGxONuliQtDAnxndgaHbAhSBt/bSWEsgKl3tMCFDLHU2d2qOIC+ir5hwmrxX1oL7y/akuYD6fr1hb
+; VFn4Jid3bebaPZy24j4/HYR3G17oN2L9AH7gIPP7p/2091adAbOUBrui4KoNp3235qjTzl4VbsR9/q
+; lTlukcDXu4R1kvDzROT/dwhnDozvnnf+XOwKOUF02d4sdyIW5+CIebs8FCj2++MywcwPahh3yUEeWW
+; eQSCCqiDw9suakiuX9hZSPhgjOpLheEyxAHmBpDcL81AsL5O+CDzDoMlH2HK1PS7x4mv/44j+qrxdW
+; x4/mTvfBwMSNPa9+BSuRCNiquxx4C27JE2lGRFOlyN/OMrTx0shMDSTQdWz0gdUvw2YKQ+F/Qk/ZGD
+; peSDjyhhuI2C5Zt/T5Zx1QM2Qw63Jk3hYxvnVUlpL6TmGQNQpTfsPAdFnpGFZt4Rg3W5uCMnKYHt1D
+; c0lnldEn3lvMusZ+YhqcMJ+kWCfNjaGxARp7/Wqq7GGO455NUeagu4uAJYDnXAgZ6vtkMRwvIIdR1h
+; 3fv40uj1NZEqT1jZhbHQZcNIfXThvVi4DdJ6Y0Y2EpgTYIagkUel6JVWsJtBCZxMcES81WQp3sybpu
+; 82sgAALNhJREFUKuBzHNqujkDbZNkRlDZB1fw06WLzqEbx/zcYi9/nXtKHawaI9KrO6/SFChn3P6Is
+; XdOPq2dAZCaBzZIAa5BQw2WMmNf55SmThW0/adA6duRr6UoW+YBi6F/8CdWz8mz1nmMbnM7qjbEgfc
+; ji56rQ0+U9gi1aHN6ct8UnAlb2WTjlPIEx5nVNirTu7qxF+qdOD00P4ZxjpxxC+DEQAeeUfjDLxGOT
+; GJo4cxrNqrFAhpkWN+DMCEvH716qf7S8aJiRbgg/jOGBY2EGkffdq7c6Lgmj1EYJzyeS4/1A6O4hqz
+; 0TG1T4DFP/kbVfHltbyKqcAkmEnQFro+DyFBPdBTwBzXMlYF7F+zFcFNRcLDeq0BvXDGfHbhvL31YS
+; jThz0WvXXpQpgFq5FynKTLL+wN2YJGGNE8Pe2hN1/flRzpIiMGuwjEg86kmbzkBBOhe6B/70so74Ke
+; whIXNZiNZz3RbA1zDTCN9XNyCogSai13gI2ONc/zpiWytgKwkDcDObRrmJqmzCsJQyLtnfzrSQJbR0
+; Tfvo8q8+8bVBcll8FvUCVoP3Bjwhi+8J2qZR6r3JEWvUvnYRYbzDIrH/PJT3LoiUWsAmx6uF0Op/a8
+; yB8SvFbEHm4w4oZscym9kdUdqeD8TYmls0GKxl7JsYWcIukr7ms6wLQ6oiGQ5ggoSq35QHl4bcF1xX
+; w87BueJG5W5jsdsg5KpRtNllM2ndcsj+iks5QK5JYBRJMI9NrCXxShpHvFlobQTpHyR7xCOE78mRex
+; FyeTNDMPqwYAYwEEa8IhwSvmEmEdk/lj5JjH6VinRCbdULIeIKq0H2+Xs8VUakIyc0jYAOQ1XdGiSE
+; 5Mu1jTQoyg6xFN0UagwXSfzsFMTlhGDE/jwkH8S0vIijGH32oEUDbkie7uXlDlkVXWbznPW9u+BzUD
+; Q8aoraW0YjAwjtiWS8PmPRakvRE2efji8wsQz+8t3+oK3YTpt4y1eKpCLcFEsEqkbT4vXw/gaShBJZ
+; FlInyrzDIqlMxRnquYfetAcetBS3/8MharV7AN92BAB6MuGl4Bknd8xWuEXvdWK5GDT16CkPqMRGvX
+; 6SJG03CwthYmbefC8a+ktuVb/ICHpwgA4JtPaXg2y/7uwqsufL17ku+7kQbQog34ITdmHaU59NzTzg
+; TpBtx2bwBoNrrFviboMUsxTbfKL2xfo4QYA4AGt+bCwJKYWd+Wz+tAtmKNPmRnIIJO43CyAN/+W3MT
+; ci8UI82g3wJm/gJFtoVCC9hOFe4vAEMU+QPwWCzNvsHC+/b31z6FpBvdw4tqmaMoDsehCFauSKKIKe
+; ML8yTy8uD9sFoptCRmL9t0C1dvTX41kHf+TH1ZNZ/olgCLP3y+hdkwlmaJnR0nE2OookkeQ06iYyOn
+; oDXeWW1gVLZLtvEI22nDJOoQ9XqYPPSxnD2i64JVIwOsqfdsXZCcyUO5WJBEDOXAVBBhEtFHamT6CO
+; Qzlob5S7N+ZbQ6XrfnR4CgR7tQla8ek29n+NwUZ5O3MrT8JBsRNQIFzAOgYYxOJldin9fUpfFsqcxd
+; OsYVZ1+KrKWdFeuprc3YxagAI2ZNB4HXg9n/f3+q94tuaqA2WGjSNkFfmPtiNJZYfCfm+LKWdyrIZ3
+; LOEglB7g8C/UTXiWkkqY8mcLIdB7zx9aWNZ9D+ET7UkKJ4vAiyzaYjpGfXEt3BqbS01fH49Sce8ZLB
+; KFyMS/I/vC1gPCQkhTytEEbT3LhjVaNJ+lomPZt/KwctLxra8tb1xbpAwgK1UMh5yj7K51R3Sga0xD
+; 6OxHViYsREaQzHGUnILnIDDOmADS108JlKofR07E8PXyIoDxywDY2gTutENaZR8nyz+FIJqXKyg072
+; 4nHvY3E8U8nRhl7UrqIkYUYp04XjZLd2MDfRWwSH2wwu9+NvMkFCm66rR3bzFGPX86tFYLEecJ0YiQ
+; EQ3YrHFBrM/detpExyCV4eruvz9J4lG/AWjGSQjOgY8VR/DQcnDgzgNroVJswoztTapmdkXl/LJHMe
+; HsdapmEFmZhkUVMJkMLIIXkPeNHv1Z6belzEu+RIFYUs9jzA1YjzMw7hui9lW4fb/EMsvqLL4MNqaE
+; ChdZA+k8twIH+BKCWhfWQUFiqy4HFMQAdXIwBThJKmbSMjAuylCtN+xiCgTZXbn5uuqSBcGpImAdHj
+; Mr5GUjkWd3ZRDen0b7D+hfo4rlObCA3XUuvaIGFji0SfbhCz5LA5SlBVV4INRTxqMEQcCx9Tyd8oc/
+; U/REAbbhVslc5UXFYVIYxShL/gMro7Z7G+S6PzQLd0ntO86iXJP2amdNTeVHyiXaQkNOmUohm/8+MQ
+; VgfSX+O7NSJqycJ/uHRupzpc/oDvUC4vjr53G6OfbAPb9S9cb6QpK616kGMSnfqbXdSI7M4NQF0ZGa
+; NVrzNuJvK+tbShBaVfqIs1mSm6MEk2bJJdte41rJqhBZ8QHCuyfqTYIZOvomPIPVWtpGP+4BQa9p2K
+; /1oSaE6UlQgYed2E44/LAlCIj80hc1B/wP9ugnsR80IY5KMY3FtdjxLu8oRNthHaneCz2ID3AQtARQ
+; 26Ub3yiE1Ln13BXkPU70quiXXWoC6e97yaZCnyJy5y/lgpEvaTnuCT563BsI+4Xk8C9dlusNgA5fHF
+; bhaagB1GzY8Agbi3mBH+XL+YcJSHI37WtTFbzkck0YqiJxUL+qjwcrxi2rJ77M+a3LNNnrcP1cMKXT
+; FVO8NYxfns7nTAklroT7j1xKGTfGBsfWZGRHy2xr5MYYt7aSb5dqX/S/3zmp9rw8XGrRLE1Dor+TNw
+; E8GTvjDgR0sp0TSOzPcnFR7ZtSKLxVSy64peZG0KLvq+AhlHNCH6MmAG77OLPS3DO3Ok3M6P0rN97S
+; CphSe+Q/oWM1fufuEyyE1+INe1UcKYqhetY/R5hYZawK4gYZQeE4PhB9AKwFuaS5J2/nA1evizHzX8
+; 5dVG8DERbn4MZvUSAmgGfLuE5SrZzq+yngOsjP8dy/8VR9PeXPSFxQvCitXMGUmk8EPdy9Jaa8Bb/u
+; /bl4A0+EPKu1B39okilUWDfTWnIwBRWIDv6zOhkWEJcQKgOzMNE7jHitzZ4u9iLRK92t0JzJJ4GNfA
+; mGLZ+chsdSAlHI/9gS98/Gjx/Loi08WkXhRCsMjgcjkxp5UPm1fqtbLa8r9uttkYeOTBgGKACuIjXa
+; II0uhgANqRvkSG1pCqNBFaNOfjy5mKW3ZbnQ3G3Bu9MwtFqYuqmg4vDfLxqp4xQl4AnVC2AoXE+kI5
+; sce2wCkP0GAGULhKFHoNsEyNHKesFXkYSGZM4i0ozmo08OMcWIORpChQrTy/jT3SVpttNBDZRhTybk
+; wcQ6aAdgCCT74Z7TZ1YujHpMaFE+r95+ayz+fExoxWWL3GHurV7KBzz9zFCNb4jcDMFT1hezbDc7NR
+; lsnSr+56sgPxS7AFmlSYnrlEYnikseTN9I3yIvQN2ZwvgWIiRCsZO1zm0LVvTfADCtLyeGN1QeyHTN
+; pLsNKAeSNjOqwNLMkj9u7Y67CLKcbyzXlfparkCaIwQjGaEXorXC7d0D8wx6AReAWtDceeX3TlEOvd
+; Gg1Hm0dwP6Vdo7u3Q0B7TONgXWD9eqqEEVtYq1cQ6jSUQZ/W0ScQ+DwRVeuDPHmytA/B6KZW/C1ELJ
+; jYZpbrhOYw/nE+6WKArCaXDoBFhPoP7lwWzTHznqCfn3hMma01yJ39/BYovCBvYIsxXDBu/D4kKwxu
+; ObfPUYtyAp3MCdrCP7gFRBwQS0xQOU6pl9GW3yytUF6xFymAmd/yRf3h5RuCg/mfnEHTsM7pXNdZYX
+; tPyrKuaqxCz/VCNHbtjqK9GKZEqhT55YpXhTOcI1kc4Z113oGQnsudgWClCe6fxguWtt+yM1yk2K1z
+; 90E3TB3mcD0mUyS1XO1ifxgJNowUw+s9lQbz4kewN7vLG/xiTKfT9grwo1JR26spycr+W6whNo8Uj7
+; 7K3opuCOKySwvmkeFvtS10Y/iBKrtle98CHJgiNFaBi2UneU1lyc51ZORdVxoydrS1KgrtAgk9ZYPT
+; NFZpL7P4A3OV4RTP/4xD4D839PJn/Oy/Zs5c/TkUHnWsCMdeZLthFF0ran1CVPGN3E1Rxv3LjG29KR
+; e7jAexx1QVggZFGyiznP7bPoXhwuNihxhlAX31qqdrKcAvbkUUey+zkNSaOdOGEtWCz9NISsU21CfU
+; 6YIUtVAfmoyE2ZYFB5D55R3BcS7gOiI9Uz/VWDjlJjKJvf0dQ1K2JKnbNGnW6E8X1jVyA831ChmyOv
+; WF4FrZNNhlDqB55tCvElgSZYGMOdQCkfG6bjoJLt1/vx+BGeO05fgHNG0znKIQrBM+qqAIISdMOqzH
+; UZSSL99kQYeBFWCbSEI8F9eoKyo5sTpEwPJos+BzYFH+wAr/AA/wlOmhUHnSj59QYbiqDsfWpKP7YO
+; 8Msf0KyPx1FMaA3Ck5e2ovialKNBAi3PjH/NhdVXkgpO5X5sKl6uR0AHhFIA+z//NWrzGZi29e3fT2
+; gJG50RpKOwuIK04eBTtCFaVa7gLCSLFHCRu/9p23uQ6Zm0EENOK93kofcQsgQQ+YBUx0DFYGMBC+yE
+; LRGMxcRb/aq8GjV4ZRm4gldluns6iKxAW8T902Tuzl8VV2nUHkRdXfREOAUP9gxnBpzzR/Uj2CePES
+; Pmjez8dvgusie7yrEg8g0YD0k/y9r8A4U7/xubHrh7B6Z3xMKUQ1kO7mGIGkauegPYGvJ83X38TIpB
+; dIS6VMMyvVmCxR1XcnY5NtXF8gswnllbATw+puJaaeMfESmeSNH6Ty2UkRy7jEVVktY/S//B8w4EZq
+; LXaackBRSN5mrkuOoykZHXdKWydtuDWrrQyX4qgQXF9Bchi6S3mvuSQm5uwBsJNsKenQzLHKwgVOEv
+; XQEiEiCmt6lvOg78u/tLYmYcGdG867uQKj/pr6gRG+DncYWmtJ7iMr8kCvwQp1ZLlwUtKFJDhcQHoR
+; +MQhvTMQy79WDYK3uB7CWJuryHqvw74/2k+qqZA0JvPo8NoyJbSUhdNJYvEVAeAytpVuxSdsI2YFi0
+; 5yS4xklFtoVe3K8/xMdQdW7xICVllNjg0GCONryk8fABQ5Hi6LqiCM/fk67aEIbAi3d2h1SSQDYmEQ
+; mbq+Cum7Oj+vjBtlZ5U/luP/tLiChRt+wT5Q3N+U+dZLHQ7rXLeFnxvKhVAmT5HdCyk11VYTfM2ENG
+; T/UILzsT0Qgx/Yf5IhRiIdnUyK9yOxVCxpUsNMJYuCL2USVdFxxBTjeQJ06RFP4bLG8pOepQwCq6q7
+; DW00hXzkYOqk1Ei5h0xVjLZTHhrpzYxWEjS8z3fDhU/9/+Qd81R62lfLKvKdoQiLXZEZPqanqQeJgQ
+; 3r0qjukncnbpk4SdRaKS/pNnWWAlHD7zP3q+lW++Op3o9n18yi2eKFUeLwUEBu3FXLPcObV+6yYS02
+; K1Dkq+QeqU3+b9msNo3Ztt75M4aKqLGCJg/bzh5OlBc1a+sd3iXzcGUluAlzOchHrEDtbnRtnqezaE
+; OOxVOKf15SYbj1NQpcgSEcmuc675u2BVqfClnquRRr2Xlpwhzda5VGxxLyucnRkgd8IW97tVO03Bke
+; E//DHjERoYMsoJ8R8WRjyW/cTdNdmri1EnlfD4F48pWGcvezsY+GPAYIgPBH6ciXX4dcU0tyKUKit9
+; IQCUHkR/qsMCBVzaZuzHjfSd52YqgkaVjk5xdmyUJyp4NQpMUegPBFhoLgLO8ilXzogTDL66mlD0vx
+; dBTarHZ+HwiM9D5p+aPrbnCiyG7+sbmGa/19dn91howVl4xRirmAEgqWCakmzQOkhyvshvCI8L/Rxc
+; iJDpHcoHDPrV3EYuELCNKguyZAWoGxewx1P1709lM6/Ceo1ACn53UPLyJ8fC/TaRfiO/7n3epA/wuh
+; euiyJI+MW5vLD6ogKfHIcTMSxPaSPLPPiVbdLMjSsF+cfTW0X5U1Xt2hfUectO1ckbB6A8Lm+YjzkW
+; Md7usKzE70v8b+ZLqp8Mo1ahO/TIIdVX1+0SLCIO4dFfIWQwfA9QCE5+DaixJXlUdtTU0iBGIaT295
+; vHcU7HVFU04uyLyqff5mvdzuHSsti5J7vqf2H1r8xG8YAtV3r+u3efkDRg9ZMvWaVwLWUK4op0oCub
+; q/UdWjPD3PZbf2u6rQMsAqRGiH8SjbK4LSlfrn5JdjXAR/FcgIJZkULwFZ8vEMiH8fqg9rC7UJaEjh
+; cUNycoZjdftEOkLD3H3KXblLb2YnJC482Q5Zkj0Ap5wMDvzJAgPDBo26IIQg7V3kTthObiNAKyxoMt
+; W5uekD2EOFpYMmKxsT4A7Fx4xfMaVP+xJZigkYMBUxMFtb0yT+v+AmpaKYThkEti7PBhrh7WAP88MT
+; cxtBj2hEY2D1MIyYVUpXwyLpGJahQPrk2xs3xKAIdIrtic281lsnoW7MiZKW30vqztOuMl6LMRr0NX
+; +G0ZYEjZ49JwXYb77oKXbqYHGFeCgs0CaSxyqbE1aCGsxPAA6PM7zFzN6arLEHZT2izY/X8JF+scQ7
+; JWtOm1AlBobZos6QaExXwI8pzYa2sVBek1paS2eUk0wb2EWDXwozv6t47RODFn49veq9WUDuZL/hBi
+; a5d6cFk98j8V3FquIKoc10JHk5cCXOt35MvMuF1Kq7zKVLryZeCrv+RKsTr9K8Fo7sBRHHqTdKwVh5
+; IVne54sDLaVa0ipFWIcHTCUmetg7/15nnxaLeGO8jJBxPV+guB9OLmPHTH9dYJueJekfEYRYKGtTH4
+; kdJHIrouL739mSwrFmrGrInZUDDAh2SivDxoesSxyqrrKsPPa1MHXz46KvmHKZ4k+N+B+CuzPUcpde
+; Osc9XZV3Rar1k4E4HoLwtJlfWfeC0GUkk1K9mONJyeQhpnTx01vU25WefONq3JGZ2Sc5EUES8sD7Ss
+; IxyWQ+Ai89MFH/GK4FXNTg/qJLGGAEe1+fxVAGn1h/rLYV3xD2gzBgwgkZ9jt8RtV8XfSbODeyLqUq
+; qyzWnibo7+wY955md1xwUTwmvtCxuu0dviTPe/irxT2azk5lrcVJZQNUg3Cpv+l8KB+hBxvxRj8rzc
+; R2I/vPYv2p/jrd2Jp0WkgBs4rocVAhC2uGtcKxGvX828dWTl6+OYjSaU0rsc5Ji8aw6BFO/NM71ftq
+; hWDMdQ/OstjNr+IL9ESnAi/SD5EozNUlQHIehsxlQJm5UkLiZt6q6iPLEGLf+tFq3BMt9Bm8ILE0QJ
+; /CRPekqwhLDoN9PHVJF0i4lhBwlySgIqmPMyZzc9nTCCZZjw9Ko3TIhGdZW/gengb2uRF5J2jaTMRv
+; a0Sn90Yfi0Lb1KUlD2LfnFpL/BZWVZsTv4PCCNDMfAHiWFk1wc2dxnMoVZWJkdaEyYMkl3b19asRIG
+; W38hjlYqc/hgg3KgLzasOvKA+bC1iPeTvefvPio6iPsJIRAq0c5G8aig7b91M94OLDP4kYU4FSHCc+
+; JHp2dC30lMJDtpj/Ok5FUgTAL0hiSmw8QqqcUvlF+BI2v5Ysu9cM27GzD7H28stJSqHVAVNVeE2p+V
+; iUE3JZqDmFehCNwCjvIERZ36/P8vLXnCBABbouJejPEmFGYIUE3ePQEA3kR/aVFpN2goMznHOruoXw
+; tC56O5qWwJDG/rDV7C5zsmqMfz0E3SlifrTgsWEIYWJ11Le9bRAAGEcieS3PasLXeZ/ocBSZ3/GJn7
+; 9a0uL4oTFfoyNfMuFpLgeYlrmtXM6dlcPJCvFvVwmrw6dsRofzn/+UBgROEvSGsfMtOW8c6FfDW72Y
+; JBG/dwRBE9p6pccLyN0N8/hVRP15sV6RM/oQfGhiZmmawbMxeUCzYKAdUZ8cLOfAhgGTKRsY2LiNdY
+; MsLtU7utrdIwjUoorNHV9x8YkY9TMZ7zgGHNy83pFZt50HuvFS0HaTCDdJ/owti3fkLPPgAQwVw7Q8
+; XfpttdoMn8CbUIhVFjbcGs+goIyS0xMakl9Jq9pqb7RoOp5Z9Pyc+ivTU42wLprSzAQj83PfA87KJV
+; rApsWdIFVUaD8hrMgpUKNeraHMrSBBhRiuJpAcl8PPi5tVI7WtJX5JxKBirD041OipoYM22Z3d7b65
+; zMwaDrbGhXL1EPGw+EV+cbT9gkiIf4XrikPHSroWVAZ+Hay8IctNzWVk9C4FaVnX+Hl+qbhoHuS8YO
+; RPQGMQnfBcdFHp1OjHEPh8WMUSMRKlxk5nsdVY0hB1MPzSJUB4TnzIZFe+hsjTpImYCfrOkAjmzJqf
+; cRyIz3LirAYxVx0aAqqIcGBDxgU1K5SLJBwEE55XmUSZI/N0LZKhLtOBIcJtkNiF3bMHV/fizcGIBN
+; zb0G2vCTwt6AtoLRB9tdGALjEOap3reWG+JihAptB8i0+Y/3ESubgcdfKPnPhW+876EwQwqhAGYWPS
+; fr5Y5VBf1tkLWa7rHBj7lxoUq0ppXROC40SGsX7PhAHyZXrAwQYocJSSCc3+oUyUzh7t5YY6cyRXMG
+; Lr+k24OM/gDnzoma9qRakhx1NWAwekx2f5iHJbp7ZsIlELYLV08DVmF7PBtqVNVRcT6GVi0hxyHwGV
+; pje/nD3LE8W/ks4vSa+x132X3UyYMc2p0Z+QwIDWhlcxd7/DJpuXmFxUSy1lQifinxu7ZcSGj/bydu
+; cIt1cL5QR5SUI6roMc9+XZC3vhEI4EWbOXNRrA2/WHYJS8ODH63GF0vkYtEQ6ZWgMUsnFV1hoq+do1
+; I3PBulMgOeP/n5bM5dp/YlNq01Q+lu5cooXuTR8F76HQaGcPScHn4OchJcBs/mTyAfa5mObLYgms2P
+; lkQmo7XeMW/54zfvEUdT6MhKNKi3AebA/3vbtQQWPpzV896Vy8I9YlfNEzK8itgkBH8qP2tvZS5Oo1
+; RspXNtojC6Ahu5WygLqaTL04KtGw3DM4Qy//bhE2u8pbe0HFkQS/8FsZ3GGECAcdXz5uV7oCWg05Ed
+; uTmdLE9j4shCC3o+Zg3EXSG/iWzjsTUs2SYW6NW7zkUjl++7njcmMOo6n00TrISoZMon6ps4wpq1Dg
+; BNKOvg2tW6eqjpopVcDJbCabvEEMUTTlm16kLmhrN7Srczn/9GVFBM5Eumsbhi/EzRKyjOTEvpC/A6
+; kp4rzJbHLmCQVyROwFTYTCqMNe4VJjHbsUsYjZH+q9EVkd+bG2Ak9hx85VGBelNhxT3irD+FNyLRiv
+; XZv9FEIHKNNQjLphTdmo4JLb9wipItRtEaViWtv7xm9NpynTTKshRgITsQMepby/SB1BxBtC2vRWSQ
+; SGQ5t0oZEPUj3+KvzL0EzUIzwu5NTT/PSlSGJC0wvEzDtNmXXWkI59LqmMQwR6N0mF4XC34AcNWMAs
+; gJ2+E+mh2hEfp4ISfa0pUMPfiHKjkUMGHyvOoSdQLgzXykZd1KxiGqUOcr9Z1VJWHNp4cQ/Ns3NHiS
+; AcnVCdav2CpyBsL0by+h8XsDMPzbHIRc0PR0CT+4xpXufDVKg3UQR5+uU1OyjgejeVYPBd6omvZF5y
+; 9W4Eu9zKdqmqBdqW0CY0SYRoNBEALQTkQ/LOZH8cBsH1ea5rQn9/iW4s1f7vuveT+Cxc0SDVFW0oAA
+; PBOwexvE/EOXfBbx/3Ru3Uw1M8GZWKfwLnJopJPn0F6nw/Iv1UTOJZwH5GawOsh/68xbl86Op1GCrh
+; WNEmJh0W7tXQmuTtR0gxipjx80e5BYXSZWl1Ew4gf3muWgX7rtssIUw/WVj5nnUgP7XmO33X3uhxcX
+; Tu17h000iLQKVh9uZs5s3+VuMof/KWficOQnFQblm2FjsIfz19ET2HjRp0AXvJ7hwDUvPlPi1HT++7
+; VZzpQWOKnLjsweis9BRzI49X5FCte1tpS8FZD+7Iyu2fC/k/0KJogGnT/hSphmQDe/qIiS/VYI9sdi
+; L9jdSCtlwt1T0FTwvhMHLchLherpWZ6BWpJQsLrrYflubsK8XU2EYO0+B8WnX/aA/453hRBhAvxFLP
+; 086uI592nrIqgrLVn2ParuMEMnyPQF5scpDaqg8AYIFePMXhzbrKD41pktas5UxWdjRT2Afsa35IEH
+; fKXlZkpszvjJTcV6JWtDxa/rNfFQ4wdNsJas+mzUvZ8iQr6LETijQbAFkl6qai18bSICzZUHucCKsS
+; R66PymZ3jqylQqQC5hkZfe1gKPv7IyGFDnvQNbMfDn6IUE4z7zyB8xMZ9xuzOW8B1dqEBxj3KKFqbc
+; uSfB/H4NosdSCICWa2IVgqMRuicJLX49QZd5cVS29j3kAtVBfem0/6kK6boccjVhoAVnBT5PvQi22v
+; Ds+GC8/mNOGT3vOHYqUz7zWqD1yaOSLnqwiVTNQwOsuAI+joWdiFw4XsbI1dG90CMi1WUZSjPPq0nx
+; u5oju4Gt6TYweS20LPN8rgBgb5AMX5YA3obJK53JIGVryiBvRYrC1x0ODZS6DpVsCptf6KkdjFzrRF
+; 1Ygt8QtCuy74uTgHzM7WzGm+hfNeARDC4RgQ/NOcTzhhwGnep2MyOnVdUKa/GNeWLjllq7eyVZSN8a
+; H6HrSssSiIvQqyyKKofcpDtU+AH8Nd3oau558slqftsvg9P4EtcOjpWKAgFtHiZGSC0f/CcoU2ia/P
+; hfV9civr+bixrV4i7BJndmj/Ll3ObQPKplDWW7UPjWJb/+ppY2ayKuxvdx6JRqKjOnBz6JqAm2ddbV
+; 1Zqa+Q9vAbRCIErVfvbJVmz0JhfBehVkAscZGMXOKa5xO5+91DqwQv4DhyIW9ZKzYFiJ0x4iTvtgqa
+; BxGup3arO2ugHlvzqThBP+oDQmHwVlmk6RnHyvB+WZSjIEG0lrNferJvHmxG6NAUg6vyrAhWnpoRJV
+; JuLEhlM0AIKrM/IwFxREMo4TBGRbC83BVfAPT4D5XrVVD7BQevxLIB+iHACj2UaYkkSoLP+X/nSPXs
+; lXyL25xecIbdOAdb0A+9u5YiuOTWgU/cFpP4oLQ7T/c2aLr/iuw6EY5PS2K6zjtqDj9FLVY5rBV2pe
+; DWaykQNV+HDS8raT+5IJYaykzB4dBAXF1vgODiwSiNv6y9ROOpn4at739RSn8iQdyyiwiXXW+1Mp6U
+; qDzN+ZrS/qal1crVw20oY7AHmwkUGPBdRY5ndMMcJ3iPRSAw9+W0qKHdOTsAYOGf4p/9rrjMmTbtuW
+; VRUtqhZCkP0bBjUoHs96vFuleAazl8wsYwGhBxMdyKS8q6Nz4QKYKN4bkvpqjE2DBDONVYYWRGy7El
+; SgTH99KUc4eqtejTci8MBgSI7d0DhBHfL2e4IIbvHk5TjwYpgUVECFvnaMHo45MmXq5b4vWnV2itSs
+; x6SLgawjeI0vO/PA4dPNeBdTkvzeuwgkhTgwbsvDg0X6TjUs4JOro9bCH6vFPhASFJFJ404h2SMRpA
+; QklMwe6UC3B/oWP7qEosQzn6kkOgHzFoRp/TLL8fw/HuNetpuV6eeA9A90FtC/RkdOAQh5QlBLVvBF
+; wgDorvvePDl5xExQ+Lt3GKMbf5HXPiyN1U7hkIaBEEEeZIxoty0leyRJ7i/59QR688v1+cexHtPCVx
+; BLZHWKtB06E+onxhxMBFwSW3PaWW0wwUx9MFTrzn1HSv6prmvNWXXyGRRq0t7Tq3HWOaatkHDhVEio
+; hVlkqPqiPWagFbAecSpRHkyREm1r75GqM+fUoSEhmJFN8PVX2/16jtcrZ8vtry6a1ddYthVOj/x01v
+; BvbWVD0DK0Thl9tBSvf6hW4WZomhBRF0cnjH5L0dDBfZ7gAMrxb/8r5emvn78B6+WKkpWzxl96MgR4
+; hcs+MfloVQBAmhtI+HoyFI7bRl3pYmVd9KgkfObUcj31r2oBrvBMhh/k+9ufcPenItzE76iMX8OZq1
+; TXMR0RXNlPyyQ7O9tdB/8WMDuBotX7O4BFygOsWxQ6Pq7dU+Pk1Ja0VlHRn/Jb7FzUl05Btm3ov9NK
+; b+SJMsGOm/7ukCVPyWaH1xUnhKIBxPhW/DzLvxbtuPUFQnqGHTMD+PolkgmlXrFFj4cVoP9YCcHn21
+; 5IAIE5PSnXUcKYzSNy1HgkCbM8tlsyxEjz6K/KMfiHHF7j6TGaEZ4O4nsfXcepJbtSoRaxh2KQnE1B
+; 5CBJfJKjlty5JJL+G3UEcKCfA4Yj7uXVl8F4fBtEgSfQvee/jCN1/pqbvjPjl97eCDuL/nCdrhUUq4
+; WFF1tRhmi82t9++fz1QiQDvyS1W7KtTnP/rz9SkWg1abUwp604kKsYxZgk2lLqlTZodGvuw/7WTZlq
+; zWkvEp+svVSo3/nV3z9PxmLUArDtEAz9wC2/lC5Duv4pvAOu+o6IyRz+BeA/nuoRzKO3KKpoe0Dt41
+; Sl1wMHSwTtGSq9+HFaeDkLgTibdlrdRxilVGhltQ+JIfLmhkpFH84R6v2CPIpO9tvwq3SG66v46mh0
+; OUqtjH8pp/gnpl7x2L/VIbBQDo1Rso15HgavjqVR2zTZly9CNgdA0HjGWP+1ytpsluHR1lttSMlHNs
+; EQ/2uPQqlx35HgoFrVB9i0N5JWO+CBrKYgiPdb0+BxQECBki3wU4nPqvEoUh/Q3mlGsOsIfVR81lqg
+; COzNU3zNaCAddIFs/sec7sB5DEHL2/bFNEeZeaVbs2W/Uu8RF9nVN0WSnsPxuSrNvdqt3XuOxNdT3/
+; 4X/gbKHlipQxOvFqi2aYOJeVDQqG6hanDAOS1dUrdNObU3CUtWl2/642VM98188DoSXoktt/48KWdg
+; 7Ga3sRXxHdnvE3TbAsRCvzfswWbPTw4hpC40BKcjHNNHB8jDWYrOvhl9xuK+QM0zWVQTUCk8I9PWpn
+; DR206v10IjCI6jMfY8ynRo70obdvhrlnSmobHUum787Ua2k3OSi/jcxbxTxWWmDnMp+C58DHmZf5l2
+; 3qGk9bZlN8bv5/MuN8APFt90d3ZAojMKnAO+sX1bD+nm3slp0w5qzVnGczpNCOlNbcXlrwCw9SU+My
+; UAdaq2Sbc2zsVHPSsd4fUq42EfV7LXIwfD6qM4bx9YD4ZGXVlBgXR8rpW+a3kbvLzCTZwbzAKiEnTH
+; BsEQ6rfjQ6yJ3F1XxZuOqW89dlcT5H7sfwJFCHLwARsomCJ2XTiu+xcOfiVM8vLwzJlMFlss19iieF
+; eHItQQJF/hEhOKqvSiC6zPk63i8/ef1tuXbeCH+zxTPLvJHvE39R8/2l1Kwmb31p0AL3K+ZA7e8M6u
+; b4E6MiPvGwQIsVBs3XIDGeD3ql2YSvr26bfmG3oPb4MiFQXr8jJQ2/h4V7oOcmAZynyAO84oIa/rWR
+; VLOKWESQOsv4SaKvoKjbaM7LdQthnhM4CIziPQGQWENCkV0umblId13p1IvCAxqbfqkAN/u8mgk7M/
+; 89/D9Na4Vripljax8HL8pzItWnvaGK6pBIAlQ4fM0eYaB9PGN2RKwANVZRv94+4CK/b6OBDAzoCPf3
+; x0C7EdAqfgEbliTICQUoRaZM1FoP0X8PajjEveZXUQDSbCu7W2Zk//vQ/2KXX+n7iMajsLlKLNMuO9
+; 8T+lh4PynATYjlhB6L40LCpB4kp/zu8eW5InwgpNBUIeiF9CVGnQQ+kJlKsXM1Gki6kV8Rm0kKeK6f
+; j244+0Q9C75Pev07xIEuBS9e36e/avtpDvqb34xmgDOX+bztPsQ3PUMODXzK5J1W0gSh9nzWRiTiSf
+; 1diUbsd5hZLSKPQGlvnN/wiVIsvO1zEG1//1b2qYCqq5HGxXM2Ix1PpOaLCWQk/nP+31uRyUNBqXDy
+; zQMqor9lu1M/czs+c+E4twwTEVhMk2PmErOHFmt33XyYFcCPPZAUp4ezxFvsaiMJ6cTQh0Gwm1K7OE
+; gr/JaV7blM4kmMWsV+rRuCc7j4MNkun93A8cSkw6NwfOtFb74MvC/tb86B2M2W0yvQn7YF+LQubVYk
+; Dz+BmNtG6yUKpFG+julhkJKnLA9J+zwEc970uyQerFZyELoUzwfZLezzHKHHNGm22xbfYNf4XdmskN
+; ief59JPq5Wwi2Kkxvc4BnpR5wqjLodoZ7lSCrHaHt7KLovgVNzaJGN2j70UrCDf9taJ06U8BtTKoYl
+; wzAUQMDB7HSfqI5rItllWtA5sbbRvcalTG7dXIwpPggEgcfu91ElMzVHrRkLDzlgrLEUnQOaduYP6a
+; B36evr/e2/63aiR5hdYK2DaTuOjdv+tgHwgTnfGndTnzC0fyGTqkmYscTK0iJ6tZnN6wW5CfP+xLTD
+; MXsIL13SEAqicn4Hb4/DmBkoSHDIDG7SbC69xhCr/2C2IZGEvtjobXCyTs4uzBwTw7KLWashlxCGPr
+; TCD8kQRQzzeLrM59miCtCqwsXCJTcd0U+V3tz0SHsJpYU4/k8bYkN/fxxDB3dSGXKgq6Yl2eP+Grsj
+; cGjnfuSebtWvm67ZUr8JCuIvsbs1jI108i68CZrpR0l6juvECt+5/05gWy69pJ2kNc6uOb6RmnyV26
+; GIBLVmJMNsq14PxcaoFKH6eRyzeTwVv9inAur7/E4A918BkU09MUFguvby2XIL9Etteqcbzp5w+cyf
+; oSvupRK7u7HeDd8zLo0dVnIwl9+yJGoWjLUv/y5nS/D56Va7nj9M102W2lj7D9MFGO+azvj9l6pyrQ
+; pRG5+mPBwYlx9Fe4yRH7MOI8+sfYuibTgTUIEl8tbBt4Np+a6Zog4I4cWe0kDpYTee/E5VPj5QedF4
+; LUeNx5d60sBMNxZYOgFHKSC+DoyrGy6ldLjrOK+CsfYVakWohxvn4JLyQnw1Jj7V3HE1j/UwWEd0wP
+; SlKWWlNxxLfCNu5rnJYznrJsrcoUHuSroBUagXe+LmEJpeiunDecCEB7Yp36RVrHYd5Dx8BRHP7ejz
+; jYrMpNw8NvDtZO/KzsvPAWtsKi8fthzmqNR5Z0+sxrbet4z1zfJJ95PB6dcgulxD3gHws70dc0rFN7
+; +BhR/NKJS4p9La2mkTZLboSZ7LXn8Qk+kOb5/C4YkClWnZ1ad7QRMLzfRUTxC/0DvFBy+0KtjBu8sj
+; 2qJK5eChDRkN8VlGNf6zdF8UqKz/jNPSbWbsZG1/EKh9fAoYDafVdOv+EG8yngWH8BRHTuI3jOXaPl
+; V0n2Z8JooWEFdZP1+TbThZiwF/jdF5ZqWwhj6nPoG2phfHXtPtLiD6KgZfnmgtULMtEcUUc9Dk9GMZ
+; +G7G1dWAnYCuBIIrlX+0hkr4Z9oBjjGLVo5R5b9a4iPF8LhTjdtjvN685ladTu13yayBkPP3wxYoRq
+; pJVZ45auFD99/xLQBU7GODJLmLM4hi/W6nH2IL0TRa0InW5swnso0q1s7+r78jVzLHoPq6XocjkjMm
+; ZGoVtve4HmAt/7GcHatLzh84fMJHEpC0+dGUm/AAAAAElFTkSuQmCC
+; thumbnail end
+;
+; external perimeters extrusion width = 0.45mm
+
+G90
+M83
+G28
+G1 Z0.20 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.40 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.60 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.80 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z1.00 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
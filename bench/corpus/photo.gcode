@@ -0,0 +1,1167 @@
+; generated by PrusaSlicer 2.7.1
+;
+
+; thumbnail begin 160x160 54272
+; iVBORw0KGgoAAAANSUhEUgAAAKAAAACgCAIAAAAErfB6AACexUlEQVR42lT9WbNkaZYdhq2193eOD3
+; eMKeeqyqrMbPSIBgFwMKNokvFV4pPM9AMENJr4W3rmi8yoCcSLJFIUAAFNoglUd01dQ04RGRF3vu5+
+; zrf30sM+HtlIK7PK4cZ19+Pft4e111qb6//q3wL7hKA1QbSANQCU0dMQAXMfM5vQ3ZVpNGNLQUhwcC
+; cJtDDR5mEm9XR8/E//4cV2e0ghwTbImMN6/d3X+c/+lU5Xmz0yfbPOh4HeyWQ0B7uJ5FoJYzjbJEym
+; LTs1zulsOSbSHCI8Q/QAs0WbhrEhrM+AYb3J+Z4Bc6csIle0zp7exqQMEDjH+Pif/MdPsXIZE+rIOS
+; ak79+0v/631ysNIkwwn3w82TckuZ3nFsE0tGFGNPdZzTBT3A5a5/3sbS+ExombWfdPx8PH24HM3333
+; +OyD85+9xWdPN/M0ffmwDssfP+0N7WcvEYM+O53/9I/PV9EB/vyXX33w8Uf/9//fXVtt/tP/aPvv//
+; rh1a4dpt3f/XT9x5+vzs/Xd7d3n5zjm6v1/+n//eoPnw0/+tFw/uRsPeL+5fTP/s2+jev3xvs/+L11
+; b21c9U9O11z/V/9GSrBLaxJmGTaYm3JOYDALmRsFkiNtFib3DWxITEBQzRo7Dqtch1kOMzORtpthAo
+; 2HnGBBoxKb7XBiZ2RLn9G0miEyzZnpG+XsNGIQkSl1j7U4aEzNgdDopCkozD6O0gHJzEGjhiQ0ZzMF
+; jcPoPiXdBNt5bGaToYXC2VPBsTk0+N3/+h8+WQ1oRg4I8242rIbvvn387/8/t9422VrmINuNrWUH0m
+; FBRp3I2dMhS0lBDLCNMiNneKKNjr1Hp7VpAmTexge7H9uYszNnXzVh7kF1G4dVt4OFe/aWmcxunITR
+; txj6xnf389jTfvgiVmd+Ok/jxqZp+s/+5Nn/9Bf3/+I3bbDDpx+u3rvwDPuL38zdTpDZ9fDDJ9M//O
+; J0xeHnP7vm6n/7bySD7aEVLcyhtpFITqmhyTvUvMuF2JhRfAAbbQsGJQxD5mzoKwzQMK9mU4oDGoxk
+; h8FgSoptAKYhLLgS+7iSoLmbhI15H5SRAJpzaGMqJssxZNYObW5K0AQ5AAncJA/NxGjBMBvF2DM30u
+; CY0rrDFaB5DGKnraUOA1qEz4z1mLHqe2LfZAkLwsygSLeprcM8RQpiNzfCTCYCoEd0TrluliM7c8xM
+; GoHooqhNgGyHhmHOgM3GJro0t7RsY6A7XYqeBnYLgpC3DnPB6B27gZZ9TM8mhqfm6Q8/92dPH85Xpx
+; F5fr755lev/sefNqzO3CJNMXWamY/ZPEHOSu/b/R7yGAe3L/7MSIHuToBmAkEYSQGS10cDMzvMjCaC
+; RpKUSAAwkQSQMri3FLoC9cdoJEFLJUBRNIFKKQRaM0MozA0IN/jQEpExiwLQkXSDJJnREwn3UUNLdG
+; RDd1rIQTpldMkTYhMrlwjeIIkGowSZkaDI9DbbOPlmatuDreY2zjYmm2igQUCGkxBlkEESSCGFOrOA
+; iUoDCSnTGimSIDNVRwaSMuFpbkMiJCIlmGRASi4aITNCqMNCGk1yBJXGZnz17dUn5+dbWdPmt7++/1
+; e/6NycRbNZlODu6QYKlJEACdOwitVKZo1kKmgGwMxDkpIgREI0uFkKEgglOmUioUBlOYWMNJMgirBI
+; kTSZySUlBYFEZpozYc2AFGkSMtMM3jyVKRFMKc1gchtajKGJIchFOD2kBCLnwcDR+9SbNSiEpJLOTM
+; DARIOHutkgBSiJRppo8lSXJJpZ6xGgeaMoiEozUWCSgswgZARs8GQqA7QUHfVToNJgqRRNXfUCqQTp
+; aEKLDKNLmoXoSXNQJA2ADLRgUmlqMvScsxMmN7CDbIAHrK2e/X9/uh9yclLWhvFkSoEJiUaQkkRQlF
+; T3BLSUjGwAzCylzISZJNZtJCQBiEwQZi4S7iaIQn0TCUkJ0FlHAAQlmBkJCO/+EiBCRgNhYP0FLOfJ
+; nBZIcwJygh5SZ7qbRAaSTGQapaSMB+KAPrTmoBBgAoSCDMjcXEpCRgbNYALqYylTEuvzIevCiIBAks
+; b6JCTNjXUyzBWCEoIUADMryYt0iSCdBgQRdYUlSpmSe1OKpAiYgRBAQikiBZIwM9VPw8zoDmQ3uDLc
+; mULn0JvLL1wHsoNOGRIGmGRulqjclUoDJEAyBMkmUQmYkaYUzeoDSpLqFjMzjTRy7vO6jTICoJR1L8
+; iUnDQiwFC2ejkBIOuJLX9HgplKJeFYrgolRc8K6WZIdUaadVpPs2BLgyHr8JBIEz0vTg/qNj84OcAc
+; SUBWr5apTDojQoSU5l5nERQAd6MUGYBBqQSMUkhZ2YRGLe/b63AoaYQRkGgugBKNmYCbUmYevTvCHL
+; 13mBORSqW1OjgESZHH00aJUAJJMlXlBXukQRokiDhQcjmtETlD9EYZRUMKSGC5jBAquRJ15miQZHW+
+; lltGQjAAdT0BsW49lptNk1Tvi6S5q64zKDDAFCqB1Su4EYAgpYxwyimpjgsIQTJAKQhGi4iEUpa2ga
+; 2CnZAJlsFwanQbnY2mtd/8/kdv/vCH18nbZk54CmZNcuMqU3WJASzfCpSZQNa3Vp9u+dhKKTM6IdRT
+; liKi7pn78jzqXqZIawCJ7+9ARmTWo7aE9UjVi1JQGinUzyozK9cKIu0Y5ZgpLlm73gBQmT+JhKuP6J
+; aHir31/QGsA9h7ZIqCmVk91+ULZIrt+O3WVwgA9WJLvCXfxVlJICo6LQ9HqOxcgUzVTAE4Bt9IuZub
+; k0yEJAgGAcxIIWmgm3pYa4Cae8Zs9rBezdN0MnCV5i4MMGmsHgmklBft5h9+fi/mX/yicX7iNnizej
+; SRcjMDSWdSECtwE7akkHoGWcVkgjQpkzQaibqmqBIkM1HXodIMoQrRZkqBVCaY7kNGBwykUuYNQl0K
+; xQyQ5kSCLZUkM1XxqNIXSDOrxFch3jopBxPKsKrtRLhnijRSGTAarYokZEZPmjklwAUZSFkd4aXSxZ
+; IZK6LqGGd1TKdSCojIyMxU6vu/6kfexWUp6ymYWWRGdDMZUwog3eEOb0uh6WYUQgLppgv9/A8//kuf
+; /6qBQp/ZZ0kW9Ek8kGkpnw/Dzb/76MnVn37hh3lPdWpPdqMIGSrCysygSikAWW+47jNYX6wSWfcvsj
+; KhMtKNUBCpzIjg8qEq1gAgCB8aSNLd2zHlC9WJVLgQIpECzYwAkoS/u2UV5czMjGSkouoDwo3NZvIA
+; dnnVuk7CIiwC2SNnHaug6KGUQPMmIJbzQiG1fHaBgJH1/S59whKFYBVy6aK7DTRzs+XnhapLaMyKAR
+; W9kc2qEggirQ6+EFIKJvYeVr8/64mrZ9Rjl+b3V7/57PwX493PLR+RvarOtB45W8qVRO4e7c0vv3zq
+; d7/3/tverirkRQbZzVJIWSR61wxbvkmom9HoGYKqLJIZm5ubNW+VpJOUsUdXRSRgaA51Q3gD7Zj4pI
+; hUtYEyJSTLCv71NSkbaYB71VAEPLMTkMIsjFEpo2dmBZjK8EDCOpUGOIQQQupLhWKNbETLrgzZsaIl
+; j2kAJprM3Oh1dkgqpZQiIdAdZqAZHSISTgc9aQIzBcFpUkb0rCsLpgSIkgGRHanW3CgqHMfWC0ZUpH
+; CASlFmVU0bK4UoH56ePjw/tU9/9LRjMphHs0xTpw2Wg4s0u92vX/1u7/v7z95/+P2PbjtnM3c2IoFs
+; DjDJFFWFmbVj1ocRDnjkkn2VqQhTNndzS0mAmZl7igKUSSU0K7uyG9NQv0qAoIyeBEhn4RYs9BaW6c
+; IRMoBEdxckZP1ZZ3pBDqxziCoSE5bpkU0iZU4oU2YieqbkkLutBhuUglKZyKiolcpYIhEk2pL838VZ
+; LWXZUveSVV9g+XLkVThBZjSjVSWhLGygSuWswJYJMCKX1JVZpZkyl2+1ogSYJKCMkGJl+8142GzMvA
+; tIueigTOlQODKRgsaz6+nHu9v5o/P9J09eZ7tBqsEgUJkRymxmQ2ukVVEtwNwBVTv0Lm6DdHcjqu0z
+; MyMqTZoZaAmhDreWgqiKxGocaGzuzdux/DDztlSxBI+dZ0VmRQqoNhjLg0qArNiBqtpY965qLpECzQ
+; fC9LcqRFQ0NqtcCVQlT6+zUkUQYH+7U13+fwkyiojj6asYKyMzok59JWEKBLzAsOqClAsiJimVUo84
+; FquqvjwzMwIQl2gPUjSaqfXXm+Gw8qHRaA3mcIFpJBLw6l7Uh/XDye/f392f9ld/9CM8OblPiUA3p5
+; HG5dhG8tggAsjMVCzneekqqq5MVFr6vqJc7jeqTyWOT5V1OyQhMiMzel2LeiCpjOi0qmCWHuTYotCW
+; Mg6kpQBU+1lfV6jPpjB1U5IwXypEfF8Xse5V3WkAGSkCNJFZiQiAxEI9JHsHOVSJpPrUFZuWN52UFI
+; nM+tx1zAm6GUkzZCQJM5JyIwQ3q+thZm5e371X0ZLV9JuROB4/d5EyxtW3Pz9ruxUGBhCFBhwqCQuW
+; KnANaLjpPu8P58zPXrQXJ4/gvGB1S15nhAxEChlDlT+EHeGOHlmFKwDD8fKZ21J50JY3b3VASLpZ/R
+; ZlLsDI0kZKOZPyZkv/oiNoKdWXJGUVOZKUUb3qu+O0IIyEu7kbFMhYWqzMqrMjJTEjJUXmUpsVbIT6
+; 0KoAUpe+vj87Zmbh++94KTWPXz5pBiSBjKXSnHvHkktSWb1sGmVE9siIOgS5YEYwohqXOrFS1s8AUC
+; oFKSGReT7uzte59sj+lrZnDSWT1ZEow92Z1qDb/bR73FO68PsfPD2Y3XdNkd213JFhGCIKE60iJ6PP
+; ULrXWTQdgwxBJSKPEVJAyCvqZW9mjeY0gM29Plf9qEBzjwwpSSln4pjnqlxfEh4BppiRiGzuRnih2J
+; nLj5GgVfq0OmlKKKp4B0BYoY11k7Owa7CKXufyMpGq/1o1whLW3wXoOmUAMoOpCuWQqjdHVXqGcWxW
+; KYb0pTlA76HjqczU8ZDW06YvoNYCfhVYtsQJSNmhzOiXm3nt+8HvVuOXt49fGsBcWQ2nPE0ZKcZqpT
+; bv4/b2bj/vTlaH3/vhIF2FdadB9KrbzEiXUAOh74uLqiGOdYaZFQwUEXU/Cr6VEBlmzCXFQHFs5RfY
+; sxJZ0qwKatDqOlIBFaxudX0BuLfWGt30/dOmWd3RAjoWrKWHeiZY0aKSZhrhthTakenu3hrIiJCONx
+; jVBBb2ChYKenwpmjnEOlNGA1kNYhaOoYpvhCx6NdPI46U3o6Te59Zaa82MzLQ6RmQCIUTdkjw+1nqU
+; BChaM2vJtOb0MD9s/FXvd8alMYnoUvcFeCYxHna8e3s9z3vX/YeX08nqKjk7fDDOhS11ubGqKsBSNH
+; cI0WOBlSIhIaOGW77cfLGyMs3MIkRbnom7Z1bNSPdl7lP31dyji2jVkIYQWYVPNjMCmRE5RwaOV7xS
+; H7mEaklVl7gZuQRwmtPd2gBa4WJUmtGNkVGh17waC2vN3r0xAm5G0CpwL0F8gcuWYUMuqLUEZdYgh8
+; f+mNEFo8g5YsHMmycxRxqY0TPmek+hBCmYxKGNBLM64iommakAVobWLLy1iTzEvDK/3IyR3bRzJuAp
+; Et6MbFNUntoFOpv2758e/vM/3EIPQJNCLpoDDgIGQUxR7wAGUHDz5gNBZKeSSEOYgOjNjWYRKbTqFc
+; 1gtlwy4ZiBYUhwGeiYg0qSnlnloanwgUgUEQXZFSkBLSMhgshcJqr13oyWGQAH96oUcCxoEyG6ZMou
+; hZlEwTxqzkImFrSkjoYWqAcgWRjK8nveJYQl/9ZRhRkygziWy1yentGaefRcWoCliTRvDVrw1cwE6Q
+; SUZmzNBS24WGZLyxRzPut3Gz6AKdo4DivvBplb12xk4yDzGZGYBh0uLPe3Uz+kx27rD59c9vnh9eAh
+; BeubOWK9NJhX2Sch3WlLJ5sk3dzpJtS/dgk9kDMLv5Yycw5lqi+UBHczZRhlNSdWPdOKsYoMLRG9i1
+; WiC0wzeB1qpfuCfapwbmBo1rwZ6Vze+dAGq6mOqrxdwmxVEPWnmUGIQvSIHiywFKSWeq1+VGbGZZpw
+; HA8AqioaUMrcl+x8nLXVPYDQjn26A61mSpkpECjctXIyso5XZAYkKJ0wh0ErutPWluuHN5t8nTmTdn
+; qybrhF7s1MfNfqoUc3EkrIHw6r0IA8DPnm/Yv5J09ijl0HnHQBGVAsGGomKSCoThaGGELUuxNp5ks2
+; yARkpDvdYKQZm/uCHACxtEhIcQEhDXVel94PMMpJL7KEW+HnKlAWUGZEr5liISDRs/d6ASkXIDWjAy
+; Lo3qqIWQZ9qLiQQkHUInJodKvOKiM7Hb1n1GAKy3ToGI6hZRpcGaLq4cyI+mjIzEgtCG0mqh4WKNWv
+; VyQLNACj92Y+joM5yQUgJeVcxqMOIdOg0fXmVz+13W8qiYyDsP+d9fua8QsRSgoNxhDYDsPp6/nplE
+; OClg8fvlj9yReXV/tbjkOdz+ULq2xAevPqvKsOMsqMmVm9ZQIRwSM6nKo/WzCWqKysVvh23aal51kQ
+; IViFLjMzeqEWS6cUhXvXVDgzK7IsQxoAGWQhDUvTWAPPiCRpyuwzl6EtCg+xylUGOOHFVkhAUEBBKC
+; PqJtt/gHIIy7gY3yMbVXsO1d5KzelGJ9yYSppZq2GRkrBm7ja4+bH6qJPdp7kAgboQqncDKERlZkfd
+; G8/NaCY04/nZ4LufYno7OpobHXS44IABU+ji2Qft/b+/m3vIiNj4/unmbu5X9He1cB3UdKsX6dWMLn
+; N8LiwlqCgAtIUgCoBigqBTSBhoqtqkoJ6iMxxz41J7VzucNV5QfeMwt/q1hS5Ias3dWwGT7kbDMuTj
+; AlCYHZNyYcCp72MtVSmyINKCuawCKN3JKhVMqGq55h+yGo4s+fJdI8HjiLAmyBgLXH7XOwGRGdIsza
+; mC8aaKC5lZnbgdqV48Jvw6oJKQ0aNQbxWMl0iH24igpJMtPvjo4nQTignAQDeZOX2gM1fsfXe4fXsT
+; fZ8B9Bxx/4OPT/7eR2Me7trgcISivkhFOqgE4YBFwuiAQ1b4pQ8eNfSoMhqimepOG4tvpOXJ4kjNqM
+; qG/g6wNdANFKmMVIZSGWm0XKoTw4Lh5gJgVSNES1QZVMhyVLR3M6VETyAjeESZCJgtQGaV8TUY+D5Q
+; FcacoUz7W0DlMkfjEcnk8lUssGVWNCqsjHQ3b82aGy0jEpkLWHEcOEsF7GUm33XY9cSBQrsoEsx6aa
+; SNHsmY6eLKdbqeBt22nClRbIAjiJ3paovXZ3yL6bWhr2lNsJieng3PxzscHkzxbpDtVr1CVRPmcIM7
+; HYnoNXDI3mcY4SbDUs/8B5iljgCySTD3iKX9W26SAlSNKOuoiwQaqm7PVGQNUyDYwgr6vhd+d2Xp7u
+; 7HBnLJm07Uv6QZYMsjjVRmo5TphUhUiceaY0g0b83MWqHEyzBDQTKRZpZKI2NhUpHmBUtF72bmbhG9
+; 8raTBmXvPja6NWNmRiRkfZ6q5MSROpRZNWIS5mJrnDpMSND67NNeJnXk/nHU/Gxtv3j1r9YvPldbQ9
+; cD942PDXevvvqLbI8jZg7fzg/nwxQ5RE8829qn708//V1QQYHYRFKcYQHjQM9MZbDmeiStEWp1tmiF
+; CS55TiZahwA62IXe0wfQLJLmx9EKlpliMntkM7eCZOd0pVdZIsGoPoNFd8kiFkThUySiHjuIha1h7o
+; SgkCJFKq2SqVkNrQqtdHkzWwYY7iCiTo5ZVo9o9enendZMHElDdbrsCFQfp4KozmNB9dwjgrQ2NKeL
+; mRlVN7dWw6YiecHMkEImK+4VSSlS0eHmPogJ99udPT5KOPS8G1ers7P27Dn27ZvM2zj88vrVv7h8st
+; 2c2EfPXjZ2Zbgefvk38/D4eH45PPvk7PL50x/9WPbz131+jt58sIxkuqkRgQZVxAAzw5unCuLwSHhT
+; IX+geiSdoNytZ91pkr6EUBxRWkqUFXMCKGwRhbpWPH3XC9qCrPVEpBZsh2zFMixcg1xQ56WNqcHMMt
+; yqpgrZAzRzAq0CSWYq2Wypqgo0LPgss8LeAmRVw1WEBC59lhmOFBeBxoX0s4Rfc1p4MZqSpoS8eWUQ
+; a1b1htNIh+T18GpWlVARBzJgADl47Htun38+5d+Ad3NMq/W43k7vf/L48up/+Pabv/n049UPn0+nJ9
+; PJduW+GX1AeJ8OXz5cf/3Tb860/9HHr//On9x9cPbBR9z/Lj+ln8FkFJWNlsE5AihsBss0uj4rYEeK
+; RyXc1egdJlhP1TiU7lnFiopKttQRhIwLU8BIc8sIpKohK7qZmRd3uGjjxbYQ0WiYA8di9Dhflg9Dz2
+; DNiL6nkHgVf/buDSiqLDb36nQqybI+W+UQM2+f/VnR545VG1RksGLaLjl1OfgLYwtoZlqGNWrmbp7H
+; jtNALly1JOhk9GjNnWw143SKMsNg1kydgOCIpC7PLm3/q4+f7y7O2+Zs9XC4w3BwXn/4XB8+a+8/3V
+; 6ecTsenpzwpOW2xXbN1anbdrvT6tubu9evv9mO48nJ+1++fhq+7lQgqG4uek/CaW6wqm+L608g4whG
+; VEMLM5tFgUYUmbgqSyppBtLcJNRwqWYgeeTJSQmDqJJEsFoepi2MPioFc9Iiwt1z6dGriIbbwtBf2o
+; 2FglcFmpZXr76aR5K7WQGOZv49ve44YSiUorhoyxxQzIU3t9BXvEiT1RpAKvp0cyyBPlNAe8dHAr21
+; 6vyKUM1itCqKcLeMRSEqYFrUAyGOfgi3GXNEJeaL7aqNPB3EHJHTqnVzgXKvSZ8Mdko/nAzTxfnj4e
+; n1zeu//OtfH2A+XW42F4FN6ODDALbQTBamnU7LDLotWgsW7oyUembzYrNQpJQVw0yRSxeQoNUIvD6h
+; snszWbH4zBuTIkyp+hboTpcVPOCILmWymYhYMuaijjBIGSwKRPt+DlWahCwcu/CajGLyF+ZlRQWMMP
+; cCphbyFbId72jdXhxr9yUKLWzdI95zHDctmJwBpCmikBw3mQqMBFH8nl7RPrMLWW2IjFhI0DpktGGV
+; hNCkDvb9tH887KbZGk9eXK6304HTbtpPNjgIc2+rNTgAwUGNTVNfbdoU3J6sLs6ePt73q999OV9dG8
+; +2mz89+Ao5mXnPAYx6AxG54MeQkITJigvHCEVGpNjakZtXPSzdHAgjUzJ1ibFwgWHGFGuWt3wfUIk2
+; lCWCKQiXIdAXnQeqQivYP5Pmy3C6elslMiAZrVDBKlIr+bt7ADQWkz0zijohxMLAMS2MMxSHrHh5Cw
+; sWBiTkhPvSc1uzamABZHaYV+bNyMFtaRlSiWhmXIRMpGT1egTdHQ5kcaNdcMMsosub4OOsTh5g/TDv
+; p6nlhIvzy8PuleU8ugdTZkQ45LBxEOzQPIb1IPBhTibnkT5sP22Xw3b6y6/+u45cb/5BapPcEaK8gn
+; ONA7VMyQg6sveImgIOzTOyqIOpdGugpggxSIpOY/XHx7mF+tTBNngr8YM5Emg0CjTrmXBGHjFCWiU8
+; p5khsyYfFNRT5i3EGt8tvC336AHFcZ6/jJmqNioaZRb8YlVD1FAEBqSieQEoxREHpZwTuYBv7BHenI
+; LJCrtYaAmB5i1rjMIMpYM9kkXnrtJRonnmUp1JkjOTiGxDU5870IwME1w2U3S03V59TqVN+4d2fsJg
+; P6TIJFvDONh6cGds1nSv0NibtxU6zGa4t1yNYdsVhtu/+Pf/18FODu3vPMywxgaLjqG1lDLSGo8dfw
+; 7mufD+k6JZCxiT1TBmaHCGlBZV3LgPgghBSYqyVnI7Wyb2lRwDMoOZC9lqUhnQsXArmNqJXAhFMonq
+; MGvuYMy9L7Q4E9HNrTDTUIISXVoCiwForgVvIIrWwoTUlLJqlZe5KYZSxxXNqs4b0YGiNUvpZu7V8l
+; dIkott8IrdhW68Y6CxuodMKHtG0d6y92aWilm5gnyB2I2ipqnvod7maZ6nw2G3kwTL9fpkvRkUsxPN
+; xMxxaOPAZm3VVqfj6hDzIROIwXtk//jFye6Th5/+9p9vnrXz4dPe28wESpbizKi0VHTPhI6lyzJjC8
+; rNETlrChiIPLYrbWik9R4kzTyzm5nUCUlRBUvx+2lQpoGVMmtC3NpQJXdmVt1SvWszA0O2zEYKERNY
+; Y1o3C1UXvUz1i7tY5XvhweYVZdFaW1gUiQb3JXhwYZ25qExDGti8FTUg5u7uC3EoMRgB9MhOFf+2UN
+; aaKRZ2T/cFbo4QuW6eQCqqM8kQ3EVXJgV1mTuFnLvBm22mw3R3e3jczTK6i0xFuLERa7fReDasxpUL
+; GnygMA626n3l7XY3ad2p9uEnm5vd73728//z+3/wjwJPGzuYBvVMb05j8SLmubO1d+w4mDdrylBPN5
+; ccC1VwAYLUUzQVEaDiFB2L6CeROZh1ZPXPMgtS7gF6s0xOR4DIqm+izD0zQwWBIDJqjmH0Gus6DPDK
+; o6SgdBXBDVgEVqRbL968e/QgNLgL0SJqPAIKWfxIY2MLpYxy5sJw9kLmipOVEUPzIoAHq5/oMCjSgP
+; Yu3EHePBa8sFhJMjKVzT0SbXBXiJG0AlnyMXL2x12uLIHDNLM6e7d0y9WA7WhNfTu0k4FmPEQiorWm
+; gBtdmchG0eb9Gp+8sJs3V9x/xZOnpQJg82I7vlPfcOkxFomliFSHy+iR3QZnoFOgtVw0mYCGodXok2
+; ahQjKoTBrM3KJXhMtMg/cMd+/TnMaSewDpCx6VVXdZsS6bK2UkGCiuQD3LHqTDEgqj9Zp+SnW5zIlq
+; u4njUCNLx1vUqlwEamAmM0poxATmTCkNoviORTu4l+7XaTRmJJEkFQLZiCOIE0SyWbMSO6cPA0OlLg
+; dlMPZsphgsAUMIbX8XXZsuf5w1yhLeWok3RPWi76xG24x0RJ8ma6M7jS6GMkbibDWmTSvjiVYvon14
+; c/+Xv/yXTz7/8aw12TKD1pSpCroKZ/bkcepnzT1DLdsiMRAMzRTLsL140RWZlc1sPk7MDHQvCsscgD
+; UvFWfQZJoysXD/SeXoJd1KY1V+SAVSyhr55KJBxZLszEkoerQBkelmPgw9ooConvX8w50odNoW8MvX
+; n/95DcmcbIUuLaxrFoS9qOaOMNgC4tasiUsadtRwm+/o3kdng0UGVxN2ET06SDdmRmQMZkJGM2Ra9E
+; Hc3359+ezq7BLuAVoAw8rNcLJerQaMzVaDjW6bcTDQWvNxtRpXJYVUhIHuw0Hzw9y77PFx7z7c3hz6
+; 47lvn88lDmcr2DbFEtNY86oxFkBp0VVD0KIuU1/Igcp3n96cZsoCCeqhOXLpXlC3epnwI5duRHIqIj
+; MXyQXgWcX1kduVNasj3sndFhI8Yc0zI3MR/EEwawWmYAEzlkEOU5npRl99/o8XzTWXwaTBmAshwUva
+; nAploV1ZQByP5gxF6jBnjVRLKg4KaN68uYioNtBbLO2aiHRja2buJWYahdEgDM+fn867f/3svbZeWW
+; Sm0lxQGrAefGg05eA+tIFyGwYYyVbCwWUkJgykohLlJGNEvvzKT9/7YsbKCNHdvWfKvLmVNpdHj4aU
+; YJ7mQSSRVNF2i1aRkTVOzuhEQpHFbjJ4MSahhMtKtSNjKcSyRvqDD0rYgpFS+l7PWKoR87ZoDo/c+6
+; NY890Ql+bm3gArmTIIR82z7Xv6ZNkuQK1X8VyFTw2VFp4BLI/cKzOrDJPyhbmGmjV11fxA5gZpoBfV
+; uJk3mgMwplEEDZkwX7Qwi7zayIBDEbKhBXPfmk0xT1PGQCMoWCOsJybFAJpBGZnydUsK9K66No1U73
+; dDQwhDi9Hn9cqGA370xbNvb797ffOb9faLri4kBDcXDZh1pLBbRbll3J1SNzOhlCoQYopoQ4uFNWCF
+; Y0AyZJOrS+pSwtTa4FYjfxGWizgHyO5LuZ6k1YCXitIFF4XDjSFZpT0sQwHSarDgBqVUBwnm5TxSGE
+; QuUTYXmJnLeTGriTS4kJGOStAFxaK5NUNmDva9wpQgDOauRM8o0n4RTmd1Y8uuhGhKZwJjE4SY+zCO
+; qV6K53maRyipoCvQGj0VE7JjnmmGYbTDFGkIxRgNbN7MycwIBmDIge0Ere2nB0I+jJlJajSuhLENm2
+; 073eof/vHmf/rN7qYjbAsabTKyAmdahsLNCKOb6q5lOpQRzWLq0UYDmaQbssplLdA1idZcvcDfso5A
+; RCTMC8dw0lspFwsIqwMEvFMes5DkJdamLEOZRxEVjuGdJqaybG6OAnAH0tyM7EvfbEeivKRoTWDoiE
+; gvkT8kd3+n961clItahpLq7KbkcHOW0MKJHuGDO1pPtaEBWfi90VKOusyic0gmyaGxQX1hpif67Bnx
+; iJhbt8GNmub12uUANe8jV03NUuzICLUGNwln7h9pxT6/nfVqPU7Y3RtiMKwanp3Z6YlO7vvvpt889h
+; /thhcy7bOa6ShyRIk0FxS3lbsJzVr27j5AiuxENnNGp2BtdFdCPg5SJpK2wE+GBkOJmgKEIbK3oSkS
+; UkhFe3QaoZ6ZxXoFlAjQYUd6fkm5SVWWwJF8nlVpV2ObishYKNAluYio+J8JSI3vxoP4ng5bONkiki
+; YhZAjk3NPflecluu29+M0GNbPRTXVQyY5oxTGITMV6qEEKIsONyIxMH4YMwL33WDWsmrc9H24e0cdh
+; 7fQeU2g2uQVyjugdEZx7z+gdONuOnvu0w2pzuVn/aO77Hf8X4jcc9gknsTnEs6Fpn7/67W//5X/737
+; 743/xJWz+VAB+BKJAYZpkBwg2QArEctp7NW/TZbQDSYIU5SzlPB3M3V58jIPPFfEmQGzrkgmW+kwcy
+; AhEgk1mlYeQS51NweJ2oLAWDmYp8VTYA1MLFJqKnu/o0SQ5SVsyNgYqMbmZeqIUkZWsekS1ZQNkiQS
+; LgWuYbuVAOcJSaMiNRfLF3sqrjfIJLVZERiSVrq4eEbGMzo5XgvHxySnoTKch96JlWPX0Cado9DP5k
+; NebJyTDdD+yMfflR5dS1mwOZfQ5O/WRzajlM+fb+4RenJ9vRz9LX06xxtbo/3G1G35ytH+71i1+9+q
+; tffXfy6d+dT7ZTay2E8MxoDLMx0pjNDDF3c3e3MkkweERUuDZnJqIvha4X4FBMfJT+Q0tWVGnZKn8y
+; j7dkaE3AlOmEIhY3jppMiZlpls3tGGBV0wguXJplLlkwoDmPgrIkDSpDiEXKn8XAqf/I1pZpYnF5jR
+; CjuKJVGZUdByVHjVTkhsx6eS8SG5hEhswWmV4pIYbWFoOd4hw6IrtZs+KDodr8gDUiiRAwBwOr0AAb
+; kfPZyXqn9nDTEUTXsPY5sQ9QCDH283o1c7TwfdPv9vs5/CzjWvkQsBbDmH692//0y+++ftB8evpHf/
+; qD1/b2Op8pB9C6F5KekcmGhBZHPiqO5hXlyaB3DSxsYWjUKJXvRIGLCCtSTkoIpIwdCsjM8jhf99aW
+; wU5PUUv3gyRV3VYgwCwerwrptVJWL4V05jJrRcoKZUW1Twu4sdxIov6bn3z25zUeLFpgcYVyMfz43t
+; epsoSB5V1iZDMv7SzMyhcDLBoirOZIFfQW0SkA9rrc9IpC8GbD4IKQ5tlcqcbkaozNyZvLJ7q49EnT
+; bkqBSLWBw6q1sc2R09xTmvr8eHh8PDzc3d0+Pt6qP8R087i7eZz89dXu6zd398l2fjlsTm1lTy9Pvv
+; p3v7bhJ2GnYqh1pKDWS0QrQuY+phyBRhnZjCV9YPZSLghl5aejxNQX9DaFAqMkRC5tJ1COCt/bnqQW
+; n6Ni2kGprLGuFounBBKWMK/rXWTZtowvBeY7AY65Hcs9ZGZzlnrEFl86B6zlon9a/LkMbPV/tlhKhb
+; L648TS+wPh5nQ4jsMrsC0uAEeXptLgSmZwWn3DrWxXqoe2JjJ7DxsAuNR7Tx9xssGTj2/3/yJXFweC
+; 45g8CDJSbAZz0ldrHwZF2OidQmI69Jdf/e76+q9Oxu3zi/Mff/7sVria+p9+9hk4f/3muvn2/jZ2t9
+; /ZU5vbKHbFPMqSfaEhoWYwwSNNuaTLCwpRPnkCwYio7zED5otYQGKxAVrzqK92TkED5U4QPZI0uAWU
+; Slc5QtqxOypil1obpIjoCz9OCKE5S31JwNkAThG0VvK14tDlET2skSWWaYS1OXu1sLaAlmlHOXop3X
+; p0so3mU49kmJsZHImewSIEIZVuBiEyW3MQjDSnDEWBX3zTUDQARQhuJRcJB5OArXytvDd72Z589Qd/
+; +OHz9/vlxdnZdp13v7q+ndlWRtM8jfDt6fYQmYe+Ozz6yKfbD2PLw/B29b7Oxs2ZuFnZxdP1r7/89e
+; 1XX//go/M8AdXm2+6DhXXgAK4HyntmdnqrgalAKa0uweJ1RPNWAFTd2dTi6GfOXGzcku7NRuVEZe8p
+; K9vjIl0gEFUTF+XZWHQc9IXIxUBkXaYEelJoslhUrwVaZWTSnUWsP7pnCPqeIm8sZdBCdgRoSmSrsV
+; INRhZOlhV72aN3tGIDoUfVmU4rhyarXzpnNluGENXr1HFu5jQmciGyLV6XYmkJIqtyEWCZnRPIbd+v
+; 42dff/Xf/Jf/5Yvf//xyeHw53N2urH94uX373cu2MYFBg2s95NPT02mn/ea0rS+fb3+sPGyHX3GY9r
+; sd+37I3dPzs8sn7//rv/x5mz+9fLG5GOK3u/ub3X7LaJERPb3PxzbOW4MU0eFe8ERkGOFuc1ngoGYk
+; 8qMkvkc0sznKbVBFTOdRMQl4F+3oaYbIRTlYnhC+SPAzk8JAW1oYq8ElI8oVFu/ieSsIWRZaki8X2Z
+; odIdWj3Bg1FDwCoZuf/KPmXk1C1cclEV+oAlIbhrrRBatGRilTiOJngqWFQnluVLjnUA5ZKnEtMhNu
+; EZE1YjK4L4MrgwH7s2E3Tn819H/2e59Nf/IHZ59c6MU4boa2f7xbrdfXN9Nh3wmhcRi08dgQ67Y+Of
+; 1wc/rH4/hZG87cHqzfMHqztnGNq43ayW+/ur57ezWY04eXb6Zb/DBO/0i+oXOhNbgBS9lIb4IdWcYm
+; MYT4W1D8YnubAWUzlA9LGRymLaRaGboQShDJZPPFE4XG5gu9/G+deS6iiIXCdtQL8OhLuPgQ1dnKEp
+; OF3Di0BcZ6pys4mtWWGLpaefftZ/+0mqLKPKU3ycXrxUiU80+x+VJIya3Keqs5eTnblHrGWcrvdNCb
+; 1edcTr1Q45i2HIxydU2RK3Pc/nvv/+yLz+ODDzafvnfx/tk2+u7Nw9U3b9+enF3e3BwOE0hLwpgje0
+; M3crt9b7X9sY3PHzrN5sHeOveUrwwNbm37dt9f3d338P3B3t7cXPzoi1++aho/mBQJmTalbFgcKIsr
+; 6U6FMRe/TitNsIpVEgqSvZeQPc1NEUoZaFQr80lZa16IN6rICjiHMpc0wN3L8WBhVNsyvyiqjZTL7K
+; +cdBbO05Gri+9NPzICCjs6Hi2mkkcn6AQy01ef/dnRUumdiwcTqimFmdevqxChdyiLWUZ6c3dfuEWQ
+; 108jvNGKxG/y5k4K6JQ1NzdRXWHNKyRky7X5q5/9mx9/8rvPf/98vek/fPbhs9PTh8PN64eHmevLyy
+; ePj9PDQ99sT4ZxaCZlWIWoCA8mwnxwKaY3mh+dq3EYFNHG8SHzt2/fBld9Xt/d3V5+YLYa3uyeop2X
+; D7KKRGd0t1gKrQQSOb9zc3Q/msSJRbUupxSDIQW3JEOMCGWRLwd32eLhsUwcZQxTkkUg6Iv5FvJdaH
+; WvOqsMiartWsw+K/0BRl88gumiqbTZWPpis1KnLX5gZQzm4xf/9TuDnuoE8uiQycX1Z4G16IvtcnmI
+; lFKcubgGmhkNpXhS+Z8ZkpnqRjZ3ig40MweGGoAkQ4aVEv35+eZye/+TH96fnPbTYTwdMRjacLHdXG
+; 63vHrz9n4X4+hu0ZrNgarsGRP67e7wynmYD9dzvxF7WeQmu4Bh3Ly5uz19+mQzbF+/vv7guX/0kV/d
+; PT4ezsdcZZoW6SisTBChag6r0zh6HSwqPPMWR5OHJOUWkIFOU6AZ1gXwgqEUEfXQy9CpB8RyGSsrIK
+; QWc0Q3EVFmXjUur36smRLmDRHFAcoIFtxLVZuzsHCyKPB458mk+kemrz7/J8VvWCBnszzqg92sbEQW
+; Ra97RC/Eti6xm3vNuJGR6TSTCtstFmprXsa9xCIHLpFrPUS6s60EJWw9WL/62e//aFqv7qfDdctp5X
+; 55/kFOPaabqdvt46E5DLFajwFaG0e3dWtjS+hwmK7nONzvtTus3M/vH64PmO92u8eHOYQ2crteXd8c
+; nqzOnp3F5ZO8urp/uJ993KbWzUswVH4j4e6LOS9ZRF0ssnfGXI3KQixeyOgkjSG6WzmMRZZbiqgiYM
+; iYoCoHVyRdJkE0cy/t1+IJeRxlFRRWcyEzp/k7TWAuXSjejYhKS1byi3LLMLfMMKIBWY6DQjbzVJg3
+; lsNv8b4sagAdykUBDUMyILOihIl0IMo0nshGY8oBzcXlNBLpyMiFpFvmZkJwXskSOWu8ez1+8+XhP/
+; vkWe9Xd7vHfRza7vHu6na9ejq0FxFXnt6GsWvvowFGjKOPWx+TNrnZ5mRYn1Fotqc9a6vx9s2rifM4
+; DLePtwdN4wkni2F/+HsfzA/v/bv/x6u/GPp/scGfTnECy3CX0wmDBxVILDzkmjANkentqAfIjsUxlv
+; PcORjReor0hC8m4Wb1pLPPgGqsjuxHy3Vzs0jQUF6y7p4qZ3N4a8lFzFIs82JMpnmWh1LOko7IZvQs
+; gtiiMAWhEEEmfPPFf53l3A5buqCiX5cHnVtXFu1SWU4PaaCQflxJEMXXUZQLRtoCh3rzcl9f/A0pZb
+; gdncMgOnyQNydh5hdPT9r0i3/w+5cDdpnycZujhL5abdvq5PXVHdnXK6dhvdoM7SQjR48NR2sujNv1
+; p5vxheVE7Ffr55v2oQNnZ5kx3d4eHg59nmLV2tkaz59sTs436To8Xudk4+oyuBYBG5PmbNaz2Ppm7n
+; QnjJ4K2BFlBlMyX/gC7ktzuZjBURER6mUeWrBheWskLQu9MtNiF96hLMlTVVj2DgBVVqlbvr1Hnb4p
+; wsRW8tDFzXLpvNrixMTI8MFA+vjjf7IU8YtqGEc7Dh6dlrxInQJ8icouoZVUvZmT5kcbrEhrXph7G4
+; ZZSfMykg8VLrIci9KeNJI5w0IcLHp+969/+GK/2kyn2+35yclqXJ9sNma+T718favso3PguncbhrM5
+; svdbj4iIoa3W43vZnZpG31i7cN88Hl7vpu/u7g/ffH0ztJPmo6Sh8WRtZ9vBsB94d3//3eNBtDP4Nu
+; QcwOyOJNyWs0kiINhxgl4eYHn0obQ2kixJNxYajVrzYfCjGKxsilKmjoRRBtFksnKwrBJ5EX8Ha42C
+; dCwGyhi1+hszcljs+BZ2WyXkZVWGMXsaNba2eNtvPvvzcWhCub2JR6doW7yl6z0Wpl1qiMXHS997Wd
+; MoRB+dRjOiEY1mWrY0qAekZC57G0xe56SV6UzLhvD9CV7/6t//8+36my9+7+OLE9vaCn1YD8+o1WPf
+; PU776NPgHFtzH2yQrxAxj47B1mPbUKPYD3G1O9w8PL55/fqr17df3+529zu/28+rzXrcrCI1rtt6HJ
+; +eXuRhb96Hdfvqq98wzlbbp7sUOTNJWEgwzn1a6BK0xYr/e88Wqy+z9zg6/yet2nu8c9eOPIpf6sAs
+; SSxTUnSrf1qWpxgW5w0bWvPFrknV6ZbiOzILCVk4PizpafW4xrIScFsUG0gjfPWTP6uXE9TcQEa5iR
+; 7daXB0JK43bmatubnVKg4iaRia17YdNyqjHI0dmZJBjeYkHEX+GkrdDKKHB8190+YPVleHq//+0x99
+; Nx0eP3l+8cl7J40D/Rn0/mo8j5im3h92h5Hjahi8DRGH1hy5mufDqvnoIOjj5ur++tubv3n7cLvZPj
+; 07Xa/Hvt2s6Lg/3IGD0TYnq+arp6cfbtp6mnY+uqP/+i//ipsft9VTl1laWJabjrnTGrgwIms4nxkR
+; sdhmmNEaa+lRYViKInWoTFtKKlzzmAyGqESqWWuEmUOKEn0djTB7RHnZoSp3d6cc5VpIs1pEUbwhqx
+; 7ZzXqkkV6EV7AAEgA+/vgfC1r02hWErET5OKKaWqLD4qSLd65d3hoNoWV6KOXCEHdURBFicX+1ZT7t
+; BjMr2XgqMYgW5/bl/pv/2/mTn3/4+entw53vdz/65L1kjCc/CT4jN6fr96/v76/uXq8GjKMLaY6Tcb
+; UeTh6myXFYj2kO+Ae++sHD1N9//t7l9tLj/rD7ere/26Uep/Z4v2/olxdD7/b+k5+MNvS4S+zOTlZz
+; 8hAX1p5mjgnR5gpFZWHTXE430s3LsrfoVItFO4ofvqwP4uLTWBPcVjhiz8VX183KIrwUa0dbJNjRQF
+; hQOe9LMB8XKAjMsoPOJFDgX9X+S/0b6W7/AdvbrOBkHz//J+YWR7P7yvBtcYVevky3xTGobPKqXcsy
+; ATSwtDfNFwmeWzqhDAScYMrNkCYZVQV2mYKbWzatpu/y7f/rYvM///iLpx9+dP7++6dvb2+fXZ6dnZ
+; 0dDtvNyYu5t2H9gu306vpr9x1IUc3NOtrgu/nQ97OJYvjw4enl751cnG8y43B/d/vNYerum9VqaBgO
+; u+6az7bM5LOzH2xagz3sdtdtGDTm9cNXqZMcL2eu3JpShNR79nI1KmlnGdh3Mze3wd1wtGkv65HlCU
+; dRKMrqFm2w5rAitS9ZCuahAI+aISwFLLT4fRbFzdxoNkeIDmsReaRbwKRKgpTcjrStKPy1qI8CzVdf
+; /HkK5g6juXcgiZqUAmmooWVvhDIbYNJAeZ3wzLG5k9FnKpsZMym40LwtFSUXh002S5lXrHNZY4NvBg
+; y7X3D33/3k9y7ee2/7/IzPLzzgMeEHH3y0e/gm5+uVqYd8++KbV9cPj69Ww+gaKYtMeqxG3x96M9uu
+; uB3oWK/9eUMjAtlXow/NIlKp65vHh4d5d3f48MnzjXFlI9gO++nh8X6yOfJxd/N6F5c5PuuSEDCJMh
+; /hFK2zV79QawtMyt6LBqHslJxympXBow1l0fkO1S/z6qOo2JY+he98WgGIC+2VQjZLQ20TydKtKZNt
+; sQEWOUtBz+MJiwhoIb5XqmhGib797J9Y6RUrwCxcvxpJLHvp3nmUvzN0KbB6aIycrZVsn+UHVT6GLB
+; etI8CGpRJtJYDpVMIGbzF9t3v7zz/5dP/BD4ezSx9J6fFsvdnfHZ5evBeYvnvzm3E1mI/Jzf109zi9
+; bANUPnrsMlPb7Gf2UINthoGZgw+hA+NwMpjpAOsHxYH2eGjXN/PYTqf94+l2GFdYjwMQV/ffmbWtDT
+; HNr642XH+M1ga5g81qqVbZdMq81b0oFNnMawAoqynyIvRn3XZ1lo85QUdpA8t66WgKW6Z5ix/p0JbH
+; l0qW/bF5aetJZE+zxsW3x5alRVXmHoX9PCoIlVmjI4O8/eQfF8hMo6qrA5s5j2y8xUitWrwF22LJhR
+; HRqnZXetHPCyEtoIeLZI/LHILMHIRmtDYmfLB5xV9crP/Hz744efH+eHaKk9Yutqv3zrcQIleXT568
+; unp19Xj/5OKHo5+Ch8P+9cPDdfZsbgOBDGvu7vvdITPXKx/GSXqb8Wh56Lt7xEGa50il7zpv7u8vnj
+; x5+d313HenZ+O2jQQn9NPt6Rrr6cBX1w3DhweeRPgcgqkjkpn0kpiUspK1esEoyluDG0CqF78G6oCX
+; 5gA0s6EWlTFhkNcCMhUzov4glXJvMUeZqBnoDa21cWVQshb+uamZzJMoQ/HankHj0Ja9HDhuzfMSUM
+; r85Md/ViGj0QZUIs+lCOe7vr52wxRQkjXZbc2tJGWFcRuzBBNLDFF9CJKtlo8RgIbalGNuvma/uv/N
+; f/P3/nD46Pl4urYnq3yxaUPkYFNb2eOuX2yfzRG//vared8+ePbhxenaMN/e3jzcPsYu1WkJ73CxH/
+; p06AaOLddtzsNDn3fCFJxA7B779Xf7r97eXL64uLg8hQ2/+/qb7Wij5dnJehf7KR761K8eDze7+83J
+; i66njlXN+pzZAMoNYjIjIwSaaCGZN1qrZTM9MqKIbBDlXnzGwOL52M2UJnOrVrgEi2y++FM3h3HOlD
+; GkgM1pUw9w6GXr4UNzc5Xdnw9Gkxa7tlxMRtqClh993Qw+fvZnFdNpgDGVrTne8bCOCyLcnaCUg7ex
+; NZRLzuIXk7a4hKXTBlqTBl9Gz35cqtfMkTG4gz3pY2ujXp/Ev/rJ5+PFpa/WOttyTTdiGJq10W1Y2a
+; ng9/vbKR6+e/2q5z5tvtvfPe7nhx1v7+aHu2l3u5unhMzQLOhzrtM5paZQpmRvrnd/87s3X72+W5+e
+; ffTRk/UaNrTDnNfXr997tjXMXe3t3cPsfAz2jMeH3T7Pop1LTZZpkLnkjiBkkDfSmQogS66R2bEQrA
+; dzF1LWRDcfIpnLegYSGihFZA8XmOGkgb54fWSxNAr7MKObNa8xfLkxarHmMDsKgsptG20peCSEakJW
+; jHuzFgCVbRgioxDSBFqpW4ohH1n1VK3wIJJCKzGHlBVzkHQv0iy96vN8RwA0Osr6H5xEUXAgd4Pdbs
+; 7t7GK9Ws/bjVtknxtbZqwNNjof9pOPw+mo58+3t7u3L2+u6H5+uTo5/fDmCm/e3F5fXz++3furffRD
+; I1fks9V4Nvj6bBzHNh2mh33/5dcvD5vxT//zP/7o2aZhFxkn6/Wz955+87v92/vYbtM5um0fsT+/XM
+; fUR3vMu199hxfCM7AJHYKxSbP70HscV1cto1ep5Gml0zPSl5WEZdyy2CNCC0c6SUNPutX2m2UKVP2L
+; ehHGi0dhbkLUctAes1mzmiiijI1ZSDXJnsHC9pWtXJx9WSnYytx9nmeSgxfEyp4xLNuBa3+Mh2Jw9z
+; JhLndUIZ1unlJzn+bezGSeQOGiy7BcYgYSbpQzIm0Esw/od29++v5P5u12WLU+ZF5uzlqarYfsKJei
+; e3GzGkbolL4+O7my/bQ/rCPGzcn5avPe82ff3fr1Hed7Pd71/RS3d7u3r3f7N29tFYl+2MXb61kc/n
+; f/+7//8fsXa935nCmbc7/ebJ68ePHdzeOzp6fnJ9ysbJ+rNbR65hfPVzc///rV/GD2NKL8qQwhM4Rm
+; H1uPLEdXCZCXG1INAJClZLGUGplKcw8gIr1ZRF/KrwXNoNHcG3LGu90dtSYmF4Y4kEZPRPNChBcdYT
+; NfRM4qfraKCuVW/pC1LFIgW4kSpGoAgkqLgXhHhQx3k/rgppgJM2/JxbnJkdZ8jo7FTZtFx0wk4fQ2
+; Z82PzQyGHKmDA2oUxvFtO/lqu51iehxPxlP3lTcxV+snVOzv3+x2k9ynnW+25xBObbU6WU3DPPV9HA
+; 7OGKEX57bdYL5gn7ezhjnscMjd4346TPtDQKv3dtPFqX/wo3OLvRKBVRKD5zYOWNur2/mbb99uf/hs
+; 8Fx3o3nH4WyNi3Wc5sNdTL5sQ1qHR+38jDkBuLXa3qmeUg2FM1PmiUVpN9TCj6mHNTcbsudicVquhQ
+; VlNJcSRforH5tlU7eOFI+FkVNt7eKgU2z41JF/wpSZe/FAAYe6WflncVkIVnuB6zwQ6TWRRiZxiG5A
+; cyYUKS5sCoi0DExZoq0mY2YifXCACnWi5KOTwsghaJlo4eSm4c2X//MffDqdDat5mjIN6vs4tOE9+Q
+; 8wl/TtZeY9Ys22Ep2BQWzj2m2Ye+9KU47ehjaHITcK9l3PWcrECqf77vup3Vzfffzs9MPz1Riz+/YQ
+; ue/zQJ6CQg7Wbm4ep+npehh20wFtHEdvFmO+5e7ftfEc7fl8aEL0lpkss0tvFCIQbC1DEjuc6jJPPx
+; q7RjdmCm3wI0c+pVJbi4LV11xRXEfyLWojQK0rSUruborjDrHK86yairko6GFU9uwL99qdStJ9Vi0P
+; 0DJdWBZ+L8uSF6vK6s1gjFqtfVxQSRrz6EYmlosdzXtSIXdbbLUz6Cwl5GS+ckvbO0H2s21HvyO4Gk
+; 7Usxm34ziMl9vxfUG2ubqzlzeHh27slnvjxrhiC6ENrrbqkSK74nTY5LKeVoc+pRPu037eRz7spov1
+; 8INnZ5dNK9tERiOrlJ1podxs59ub+fp2fv7sZBji4XC/MpsOD0/O7e+eP/zszV8+zH/k/MEsJnJwIS
+; iQvYhphg4lHe3IqvLsnTb0mMSysKytw6w1pQq1gjgK4SdrlUMZopGLPWWtEcAw1HKCWqdREmFLlcw+
+; +twWOmUSbCazXBjJOZeZqmOQ2EYZjujYsl7mSIOFKlmXW2Oh4WUKx1xGGTDzQtYz5tY8j7uDS2fM1E
+; CYMGsu0xhvadYgxeF+GGLYrjmAhozoj/NKBx9v5s75sBt9bRmMUXOauzWPVO11Lr2ueQOHQ6nf6Ept
+; bZW0SMxjX0/Ts/NhPa62gzUGzTzypK0w2SGmJIZ1Oznf3O0OPWmyzWr9uD+ctCEDqwE/2O53tz//l3
+; 9jT374yXzoQ3TTFAKsDc2nec6yhTImLKJ7XVgHqXQ4C8aoLT8wwJwJzFyYhuYmlP4Vw7IDVtUbWxtL
+; zmtUZm9tqKXD7uVDbxDMF8b8Qo5zKkrLaFjMeBLWQbZlDatTSmbWG6rBgKBaJVavz2XrgNfIvlU+l3
+; qP1hroFX+8uaQMuTcAynAv+lA3c1Fp7Mb7/f7s2fmHH2wvz/zEe6Oyj9M0z7e/NBsbdxbqu3nYBIGQ
+; 9+CKtaZJy6pEdZiPg2XX0XjPwSFTJw6uvRjJVtKU1po7wZOVrdI7os0Zp+3t1Z0Mm83GlIex59RN7f
+; FwOD2dzyPGGA7GeUgHEw0RZtYj/N12b9A0V2Ni1kBEzo1lnzAEkFU0gT3CbMA7m+lI0NZDC0kKYfEB
+; TKXBYHSlFXmmh/O4n4DLHjIpeyRNYho9dORzWIOSKRKRs4TWXQsHNtNIN3OmL5TbZSUmSlJeK3hrkW
+; wSzIEyt8EWIAcLtlckbAukiHDbMZExgNkxDMPSymGYdg8X4/ZszJXnyk+3/qP15rN28mzafdkffjny
+; 8emqDS3kzVLTfh/UyWbj7uYD5PJRYENyDDIiJmAWQpa7/cPj/jBLh4zmK6ePPm4Ha82HYVz50JK0VM
+; PT09OX373+9L33NqtTbexmevu4363XG+Tq7s01Y99woNY9CaRjgLz37j5wASEppLcigyO1yFYMgmbC
+; +e7Elzo+FDmVVcPU+zxNbkwLLj6S5k6aQokwWlOZs5BmNhchDsUEMlnZQhQmlmCtHaruyMEo3+C27F
+; GoSRFK5LIsJLASnUcKat5y8cmMhY5ki8bY3ZA5mmfvBLqy1l+EYO6iyixhNhCW8sxYITXP6Lv5cNhz
+; tLHhZFyvz0/O3u/t3Poh7eW0+3Zs65gH+Hh1/7DBvBkw50CsTWtrZ8BWUstHWs/cU0pEKA7Rf31197
+; CbP/7w49Nx7HMYOc3z1f1dIga0jfl21Vbb7Woc3n/xwatX92/fPv7k4xfjdnzY3cz7hxfPnr999fA2
+; 9nP/t/7w5PLiD6/2W3GIUnoNPkMLz6O+WTEXj+iSZS/aLmMrIKGg+1Qu/Ge34lSjtoJgONLdLaPTxM
+; W4TkfOfW1Us+O+I0RE7ZuikEizsqeqHc++wI3mIP3ii39aO7gGb0aTYG0w92VrS5E4m2NRU9LL5olw
+; oxqmnNXcm3VlGrstrb3I5nSzsTX03tiqSjPaAI42P9u+OT/95vS0b9fj2ckweLjlNO+jP4j3stspHg
+; T2wJzaT4f9fpeSI0en23YYP2rrj9NORMugZVIhajfj65e3hz5+/qPPn2xOx8RIjkNjw6P6AXnIOGR/
+; nKe7/S6Nz56+vxpPvvzqmw+e/PBi/SHcfN1397vf/s2bJ+99+PQZmC/n/W4YnqufIijIHZZOwGpnrD
+; dZCyitpbNr+RqT6mIqFj65lWlFlac9jeaeC3lmcaY8CjkZqUP20uP2REg9s54eEpko/kbzkRzcF5vW
+; ZV+fUohioQBshwjWmcFxdpX0smUi3C0zJC6b473WShQr2Sy7wzzgqUw0tx6J1krdU/tXax1OU7TjMC
+; MSD311/3h2fng6zTNs9bCPab9/3H01jlfmJ8hUzmRA4aPd3D/M8OtHPuwTisH3bLOpnZ9+pLnvd1Tf
+; Cwfj/Hg4/Prl9c0hPv3oQ+R0df3dfn936PNMD/MZTKlHR0Ixn643q7lr93bk9PLqzZcvb96//JPn55
+; v7t3dffv2bp5+8v91u3rPx2eP889/99iGeISP8+T0wxbz2YVbCxejLRscyCSuFJsvWwiAve2yUMiul
+; Oc3NZEoJc3XZdMFQq5CKSzs27+HF1XVm8eOcrP0udJ8BKb0WYYH0MTOXuRJjmTIjgfTtj//Ralgc2b
+; 2EZhCYx1nUMlxc1m0UfkZq6XEXU7bU0kkvkmhpWIwArBZOVc3tspYZ5tT4ZHOadz9dnd49zPNDT7W2
+; WW9O1quNw8fVpH6YH2/vb0Qdpuhz9/X26uGwnwPyVuDw8HS7vtDDS+GVhrvvbm9/9tvXD8nT52f72H
+; 13d3UX8yMY47ZzwLCFr+SDDeO4Wpu3w34+TH037d7cXD/u8Nsvv/3w4/dOzjbf3byNtnv2ZFw7NB80
+; TWuTH67evvwdts/DLuiEAg54EjHILI1IRyv9mcOXFcVJW3RGcBPo2QzO2oNY+H/JwCPz6PRLSuphko
+; uNRnHZIhIkvGzcoTTV/i/VbEnvRtUkaIIpRNJP/s4/xdFuawkQhoUXZ6UgrXmDeTNQbl4bd8uNbWit
+; 1qmVFRmBxsVAqdEyAoGyj3InTMHowMhp7VevX/8Pzz86/OCHz3/yo+c/eO9yVNy9ueqHHjmbq43rGc
+; Pr67vDdLg4P12drWw9zBlXr29WwGZjaOM838+Pv355/fXfvPzm1cNkp2eb840UBNuwSjh8cG+NHA2D
+; aXA6KVjI0pra5uYQu5netnfTfcbdiyfrfngYV4w+GXKzWrvbas2zy9F4fzOt2D7CMIKZSDZf1i0bk0
+; IbgmJzmUtphXWVuYUklR1dTRYsl4qISUtzmGVtG1fRLp2iLVS7ZX+6Fp9/mSGV7pbZizwvLm65xsWv
+; PyVY0uCbH/8fa3WUG4gglSWJ4YJro9iyZlYqb8ndnNa8ZfHPzTMzgDaUTOZoBMLFgilTQU5UZ/QGSz
+; ux3c3v/i//xX/M/9U/+OS9s7a7/u71N998d3P7cn/4LuJmv7953D8csgfXJydTTAc9Pj3dxu5hONu+
+; vd999bsvn5ydPLvYzPPVr77+t99cXbWzJ9vLy8TcaBsf1rXvBKTUiHXDynLjWLs1AzKcPoyrOaKNW7
+; NVhHwcX37zu6cn1rhbjW27Ws+xv71/eNg9gIcnl+unT85effn6fvpYvkHmyBHdGkYp4El30ZZZw3FR
+; uVhcrtL0qZbk2cLTWZTyBiTmsn2sTR1Rrp+sQ2M+eIXMhJkft8Ibo8ywgMxQdAPdG8oJwmjkgOZpvv
+; 38zwvbLHpmbRMsoWoleThFlP9uzaTMvWpDLxOOFIWxOY6yiZqjRpmpeknZsRK3mZadGNwPX/zk2z/5
+; Y56tDt++/PZqPz+w+en5+vTs4uKiwZubOxPzftptT7a08fn69Nnp+dSxPb3M8KG1y8uTq7tXjzo8ee
+; 9iXHEwXazXl6v16WqgH9yxGgcnVm0g5Gw1XWGNMtWpvhlo7MjJjMjx8VG7w1Vbz1JOgbup33btwyTy
+; MHnv97u8mj/M8bykOIBnCoyoBY+lGC1uMzMgtpbM9EyDj7WNd7FWRqOciYTROZiap3sOg3zQMKJFnQ
+; d6vltBSznRvESBYG2KlJymo4H4IvUuPCPnRDQrwmZGLZGoNZmthBdRZFAeSWdRdoeBsFbC/goa9MFD
+; WVPCADI1lGTa0JWteQZMbCHjCk30bz/+gVab6Xq/21w8X4tT7+vVVpb3j3dnvjIfsgUyyd7nh9PV1p
+; jjsDr31LT/7LMPvntz9e+/+U3E/sXFxcoS0Ve+HmhuIczmFjTBcqy9IM0WDmJXKiJWm9WU6pnR+zRM
+; ZsOg4fTp6Zdvvj1/dgmbYrbVePp8ZE/u93F3c5XxMO9O1p4HQen7+WC+BYG+bPlosOxpzkZDdGXGvG
+; +jHzeZyILWhqwZopLAMDilxsysHUkd7hLmEokt1DBLQgGBcwm4S/RNF6nej+sGmAk3IdHcI3MOmnnr
+; ETHHOLQiOi3NsGqv77I11d36stOrtpuXYUAaYvAGEMp3fMuWGr2ZEBnZ092YCiJGHnoDB7OHw5t/+e
+; F2fu/85Oqg+fF+4227HvcPt6txc7o+n+bb2mJx6rR1y8DN7WtM9317Pgxrb4973dtJ30+Hj58/uWij
+; 9disTlzmNHrvUsvTHtkGS8Whd0l0uZNogom26zEYAG0Gzr3Ns5q0FvN2e3/vP3zxPGI+3axXrc0Rbz
+; i5zr67u4uch/HRbUpro3vPKdGdJFrtwk4hKUBWOtzWag2ze/lo25TdDYLNkWbWey8YvXSdlZNLMOGZ
+; te1yWUl99CiE2JbNobHsYQTCjnzOMtBVAlk+oX72+Z8ZcnAjSgeddLlBCjM4y29GlJpZIwa6gxEarB
+; wvvSTqCcxRls1W21Vhy98EUq5MINJ8OnD3R5/u/sEXj8jd7a5fttg0e/twvx7b2u1ud4PG5pvmJ3HI
+; 3e19hk7Pn7++vru5v07Nh/kwTfvLk/G91XDZyJgbfBzMjc7VQjqWj200uMGaudGbDY1rxjDYavBxdD
+; qjcWqcZZSNLRHCIXV7df35xx+ux06bo9v9w93DdP0Q0y51/7B/+fWb7ZOP9/3U+2CE1F0yyGrOBjph
+; REYuFTWbiQ4gwgCEMWBlGJklJ/ABGEiTmqGWHy42KOV+m0kzHxpKyuIOoblBWexq88XLF3UAysqdZG
+; sya5K1tj6u/SnqSDjN3MsldopssAQRSVAK1iZlJDPL66f+S21ZVONjdhPc3YDqBkYOmX0zMH3d3O/v
+; 8Pr1w+X54WJcx4SXt/fjs7NOPe4ml9++vHt79+ZBQ2Azco35/sn5m+dPX+z2h6+v9u4YiczYXp40+b
+; BaUc7swpwVqYA2UJmCWivlzRCzSYEBzVwJtFVreJy7+n4E1w1aM8Hz8/HV1W6/uzs5t5vdTce0Y4/N
+; 6G3cju38yfXmq28e3/4Mp5fRXhi6aa1yufJBtcFSC2+1TCbnDBkbitReRtnlUdx5dENQOX0S5WlSzn
+; RmMAKB1rw2mkrsmTQZ0EM9Soi7mKgMi01t9UEC0DON5qef/9Pvva4ICKvjclhf3GIXLRpFtyODFyLU
+; SF+CiygNZlVmN7faqfdOfBHqpFJtIg+eEXi8ftlW94+H3T776nTdbLbQ3VX/8tdvX+/s5L2f/OCzP3
+; ry7MXzp+dPL9ZumnvOicP+sN6s2mqYpv3Jej16azY4HBkQzIdk6+nmW9pWGEimZqWMDk3GXsCPswHu
+; th680QxJp9PboePxdn+xXj97ct4jT7fPtuPK1KMrpsN64+9/fPFsk6fbF19Om4nzQGQwfahIG0dWo3
+; kDi/6gRdlL5nHlTfTOumZKZmqJ0cRiqsNmtRPQM4rXLtq7HrZ2MdQiy4UOazXe0bJ4QOpQVAfumy/+
+; XMZE0ECvJtjhBkOUusG9DR7LJjiWhHbxwTPL0k6BtRxRS3GJBmYUuXMxUMrsgHUyW5v7aRw23/7m3w
+; 7D/gc/enGyMj/0V9+8+vb17uyDD//g9z/99JMX6I/j/JbTt48P3+0O88OhP+we729v1tttjq0bDTbA
+; R0MzR4I2ejshL1t7L3Hu7YX7c/ezDBjoQJYlOTPRaWzD2rBGImJq5gI7cIj+uNuvkp//4AOZ7SZ/3O
+; 2kPtJHJ4fpfINPPryI9uTXb05ca0ck3dzF4xJC0zsG6+JDbEV0EszSWi+U2A21h9nMmxcZtrqjKmUj
+; KsUuY8Sid/UaLyNIRMBoKskFDDYUh9boBa4N5iY05UyyGat3K+YWm9cdBeAmizSoxO0mRKg2HCcQud
+; ARSsajDJIGc2JsQ0S4DIkUwgb5RGuNq+B6xtNf/S8vv/jjJ+drbrH66Tcvf3318MXnv//jj94bNL/+
+; 8q+DNPe313f7br45a2u54vTZ+ZydMZ+vh/VmEPNx2g3jYHDAhSHyZBw+GdZnZhvIFXvgXP3LzNfefD
+; dN+8POhmY9Nrlet9NGrNuUfdeERmsGM9vvZkMzrBrGy9P1Zj1FTLe7/X5nr7/77pOzy5Zfb/rF7Oez
+; Jm/lrl60KUb0iCCbWc0nWYwbN+u9WPFUIhTl+JfRlyZo2TXLVt7QzPLzN2P5A9bMQkmqoSymM5TRht
+; pMX2udNEUWojyHGdm8gn/54hgTyLGJKl5lRMAEgs1TMdeyydbkVlughzZkxFHLFFgcodq8qEvFRf/C
+; wVutXMt5cq7R88WmPT27dG+/+PXrX7za/73/6I9+9Hzreffm9v429vvskdqenVxsNzCQw3TING5W68
+; eb2/n+YXV6sV6P0/7hfr/bjltmR3awiae2fl+01biOw5477vtd5o1Z2LC6urt7++bqdHPxwxeXG+8Z
+; szQj96XBHIdoLXe7eT/JgYuBY+vz4V7A493dPPs+/OtXd4c3X+vtyp4/dTuZa1WpWUh9nivIpeBk1t
+; MzRqRZE7K4kzAbrBEM0du42IovzpXlSSWiQcqUFzAiRmrlLFNP0YFaveaEhWbKkGKg+VCqtnKGaPWi
+; qUVIDAFeKMzCFFkkhQVf83s7D8JaEVVKOqEgFzqeFdJtJmNftOox1J42IKfwtYumGIeD3by++/lvvv
+; rBZ7/3/pOt5rtvbx47mJlxwNPz0ydnq3Vjs9Wsw94fHx/64da2Jyfdxzmm9fpC4GF/z2m3Gdew2bxb
+; M46bce1QRmdwGNfn+8cxeW8Dt+cXd3K1FYcWmkhKzdgIZo+cFYEmDJwP+fDt1dcc8ur27YxTtbPTi0
+; ttLh+6DSf+k492X+aba20Kdzyikm7updivMV8om5uhKdIkxFxir0yRzc2UzJq7krVUyxbSnQBbNDo0
+; JRoW33ktjoHmZpmp1GAGeizbtpb9OyEQ2Yzsc1gjzMpJyRK+uGCigEktYHZ9Bqt0tRjCcRG3urVU8c
+; J8cZNR1hp5AKq1qL7vdB/H7Ic+nj75O/+Hr179i9vD6+cfvPj843baHt/e5yPXUu4jLs4v339+sZLO
+; VpvBctrj9f5wv5970Le4vNycjX6YHoe2vcOhz/cDYvTGdgV9M+/Os2+H1gZm6CHjzi0yGlOXw9ZPzO
+; jee0fM00GEOChnZU49c7JxGGbqEO06xtcPj+fbD56dP4+5na5OX5xe3s42ndxHTLdv8+FhF3Bay7RS
+; 82HZQozIMMdgqwxmLAb+PYOLWxzFlCJThPO44dfdxEiVDiqX9VfMOHIii1ORQmb8rYXrAXU3T6hZqy
+; XOzHS31hUcHIaOYJnM1lRjWWubMIdgHctcA7Wez5TJwRePe1hmCGjuKYRquf3A6GVCbea9h3maD5Kl
+; dLDRcPpXf3P16Wf7v//5R5shDo8HdayM37y9Xq23l0+3xty2YTs4yV/f3vzu5kFYffje8yeXm9tX39
+; 7e7o2PF8+bGQ77PDQM6pxuM7+CGoYn8hVyH/2bfnjZ2Js3RffsJ42tOfuuyIdTHOY+gyH1/ZT3j4en
+; l6tDzJF2cfnB1XevSR+HFay1tJPBp8PbzbqveIgJiJYWbkIIigIenLBhmLsyRWXUGMYoqXw1Uonatb
+; Y84WWxVi3PU2ajlZywDD6KQZ0S0KChfqOBjY7WAjHbHlkFUzsa9Jd5njdLrNzmaTJiaC1QqiJBXDzl
+; 63+1WUQ0WGS4w0q3qrIlQ21cNZFuqI2MQLLU/TLZ0JhwJTNyUc5jfPVm/+M/HLYbrofx9du7zWb9sH
+; sY2N5/cr7G5AcNJ6cv37x8c79/udu9+OCzF+efPNy+8j7B1//zX//mww9ejE8ftqvh6vXU1iNiOvHm
+; +YZTZGxlY4/JbT8OB2ZXdrcEQ7VNhDCzwBRl/hNxmGK35/XD4Q8+PTP6brq72t2OFiab9tPZ6fl0e3
+; O6ls/fPRymab7chU2QODI94XBnEpqVyCkMxjLpKa/EgEkRXhbEtVI7kuZtVizrHctWfmBEusRMb8NC
+; xoswMykDkUebTwGAw70A5SUwCGxGWhORahjawZJjg6mTEenHEaak5hYKM5uzDkXZiCgRjTX/gMGOZj
+; ChEBjZJ9IWPqEWX16grGU8IkAwOU14vDucrl6cDKt53/cTxrVf3e4vnn74bHti+4fNav311Ztff/dy
+; PPnAxtO17HIYrDXOt+NWfLp5Ne0u97ZeX4zr0y+vrt9/ep4WZ+tH73t4RReGDBQ00ZCRc8xFPS0//0
+; McJllHezj0h11eX+8T2p6NXZOG8Dk/efa0T3vEAZgmu95Pd4AOE1LPU2vYkJA0F51QTKA39yBFRs3u
+; kHFcf0FHqBOwZjXCLU+8mEOW5paKeS4ZSNG4aqzIWk7vpMnldGdkh6jsy+qFhUy/GGkgAzb06A093W
+; mGnNNbTfnKyxhGIqK59bnLTNlbVRCEKiILSLmRGaQtq0MIHxmRqaAtW4NgPkGGpSTA4DGY6HFI9Bw4
+; PD7uZ/jL64dDrk/WbeV8nPHlq9f3jBw2X/zo4+ubu/uHL69ubhhAxOZ0dXE6fvfm7ru3cfbi5Oz87J
+; tv3766vuXpybBqa4bSzJqbZ+3QMU596tmTmCLKur2Zz9AMPvS83et+p6vrux9+8N6Ty/WM/WPfD8N6
+; BE8362mOh9vXou3385vbh9+8PXz79qn7bHSylpGU/UETDLCM2Vspf5AhABnhbYisrem1fFoGaSbL+z
+; CTCSJ7mYsa2aiMGhTC2KOXDwgNc0bp/6q98lr9Q6tRUpXfHXMwWoGnPeuaZnmvJeXuogCr7fBtWcqw
+; aJ5KP5ys4jwJRUSJVwiLngYOralWTyzODzAbajWWk9OcrvHiyUe0YLP73T5SB/DkbHu+yoz9q9v7i/
+; c/eO/05OWXv8m7m/M2Xu/m/fr2ZDx99Xr38Hpv3s62J48P85vx/sXz1bPzp19992poDdbPx3mwNXu4
+; YXA0H3pYUOmYIvriDmMC92FvH/e7bvczb3adxA8/Oh8Qh+BeicPOVtt1G7bb82nY2Hg6H260/42GuH
+; hy9/bmt7fz+SG3WAAeiBUw3LxmBrWjEgTZWkiLaDujbpKbJTD54mVTBq3uXovomYpatmAA0NwJZFBl
+; 4ssy6vDIDgaNmZkq3zFP9cF9kC+TiaqQjV76J5RKjCDRFV5AJY9LrmkqlYOZmSIX/uayqUOStRQIy9
+; pxXfLRxnKgMOMhJrW2Ojk//cl/0vH/nHE4zAeq0XVxahtCU75+/fWzZ6cvhk1u1r99+eWLD987u9zs
+; I0YQ25UdmnYTejrHm4fp5OTh/Wcvrh72N/udkrHmyXpudE9EYk32OExpsLabDmiN5nMkUoeOfY+3D/
+; ePe395dfvhJ8/ef741zbskhxVnnK/Pt2ObOmit94NxHk9Wp6Hrb15ebD+4fegZFtnJQuvKYKd8YRmw
+; 8gTNTGsNKrmmJK/NG6Jl74MW79BKix1iqsRl5WBTJpbeWp8mlBkSFrePsvSI2llqTrAvv1mGANQS31
+; tuGpgA3bCwy2FEW8b6ESpNd5aFgy0r0Io+wKWbqsKvwEulpyKDbsnajUy6T1E5xqa2evPG+2NM+3l/
+; 2K9OzjDnerXV4LvHfRs299d3P37/46dPL1/ubh6nx81mdXN9GNYxbIQWu2kebByG8fHuar97vDybPn
+; 7+4q9/++UdWp/7HsMw5gpai/vHfWKeJMgq5MnQlXPMu8O8m4m+2j1OpxebP/j0vcvR729v6cOQfTNu
+; V8Nm3S7cx13kfPi2td3p1NeKNs/r6Y3vXsFPKDZSCROSIiNhslRmc1eGW2YEza15mVZlhg9t2YqEIq
+; 0vbpVR1DahhBK5OD8qItOp0qXUdkhKjGp8y0rFaY6MyOI3m7uffvZntrgzHAX7ICUDBndbisBikJCD
+; 1+a+klApopDoWqJTizi4bINAMYHKNltGo8F8Xraz+GHuY2v7b3/7Yvuzj3/87Lu7+7AhDg8fPN201g
+; /RMa7SrGu63908uTyNPq/G4eL8fLtam/Jx/3Doue+9rcfHu4eRcuuXlxeHKW8eHsm2280+rDo1IXY9
+; ZvmkdpDNGGYMj3OfAoc5dvv+eMDrm4luf+dHz9+/GPf7x9v7x9Oz1ePd1eXp5nS9ZWyAZ6v1i8F6nx
+; 8DfU9MPeeH+Nlvp/b0s30QxroSMnhzIN3NKSjMRKUpmjMVVmO+yln1iArxgEMWKWNTLvbrtlDZy3dt
+; sV8p4wczJ49T5JpGLSrl5GKCA3O2xavjqIoT0GzZoDNnkJITUkMrfESCWyvMhANryh9Q1raGDKe5LF
+; K1A87BIpQOzpr/SzChuSu4ufxg55/fzft9piaNPRzz/mG6PwRW436ef/nNbz98evZ8vT08xEieDc2X
+; XSGxWq3CFXlYrTcPc/f7+3Z688nHF7d3bztHRb++vj15cto7HT5KoaC7ypkzCfHhIXeH9t31g23GP/
+; 69Tz45b12Hm2l++uy9/f56nsy4eXy8mzSZ7zwvM3aRc9fULJ6cr9++pM9rx4DS5hXRH+hiFDUCAOgs
+; O1d6gkDpkSiUaWXPwBC14aj4danZWptR2+wyEjDQfM4cpeHd+rtCucEqtwSwgcbocHrPnuYmNnXR2I
+; Zl1UC59q9W4/6wa0O54gqQRZoX1GEmJBJiCdtVnVLZbrWBRBByozj3KE4wjF2p4+bFMoOZlafPP9oP
+; n0z515v1uLvdX56e9WgPu90hva221ubVlsN4Ag1MUuH9gMRAZeRhPvgwGvwx5/vdHsNoV1cvnuKLH3
+; /wl7+9Hk/Xu+lxut+tVicNTB0CXdPMGaYh1B6mfPsQ4Zv3Pnj2w2fr51tXzN9d323X5wZeXz189OIn
+; Gz91U8wH8pDz7SHvMh485qHrcD9/e326Pv90PuQKQvZmlss8gebozGVVJCINgDpl3rJMnxdWLTmM6l
+; mepcsOUC7rC4Es6yKTIqLRgF4bqn1oCwesVKA+ZISEw25qg2e5S5oC2by1yOxZ6+gYKQBdidbojmMN
+; JYccdFDh5epmixN1LWCvvaUhebkceZujqjOTI5VleVvs3yipI/A493vm/X3PycZhDQYMeyHQtIt5Om
+; y3wzTPh8iA+jyhNSTG9brLDlM/25zf7+eueDjM9jCs18Pd3cOLF08+/+F7P/3lb7dnJwbfPTwQaKux
+; z5ZT5KTM/jjP3cbz9z95/4MPTrl/j4+cH3/z9mq9OTsd28tXX5+sz5+enzeacjcMg2u18lPv8y5XUu
+; 52D2+uY9+e+tPnB8q5OC+zPM0IdA7WsvbmgA0gSvQQRamUMoVlG5JTqtWvzMzSDDKzuYnw1qIc+aEO
+; ypxkl8w8jvvIobnWoaw2jUBmJCG6mbX/f1Nv8uvdmt31re7Ze//607/t7W/Vresq25Rj47JdgDGyHb
+; AwKEIIRYQwsR0pSiSmmeQfyAAGiTJJBkRKTJBQIoKsmNBYYOyycagqXFRzm7rd253znu7X7eZ51loZ
+; rH2uM/CorKt7zzl77+dZ6/v9fBQtotgGTjAqsoo7MJVQLqMRoDi4GTNbUYhec+w6iKMkodmkEgDDEK
+; YOGpU4QtIwx4MHzwCZ3IxFshqkJOxlDZ6H1GBqqu2QOytMon1fuj3NZtk0ay9NlS3v+j2zFK8sST+0
+; VTf0WlJTdVcmAzjVxnhxcXX/+GT5ztvf+/h5s0g0k/Wuvdr13g1INLi7pPnR/O3HDydNlUo3Jc25u7
+; 65Wh4cL+v51dUzQ3x8/1FDU8F68Nqhddpt99fqvh/KyzY/ve6vdouL25md1D2AA8YwCQLRP7otR3RC
+; vHiJGNWTBjGSCDm7QtYITpgZITkakBOhmgo4Eal5KZlIYj2MxVPMle7Eo45oTM48agMRrChLRW4EBm
+; 4SVcMApH6O0BwNMbEnJHYzRQNEtwIEiTnQp5G3FqISl3kNTEdc5V0kWbHRDuEgQhkBIgnE6IQsUsH5
+; 9fkPXtQvqzQsD/EEm5wBXRJWbd++OH9ZzdO0kdwXJNm0m2pWAXox81Sp42a/odkELRFPs8Ll7W2qFu
+; 1tN8Gr45OTd145fHp1e73tuK7vn0xL6R3JIDWT+XI+bbDUfTsV3uw2N2VfLSd1jc9fPr/ZtV96481F
+; U1fQuw2OuUBhy4NtL4dtO+DFZhhKtV3P5kc/fuWzsd2j/jmoTk1RyJHUQh0PYXh19BBTA0JRjeYZIe
+; FgKRSEJaJPwBi5NwMiiD7oyJ6M7BWQj5R3czNwdXUzsiDWuQ4DEDkSEkpoMJk4rnBRR6dRYjxON2Jn
+; TyhalIg1Xj2EgmJmoR9IIl4KBPIQHTH2hyHBRSGM+baBsRBgQvOmXOn5vz47Pm+LQl236JYa1eIZpa
+; 6cDdJsKGmOTc4ACQYj4BoRsg2TCU4n1YsXmwfLlXOqUq0lO2v2YlR//6Pz+9v+/oOj+8czAr7ZdFby
+; /GiZ0up4dq8GqWFQ3XZDvtpdtToslwc1y5NPn73clR9/50tH9ZwwEddm2YYBiYvlFvo95HWGPtvQ2k
+; ff/Sx9qS4zisUrJQHXUpQoMVcObppHlTagmTKLE/RWiEi1RCFC3RiQEqgVJhYC07G8GTVsKzl64O4A
+; ioamRHf2o4w45qkCTj6uLsCDNgqurlnER6cwOfA4jSEGtBKX8lB+IAqaGyGDUy4qFbubo4OQqXISNQ
+; PmiPVwxSUXB0UhjxyZIypRTTaay6nGoptP7Pk/X33xAclevZ+sDmiSrNiUG0OFhnFSZYMhl8Wini0m
+; vZVuwOWkJh0mqRwfNJ99utlc7qarZj4TzVShr282i9X9m2z//sn5Zy+382qpUG2NcpGjdPr2ozcfzp
+; tk29vb9ZPzlz3yZHVytkqV6acfP3lyvv7KV37y/vTVicYwv/R2u+svssFgut63l5t8u/frm+758zbN
+; zxLsyGYDkoMCiMEAYU6hRIgEdyo8ByQBEjATMALGMTcPIimK6zFsBgNycvdEZO5ElBLGqNnCKu0SXn
+; B3J2cM1xwCcIBnlUVibqUIBqJgkqMICqM4HsATBBTLCdBNhTGgV8HocleOmil4NjWghFDA1JTHcptZ
+; cXVABxFEZDVjIgcFVwZGDRifavHdMN9nTXVtkNmtwlKGjlKlNsSR3lydZLPfTaZSMez3PTMX93paya
+; pZrLbn69uHM5xP+fZ6W/Jst/euXJ8+Op4e1B9/0t5eHBMeHRxXZ2fpS68/OK798vK75xcf77RMlodH
+; y9XBZDkn+g/f++4ffO87P/unf+6tw6MFL4DFhicZ1tvuWWe7613fe90N9S5LQRjcZ4dymiYfnP/x9L
+; U/w1C7OZYSBTJiBPPswccGZgQ3YgZUqgiQFcBstI8FlsjLCBUOczQgKka/xhXdwInQzJHHjPQo2hnr
+; MYAEQqRmFNJ5d3CwUozI0SWGJkEqHhOTozeVISwFEF/vACaTqRIFPhdqZA+dPEHgeiKQEHqKwPjEjF
+; oNCclBBcjcFQYRWR2/NW2/vln/m2lTl2JCQmh1lQBMUirtPpcWaOIEbc6a8yRRS9qb16kWNGngweuH
+; H3/rqvS6nCc6mK13Ol0sh92et/2jB8eLo3nir8zlwaruk33abT749ocfXl7fHB6cvPb4rSZVk6bK7f
+; YPv/29P/7hJz/3Mz/35tl9Hvpen6Jg1ptNe74ZukI1TyaewSxB1RPYwWrSdR1XzXtP1m4FcPK5c5mR
+; VI0YJpUUKw7gaoKoOp6Q49JhCoBU1CQlc3eGu+5mIBqMI6RlwCkhGBiMjXon88/xkZ8T/WM7hqM4As
+; BdhRA8E5E4oREhI7gVtHFIBT7mr8e7to7/KqbMke1xB0yASFj6npAJMdIH4AbmwBhzERx3n5JNXIsB
+; UyrGQ2t1pZO8m6brPd1r1vtN382B5wMMFcm+7XLOdd2kJMRcCu727fHB1NFaVRLJbVdN7PRk8uqjw5
+; cv1tN6Mp/PZnPZtt39B2fDvt28vDo7TQfLp6U9v37y4ur645byZF69/cVHB3WqdeNdevJ8/e9/8P4n
+; Lzc//dNfffvx8VxdQdFbLOqodTVxbHpz123tPTCng5pskne463jztEn1/Z5SjgYoIjgZoCMrIioiim
+; kxA+YRPxv2BSiFYdwiobka5DiCj2djT8xaipO7kJFGnzTYIHDnwLMRBR43YTeLE5XnooAULDqChAbC
+; 7lpK9MpGKGYIuNwNIHjtamjF78S0n2uwKNBMUZu00K8RCFEiNIf4ayqqktigJLEeMOzOhgIFiXx+RB
+; eXTx+Uhisy82yUEYWkH3rmRgST1IhUiufiIjKdTs9v+1JsOiVyWDD86JsP/2Dz8ftPn7967/h4uZjU
+; 2OX1/UcnntPTzz55lj5U48Gr2VlzArNl8inm/Xr3fD94mtzs+vrs7K2Hx6nZbTbPJtNjTpUpArh4dt
+; BZ8gagLjhY1Rtel76p0ouL7c0NfPbUp2fv3oCEr7WM2jr2mGGAEQWIH8M8DCzCFPFlJjJD8vFSVUXp
+; gWz0EJMTGTP5mL90QCylIJGpIXFILO8WPAIAPLLmGTjGkYTjZxgknHexB4zZismIjwWAMl7g0aKUIW
+; MZMhwfAKQlS+h3wCHEb3fZ/mApMTgisit7cWYHQxBUaWRA/XD16uWjL/7oYGsXTELkyCSDYl9g17bm
+; ZuaJq8zVkH3INptOy3XWigcka23i+Wgy+eqXX/vm9z7+wSefni0PH98/mbBsLq4Pjg7vPzhFSoTOVN
+; zz7fn19957keopVNX08Gg+mZ8s4AC07ffdbvNCbwipIQRgILa+dbCutAawH3DTal+sEJ1vnz95trvs
+; Dp5v03QxYUtm2d0SxfxdR226E8YoMuRW5GDqrqEj8kBLjhdmsFEWOYafQTMRkTtZHu+uCGyOQM5gAV
+; b0cCIAxhyUJF667kYc52YI+grP3vy1uAYTALqRW/Bho67GrugmYQgg4M/3yW6IGCe6UWs44tHI0Qs4
+; sjiyjRY4QGArDJQIiFMSAtLPcv9Pv/DOzb2z9Oz5xXw+X01puUiErgbbXdt13Xwxn9TiNmgpIjypBI
+; l6x5tda3FSVJNEs7paHSwHoJf7vt12uu81DabtVGDOBXWLmF9e3awN+6oZKB0eHjw6mZ7N5HA6nVfz
+; BI1Dvev2bbtmkU233w29kVy3w003PL/dPL/t9iqe6v3WPv7saptnV/vJ5PDdIT10rIlJ4qeDTuMP1k
+; dV2vikMBA6hAWCiLhEw5DRiSwmWSPXf3SAM1AGzEyGZIjOXBAtGtp/0igIIY+COYOTQ5Tu44zNgBJw
+; 69lbv27uQITMyGSOwoTEZuYIidkJwZwoulREzOaKBMpg4CikYJ6oBAldhEJbB/GrJbvjS2AtRhCfKM
+; VSw/O3H/zgjYeaxLpdC0p1jQeHE/LSt4MZekZGOz6e57zfrHd1U82mlaBVk7Ru91qwqmTQoWSVRHVN
+; i2WzWC4y8dYIgBG4EjF1M9ns7eJqg82CHI/nzdnJrNZ+6sqsE06HzWw2b6Spt92gAPPFFJJctt12GN
+; qCBSupp1xJ2/XPXtzaZAV1Wi4WkmZXXTPIylBGi26EhTnCOkCc4l12V8h2cEyAZEjm6MjuZEQG8VBR
+; 1JkcmcUBsmvcce1OXhSr9tjqj6bhEc2D6M5CY7zCnVHj3WGu3Lz56+Z+53RxuKNw6IiNsFFIe2daQ/
+; NE8c+KkAYRgmoew9JI4BqrK79TxTAiIWUrgBDsJwedy/rNBy9Xs85d57P59dVtk9LJ6ZwA2q50nRJL
+; 1n51OCfkq6ur+WwybVhIV5NmWk9ubm/rqmLGXIZBB0KbsSybSVVJPU2TRLOJzCYThPpmXT57enO97k
+; 8ODjh7Huym7c/X+/Pr9YDy8vr6+dNPmySzSV1c17v9ft8J14vlgTu17aAGClgc1Xk2XRwdLqYTOzxM
+; TUOX617lrFjlgTCJ6wY4ULiX+O6wCp+XupDRI9FCRFE1YGSK0AuRMI2KVyQY+XMMdxqTUYQV3geKLc
+; MoXQgZW6yBwzg/ChqIF2//BiEJc5RQmTmHDQQAABPzaHxGCrJ8kJTM1QmYRIsKITGDmdwJlLMWIY58
+; VlzL+M7h5RZjMpvgzYODT+azHTo0tbTbTns4Pp65weX1jqjZbLerg8VqtUBMV9c388msrielH+bcLJ
+; p5n23bDnXdYAXhJpqmWijmZ4VAdRh2u+7qun32Yv3ex8/q2UEtdnt1td2Ww3v3eDLZZW4mJ0/Od59d
+; 7D/5+DPv+4bTtJ4bTC+v13Vly9V8MpsWx7bTYfB9l2smLOoluw2reeVKl9cTqY4QEcItE0x95kiZI2
+; BiYWK0MeZWEBSgmKq7hmJpTEcSIKjfgfHB430bahVGFCQ3HeOt8eA5UEDz0AcwZ1FCRXRGYwJytWKu
+; 3Lz1aywcMieWiIggIHLYf+BubMlsRGFNMgenePfejc3cxrw3IiJWzAyRsAMGYiAhUlB3EGIgVM0Tun
+; 189mw135WcJ9Ok2Z8/W5/dO9ps993gTTPPOqwOp3XddPu83+1feXy2OJgNeejWt/NZM1lO1/t917WT
+; 2WxQ3/fDZt92/SAs5KgFu65s97kdcD8AVNXy+GBwuL4dzOztt85A96vp8pWHr3W5mxxMZHHw7e//sG
+; sNDIhLqkxL3q1vG5JZXTepIsJp0yzT3Dq6umkdaDFj8NK1TVtWQ0F0cCsSN1SIyHBYSc3ir5wQRSIK
+; OdpoRnPd5ydahQAwgBO5MTmRE2r8D4TAbIRGYKP3BY3QPu/3A4CFeY4s4nlIAMyrt3+DImoDQG6RhB
+; 5/UdEncyMMsCqOifvooBAmEgswpowddWJWhFC1apxfwQAhW4i5wuCAgIrl5f2DDw9WvbsyQ7svH3xw
+; kar6drOum1qLSoXLVcXE3T537fbRo6Vqa+D90DWNNJM0mTVDLsNQEvJkttw7Xe76dttBZ/sBBkXF5N
+; TU80W2Ydfd3H98bzfo+vr2zYcHBzVcv3xJSJvt1c3NuqpnWC2eXG16l+12aDd9lRrCSs2QoB/aoduS
+; lTzYJ0+fpkWazqtEmlievPfZ0/ZRszgKt2eYmcPMDe5qgXnFsccNIAAUL2YaIxtEAfUXpMpRgARANJ
+; QrHrnJeL4x7qhMRIiRy8MoNsSJeHQMQsTUYx5BiGKI7kaJEdHA0J0MiMeQEIzvWI9MykgeNscgZxFH
+; mwZoHIbmACMihnbZAvLhICwDWzZFBjWTxEO2drdWc2QgFmRpO/3B++evvXFYVU0Z8qyq3Iah86vLTU
+; ooYAmhpEkvQ1tsCbRimj04bfNwcbtd73dAcnBw2G+7F1frXCCrD4oGVdFt224ePT780uunVOzffPj+
+; 5dX52esPZ9P5H33726+8/vj05PDy4naepo/u33/64sXjswfA8N7T8+T6+OxkUvlQMoDsuvLps6cwqU
+; 6PazLVXLBqD04x3ai6KThiKCCdk6A6eNws3LwEGxLMlNwiYQVcTEWSFmceZ0HuMBLp0B1YwSEUtpFh
+; DUNm6LOsJGEiUDNEsv9fbQwx3HYgbADAzZu/BmOg1uOgTzhmrCLCC/HnFodroooFYwGVEt39ZRmamp
+; GwQnTrDJBiHW13gg9FByIDdEIAPahuHp2+ODpQ1YGIENLQ00efvlgeTJuKyzAsFg1hzr09e/ry/v3V
+; g5O68uJAu6EDzyezhjRr7oRwOptXUmmnedBW1ZskKVXNxFEcSDhVFc0m/GCSFrPjJxf7rt0sZtPDs9
+; MO8v2H9/ttnx1yGUzLsNm6loOTQ27Sru0/+uTJxfntel0uXuxfXu9lNX/41uNU2RRq0HqX9fLGbvwd
+; k8NQxTtiXCaLewECYh2HR0Ee4nhy78x1YTUxBkRAN/OiNC4IncL4WpTDMG5qJcjgoKqIGMT3gIj/iS
+; QUQEsRRnBAYEDmyVv/BSKlCLODKzhRGskbUTglcqQSdWYAFAJhYyp/4hYfo1+AHEARRrijkwOoMqFb
+; ITeBGslVkIbbV+Q7b7yZJ81OGIp29UTuPzo+Pjt478OPJCdANjdQvLm1fc5ffPv0eCo2ZENI1WzfDl
+; W1AksEXnMjnibSHC7n80UDFdbLCaXkgFXFdcWadejVNB9OZycnr246v9pv5g3dP5zXDTz57MJ1cnp6
+; tlnvnj2/rKery812394eTGfN8ginR7c9XG7b5mD24PXTx68ciu8rKEPXm7hheu+759f6FZmeqhojCW
+; jieFZCMBgN/BDPxA/dESIR6+ASj0+oENGRgVCNEQiiCBgfOjNTdKNgRbuGpNSjVgQQwCt1G78GIbKK
+; QzGigCsjh2cjUfDeI9br4ODmyGiqysQkiDDkgRMDEzgO3UAyxk7iV+tIbgoCxGTuBCBVAgBXdZa4ja
+; v7g8XmlQfl/On38H69Ws1NW6OumqS33r6XKvq93/32q/VrldftdXt1ff3qq8fTSWVePCGiezE3Vqub
+; xcLKbfGuFDcrdZUQutcXvDPvuN4J32zWO+3rqsptpX1/frs5etgdHvDtXrL21u8PE+8mzWR2fLPtrm
+; 77vsCPf+WLYPrk6fMX+0zcCdMbb5wtZ69UyQFK3+4ZzcGLQjWRvC19N5S5MZgFK4PcHO9krjHDiElW
+; bBIQQD2YSGgYVC2AwAkTEAGaxzXJWSGYn64O7ukubxthaMojYk/vcnEO6BpvkMhMxZYQRREZwlTqDk
+; EltagRFvdqVDUoCUfKK4BA5oYiUlWqZiVYXWhFSRIQDhZpLDAAdjN3IyxgDFGVVEmclfdtf3MLk8mM
+; uXLP5AOW9euvHPBf+MkPPjq/2fXeDTJJx6czIs9aEGwA2HTtPqs5ClW7wfdl6Ao2zbzfD93u1r1s+6
+; HjOUm9bKrk+HIzJEI1vN3d3Nx+UlPbSHGerLv9kmqs+nV5vi7W+e2rbx0cH1pyW0yOWuehdORaqZHn
+; bd/15rNmVnI/5DydLffDICwPX/nC4NO1KxGNzSBCDamkx0vUw/Vr0fhzQYgdOXkUA4DZRjgkuo88Oy
+; Yl9zHCFuMMdPrcYDuGb+7otDBG40N8iGOVOw5nUpGiZhkJh+N4DUqBmFyyxP1VIZ7nOHwBChuAR/rV
+; R9BbKLMBSPCuS+5uCKZOCdkBncypEnx+s5B+8ZUvvnv+9DurhR4cNQhGPngZCPPjh4tHj37kkw9e/I
+; vf+dbPfO3Ly8PGyLISALRW9v2w68rgOXtuc3+13bZWla1t1lsm7Nu+mU+rSVUG3VxuEk36Pbadbvvt
+; TVsOF9tJlXa3SoiXte+69mq7b5ZSJzo9bpYLvrj4FCx78VqmCaDPgzIDsUwaAew2O9UyXx7sO1O3qp
+; 6sDpdpk7wggbgRoYKzxFjLQrIQ8Gd0JHUDyIBC5CSkpg6KZhQxLrNxIsJoMd6NZx48fKaIaIjl7nhs
+; bggW5y/wgBtHVDf8lZjcQE0MxUFj32ehLI6hN6IBFXR3FxZwRxA3jZ4rOJiOED13J5LwMpo7I9YiuZ
+; QxeeCemOP77+BOgxYhXNaH99P8RbvL5xdXx8ePh27DCODZoRB0dTW8/crq5ke+sJhXldAwdAXBHfpO
+; cYBk3Pbde88/vHh5QZN5q5nrtEc9XMykxslidnZ42Lb47Mnu8vr66rrbdv29B/Mvvnbv1fuHs9m0d/
+; 7g6eUfX7+cpFQcloMuZ0gKPCS0ylF1aNsulyRQTZtJhWa9dn3fTqWum8nl7c1mV45OjnLW9fVFV3pO
+; oKqja9nN0RUEUNTMXBmoLx4tWiKJSygYgYU8FgiBkMZfKpKBMzFDiQO12p3K3V0dgjQ5OlMwEu0Yhk
+; tVHRGYhA6eyd1cSinCYhjmQbgbe0eLAkaflpkTxy0p6OWBGihaIhVkrjFWUbc7nUfkg4CQ1JwI3AEF
+; VIea69464L5uakJKXN2uN/NplYe2qgQcofQIN0J+dn/eDrvF9FFDzHUqBRl215vL9XW77z+rD3h6cp
+; rq2e76dj6RebUgHR4+OO33/TxXZ8f3Lh/13/rwXx2f3P/yq68fHdK8ym13Pgz84NHRbHUPlYsWLTif
+; Lne7q7zfuGs77KViaVJi8CDelz7vu4nIoll1vV1eb17ebk9PXz88OH3/+x9srkHmRBEhdgtWXbTn3Q
+; zB4w1HGLRnMx1Dl8RgBkxkboNb2J0DVqU+aq0Q1B0NgZkVYATmjyfnEdNhZiFSCkJ/UGAYOR42ABJA
+; QmZwVDcldPOa+G6WGUJqMLM4BJI7cbiq0YlcjRGQsLgxgKPE26LEUgzQrDhSMWNgZzRzwIkXTWC3N7
+; a/WjeTydn9s/OLj/hsPptUQx6qKgFIX3Kqy2zRfPbBJ5999Omjs+VEKy3YDfm666/acjiVR0cPJNXm
+; 8MbpA3Q9mZ92683x4n4rGXNOpPePp19999GDR69WDP3+fL3PPDBC77ttSs2sWQzQDyX7kNV6rhM0Pq
+; 2IwbNCC8BYJgSzqqHJvC/cZWi7tVld13J0/BBALp7fsD9kRLUSzGcnpeghQPGQcgIQgYEXzYjCSKpO
+; yPG5BnNwDtmnR9Jc79TqEBI0HGndZojk5ERjWVDVwohH4AjGjGYFAIkgWrsM5AjcvPnrHp/ocOJiEC
+; QC8oFM3mtGYnAlHn/fgBYMD4rDIzIBulpci+JfiZg9hLqEwhQDNojFI5pjQX951nxcfA1g65tut+1W
+; hxNJnPthUlXIuM+dTKv5bHb58loLLhcniMwAk/kKqup2e/362dnhdJ69LJtm6vWqOiTFaTVZTBb79r
+; Z4f3VzQagMfvvywou7sTsbkgJm9X3X91mTECb05M28YjDUATxXiWfNdJEqdu9zvrreCU2XzcGL8/Ni
+; 7onPTg7yfvvZJ+3TDxfd8sdKPQ+hBkEacZjqHHZoBVBnQHJISBoKFRupkQAKYCA+NkfBObZ6Ib4JfS
+; sBuTMBM2Y3I4wiTA40MJgTKkEBL+CKrkQFLFpihi7RGw+0igd7GoBZTDUPgwgSovB4dYuhSfDW4iOs
+; MSMBcJKMAEQMLpFGCDIQwvj3A8LEsU0TqUDxyZO1Q/fsyWY2qY5PqmcXNw/O5k3F681muTpi0NL194
+; 4WB/Nquxv6RDVr1VC3Lfu+fXpxUfRPr+Zv0n4zrfJkiozZPXf5XGH+5PmTJ+fnnSM2TZqgMpkgAQsn
+; SZwEEaxiFqTsNJix6Uy4nk4JOAkTGltJzKWS8+1ugGF5PGu3u3pZ9/3+YDZLJT/56NO+JXz9a2V2kM
+; EJIB4aYnIgICjuHmtidCByt6xGAd0gcLBR9Eto6mbGGPhJQ4tZbgg/AEdxBzAAqQukCKZywP6Bw9Bi
+; Gp22eMAIwR0ViURI3EyISlD/iRDdigmLRkkZSdWRCZlNCyAioI7KlhiVYXy0NdjRCDkb8Bj4DqcWAG
+; rghwEQCwFqaW62tXpXcWNTkKnMDpefPXv66v2Hk2mz3bbTySylqgw9oi9Xs6FAHnw5YZby+NFxU8vL
+; m8t7pyddvlxvLsm7oW3N/MWL9ZBlgz1VE64aTAkqqVgqIRaoCKcgotD1Jav2SaokJ6k6qBfo1BVzJE
+; GYjO89APBZk1Zaqe8dtXadc/fK8StXl7ubHe+urV1WBJTMgqdOrjRa52hwNy+BcU44AtfNApQVoncw
+; s5j00vhRdCQ2RzejyF2omRqLBEgL0YrvIabIwYx2B0ALaU58ieNLDgjI7i45KyOagjmwxP14PKchYi
+; kaeYyAWrDImDIZIfUawyomUlMgBAAhYuJSCrJE6c0JJHFBRAUSZCR3VFvcrFeH8+l8xcsz5hqOV4uk
+; Zz/85OILr50cLCZdafsCVTMlJEEv2yvUvN70ajnN568+Pnz69Nk3vn1eV4v9ftP3rTtQ4uzSLGavPX
+; qL2duhdTcKCYmDDb0SZAEDWhzMRbCukyBCsaHPl1fdYnW6WE48bwbthlI0uCfmM67ydpcHX3fbh/cP
+; dNhfXm42rbzE1311z+vkRRXCPQUi6ADoWAE4cfCK0CJ3jGol+pXmGsocJxi8OHl4mgcsAWngAFgyxp
+; MNOMLxRsudj9o7ZrEYjtCdHiIQOuMdmSTstcXMQBHEVBE51CooXnGsBWNCPRZIJf4sAUSSWRghjEdI
+; QFycjFgAgFncFdEtSMMkbobkDizTs+HqNeh/8Opbp9hc99ub0t4eHU071evtfrPrHr7yABDbtjP0TM
+; VTDc6GdS6+u+rwJk9EDk9X8/lRySfgzoRFrS+dmlIZoBgP3ZC7rIWJV8tVU81SSgQM5nkYNNtu2GvR
+; NJliVaVFdXw4t2HY7La7vDNpuq6vUmLkkmnbdZjqqp7tN2WzPfd8ePMM1vBq06y6dkhCDqDmBJSzIv
+; v4w3aDuyHWyGRH5EhgEUePFQEFIvM6dnjDWmQjDC0W+LEERjBgJAvKe9xRFRhAXMldi42p56BHoCON
+; +QpXV+Jo/hkSB6e64jGVzTAqbTEQpOCx7rRiBIhMWgqLqIZhgswM0DBg1q4KjsKuCvH+QTKkTcajky
+; 8+f/+b7w7DW28c3b7Qly9ero6OUlUdHZx89N4HV5cffOkLr58ez5xscM+DZjWqJ1VTm1clMzKu933u
+; N6qq1hK7W8rFcxkcVJgnk+ZotqoSMykTgKq1uhvKZDKvq6bv2yrVwgmpRtRJpbvNxXq96alMZvMJVo
+; nrZjLtumGw3GHe7rfQWi42nd97+qJ+zq+v7n2p7Z0j4s/ohjIePYuBIwsCOKgjRt4dHVA9iLPxuYRY
+; OBGISM55hBAHaDCW9O7IUek1Zi5oCG4OER1RVQQQZjLS+J6POZpADRiAS4RzWcYXJxKoFyQWEfXCjK
+; 7jDMw0MxMiFC0Bgg9uS6Q0DAETO1KOCloMQ1wR8c6Gaw6AKKZZGRSTpmPkN87f/8OvvPZgcLxteWJ0
+; fDi/ubo+OT3bb24uLq8nswddv+XEk5oPlkkTujD6PNE9gsYcdwVL3pldG241Dyg+4STUNJUgWe73UA
+; KlIImEiU9Xx/PprO1225urJPXQy0JWFfk631z3XZrMT5fT3O68azebjZv1Q0n1dErTzVYRZDFb3j7z
+; jz5I1cM/9VJqNk1ICmaO7kpAcb1FNyhOSOHyjBle3JEZ3JysGCAQoRMVg5ID44qRuAB3Gv0WwEyqyg
+; AY6VoE9pgbEjGHWDhHHiguTYiKGD48ROLJW7+O4BzXuPGIFwbj8NuFEAuBwMbBBQI68viuwfHQFpEw
+; ADdAR2GIe525oxPTOM12BHBm7K0goxkcHTy6fbHX3ceIvVQJq3J0b/ni2aVmWy5nasPB4WHVNOdXFw
+; 6FK+JJDUmGoZS2tWGtZeNQVot0fCCrOS6a5F5ybiucnRwcWRna7e1sOpGqWiyWNQHkYbmYm+mzly8K
+; YJHKTFbz6b672fUbbIiT6v5Wu7ZTvdxstvtu0SyOV6uc24nQWb18eYnf+Mb2Zf8Tung9u6EbqCIYEQ
+; oyBS5p/BJ9ztaOTLuN5VKMPdPn4fUA20B4w2K7yGRhzwrzK2BI1hjRwEv08N00SrljMsOAgEankQMB
+; GCIAcPX2bzgAx2wZiVgk3JHgzByf7c+lSoEUlsTF9PM1mFHwlFDBAJ2TqCsTu7swKxgCOMfNeiR3ul
+; BCH9yHtOTJ8Q8/3uXNk6bxw+NJPatns+nt7RpAgLCe0nxVS52Ojg8Ws+msnh40q9lk4r7vuwv03enB
+; /GA6mfowtbYhFcZ9tz2cz5uJvLh4xoKTuplKs2ymYMO+22NFhfLlzUUSmch0NZ+ob9t+TYyutt90KA
+; 1WtSXKqZpMpveX84l7uxtuNvbZR/y7v3O7XfwyPfyxPQkQE4VThg3copwfZnVyxED8goIa+J0fNJp+
+; Ix6Q4rIJCBF4isR68NZNwSVUvK5ATh4SB2RwIhTEKsKyiDRmauNQfRfWYnRC4Olbv0bmCJYkSmgeSs
+; ogfguzgzEzEkcPJq4/Ef7yUc0cWLtx4YlEHod1IgRUsIgFBNQp6HuK6MUdEbxkquezty6fwu7m/eOj
+; ybKmJNo0TV8Gx7JcNey5MqfiedB+21M/HNeyqriW1DRJqGw3novs2v12d8OJ6iqhlyF3fW5Xq1Vd16
+; C2vV1f3FySJFOvkyRytDyf1Ilt1w37LIrc93k5Wy6WM9WOwEGaKkkFur7VD54f/PuPH/yHy3f2i5+2
+; 1ZtbkBK1MJDYBgIgAJs7YUyjgRTJqSICY0JGIyH26BXdcV0dyQAwtBfjI2c8npKj6Aljmxcc3IhAXd
+; 111L1aAVeHiCajuQXJSBH0zq8iBhyr/WxjTB7NCe++0oha3N0l4R3h0EwdiVWdAAhZx3UwSErxZ0vE
+; 7m5WwikdJVZ3RAc1IGECBFBGBCoOVVstmjf+/MXH7ff/+PcOFqm/2hpYXUtK1O92/VoZ02pZSy1Zpt
+; ttq/3+7HAKntUzZzhYLZAl93XJTc4DAaUkuZh3Jdc9qJU8uOni6JAp7a5vy34/XzTT1bQAXraKtDpc
+; 1Ej9lbWesgPE1K9yz2Xy/Zf1i5tXv/N8tedXNvXUWZATuldUoBgZG9IYcA+viysyG/jgwGiG6IkNxs
+; LHSJJDcFdGjP2tEX7OmAMDMw81inoGYAwLdSz3naEwUwJDUAMnYTaL/T3AGOwkjwggugNw88Vfj8ZI
+; gDiQiJE1MBtMgA7EGMUUpBh0e7g/EJkIIJy3gBy9ZgQHlggLQrgOBRkIkWQklt7xKBBjzuMuOUu9WD
+; y4eH6bh+eLw2lQEVUzizTzuXFKDe36/cHhvaPV0dBvJfnNdl0yVFj1udvur2+unzOWJFSGMFtpQehV
+; CWjG1WEzPz48QODNtrtab/e59EXbTgkOD1cnDbelW0sI5gw8U5dnz19Ovv/Zo28/feuD9Ws39Hgjs4
+; yGLOqlkjtaHhiwKdjnMBMDC+lsUKQcwsURjyaCMZMgMI2JcgEgNAB1NOAAyKoLIpkzEGqctnAUnng8
+; f6ONzINiyQ5eABTZAA3RiAzRgBzQBAuwpCiLqUKIcAh5BPOZjpGS0C0iALqwRNxewynNqZgShI9JEe
+; LJB3BF4ojpqUH0osauI4HmQkgJU8Ycl699dbx47S9+79MJ5u+++no9n5XVwXRaN4vpdOjWUHxWr9YX
+; F2kxm9dyc317ud4RN5N7B5Y4pWrd9W2Bqp6Q0Mu2Q8LpdJnQJ0QzrhpOtM+Y9ez+A5hOrq8va68O6u
+; nZalbKzfX+vCC5cdvSdjd//rR8/Nwu669+OjyCelkgowIbYCVqBcFzQQBCwaxZiBg4qEkO8cnyAGWH
+; ryJi6RxxZxg1KyLBTlBEdBktYuM1ioL2JFFyQnQDVo+8TEYfzIu7BxQku7MHTxoAKJ5kcnIANGQiMf
+; JsWd0QKETQrpEGcOKExObmqsKopkCQiAEMwwJSHAnz0ElK6spEVZWC/wSuLITmCibIxFTCpItASLnk
+; RPHkh7xCGBncej5ZPvql9z4+vN09eW334auvCa/yvBqaSva73f2Th13uXpy/0L5PIvcfvt4O+WJ7u5
+; SV7neN0clqXlT6oV4uHkJpcbhtJFfiA7S7bls6XyxP5tW0S+3BvZPjxZxVd7vzfV+yLi5u+Wqz+PAz
+; v82vrfX0RZ+a+kFJjZuiGwKZghcgNEKMIju6JUAsBkRmMEpJEE1DKeQEFJijsbPt7lCYGHns+ZGDWi
+; GozC2+aOBgbrm4U4oDc4x6DdQBxYAhRTWIKPywLsyA6u6qI9MDHR2ggCogHvzSvw0riAEUM05pdFUj
+; EmPckeLKJFVyMwMNlrQDMEJiLm40gldMkrhF+ckAnYgsYAaEUKGZKXhKqbijaphLFdwSgUvtTj4A1Y
+; 0Dts8lv38y+95bb63v388HB1qG7cnBwaPH9031enMzn06mgkz1bVvd3mZ0OjoikZvtpi1llWQlokKt
+; 284gD6Z9sYPmYFpPCbFvd26qhm2fX27kZn/6/Lz55OWir99+2q02BSiJS5OYrHSAkStN7gjaO0aNiw
+; N2JaSKgCTqcayJQQaHmJOpGIqPuG9AcwL2ux/vGGMbb0Ju5lKloByaOzLE6QkjHDfSPmIJG6lYsvGB
+; jTIEuI9c+RHeFGGA5S/+AYUDmFCIo3IUuMTIVptZYgF3J0pM2TVJAAP4LohkBobEY2SEEAglsv5ujO
+; zuLARMZoosAacPlQciAjMQllyqiokwFwXEhDRjHfZPz6ZPTprvvvG6HB3zYkL3DqYPjuYVF9WM5Czz
+; ZvKq0Kwf9l15tt5/1u5797ni5OhgRtqVfgdoxpQdxMQ0r/e3+073a7q+brb2+LN2flmO+mG1ybMWk3
+; FQsf3OHVXcjSMqR4jes8TsQhwAXCnKliixVSGwcAgSODgjFhJBEvNChMNQABIxmQNJCBEYAGKEWNw5
+; iY9mw88jy+H2HUNWscb3Ua0A6hHhiMqZAo6BHSIyRycxNzz4pT+MFoOCk+MIeoipKZOZISEjWnSAI8
+; cVPH9AH6UvKkw6BhIICdRdhM2CXEpC5OglSuzMgKSaxyoloo23LGMZ4909Dc6cuK7APK9dbx+s4PEx
+; HNS5gnKyqJuKiACYhGk+nQpXOQ9d6YYyACCRVE2Dpl66sBu4pMF80+ttO2x76zp+9mx4fumnp69uq8
+; kakw7Rbc9JICGBmkeBA5zRwcfLKlMBQoMgwDq6ooUEUwANjNydGXNxJnNDptgOGZKhk1oBihckpDTu
+; j8zHE1lgL9ydKS7ODB4ZdRxjdwBAoBESIAHCSL0zQBqnZB4RAwQqjsrkbmLjht6zWxVUTDcwwCAKBy
+; zenJKoW2J28OggYljcIcpyaFqYRkQXIbhq1M3ihW8wNpCHXKqqohCzBFlXOEiPbg4ASJRMYg06mAEt
+; WRZP9vbRLmZ9pZg6urkPAMKy09LDds40hangAZIjq8dd2xphJBFkckR0I4kPD9WU5H565g4GFUGhQV
+; HDr6XOAOzqyGMSEcakIhAJgAFwXAYIwhHmDmOQhihK2eAEancWdYwFmjOhEsT7WPWuDmyozkSJkTyO
+; Su4UevY7gOgo7BiBReTuqgoWSwtwGNMdSCPMZfwtkIGbxPdBiBJz1JqI2SFYKgbgYM5JFMfmSmSuYs
+; sf13EAUAOKJf844nROouYa25Rx8IngkCiBGhNbKQjxg/iTDZiDuwFjssHRiEmcyVQJXWKczlLHJ5+5
+; qKOkJWLxXhgQBBANFdCYxFUJXN0hpeLmxI0XklASee/m3nsiBtYyyusJefx9cixyYoutbh6vNrUoh6
+; maEqK6MlixSEfFfWdUFyAypeSE7gQOjmoW88UYOBna52WEWOMqgOLdQAMByDH02+gUI053J6cgQMQT
+; Zk5E7G5KIdoZ5YTmCnEDQhTj8dZdwJilmEo4KON3Nn7D0d1FWH0UzmdXCUVbfGvDCFKJuYJ5SqFtMo
+; /t8ni1d1OTijGarKNq3cIfH0tsB1cHkMFJiSoAcgOLIaArITDxXRkX2QFLjwQJ3M0Z1QBYyMb3kaG7
+; sHjJBG6m6FwUnR2hBCtCM1qgRBwIBJzNC3GRhFGOHp2xY2szJr8xP0JDkLiVxLtp3MiPAx13BTQFVH
+; dBDklhpFk9TN9Cbl5izaoK4DCOSRyIHKD43ScdTcIsGcw5BwaKehuBkwYRZDypE+EYAQBUZEAQNEMi
+; VyVhVwuaeFx7As/lCOaGhOAhFyfmMcJppkISSiUkgnB6RFAhbn1MMdOI/3quJPK98U8jRg9Tp4/Jhr
+; h8B00xSKrowLHJQDSCAaKr7iKu0X8DZwaKAwbGmB2KlnCUMBIzmiojEGrBMV8CMA7agNwsIxYHcqyy
+; KTNEmJQIY+ZKzNHAjnCdk8Q/3EBT9LXdIkPhowclLK8UZLHROTliFES1CKMDhSHdCc1SDI6KWbwE1Y
+; zYo01qFo0FdHdzZSL1Ap/HQsIJgRKyxLHl5oiEQmZWxOLjRKRuSZIjgFnRMgZKvCAzMMfPb2SGE7iq
+; gzMyE8e30YjULGi46h7IoHGHjbFmoLiJBWqJeAwkxCp8XGGO7XImhAJKFCU2AKqZPIya8fcy3iHDFk
+; BupoAMhI6GBJpD2slmXqzQOMgnDGGMOUVDmwA8tjhRwXUmIlVXIxACdo/5LpqNl0t3d/SoWhKQxmoc
+; AuB3Vz+C8N8gYdAxCONNgUXNScgADBU4epuhCnZOTBaHLSCO544MEIR01CtF0goC4DJCMN0KKLAhob
+; vyHSgUAwyMKBQtx5gvOljAtNwiis3ECOjmkagEYDckgOSxfTEoJdRYGK/HqLODuoM6AkKFaKCoAzoh
+; 1oLsoCCmhkWRMXhBbq40WuijB02EEj8ABEAoBIKYzNTVkNCLBftAsUQgHJERVYRVvaqSDzmXoaprDx
+; 8zeK/hCHdOMYwAQDTLAIaY1MHBAEAViDCczjiCBp0lkL0OSBA5cUQaURiICKY4jq7GloogJoMChMVD
+; 6CgxADI1Jrpb0UAMM9Hd+yKENpYGUWOvSADuENcWAiAhoHC5RBQrsJQaXxkUU48vJjGDKcR1DMdjUI
+; ho1QL4Mh6pnERGUwSORYxISSOCSSZ2czZwZFW0WF3G+Rl8JK85oCkLiburDoaWKCHdpULDnExEiLkU
+; Zh7PCqrxrjYwjNUpGpASIhIyOwDmjJTGNUhRS4xuhk5B5Yn8P42FDkRiNRAm0xwM15gSpUpMzYEcCy
+; C5+iiJdCeMYRuHGGNUbtxBp+xOA82O4+/ZqZTCgM7BmIyLFt5R99njoHx3wBpvvfF8380mzCweD/b4
+; 5rurRsAdwl+ECG53MWcwcAVE5pgaxUvRARkQEeSui+bujqqjBTz2gUGLjdPyHUXEwpKLMJiCJwSOYb
+; NwisKLh1/HHUxDUYxEgLUaISuQkqMXJGEHo5SKOyMAkLsF2UJLESRhUb1rnEeiHwMwHh/H8VANpiDu
+; BnUS82LmjIRgWlSQgkljbsJsAIFwxnjZARACEVvpkYgIDdDMkgigq41j8/B6x/BmfIf5nb1eCyEpDs
+; 4OyOBO5AahKMtuIDLScdDVdBCUwPuORe8YERE5kVvk5sgcKLr9CAhg8Y0fG2weWWkaJRxAI9UqGoEA
+; I9Yj7sPAgROGgP84R0jdzaNJHuYOEomOuZt/bg8XJocgzksBJx4c0ZwA2K2QuwCAqXlBRwNwI6IamA
+; 0yMboiAlmJtn8As4FQmYmRillKCQlVi4OM5zMC80KeAAQgqxWGFPxkGEluaKaAxkwRJhZCAdQYshIx
+; kVsY3y1KJczs4OAlJgmImGRcvTGLlniRIhLF3NYiU4v0uRYuohMMFZbx2S4Wb3cCZkcBMC0mTAiZOI
+; Zk8PnaFcZbEJjZWPE0Zw9RuMG4I6TwpbkDIhsURAMkYEAix6BFYGSkghJBDmiKRMoAiIKIMaDQKPUL
+; xXcvhihw928TsvK4bntRIGeEROwYwp4KSs2JB2+RxkgB3v1jlACwIIR2BMfbLoGBozMiOygGjAJB4q
+; DvAYLT0YOHDqzMlSogqoMR1+ZuXsA1BgRqyBIPHMXetZgC84g1cAAsDgoA4+lMFRCZOJys8VGgaB04
+; jf8aVpCMUKIpNrIdAYecEUEkqQNIGCwYkaCAExQrTHEzdURRM6aIKwXWPUzLPs56wOguyAgWK30X5t
+; C4eMAOAcEj+AUObKGiCutD8AbvCN5E5Dj+hAPpMH6Do6gUozJCJEaD+AX4mLsiCu5GFBTdFNDOb3dg
+; DligMkgGvR/NSYtyJaDGXBUvzAZim66dCCZp3ATQHIOxCcWMQ185jlGdAGyEyKCBM4uDRgCilDIYTo
+; gJuGR1J6RE3A9FCWn0SsHYn3R3iAAJIYxJVdIx9hJd53GSz8yqZmZAHj2fAIdC1ETAwQuOgQoyi++d
+; u0EpOVZzZkZAPsKJMHaCQF5UmSsSAi/qHrBWETFVQFIAIg5mO4XZE0x1fF8SgJmPEVobTwMpHrD4rw
+; xKMGBBL2gxHiCncTKJHrhqif//eFg9oMSu4KRmQJEvAQdwwsEsYfxnoCJWif7WX5stluquIOBp0m75
+; H/+zF8VmqJqAwZ04AZV96X/mRw/32/79T4dEEyY2MgVDrhglZkfXXb+qmd0oxUDBAVBEBtPd0B1Okg
+; PMJ+2De837H2emRNy5iXtSszcepM3Gb/aRiAqNK4IGJwFCPOYOHInUEQ0jPkKUYch9SLZHldH4MzTT
+; UBCEzcIdAsc+DhM4iZVRZRb8L0aPC1hxHbzUTMQOqA6eMcd8gFGiL0xEqgpMYIaIRZVCIuigqiw8Wi
+; njBxHrmaCVRYLHzGDMHKBDGsFM+LkEM47nCMj1W7/hEPg8v/OYBcGDYj1JiHinqEM3YHbwTLxcDL/2
+; a19YTGAxa06P5kez+uQovfrK5FvvXbA3CEmNChTE4WYYfvFrRxXaH32iKYG7YRiyPDEQom779a/8mS
+; VCd76eEGcXj2HkVss7j9svv15/57nmQu++0f2FX37wu3/whKhCZgEygLas/+zXjxPTR0/zNAl4VVwJ
+; FR2AQDlAukpkiorIAsiRH+VUoABkSciIRd25KLMjGLkxA8RNtxSsmYDJNGKIJKVv//LPnujQPWvBuE
+; xAYqrMAFTMbPuf/Py93e32dgNAWPHLv/L101/4seNXzug7n66zi0NxFPQEhuqFndgD+HknswIEoMQ1
+; ssQMnCmBA4ogp7G3Es3Qu88oUZBRghxxZ392G/dTpWRiJubxT2BcSgCOc08fNVxmIFyKFvWah7zt/p
+; f/4fe/8dkJTACwvLbIf/M/f/dv/7XX/97f/3A1WfRIR3XLbveE/7f/64cV8XK66KAnkxqBJ0OxvC/T
+; CTVr2//EV19JdPmHH+r9VJGzuhrhi9L+1TfTm2+s/uEffv9kckpkibSTvoe2camsTtSsmqN/8lvPUj
+; Wf1LVi3+KwsV7MzdMSF+Sx36rIzV2BbdfvEvqll8HoQZokxNuu7HqdM8+4UhUCTKxtGZ72eUJ8MkkK
+; kAFMK2W/zrkznGg5PIBmkrtcH8N86+XahgZtRaKgKH7/OM2a0lJ1Wm3/7E892ty2z797e/j67C/86b
+; Pf+7cvh5JAgSmT6uDoYobxAYVi5oimKiwDmblFG1W1cIoiXxk3mgDEqGpA45UzTmKKoxmPkNxdaBwJ
+; hhTNxknbiF/h6OWPIUAER1I1ZhbwxKhAvLi/ODlegmcqH+/K9//fj3/ul/4juLn9jd947fnTF1/+8b
+; e7Nfy3f/ff/Vd/+8sXn1z/5r/s/tLPwo+8u+q3/Y/9xOvbbfcP/tHz3//g4r/8lVfffW3x8OTtd97t
+; /sf/6UOCB05d1vxnX6E/95OvLKfp7/2dH/3t33qG0Ccvf/knF1/76he7rv/ff+vTTy8r78pf/XOPPn
+; 2y/8YnaGX4lZ+q/9S7jyooz2/17//WZfGDWhzQ1LhADbr7lZ85ffbs6U98+bhq+JsfDP/6Oy/+5s8/
+; PlryDz7b/sNv7h7VlQNfq3/tdf3P3pmvW/8nf7CjAVjAoCB2f+OnZ/UUvvV+LqVjYGJ6YbdfexXefD
+; S/2ZZ/9q11U8+FXTUX8Bsof/1PHflAv/2H21ImzWcXf+2XH//Uu9N/+q3NFFnBwI0d0JK5kRmRo42x
+; VMSibqOL1jyhg0NRAKdYQ2p8DzzY/Gx32wsca4lmgSTE8ZcbyXVDGv+WhNlMtWj8n1sxLWCqWtyN0F
+; MiAN+1N5vN7sn6+ny3AV4/erzImx46eeNUfvEXv/Ld3//km7/7KYg/vCdHK4B9Op3gz33t/nIiv/t/
+; fv/9b3/0q3/lwaN5993/8Mn2avPeNz/6o9+7qNOM3BhTw9XFtV189HJzvvnWv/n0cotFq3tnx+++8e
+; i733jyyfsXv/wX36SpnpfutVfw3unwvG///I82X3jr8NPvn3/y3Y3vy9/45dOd7WIUyKBKZae7H/tC
+; 9Vd++Qu6Gdrz4ce/MP07/+nbSay9bR+9kv7ST0yve1or/Pgb/uV3D6vBF0K/+rMHydeDi9L2P/7J5e
+; miPmD8+pcfvHY2K8OwHXZff0O/+s7R/Zm8dW/+Cz+xvOl2lMUtqeKMeH29f/5MtzrBefWiuOdc1ZBr
+; K+Q90oBUGAq6EWf34qiI2UGRvbgYiSGrswErSDF2JzIERS+JnNGqhImUYBDKiQtTFsoEvVAWwhgHei
+; CPmGW0TrrFSwDDWQl3KTpEJiYAd8uqRFAn+IU/c+/n8qxKdQ+pasrjeyf/x29+B5Z15fjvfvub/+Cf
+; 2oyOwBbJnDQDGJJ9/MPtb/7jpx9sZn/uHf2Rn+ZF3fzzH25+dQs/+KT9R9+s31g2bBlR1Pi7G/zovO
+; 9S8z//TsdH9a/eT5eXm//7tz/85+err511f+ursEj6PGUA00Kg9uCAsXT/3f9zDs3Bj8/Xbz6anVUC
+; RdBIECaliBfsuvc+vPmHvzP8wPPf/euT/rL9zX95+/3rzX/zl2avn5w+yZtfeYhf/9H73/ijF7//3v
+; aY7Vd+/uAv/8Lxf/9bl//1Lz3Kefhf/+XFzS7//BvptdODQbuffGv2zjunf/TN59/8eLhf11//+uKX
+; fmrxR98+Tww+aO2Lf/WDG83DSqrLfv8z7zBU6aPvbmpryCvz7EDutZMCAiCNCEizGLq6W8AbEN3NCA
+; nunAwOzkSu4yLYPYLo6AHo0EJM4Vv6/wCjF0klLKxzEAAAAABJRU5ErkJggg==
+; thumbnail end
+;
+; external perimeters extrusion width = 0.45mm
+
+G90
+M83
+G28
+G1 Z0.20 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.40 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.60 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z0.80 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
+G1 Z1.00 F600
+G1 X115.000 Y100.000 F6000
+G1 X114.963 Y101.046 E0.0400
+G1 X114.854 Y102.088 E0.0400
+G1 X114.672 Y103.119 E0.0400
+G1 X114.419 Y104.135 E0.0400
+G1 X114.095 Y105.130 E0.0400
+G1 X113.703 Y106.101 E0.0400
+G1 X113.244 Y107.042 E0.0400
+G1 X112.721 Y107.949 E0.0400
+G1 X112.135 Y108.817 E0.0400
+G1 X111.491 Y109.642 E0.0400
+G1 X110.790 Y110.420 E0.0400
+G1 X110.037 Y111.147 E0.0400
+G1 X109.235 Y111.820 E0.0400
+G1 X108.388 Y112.436 E0.0400
+G1 X107.500 Y112.990 E0.0400
+G1 X106.576 Y113.482 E0.0400
+G1 X105.619 Y113.908 E0.0400
+G1 X104.635 Y114.266 E0.0400
+G1 X103.629 Y114.554 E0.0400
+G1 X102.605 Y114.772 E0.0400
+G1 X101.568 Y114.918 E0.0400
+G1 X100.523 Y114.991 E0.0400
+G1 X99.477 Y114.991 E0.0400
+G1 X98.432 Y114.918 E0.0400
+G1 X97.395 Y114.772 E0.0400
+G1 X96.371 Y114.554 E0.0400
+G1 X95.365 Y114.266 E0.0400
+G1 X94.381 Y113.908 E0.0400
+G1 X93.424 Y113.482 E0.0400
+G1 X92.500 Y112.990 E0.0400
+G1 X91.612 Y112.436 E0.0400
+G1 X90.765 Y111.820 E0.0400
+G1 X89.963 Y111.147 E0.0400
+G1 X89.210 Y110.420 E0.0400
+G1 X88.509 Y109.642 E0.0400
+G1 X87.865 Y108.817 E0.0400
+G1 X87.279 Y107.949 E0.0400
+G1 X86.756 Y107.042 E0.0400
+G1 X86.297 Y106.101 E0.0400
+G1 X85.905 Y105.130 E0.0400
+G1 X85.581 Y104.135 E0.0400
+G1 X85.328 Y103.119 E0.0400
+G1 X85.146 Y102.088 E0.0400
+G1 X85.037 Y101.046 E0.0400
+G1 X85.000 Y100.000 E0.0400
+G1 X85.037 Y98.954 E0.0400
+G1 X85.146 Y97.912 E0.0400
+G1 X85.328 Y96.881 E0.0400
+G1 X85.581 Y95.865 E0.0400
+G1 X85.905 Y94.870 E0.0400
+G1 X86.297 Y93.899 E0.0400
+G1 X86.756 Y92.958 E0.0400
+G1 X87.279 Y92.051 E0.0400
+G1 X87.865 Y91.183 E0.0400
+G1 X88.509 Y90.358 E0.0400
+G1 X89.210 Y89.580 E0.0400
+G1 X89.963 Y88.853 E0.0400
+G1 X90.765 Y88.180 E0.0400
+G1 X91.612 Y87.564 E0.0400
+G1 X92.500 Y87.010 E0.0400
+G1 X93.424 Y86.518 E0.0400
+G1 X94.381 Y86.092 E0.0400
+G1 X95.365 Y85.734 E0.0400
+G1 X96.371 Y85.446 E0.0400
+G1 X97.395 Y85.228 E0.0400
+G1 X98.432 Y85.082 E0.0400
+G1 X99.477 Y85.009 E0.0400
+G1 X100.523 Y85.009 E0.0400
+G1 X101.568 Y85.082 E0.0400
+G1 X102.605 Y85.228 E0.0400
+G1 X103.629 Y85.446 E0.0400
+G1 X104.635 Y85.734 E0.0400
+G1 X105.619 Y86.092 E0.0400
+G1 X106.576 Y86.518 E0.0400
+G1 X107.500 Y87.010 E0.0400
+G1 X108.388 Y87.564 E0.0400
+G1 X109.235 Y88.180 E0.0400
+G1 X110.037 Y88.853 E0.0400
+G1 X110.790 Y89.580 E0.0400
+G1 X111.491 Y90.358 E0.0400
+G1 X112.135 Y91.183 E0.0400
+G1 X112.721 Y92.051 E0.0400
+G1 X113.244 Y92.958 E0.0400
+G1 X113.703 Y93.899 E0.0400
+G1 X114.095 Y94.870 E0.0400
+G1 X114.419 Y95.865 E0.0400
+G1 X114.672 Y96.881 E0.0400
+G1 X114.854 Y97.912 E0.0400
+G1 X114.963 Y98.954 E0.0400
+G1 X115.000 Y100.000 E0.0400
@@ -0,0 +1,7285 @@
+; generated by a slicer without thumbnails
+
+G90
+M83
+G28
+G1 Z0.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z0.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z0.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z0.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z1.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z1.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z1.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z1.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z1.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z2.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z2.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z2.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z2.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z2.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z3.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z3.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z3.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z3.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z3.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z4.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z4.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z4.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z4.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z4.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z5.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z5.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z5.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z5.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z5.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z6.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z6.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z6.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z6.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z6.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z7.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z7.20 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z7.40 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z7.60 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z7.80 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
+G1 Z8.00 F600
+G1 X120.000 Y100.000 F6000
+G1 X119.988 Y100.698 E0.0400
+G1 X119.951 Y101.395 E0.0400
+G1 X119.890 Y102.091 E0.0400
+G1 X119.805 Y102.783 E0.0400
+G1 X119.696 Y103.473 E0.0400
+G1 X119.563 Y104.158 E0.0400
+G1 X119.406 Y104.838 E0.0400
+G1 X119.225 Y105.513 E0.0400
+G1 X119.021 Y106.180 E0.0400
+G1 X118.794 Y106.840 E0.0400
+G1 X118.544 Y107.492 E0.0400
+G1 X118.271 Y108.135 E0.0400
+G1 X117.976 Y108.767 E0.0400
+G1 X117.659 Y109.389 E0.0400
+G1 X117.321 Y110.000 E0.0400
+G1 X116.961 Y110.598 E0.0400
+G1 X116.581 Y111.184 E0.0400
+G1 X116.180 Y111.756 E0.0400
+G1 X115.760 Y112.313 E0.0400
+G1 X115.321 Y112.856 E0.0400
+G1 X114.863 Y113.383 E0.0400
+G1 X114.387 Y113.893 E0.0400
+G1 X113.893 Y114.387 E0.0400
+G1 X113.383 Y114.863 E0.0400
+G1 X112.856 Y115.321 E0.0400
+G1 X112.313 Y115.760 E0.0400
+G1 X111.756 Y116.180 E0.0400
+G1 X111.184 Y116.581 E0.0400
+G1 X110.598 Y116.961 E0.0400
+G1 X110.000 Y117.321 E0.0400
+G1 X109.389 Y117.659 E0.0400
+G1 X108.767 Y117.976 E0.0400
+G1 X108.135 Y118.271 E0.0400
+G1 X107.492 Y118.544 E0.0400
+G1 X106.840 Y118.794 E0.0400
+G1 X106.180 Y119.021 E0.0400
+G1 X105.513 Y119.225 E0.0400
+G1 X104.838 Y119.406 E0.0400
+G1 X104.158 Y119.563 E0.0400
+G1 X103.473 Y119.696 E0.0400
+G1 X102.783 Y119.805 E0.0400
+G1 X102.091 Y119.890 E0.0400
+G1 X101.395 Y119.951 E0.0400
+G1 X100.698 Y119.988 E0.0400
+G1 X100.000 Y120.000 E0.0400
+G1 X99.302 Y119.988 E0.0400
+G1 X98.605 Y119.951 E0.0400
+G1 X97.909 Y119.890 E0.0400
+G1 X97.217 Y119.805 E0.0400
+G1 X96.527 Y119.696 E0.0400
+G1 X95.842 Y119.563 E0.0400
+G1 X95.162 Y119.406 E0.0400
+G1 X94.487 Y119.225 E0.0400
+G1 X93.820 Y119.021 E0.0400
+G1 X93.160 Y118.794 E0.0400
+G1 X92.508 Y118.544 E0.0400
+G1 X91.865 Y118.271 E0.0400
+G1 X91.233 Y117.976 E0.0400
+G1 X90.611 Y117.659 E0.0400
+G1 X90.000 Y117.321 E0.0400
+G1 X89.402 Y116.961 E0.0400
+G1 X88.816 Y116.581 E0.0400
+G1 X88.244 Y116.180 E0.0400
+G1 X87.687 Y115.760 E0.0400
+G1 X87.144 Y115.321 E0.0400
+G1 X86.617 Y114.863 E0.0400
+G1 X86.107 Y114.387 E0.0400
+G1 X85.613 Y113.893 E0.0400
+G1 X85.137 Y113.383 E0.0400
+G1 X84.679 Y112.856 E0.0400
+G1 X84.240 Y112.313 E0.0400
+G1 X83.820 Y111.756 E0.0400
+G1 X83.419 Y111.184 E0.0400
+G1 X83.039 Y110.598 E0.0400
+G1 X82.679 Y110.000 E0.0400
+G1 X82.341 Y109.389 E0.0400
+G1 X82.024 Y108.767 E0.0400
+G1 X81.729 Y108.135 E0.0400
+G1 X81.456 Y107.492 E0.0400
+G1 X81.206 Y106.840 E0.0400
+G1 X80.979 Y106.180 E0.0400
+G1 X80.775 Y105.513 E0.0400
+G1 X80.594 Y104.838 E0.0400
+G1 X80.437 Y104.158 E0.0400
+G1 X80.304 Y103.473 E0.0400
+G1 X80.195 Y102.783 E0.0400
+G1 X80.110 Y102.091 E0.0400
+G1 X80.049 Y101.395 E0.0400
+G1 X80.012 Y100.698 E0.0400
+G1 X80.000 Y100.000 E0.0400
+G1 X80.012 Y99.302 E0.0400
+G1 X80.049 Y98.605 E0.0400
+G1 X80.110 Y97.909 E0.0400
+G1 X80.195 Y97.217 E0.0400
+G1 X80.304 Y96.527 E0.0400
+G1 X80.437 Y95.842 E0.0400
+G1 X80.594 Y95.162 E0.0400
+G1 X80.775 Y94.487 E0.0400
+G1 X80.979 Y93.820 E0.0400
+G1 X81.206 Y93.160 E0.0400
+G1 X81.456 Y92.508 E0.0400
+G1 X81.729 Y91.865 E0.0400
+G1 X82.024 Y91.233 E0.0400
+G1 X82.341 Y90.611 E0.0400
+G1 X82.679 Y90.000 E0.0400
+G1 X83.039 Y89.402 E0.0400
+G1 X83.419 Y88.816 E0.0400
+G1 X83.820 Y88.244 E0.0400
+G1 X84.240 Y87.687 E0.0400
+G1 X84.679 Y87.144 E0.0400
+G1 X85.137 Y86.617 E0.0400
+G1 X85.613 Y86.107 E0.0400
+G1 X86.107 Y85.613 E0.0400
+G1 X86.617 Y85.137 E0.0400
+G1 X87.144 Y84.679 E0.0400
+G1 X87.687 Y84.240 E0.0400
+G1 X88.244 Y83.820 E0.0400
+G1 X88.816 Y83.419 E0.0400
+G1 X89.402 Y83.039 E0.0400
+G1 X90.000 Y82.679 E0.0400
+G1 X90.611 Y82.341 E0.0400
+G1 X91.233 Y82.024 E0.0400
+G1 X91.865 Y81.729 E0.0400
+G1 X92.508 Y81.456 E0.0400
+G1 X93.160 Y81.206 E0.0400
+G1 X93.820 Y80.979 E0.0400
+G1 X94.487 Y80.775 E0.0400
+G1 X95.162 Y80.594 E0.0400
+G1 X95.842 Y80.437 E0.0400
+G1 X96.527 Y80.304 E0.0400
+G1 X97.217 Y80.195 E0.0400
+G1 X97.909 Y80.110 E0.0400
+G1 X98.605 Y80.049 E0.0400
+G1 X99.302 Y80.012 E0.0400
+G1 X100.000 Y80.000 E0.0400
+G1 X100.698 Y80.012 E0.0400
+G1 X101.395 Y80.049 E0.0400
+G1 X102.091 Y80.110 E0.0400
+G1 X102.783 Y80.195 E0.0400
+G1 X103.473 Y80.304 E0.0400
+G1 X104.158 Y80.437 E0.0400
+G1 X104.838 Y80.594 E0.0400
+G1 X105.513 Y80.775 E0.0400
+G1 X106.180 Y80.979 E0.0400
+G1 X106.840 Y81.206 E0.0400
+G1 X107.492 Y81.456 E0.0400
+G1 X108.135 Y81.729 E0.0400
+G1 X108.767 Y82.024 E0.0400
+G1 X109.389 Y82.341 E0.0400
+G1 X110.000 Y82.679 E0.0400
+G1 X110.598 Y83.039 E0.0400
+G1 X111.184 Y83.419 E0.0400
+G1 X111.756 Y83.820 E0.0400
+G1 X112.313 Y84.240 E0.0400
+G1 X112.856 Y84.679 E0.0400
+G1 X113.383 Y85.137 E0.0400
+G1 X113.893 Y85.613 E0.0400
+G1 X114.387 Y86.107 E0.0400
+G1 X114.863 Y86.617 E0.0400
+G1 X115.321 Y87.144 E0.0400
+G1 X115.760 Y87.687 E0.0400
+G1 X116.180 Y88.244 E0.0400
+G1 X116.581 Y88.816 E0.0400
+G1 X116.961 Y89.402 E0.0400
+G1 X117.321 Y90.000 E0.0400
+G1 X117.659 Y90.611 E0.0400
+G1 X117.976 Y91.233 E0.0400
+G1 X118.271 Y91.865 E0.0400
+G1 X118.544 Y92.508 E0.0400
+G1 X118.794 Y93.160 E0.0400
+G1 X119.021 Y93.820 E0.0400
+G1 X119.225 Y94.487 E0.0400
+G1 X119.406 Y95.162 E0.0400
+G1 X119.563 Y95.842 E0.0400
+G1 X119.696 Y96.527 E0.0400
+G1 X119.805 Y97.217 E0.0400
+G1 X119.890 Y97.909 E0.0400
+G1 X119.951 Y98.605 E0.0400
+G1 X119.988 Y99.302 E0.0400
+G1 X120.000 Y100.000 E0.0400
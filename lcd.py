@@ -1,10 +1,16 @@
 import binascii
-from time import sleep
-from threading import Thread
-from array import array
-from io import BytesIO
-from PIL import Image
-import lib_col_pic
+import hashlib
+import multiprocessing
+import os
+import re
+import struct
+from time import sleep, monotonic, thread_time
+from threading import Event, Lock, Thread, local
+from contextlib import contextmanager
+from queue import PriorityQueue, Queue, Full
+from itertools import count
+from concurrent.futures import ProcessPoolExecutor
+import thumbnail
 
 import atexit
 import serial
@@ -14,6 +20,7 @@ FHTWO = 0xa5
 FHLEN = 0x06
 
 MaxFileNumber = 25
+FilesPerPage  = 5
 
 RegAddr_W = 0x80
 RegAddr_R = 0x81
@@ -29,10 +36,64 @@ FONT_EEPROM      = 0
 ExchangepageAddr = 0x0084
 SoundAddr        = 0x00A0
 
-RX_STATE_IDLE = 0
-RX_STATE_READ_LEN = 1
-RX_STATE_READ_CMD = 2
-RX_STATE_READ_DAT = 3
+# Frames from the display: 5A A5, length of the rest, command, payload
+FRAME_HEADER = bytes([FHONE, FHTWO])
+_READVAR = struct.Struct('>HB')   # Address, number of words
+_CONSOLE = struct.Struct('>HB')   # Address, number of bytes
+_WORDS   = [struct.Struct('>%dH' % n) for n in range(128)]
+
+# Thumbnail transfer, command bytes sent around each chunk and the limits for
+# pacing it. The delay after each chunk and the chunk size adapt to the link.
+THUMBNAIL_CHUNK_OVERHEAD = 65
+THUMBNAIL_CHUNK_DELAY    = 0.02
+THUMBNAIL_MIN_DELAY      = 0.002
+THUMBNAIL_MAX_DELAY      = 0.2
+THUMBNAIL_MIN_CHUNK      = 128
+THUMBNAIL_MAX_RETRIES    = 8 # Piece retries per image before starting over
+PREFETCH_NICE            = 10 # Niceness added to the thumbnail prefetch worker
+
+# The display boots at BAUD_DEFAULT, faster rates are tried from the top down.
+# A rate is kept only if the display answers 'sendme' (0x66, page, ff ff ff).
+BAUD_DEFAULT = 115200
+BAUD_RATES   = (921600, 512000, 256000, 230400)
+BAUD_SETTLE  = 0.1
+PROBE_TIMEOUT = 0.5
+# Above BAUD_DEFAULT the link is probed when nothing has been received for
+# LINK_CHECK_INTERVAL seconds, and falls back if the display does not answer
+LINK_CHECK_INTERVAL = 5.0
+
+# Touch events wait in a queue per handler worker, an address always goes to
+# the same worker so its events are handled in order
+HANDLER_QUEUE_SIZE = 64
+
+# All output goes through one writer thread, lower priorities are sent first
+# and commands of the same priority in order
+PRIO_TOUCH  = 0 # Responses to touch events
+PRIO_STATUS = 1 # Status updates and everything else
+PRIO_BULK   = 2 # Thumbnail and camera transfers
+
+# Widget values last written. Setting a widget to the value it already has is
+# skipped, unless that value was sent more than SHADOW_TTL seconds ago, in
+# case the display changed it on its own. Only literal strings and numbers
+# are compared, a value copied from another widget is always sent, and so are
+# the va variables the display's own scripts change.
+SHADOW_TTL = 10.0
+SHADOW_MAX_VALUE = 128
+_ASSIGN = re.compile(r'([A-Za-z_]\w*(?:\.\w+)+)(\+?=)(.*)', re.S)
+_LITERAL = re.compile(r'"[^"]*"|-?\d+')
+_STATE_VAR = re.compile(r'(?:^|\.)va\d+\.')
+
+# Commands written inside LCD.batch() are sent together once the batch ends,
+# in writes of at most this many bytes
+TX_BATCH_MAX = 1024
+
+# Camera preview, seconds between frames and the largest share of one CPU
+# core and of the serial link it may use. The print page polls the status
+# while it is shown, without a poll for CAMERA_PAGE_TIMEOUT it is taken as left.
+CAMERA_INTERVAL   = 2.0
+CAMERA_CPU_SHARE  = 0.1
+CAMERA_UART_SHARE = 0.3
+CAMERA_PAGE_TIMEOUT = 5.0
 
 PLA   = 0
 ABS   = 1
@@ -96,10 +157,20 @@ class LCDEvents():
     SQUARE_CORNER_VELOCITY = 27
     THUMBNAIL      = 28
     CONSOLE        = 29
+    THUMBNAIL_PREFETCH = 30
+
+
+class _TxBatch(local):
+    # Per thread batch of encoded commands
+    def __init__(self):
+        self.depth = 0
+        self.buf = bytearray()
+        self.priority = PRIO_STATUS
 
 
 class LCD:
-    def __init__(self, port=None, baud=115200, callback=None):
+    def __init__(self, port=None, baud=BAUD_DEFAULT, callback=None, thumbnail_workers=1, max_baud=None,
+                 handler_workers=1):
         self.addr_func_map = {
             0x1002: self._MainPage,          
             0x1004: self._Adjustment,        
@@ -156,9 +227,27 @@ class LCD:
         self.ser.timeout = None
         self.running = False
         self.rx_buf = bytearray()
-        self.rx_data_cnt = 0
-        self.rx_state = RX_STATE_IDLE
+        self.handler_queues = [Queue(HANDLER_QUEUE_SIZE) for _ in range(max(handler_workers, 1))]
+        self.handler_lock = Lock()
+        self.handler_count = 0        # Events handled
+        self.handler_dropped = 0      # Events dropped because their queue was full
+        self.handler_max_depth = 0    # Most events seen waiting in one queue
+        self.handler_latency = 0.0    # Total seconds from arrival to handled
+        self.handler_max_latency = 0.0
+        self.tx = _TxBatch()
+        self.tx_lock = Lock()
+        self.tx_queue = PriorityQueue()
+        self.shadow = {} # Widget name: (value, time sent)
+        self.shadow_lock = Lock()
+        self.shadow_dropped = 0 # Writes skipped because nothing changed
+        self.tx_seq = count()
+        self.writer = None
         self.error_from_lcd = False
+        self.max_baud = max_baud # Highest rate to negotiate in start(), None keeps baud
+        self.probe_reply = None  # Collects bytes outside frames while probing
+        self.rx_time = monotonic() # When the last touch event or poll arrived
+        self.page = None         # Last page switched to with a page command
+        self.print_page_polled = None # When the print page last asked for status
         # List of GCode files
         self.files = False
         self.selected_file = False
@@ -180,18 +269,55 @@ class LCD:
         self.probe_mode = False
         # Thumbnail
         self.is_thumbnail_written = False
+        self.thumbnail_key = None # Identifies the image held in printpause.va1
         self.askprint = False
+        self.thumbnail_colors = 1024
+        self.thumbnail_quantizer = None # None, 'mediancut' or 'octree'
+        self.thumbnail_budget = None    # Max encoded thumbnail bytes
+        self.thumbnail_max_time = None  # Max thumbnail transfer time in seconds
+        self.thumbnail_resample = None  # PIL filter for large thumbnails, None is PIL's default
+        self.thumbnail_request = 0 # Bumped for every new thumbnail, older transfers stop
+        self.thumbnail_delay = THUMBNAIL_CHUNK_DELAY
+        self.thumbnail_chunk_size = thumbnail.CHUNK_SIZE
+        self.thumbnail_retries = 0 # Pieces sent again after a display error
+        self.thumbnail_resends = 0 # Images sent again from the start
+        self.picture_lock = Lock() # File thumbnails and camera frames share printpause.va1
+        self.camera = None
+        # Thumbnails are decoded and encoded in worker processes so the GIL is
+        # not held away from the serial and status threads, 0 encodes in-process
+        self.thumbnail_pool = None
+        # Prefetching has a worker of its own at a lower CPU priority, so the
+        # selected file never waits behind files that might be selected later
+        self.prefetch_pool = None
+        if thumbnail_workers > 0:
+            self.thumbnail_pool = ProcessPoolExecutor(max_workers=thumbnail_workers,
+                                                      mp_context=multiprocessing.get_context('spawn'))
+            self.prefetch_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                                                     initializer=os.nice, initargs=(PREFETCH_NICE,))
         # Make sure the serial port closes when you quit the program.
         atexit.register(self._atexit)
 
     def _atexit(self):
+        # Leave the display at the rate it boots at for whatever opens it next
+        if self.writer and self.ser.is_open and self.ser.baudrate != BAUD_DEFAULT:
+            with self.priority(PRIO_TOUCH):
+                self.set_baud(BAUD_DEFAULT)
         self.ser.close()
         self.running = False
+        if self.thumbnail_pool:
+            self.thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+            self.prefetch_pool.shutdown(wait=False, cancel_futures=True)
     
     def start(self, *args, **kwargs):
         self.running = True
         self.ser.open()
+        self.writer = Thread(target=self._writer, daemon=True)
+        self.writer.start()
         Thread(target=self.run).start()
+        self.invalidate() # The display starts over with its own defaults
+        for queue in self.handler_queues:
+            Thread(target=self._handler_worker, args=(queue,), daemon=True).start()
+        self.find_baud()
 
         #self.write(b'page boot')
         self.write("page boot")
@@ -200,6 +326,101 @@ class LCD:
         self.write("boot.j0.val=1")
         self.write("boot.t0.txt=\"KlipperLCD.service starting...\"")
         #self.write("page main")
+        if self.max_baud and self.max_baud > self.ser.baudrate:
+            self.upgrade_baud(self.max_baud)
+            Thread(target=self._link_monitor, daemon=True).start()
+
+    def _link_monitor(self):
+        # A display that no longer understands the faster rate goes quiet,
+        # garbled touch events are dropped by the parser without a sound
+        while self.running:
+            sleep(LINK_CHECK_INTERVAL)
+            if self.ser.baudrate == BAUD_DEFAULT or monotonic() - self.rx_time < LINK_CHECK_INTERVAL:
+                continue
+            # Thumbnail transfers check the link themselves and their error
+            # replies must not end up in a probe
+            if not self.picture_lock.acquire(blocking=False):
+                continue
+            try:
+                if not self.probe():
+                    print("LCD did not answer at %d baud, falling back to %d" % (self.ser.baudrate, BAUD_DEFAULT))
+                    self.fallback_baud()
+            finally:
+                self.picture_lock.release()
+
+    def probe(self):
+        # Round trip check of the link, True if the display answers 'sendme'
+        self.probe_reply = bytearray()
+        self.write("sendme")
+        self._drain(PROBE_TIMEOUT)
+        reply, self.probe_reply = self.probe_reply, None
+        self.error_from_lcd = False
+        return reply[:1] == b'\x66' and reply[2:5] == b'\xff\xff\xff'
+
+    def set_baud(self, rate):
+        # Tell the display to switch rates, then follow it
+        self._change_baud(rate, b'baud=%d\xff\xff\xff' % rate)
+
+    def _change_baud(self, rate, dat=b''):
+        # Send dat and move the port to rate as one step of the writer, so no
+        # other command goes out between them at a rate the display is not on
+        self.flush()
+        if self.writer is None:
+            with self.tx_lock:
+                self._switch_baud(dat, rate)
+        else:
+            self.tx_queue.put((self.tx.priority, next(self.tx_seq), (dat, rate)))
+            self._drain(0)
+
+    def _switch_baud(self, dat, rate):
+        if dat:
+            self.ser.write(dat)
+            self.ser.flush()
+            sleep(BAUD_SETTLE)
+        self.ser.baudrate = rate
+        sleep(BAUD_SETTLE)
+
+    def find_baud(self):
+        # The display stays at the last rate it was switched to until it is
+        # power cycled. If it does not answer at the current rate, look for it
+        # at the faster ones and switch it back.
+        if self.probe():
+            return True
+        start = self.ser.baudrate
+        for rate in BAUD_RATES:
+            if rate == start:
+                continue
+            self._change_baud(rate)
+            if self.probe():
+                print("LCD answered at %d baud, switching it back to %d" % (rate, start))
+                return self.fallback_baud(start)
+        print("LCD did not answer at any rate, staying at %d baud" % start)
+        self._change_baud(start)
+        return False
+
+    def upgrade_baud(self, max_baud):
+        # Switch to the fastest rate up to max_baud the display answers at
+        if not self.probe():
+            print("LCD did not answer at %d baud, not changing rate" % self.ser.baudrate)
+            return self.ser.baudrate
+        start = self.ser.baudrate
+        for rate in BAUD_RATES:
+            if rate > max_baud or rate <= start:
+                continue
+            self.set_baud(rate)
+            if self.probe():
+                print("LCD baud rate %d" % rate)
+                return rate
+            print("LCD did not answer at %d baud" % rate)
+            self.fallback_baud(start)
+        return self.ser.baudrate
+
+    def fallback_baud(self, rate=BAUD_DEFAULT):
+        # Ask at the current rate in case the display did switch, a display
+        # that never switched does not understand the request and stays put
+        if self.ser.baudrate != rate:
+            self.set_baud(rate)
+        return self.probe()
     
     def boot_progress(self, progress):
         self.write("boot.t0.txt=\"Waiting for Klipper...\"")
@@ -214,6 +435,14 @@ class LCD:
     def write(self, data, eol=True, lf=False):
         dat = bytearray()
         if type(data) == str:
+            if data.startswith("page "):
+                self.page = data[5:]
+                self.print_page_polled = None
+                # Widgets of the page being loaded are reset by the display
+                self.invalidate(self.page + ".")
+                self.invalidate(local=True)
+            elif eol and self._unchanged(data):
+                return
             dat.extend(map(ord, data))
         else:
             dat.extend(data)
@@ -223,88 +452,306 @@ class LCD:
             dat.extend(dat[-1:])
             dat[len(dat)-2] = 10 #'\r'
             dat[len(dat)-3] = 13 #'\n'
-        self.ser.write(dat)
         if eol:
-            self.ser.write(bytearray([0xFF, 0xFF, 0xFF]))
-
-    def clear_thumbnail(self):
-        self.write("printpause.cp0.close()")
-        self.write("printpause.cp0.aph=0")
+            dat.extend(b'\xff\xff\xff')
+        if self.tx.depth:
+            if len(self.tx.buf) + len(dat) > TX_BATCH_MAX:
+                self.flush()
+            self.tx.buf += dat
+        else:
+            self._send(dat)
+
+    def _unchanged(self, cmd):
+        # True if cmd sets a widget to the value it was last set to
+        m = _ASSIGN.fullmatch(cmd)
+        if not m:
+            return False
+        key, op, value = m.groups()
+        with self.shadow_lock:
+            if (op == '+=' or len(value) > SHADOW_MAX_VALUE or not _LITERAL.fullmatch(value)
+                    or _STATE_VAR.search(key)):
+                self.shadow.pop(key, None)
+                return False
+            now = monotonic()
+            last = self.shadow.get(key)
+            if last and last[0] == value and now - last[1] < SHADOW_TTL:
+                self.shadow_dropped += 1
+                return True
+            self.shadow[key] = (value, now)
+            return False
+
+    def invalidate(self, prefix=None, local=False, suffix=None):
+        # Forget widget values so they are sent again: all of them, those
+        # starting with prefix or ending with suffix, or with local those of
+        # the current page that are named without a page
+        with self.shadow_lock:
+            if prefix is None and suffix is None and not local:
+                self.shadow.clear()
+                return
+            for key in list(self.shadow):
+                if ((prefix and key.startswith(prefix)) or (suffix and key.endswith(suffix))
+                        or (local and key.count('.') == 1)):
+                    del self.shadow[key]
+
+    @contextmanager
+    def batch(self):
+        # Commands this thread writes inside the block go out in one serial
+        # write when the outermost block ends
+        self.tx.depth += 1
+        try:
+            yield self
+        finally:
+            self.tx.depth -= 1
+            if self.tx.depth == 0:
+                self.flush()
+
+    def flush(self):
+        # Send what this thread has batched so far
+        if self.tx.buf:
+            dat, self.tx.buf = self.tx.buf, bytearray()
+            self._send(dat)
+
+    @contextmanager
+    def priority(self, priority):
+        # Commands this thread writes inside the block are sent at priority
+        self.flush()
+        previous, self.tx.priority = self.tx.priority, priority
+        try:
+            yield self
+        finally:
+            self.flush()
+            self.tx.priority = previous
+
+    def _send(self, dat):
+        # Queue for the writer thread, before start() write right away
+        if self.writer is None:
+            with self.tx_lock:
+                self.ser.write(dat)
+        else:
+            self.tx_queue.put((self.tx.priority, next(self.tx_seq), dat))
+
+    def _writer(self):
+        # Owns the serial port. Each queued item is one command or batch, so a
+        # bulk transfer lets waiting touch responses and status go in between.
+        # An Event is set once everything before it is sent, a (command, rate)
+        # tuple changes the baud rate.
+        while True:
+            priority, seq, dat = self.tx_queue.get()
+            try:
+                if isinstance(dat, Event):
+                    self.ser.flush()
+                elif isinstance(dat, tuple):
+                    self._switch_baud(*dat)
+                else:
+                    self.ser.write(dat)
+            except Exception as e:
+                print("Write to LCD failed: %s" % e)
+            if isinstance(dat, Event):
+                dat.set()
+
+    def clear_thumbnail(self, keep_shown=False):
+        # keep_shown empties the variables but leaves the picture on screen
+        if not keep_shown:
+            self.write("printpause.cp0.close()")
+            self.write("printpause.cp0.aph=0")
         self.write("printpause.va0.txt=\"\"")
         self.write("printpause.va1.txt=\"\"") 
+        self.thumbnail_key = None
+
+    def _drain(self, delay):
+        # Wait until the UART has sent everything this thread wrote, then give
+        # the display time to process it
+        self.flush()
+        if self.writer is None:
+            self.ser.flush()
+        else:
+            sent = Event()
+            self.tx_queue.put((self.tx.priority, next(self.tx_seq), sent))
+            sent.wait()
+        sleep(delay)
+
+    def _thumbnail_pacing(self, error):
+        # Back off fast when the display reports errors, speed up slowly while it keeps up
+        if error:
+            self.thumbnail_delay = min(self.thumbnail_delay * 2, THUMBNAIL_MAX_DELAY)
+            self.thumbnail_chunk_size = max(self.thumbnail_chunk_size // 2, THUMBNAIL_MIN_CHUNK)
+        else:
+            self.thumbnail_delay = max(self.thumbnail_delay * 0.75, THUMBNAIL_MIN_DELAY)
+            self.thumbnail_chunk_size = min(self.thumbnail_chunk_size * 2, thumbnail.CHUNK_SIZE)
+
+    def thumbnail_byte_budget(self):
+        # Encoded bytes allowed by thumbnail_budget and thumbnail_max_time. The
+        # time estimate uses the nominal chunk delay, not the adaptive one, so
+        # the budget and with it the cache and redraw keys stay put between images
+        budget = self.thumbnail_budget
+        if self.thumbnail_max_time:
+            chunk_time = (thumbnail.CHUNK_SIZE + THUMBNAIL_CHUNK_OVERHEAD) * 10 / self.ser.baudrate + THUMBNAIL_CHUNK_DELAY
+            time_budget = int(self.thumbnail_max_time / chunk_time * thumbnail.CHUNK_SIZE)
+            if budget is None or time_budget < budget:
+                budget = time_budget
+        return budget
+
+    def thumbnail_settings(self):
+        # Everything besides the image that changes the encoded thumbnail
+        return (self.thumbnail_colors, self.thumbnail_quantizer, self.thumbnail_byte_budget(), thumbnail.CHUNK_SIZE,
+                self.thumbnail_resample)
+
+    def encode_thumbnail(self, img, prefetch=False):
+        # Iterator over the encoded chunks. Encoding in-process runs on a
+        # background thread and hands over chunks as they are packed. A pool
+        # worker returns all of them at once, the palette and run lengths
+        # have to be complete before the first chunk either way.
+        args = (img, self.thumbnail_colors, self.thumbnail_quantizer, thumbnail.CHUNK_SIZE, self.thumbnail_byte_budget(),
+                self.thumbnail_resample)
+        if self.thumbnail_pool:
+            return thumbnail.encode_in_pool(self.prefetch_pool if prefetch else self.thumbnail_pool, *args)
+        return thumbnail.iter_in_background(thumbnail.encode_thumbnail(*args))
+
+    def render_toolpath(self, file):
+        # PNG drawing of the toolpath for files without an embedded thumbnail
+        if self.thumbnail_pool:
+            return self.thumbnail_pool.submit(thumbnail.render_toolpath, file).result()
+        return thumbnail.render_toolpath(file)
 
     def write_thumbnail(self, img):
-        # Clear screen
-        self.clear_thumbnail()
-
-        # Open as image
-        im = Image.open(BytesIO(img))
-        width, height = im.size
-        if width != 160 or height != 160:
-            im = im.resize((160, 160))
-            width, height = im.size
-
-        pixels = im.load()
-
-        color16 = array('H')
-        for i in range(height): #Height
-            for j in range(width): #Width
-                r, g, b, a = pixels[j, i]
-                r = r >> 3
-                g = g >> 2
-                b = b >> 3
-                rgb = (r << 11) | (g << 5) | b
-                if rgb == 0x0000:
-                    rgb = 0x4AF0
-                color16.append(rgb)
-
-        output_data = bytearray(height * width * 10)
-        result_int = lib_col_pic.ColPic_EncodeStr(color16, width, height, output_data, width * height * 10, 1024)
-
-        each_max = 512
-        j = 0
-        k = 0
-        result = [bytearray()]
-        for i in range(len(output_data)):
-            if output_data[i] != 0:
-                if j % each_max == 0:
-                    result.append(bytearray())
-                    k += 1
-                result[k].append(output_data[i])
-                j += 1
-
-        # Send image to screen
-        self.error_from_lcd = True 
-        while self.error_from_lcd == True:
-            print("Write thumbnail to LCD")
-            self.error_from_lcd = False 
-
-            # Clear screen
-            self.clear_thumbnail()   
-
-            sleep(0.2)
-
-            for bytes in result:
-                self.write("printpause.cp0.aph=0")
-                self.write("printpause.va0.txt=\"\"")#
-
-                self.write("printpause.va0.txt=\"", eol = False)
-                self.write(bytes, eol = False)
-                self.write("\"")
-
-                self.write(("printpause.va1.txt+=printpause.va0.txt"))
-                sleep(0.02)
-
-            sleep(0.2)
-            self.write("printpause.cp0.aph=127")
-            self.write("printpause.cp0.write(printpause.va1.txt)")
-            self.is_thumbnail_written = True
-            print("Write thumbnail to LCD done!")
-        
+        key = hashlib.sha1(repr(self.thumbnail_settings()).encode() + img).hexdigest()
+        if self.redraw_thumbnail(key):
+            return
+        self.write_thumbnail_chunks(self.encode_thumbnail(img), key)
+
+    def redraw_thumbnail(self, key):
+        # Show the image already held in printpause.va1 again if key matches it
+        if key is None or key != self.thumbnail_key:
+            return False
+        print("Thumbnail already on LCD")
+        self._show_thumbnail()
+        return True
+
+    def _show_thumbnail(self):
+        self.write("printpause.cp0.aph=127")
+        self.write("printpause.cp0.write(printpause.va1.txt)")
+        self.is_thumbnail_written = True
         if self.askprint == True:
             self.write("askprint.cp0.aph=127")
-            self.write("askprint.cp0.write(printpause.va1.txt)")            
+            self.write("askprint.cp0.write(printpause.va1.txt)")
+
+    def write_thumbnail_chunks(self, chunks, key=None, request=None, keep_shown=False):
+        # request is the thumbnail_request this transfer belongs to, the
+        # transfer stops once a newer one is made. None is never stopped.
+        # keep_shown leaves the previous picture up until the new one is drawn.
+        with self.picture_lock, self.priority(PRIO_BULK):
+            self._write_thumbnail_chunks(chunks, key, request, keep_shown)
+
+    def _write_thumbnail_chunks(self, chunks, key, request, keep_shown):
+        # Chunks are split into pieces of the current transfer size. When the
+        # display reports an error the piece in flight and the one before it
+        # are sent again, after cutting printpause.va1 back to the length it
+        # had before them. Only repeated errors restart the whole image.
+        chunks = iter(chunks)
+        pieces = []
+        offsets = [0] # Length of printpause.va1 before each piece
+        retries = 0
+
+        print("Write thumbnail to LCD")
+        self.clear_thumbnail(keep_shown)
+        self._drain(self.thumbnail_delay)
+        self.error_from_lcd = False
+        i = 0
+        while True:
+            if request is not None and request != self.thumbnail_request:
+                print("Write thumbnail to LCD aborted")
+                return
+            if i == len(pieces):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                for j in range(0, len(chunk), self.thumbnail_chunk_size):
+                    pieces.append(chunk[j:j + self.thumbnail_chunk_size])
+                    offsets.append(offsets[-1] + len(pieces[-1]))
+                continue
+
+            self.write(b'printpause.va0.txt="' + pieces[i] + b'"')
+            self.write(("printpause.va1.txt+=printpause.va0.txt"))
+            self._drain(self.thumbnail_delay)
+
+            if not self.error_from_lcd:
+                i += 1
+                continue
+
+            self.error_from_lcd = False
+            self._thumbnail_pacing(True)
+            retries += 1
+            if retries > THUMBNAIL_MAX_RETRIES:
+                print("Write thumbnail to LCD failed, resending the whole image")
+                self.thumbnail_resends += 1
+                if self.ser.baudrate != BAUD_DEFAULT:
+                    print("LCD link unreliable at %d baud, falling back to %d" % (self.ser.baudrate, BAUD_DEFAULT))
+                    self.fallback_baud()
+                self.clear_thumbnail(keep_shown)
+                i = 0
+                retries = 0
+            else:
+                self.thumbnail_retries += 1
+                i = max(i - 1, 0)
+                if offsets[i]:
+                    self.write("substr printpause.va1.txt,printpause.va1.txt,0,%d" % offsets[i])
+                else:
+                    self.write("printpause.va1.txt=\"\"")
+            self._drain(self.thumbnail_delay)
+
+        self._thumbnail_pacing(retries > 0)
+        self.thumbnail_key = key
+        print("Write thumbnail to LCD done! %d pieces, %d retries" % (len(pieces), retries))
+        self._show_thumbnail()
    
+    def start_camera(self, source, interval=CAMERA_INTERVAL, cpu_share=CAMERA_CPU_SHARE,
+                     uart_share=CAMERA_UART_SHARE):
+        # Show snapshots from source in printpause.cp0 while the print page is
+        # shown, see thumbnail.read_snapshot for the kinds of source
+        self.stop_camera()
+        self.camera = Event()
+        Thread(target=self._camera_worker, args=(source, interval, cpu_share, uart_share, self.camera),
+               daemon=True).start()
+
+    def stop_camera(self):
+        if self.camera:
+            self.camera.set()
+            self.camera = None
+
+    def print_page_shown(self):
+        # Pages can be changed on the display itself, so the status polls of
+        # the print page count for more than the last page command sent
+        if self.print_page_polled is not None:
+            return monotonic() - self.print_page_polled < CAMERA_PAGE_TIMEOUT
+        return self.page == "printpause"
+
+    def _camera_worker(self, source, interval, cpu_share, uart_share, stop):
+        # Frames are never aborted by thumbnail requests, they are written
+        # without one and file thumbnails wait for picture_lock
+        encoder = thumbnail.FrameEncoder()
+        frame = 0
+        while not stop.is_set():
+            if not self.print_page_shown():
+                stop.wait(interval)
+                continue
+            start = monotonic()
+            cpu = thread_time()
+            try:
+                img = thumbnail.read_snapshot(source, frame)
+                chunks = encoder.encode(img, int(uart_share * interval * self.ser.baudrate / 10)) if img else []
+            except Exception as e:
+                print("Camera frame failed: %s" % e)
+                stop.wait(interval)
+                continue
+            frame += 1
+            cpu = thread_time() - cpu
+            if chunks and self.print_page_shown() and not stop.is_set():
+                self.write_thumbnail_chunks(chunks, keep_shown=True)
+            # Stretch the frame interval until both budgets hold
+            wire = sum(len(c) + THUMBNAIL_CHUNK_OVERHEAD for c in chunks) * 10 / self.ser.baudrate
+            period = max(interval, cpu / cpu_share, wire / uart_share)
+            stop.wait(max(period - (monotonic() - start), 0))
+
     def clear_console(self):
         self.write("console.buf.txt=\"\"")
         self.write("console.slt0.txt=\"\"")
@@ -422,78 +869,115 @@ class LCD:
 
     def run(self):
         while self.running:
-                incomingByte = self.ser.read(1)
-                #
-                if self.rx_state == RX_STATE_IDLE:
-                    if incomingByte[0] == FHONE:
-                        self.rx_buf.extend(incomingByte)
-                    elif incomingByte[0] == FHTWO:
-                        if self.rx_buf[0] == FHONE:
-                            self.rx_buf.extend(incomingByte)
-                            self.rx_state = RX_STATE_READ_LEN
-                        else:
-                            self.rx_buf.clear()
-                            print("Unexpected header received: 0x%02x ()" % incomingByte[0])         
-                    else:
-                        self.rx_buf.clear()
-                        self.error_from_lcd = True
-                        print("Unexpected data received: 0x%02x" % incomingByte[0])
-                #
-                elif self.rx_state == RX_STATE_READ_LEN:
-                    # Check if len is as expected, seems to alway be 6 bytes?
-                    #if incomingByte[0] == FHLEN:
-                    self.rx_buf.extend(incomingByte) # Read length
-                    self.rx_state = RX_STATE_READ_DAT
-                    #else:
-                    #    self.rx_buf.clear()
-                    #    self.rx_state = RX_STATE_IDLE
-                    #    print("Unexpected len param received: 0x%02x" % incomingByte[0])
-                #
-                elif self.rx_state == RX_STATE_READ_DAT:
-                    self.rx_buf.extend(incomingByte)
-                    self.rx_data_cnt += 1
-                    len = self.rx_buf[2]
-                    if self.rx_data_cnt >= len:
-                        # New command/message received from display
-                        cmd = self.rx_buf[3]
-                        data = self.rx_buf[-(len-1):] # Remove header and command
-                        # Handle incoming data
-                        self._handle_command(cmd, data)
-                        self.rx_buf.clear()
-                        self.rx_data_cnt = 0
-                        self.rx_state = RX_STATE_IDLE
+            # Wait for a byte, then take everything else that has arrived
+            self.rx_buf += self.ser.read(max(1, self.ser.in_waiting))
+            self._parse_rx()
+
+    def _parse_rx(self):
+        # Handle every complete frame in rx_buf, keep a partial one for later
+        buf = self.rx_buf
+        pos = 0
+        with memoryview(buf) as view:
+            while pos < len(buf):
+                start = buf.find(FRAME_HEADER, pos)
+                if start < 0:
+                    # A trailing 5A may be the start of the next header
+                    start = len(buf) - 1 if buf[-1] == FHONE else len(buf)
+                if start > pos:
+                    with view[pos:start] as dat:
+                        self._rx_unexpected(dat)
+                    pos = start
+                    continue
+                if len(buf) - pos < 3 or len(buf) - pos < 3 + buf[pos + 2]:
+                    break
+                length = buf[pos + 2]
+                if length > 0:
+                    with view[pos + 4:pos + 3 + length] as dat:
+                        self._handle_command(buf[pos + 3], dat)
+                pos += 3 + length
+        del buf[:pos]
+
+    def _rx_unexpected(self, dat):
+        # Bytes outside frames are the display answering a command, mostly errors
+        if self.probe_reply is not None:
+            self.probe_reply += dat
+            return
+        self.error_from_lcd = True
+        print("Unexpected data received: %s" % binascii.hexlify(dat, ' ').decode())
 
     def _handle_command(self, cmd, dat):
         if cmd == CMD_WRITEVAR: #0x82
             print("Write variable command received")
             print(binascii.hexlify(dat))
+        elif len(dat) < _READVAR.size:
+            print("Command 0x%02x too short: %s" % (cmd, binascii.hexlify(dat)))
         elif cmd == CMD_READVAR: #0x83
-            addr = dat[0]
-            addr = (addr << 8) | dat[1]
-            bytelen = dat[2]
-            data = [32]
-            for i in range (0, bytelen, 2):
-                idx = int(i / 2)
-                data[idx] = dat[3 + i]
-                data[idx] = (data[idx] << 8) | dat[4 + i]
+            self.rx_time = monotonic()
+            addr, words = _READVAR.unpack_from(dat)
+            words = min(words, (len(dat) - _READVAR.size) // 2)
+            if words == 0:
+                print("READVAR 0x%04x without data" % addr)
+                return
+            data = list(_WORDS[words].unpack_from(dat, _READVAR.size))
             self._handle_readvar(addr, data)
         elif cmd == CMD_CONSOLE: #0x42
-            addr = dat[0]
-            addr = (addr << 8) | dat[1]
-            data = dat[3:] # Remove addr and len
+            addr, bytelen = _CONSOLE.unpack_from(dat)
+            data = bytes(dat[_CONSOLE.size:]) # Remove addr and len
             self._handle_readvar(addr, data)
         else:
             print("Command not reqognised: %d" % cmd)
             print(binascii.hexlify(dat))
 
     def _handle_readvar(self, addr, data):
+        # Handlers may block on Moonraker, so they run on the handler workers
+        # and the RX thread only queues the event
+        queue = self.handler_queues[addr % len(self.handler_queues)]
+        try:
+            queue.put_nowait((addr, data, monotonic()))
+        except Full:
+            self.handler_dropped += 1
+            print("_handle_readvar: queue full, addr %x dropped" % addr)
+            return
+        depth = queue.qsize()
+        if depth > self.handler_max_depth:
+            self.handler_max_depth = depth
+
+    def _handler_worker(self, queue):
+        while True:
+            addr, data, arrived = queue.get()
+            try:
+                self._call_handler(addr, data)
+            except Exception as e:
+                print("Handler for addr %x failed: %s" % (addr, e))
+            latency = monotonic() - arrived
+            with self.handler_lock:
+                self.handler_count += 1
+                self.handler_latency += latency
+                self.handler_max_latency = max(self.handler_max_latency, latency)
+
+    def handler_stats(self):
+        # Queue depth and handler latency in seconds
+        with self.handler_lock:
+            return {
+                'depth': sum(q.qsize() for q in self.handler_queues),
+                'max_depth': self.handler_max_depth,
+                'handled': self.handler_count,
+                'dropped': self.handler_dropped,
+                'avg_latency': self.handler_latency / self.handler_count if self.handler_count else 0.0,
+                'max_latency': self.handler_max_latency,
+            }
+
+    def _call_handler(self, addr, data):
         if addr in self.addr_func_map:
             # Call function corresponding with addr
             if (self.addr_func_map[addr].__name__ == "_BedLevelFun" and data[0] == 0x0a):
                 pass ## Avoid to spam the log file while printing
             else:
                 print("%s: len: %d data[0]: %x" % (self.addr_func_map[addr].__name__, len(data), data[0]))
-            self.addr_func_map[addr](data)
+                # Sliders and buttons may have changed their value on the display
+                self.invalidate(suffix=".val")
+            with self.priority(PRIO_TOUCH), self.batch():
+                self.addr_func_map[addr](data)
         else:
             print("_handle_readvar: addr %x not recognised" % addr)
 
@@ -521,6 +1005,8 @@ class LCD:
                     self.write("file%d.t%d.txt=\"%s\"" % (page_num, i, file))
                     i += 1
                 self.write("page file1")
+                # Prepare thumbnails for the first page and the one after it
+                self.callback(self.evt.THUMBNAIL_PREFETCH, files[:2 * FilesPerPage])
             else:
                 self.files = False
                 # Clear old files from LCD
@@ -906,6 +1392,7 @@ class LCD:
             #self.write("page warn_zoffset")
 
         elif data[0] == 0x0a:
+            self.print_page_polled = monotonic()
             #status = self.callback(self.evt.PRINT_STATUS)
             self.write("printpause.printspeed.txt=\"%d\"" % self.printer.feedrate)
             self.write("printpause.fanspeed.txt=\"%d\"" % self.printer.fan)
@@ -1042,7 +1529,9 @@ class LCD:
             if self.askprint:
                 self.askprint = False
                 self.write("page file1")
+                self.callback(self.evt.THUMBNAIL_PREFETCH, self.files[:2 * FilesPerPage])
             else:
+                self.callback(self.evt.THUMBNAIL_PREFETCH, None)
                 self.write("page main")
             
         else:
@@ -1052,13 +1541,17 @@ class LCD:
         print(self.files)
         if self.files and data[0] <= len(self.files):
             self.selected_file = (data[0] - 1) 
+            self.callback(self.evt.THUMBNAIL_PREFETCH, None)
             self.write("askprint.t0.txt=\"%s\"" % self.files[self.selected_file])
             self.write("printpause.t0.txt=\"%s\"" % self.files[self.selected_file])
             self.write("askprint.cp0.close()")
             self.write("askprint.cp0.aph=0")
             self.write("page askprint")
-            self.callback(self.evt.THUMBNAIL)
+            # A thumbnail already on the display is drawn again right away,
+            # the page has to be up and askprint set before that
             self.askprint = True
+            self.flush()
+            self.callback(self.evt.THUMBNAIL)
         else:
             print("_SelectFile: Data not recognised %d" % data[0])
 
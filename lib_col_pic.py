@@ -1,111 +1,114 @@
 # Copyright (c) 2023 Molodos
 # The ElegooNeptuneThumbnails plugin is released under the terms of the AGPLv3 or higher.
 
+import binascii
+from array import array
+from collections import Counter
+from itertools import groupby, islice
+
+
+# The display reads 6 bits per printable character starting at '0', with '~'
+# standing in for '\\'. That is base64 bit slicing with another alphabet.
+_B64_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+_COLPIC_ALPHABET = bytes(126 if i + 48 == 92 else i + 48 for i in range(64))
+_PACK_TABLE = bytes.maketrans(_B64_ALPHABET, _COLPIC_ALPHABET)
+
+
 def ColPic_EncodeStr(fromcolor16, picw, pich, outputdata: bytearray, outputmaxtsize, colorsmax):
-    qty = 0
-    temp = 0
-    strindex = 0
-    hexindex = 0
-    TempBytes = bytearray(4)
     qty = ColPicEncode(fromcolor16, picw, pich, outputdata, outputmaxtsize, colorsmax)
+    qty = ColPicPad(outputdata, qty, outputmaxtsize)
     if qty == 0:
         return 0
-    temp = 3 - qty % 3
-    while temp > 0 and qty < outputmaxtsize:
-        outputdata[qty] = 0
-        qty += 1
-        temp -= 1
+    packed = ColPicPack(outputdata[:qty])
+    outputdata[:len(packed)] = packed
+    outputdata[len(packed)] = 0
+    return qty * 4 / 3
+
+
+def ColPic_EncodeIter(fromcolor16, picw, pich, outputmaxtsize, colorsmax, chunksize=512):
+    # Same encoding as ColPic_EncodeStr, as chunks of printable bytes. The
+    # header needs the palette and the encoded size up front, so the binary
+    # stream is built first and then packed one chunk at a time as it is
+    # consumed.
+    outputdata = bytearray(outputmaxtsize)
+    qty = ColPicEncode(fromcolor16, picw, pich, outputdata, outputmaxtsize, colorsmax)
+    qty = ColPicPad(outputdata, qty, outputmaxtsize)
+    view = memoryview(outputdata)
+    step = 3 * (chunksize // 4 + 1)
+    pending = b''
+    for i in range(0, qty, step):
+        pending += ColPicPack(view[i:min(i + step, qty)])
+        while len(pending) >= chunksize:
+            yield pending[:chunksize]
+            pending = pending[chunksize:]
+    if pending:
+        yield pending
+
+
+def ColPic_FitColors(fromcolor16, picw, pich, outputmaxtsize, colorsmax, budget):
+    # Largest palette, up to colorsmax, whose packed text fits in budget
+    # bytes. Fewer colours give longer runs, so size is searched as if it
+    # only ever shrinks with the palette.
+    outputdata = bytearray(outputmaxtsize)
+    if colorsmax > 1024:
+        colorsmax = 1024
 
+    def packedsize(colors):
+        qty = ColPicEncode(fromcolor16, picw, pich, outputdata, outputmaxtsize, colors)
+        qty = ColPicPad(outputdata, qty, outputmaxtsize)
+        return qty * 4 // 3 if qty else outputmaxtsize
+
+    listqty = len(ColorHistogram(fromcolor16, picw * pich, 1024)[0])
+    high = min(colorsmax, listqty)
+    if packedsize(high) <= budget:
+        return colorsmax
+    low = 1
+    high -= 1
+    while low < high:
+        mid = (low + high + 1) // 2
+        if packedsize(mid) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def ColPicPad(outputdata: bytearray, qty, outputmaxtsize):
+    # Zero pad to a whole number of 3 byte groups, always at least one byte
+    if qty == 0:
+        return 0
+    temp = min(3 - qty % 3, outputmaxtsize - qty)
+    outputdata[qty:qty + temp] = bytes(temp)
+    qty += temp
     if qty * 4 / 3 >= outputmaxtsize:
         return 0
-    hexindex = qty
-    strindex = qty * 4 / 3
-    while hexindex > 0:
-        hexindex -= 3
-        strindex -= 4
-        TempBytes[0] = outputdata[hexindex] >> 2
-        TempBytes[1] = outputdata[hexindex] & 3
-        TempBytes[1] <<= 4
-        TempBytes[1] += outputdata[hexindex + 1] >> 4
-        TempBytes[2] = outputdata[hexindex + 1] & 15
-        TempBytes[2] <<= 2
-        TempBytes[2] += outputdata[hexindex + 2] >> 6
-        TempBytes[3] = outputdata[hexindex + 2] & 63
-        TempBytes[0] += 48
-        if chr(TempBytes[0]) == '\\':
-            TempBytes[0] = 126
-        TempBytes[1] += 48
-        if chr(TempBytes[1]) == '\\':
-            TempBytes[1] = 126
-        TempBytes[2] += 48
-        if chr(TempBytes[2]) == '\\':
-            TempBytes[2] = 126
-        TempBytes[3] += 48
-        if chr(TempBytes[3]) == '\\':
-            TempBytes[3] = 126
-        outputdata[int(strindex)] = TempBytes[0]
-        outputdata[int(strindex) + 1] = TempBytes[1]
-        outputdata[int(strindex) + 2] = TempBytes[2]
-        outputdata[int(strindex) + 3] = TempBytes[3]
-
-    qty = qty * 4 / 3
-    outputdata[int(qty)] = 0
     return qty
 
 
+def ColPicPack(data):
+    return binascii.b2a_base64(data, newline=False).translate(_PACK_TABLE)
+
+
 def ColPicEncode(fromcolor16, picw, pich, outputdata: bytearray, outputmaxtsize, colorsmax):
-    l0 = U16HEAD()
     Head0 = ColPicHead3()
-    Listu16 = []
-    for i in range(1024):
-        Listu16.append(U16HEAD())
-
-    ListQty = 0
     enqty = 0
     dotsqty = picw * pich
     if colorsmax > 1024:
         colorsmax = 1024
-    for i in range(dotsqty):
-        ListQty = ADList0(fromcolor16[i], Listu16, ListQty, 1024)
-
-    for index in range(1, ListQty):
-        l0 = Listu16[index]
-        for i in range(index):
-            if l0.qty >= Listu16[i].qty:
-                aListu16 = bListu16 = Listu16.copy()
-                for j in range(index - i):
-                    Listu16[i + j + 1] = aListu16[i + j]
-
-                Listu16[i] = l0
-                break
-
-    while ListQty > colorsmax:
-        l0 = Listu16[ListQty - 1]
-        minval = 255
-        fid = -1
-        for i in range(colorsmax):
-            cha0 = Listu16[i].A0 - l0.A0
-            if cha0 < 0:
-                cha0 = 0 - cha0
-            cha1 = Listu16[i].A1 - l0.A1
-            if cha1 < 0:
-                cha1 = 0 - cha1
-            cha2 = Listu16[i].A2 - l0.A2
-            if cha2 < 0:
-                cha2 = 0 - cha2
-            chall = cha0 + cha1 + cha2
-            if chall < minval:
-                minval = chall
-                fid = i
-
-        for i in range(dotsqty):
-            if fromcolor16[i] == l0.colo16:
-                fromcolor16[i] = Listu16[fid].colo16
-
-        ListQty = ListQty - 1
-
-    for n in range(len(outputdata)):
-        outputdata[n] = 0
+    colors, counts = ColorHistogram(fromcolor16, dotsqty, 1024)
+    ListQty = len(colors)
+
+    # Most frequent colour first, ties keep the latest first seen colour first
+    order = sorted(range(ListQty), key=lambda i: (counts[i], i), reverse=True)
+    Listu16 = array('H', [colors[i] for i in order])
+
+    if ListQty > colorsmax:
+        remap = ReduceColors(Listu16, ListQty, colorsmax)
+        pixels = fromcolor16[:dotsqty]
+        fromcolor16 = array('H', map(remap.get, pixels, pixels))
+        ListQty = colorsmax
+
+    outputdata[:] = bytes(len(outputdata))
 
     Head0.encodever = 3
     Head0.oncelistqty = 0
@@ -122,8 +125,8 @@ def ColPicEncode(fromcolor16, picw, pich, outputdata: bytearray, outputmaxtsize,
     outputdata[19] = (ListQty * 2 & 4278190080) >> 24
     sizeofColPicHead3 = 32
     for i in range(ListQty):
-        outputdata[sizeofColPicHead3 + i * 2 + 1] = (Listu16[i].colo16 & 65280) >> 8
-        outputdata[sizeofColPicHead3 + i * 2 + 0] = Listu16[i].colo16 & 255
+        outputdata[sizeofColPicHead3 + i * 2 + 1] = (Listu16[i] & 65280) >> 8
+        outputdata[sizeofColPicHead3 + i * 2 + 0] = Listu16[i] & 255
 
     enqty = Byte8bitEncode(fromcolor16, sizeofColPicHead3, Head0.ListDataSize >> 1, dotsqty, outputdata,
                            sizeofColPicHead3 + Head0.ListDataSize,
@@ -146,110 +149,63 @@ def ColPicEncode(fromcolor16, picw, pich, outputdata: bytearray, outputmaxtsize,
     return sizeofColPicHead3 + Head0.ListDataSize + Head0.ColorDataSize
 
 
-def ADList0(val, Listu16, ListQty, maxqty):
-    qty = ListQty
-    if qty >= maxqty:
-        return ListQty
-    for i in range(qty):
-        if Listu16[i].colo16 == val:
-            Listu16[i].qty += 1
-            return ListQty
+def ColorHistogram(fromcolor16, dotsqty, maxqty):
+    # Distinct colours in first seen order with their pixel counts. Once
+    # maxqty colours are known the encoder stops counting altogether.
+    pixels = fromcolor16[:dotsqty]
+    counts = Counter(pixels)
+    if len(counts) >= maxqty:
+        last = list(islice(counts, maxqty - 1, maxqty))[0]
+        counts = Counter(pixels[:pixels.index(last) + 1])
+    return array('H', counts.keys()), array('I', counts.values())
 
-    A0 = val >> 11 & 31
-    A1 = (val & 2016) >> 5
-    A2 = val & 31
-    Listu16[qty].colo16 = val
-    Listu16[qty].A0 = A0
-    Listu16[qty].A1 = A1
-    Listu16[qty].A2 = A2
-    Listu16[qty].qty = 1
-    ListQty = qty + 1
-    return ListQty
+
+def ReduceColors(Listu16, ListQty, colorsmax):
+    # Map every colour past colorsmax onto its closest kept colour, the
+    # first one wins when several are equally close
+    kept = [(c >> 11 & 31, (c & 2016) >> 5, c & 31) for c in Listu16[:colorsmax]]
+    remap = {}
+    for c in Listu16[colorsmax:ListQty]:
+        A0 = c >> 11 & 31
+        A1 = (c & 2016) >> 5
+        A2 = c & 31
+        fid = min(range(colorsmax), key=lambda i: abs(kept[i][0] - A0) + abs(kept[i][1] - A1) + abs(kept[i][2] - A2))
+        remap[c] = Listu16[fid]
+    return remap
 
 
 def Byte8bitEncode(fromcolor16, listu16Index, listqty, dotsqty, outputdata: bytearray, outputdataIndex, decMaxBytesize):
+    # Palette index per colour, colours missing from the palette encode as 0
     listu16 = outputdata
-    dots = 0
-    srcindex = 0
-    decindex = 0
-    lastid = 0
-    temp = 0
-    while dotsqty > 0:
-        dots = 1
-        for i in range(dotsqty - 1):
-            if fromcolor16[srcindex + i] != fromcolor16[srcindex + i + 1]:
-                break
-            dots += 1
-            if dots == 255:
-                break
-
-        temp = 0
-        for i in range(listqty):
-            aa = listu16[i * 2 + 1 + listu16Index] << 8
-            aa |= listu16[i * 2 + 0 + listu16Index]
-            if aa == fromcolor16[srcindex]:
-                temp = i
-                break
-
-        tid = int(temp % 32)
-        if tid > 255:
-            tid = 255
-        sid = int(temp / 32)
-        if sid > 255:
-            sid = 255
-        if lastid != sid:
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            outputdata[decindex + outputdataIndex] = 7
-            outputdata[decindex + outputdataIndex] <<= 5
-            outputdata[decindex + outputdataIndex] += sid
-            decindex += 1
-            lastid = sid
-        if dots <= 6:
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            aa = dots
-            if aa > 255:
-                aa = 255
-            outputdata[decindex + outputdataIndex] = aa
-            outputdata[decindex + outputdataIndex] <<= 5
-            outputdata[decindex + outputdataIndex] += tid
-            decindex += 1
-        else:
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            outputdata[decindex + outputdataIndex] = 0
-            outputdata[decindex + outputdataIndex] += tid
-            decindex += 1
-            if decindex >= decMaxBytesize:
-                dotsqty = 0
-                break
-            aa = dots
-            if aa > 255:
-                aa = 255
-            outputdata[decindex + outputdataIndex] = aa
-            decindex += 1
-        srcindex += dots
-        dotsqty -= dots
+    lut = {}
+    for i in range(listqty - 1, -1, -1):
+        lut[listu16[i * 2 + 1 + listu16Index] << 8 | listu16[i * 2 + 0 + listu16Index]] = i
 
+    encoded = bytearray()
+    lastid = 0
+    for color, run in groupby(fromcolor16[:dotsqty]):
+        temp = lut.get(color, 0)
+        tid = temp % 32
+        sid = temp // 32
+        dotsleft = sum(1 for _ in run)
+        while dotsleft > 0:
+            dots = min(dotsleft, 255)
+            if lastid != sid:
+                encoded.append(7 << 5 | sid)
+                lastid = sid
+            if dots <= 6:
+                encoded.append(dots << 5 | tid)
+            else:
+                encoded.append(tid)
+                encoded.append(dots)
+            dotsleft -= dots
+
+    # Running out of space truncates the stream at the byte that did not fit
+    decindex = min(len(encoded), max(decMaxBytesize, 0))
+    outputdata[outputdataIndex:outputdataIndex + decindex] = encoded[:decindex]
     return decindex
 
 
-class U16HEAD:
-
-    def __init__(self):
-        self.colo16 = 0
-        self.A0 = 0
-        self.A1 = 0
-        self.A2 = 0
-        self.res0 = 0
-        self.res1 = 0
-        self.qty = 0
-
-
 class ColPicHead3:
 
     def __init__(self):
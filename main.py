@@ -1,21 +1,30 @@
 import getopt
+import os
 import sys
 import time
-import base64
-from threading import Thread
+from threading import Event, Lock, Thread
 from datetime import timedelta
 
 from printer import PrinterData
 from lcd import LCD, _printerData
+import thumbnail
+
+# Camera snapshot URL, image file or directory of images to show on the
+# print page, None disables the camera preview
+CAMERA_SNAPSHOT = None # "http://127.0.0.1/webcam/?action=snapshot"
 
 class KlipperLCD ():
     def __init__(self):
-        self.lcd = LCD("/dev/ttyAMA0", callback=self.lcd_callback)
+        self.lcd = LCD("/dev/ttyAMA0", callback=self.lcd_callback, max_baud=921600)
         self.lcd.start()
         self.printer = PrinterData('XXXXXX', URL=("127.0.0.1"), klippy_sock='/home/pi/printer_data/comms/klippy.sock', callback=self.printer_callback)
         self.running = False
         self.wait_probe = False
         self.thumbnail_inprogress = False
+        self.thumbnail_shown = 0 # Last lcd.thumbnail_request the worker took on
+        self.thumbnail_lock = Lock()
+        self.thumbnail_prefetch = Event()
+        self.thumbnail_cache = thumbnail.ThumbnailCache(os.path.expanduser('~/.cache/KlipperLCD/thumbnails'))
 
         progress_bar = 1
         while self.printer.update_variable() == False:
@@ -41,6 +50,8 @@ class KlipperLCD ():
         self.running = True
         #self.lcd.start()
         Thread(target=self.periodic_update).start()
+        if CAMERA_SNAPSHOT:
+            self.lcd.start_camera(CAMERA_SNAPSHOT)
 
     def periodic_update(self):
         while self.running:
@@ -74,7 +85,8 @@ class KlipperLCD ():
             data.max_accel_to_decel     = self.printer.max_accel_to_decel    
             data.square_corner_velocity = self.printer.square_corner_velocity
 
-            self.lcd.data_update(data)
+            with self.lcd.batch():
+                self.lcd.data_update(data)
                 
             time.sleep(2)
 
@@ -83,7 +95,7 @@ class KlipperLCD ():
         if msg:
             self.lcd.write_console(msg)
 
-    def show_thumbnail(self):
+    def show_thumbnail(self, request=None):
         if self.printer.file_path and (self.printer.file_name or self.lcd.files[self.lcd.selected_file]):
             file_name = ""
             if self.lcd.files:
@@ -94,46 +106,85 @@ class KlipperLCD ():
                 print("ERROR: gcode file not known")
             
             file = self.printer.file_path + "/" + file_name
-
-            # Reading file
-            print(file)
-            f = open(file, "r")
-            if not f:
-                f.close()
-                print("File could not be opened: %s" % file)
+            key = self.thumbnail_cache.key(file, self.lcd.thumbnail_settings())
+            if self.lcd.redraw_thumbnail(key):
                 return
-            buf = f.readlines()
-            if not f:
-                f.close()
-                print("File could not be read")
+            chunks = self.thumbnail_cache.get(key)
+            if chunks is not None:
+                print("Thumbnail cache hit: %s" % file)
+                self.lcd.write_thumbnail_chunks(chunks, key, request)
                 return
 
-            f.close()
-            thumbnail_found = False
-            b64 = ""
-
-            for line in buf:
-                if 'thumbnail begin' in line:
-                    thumbnail_found = True
-                elif 'thumbnail end' in line:
-                    thumbnail_found = False
-                    break
-                elif thumbnail_found:
-                    b64 += line.strip(' \t\n\r;')
-        
-            if len(b64):
-                # Decode Base64
-                img = base64.b64decode(b64)        
-                
-                # Write thumbnail to LCD
-                self.lcd.write_thumbnail(img)
+            # Reading file
+            print(file)
+            img = self.read_thumbnail(file_name)
+            if img:
+                # Write thumbnail to LCD, keeping the encoded chunks for next time
+                chunks = self.thumbnail_cache.fill(key, self.lcd.encode_thumbnail(img))
+                self.lcd.write_thumbnail_chunks(chunks, key, request)
             else:
                 self.lcd.clear_thumbnail()
                 print("Aborting thumbnail, no image found")
         else:
             print("File path or name to gcode-files missing")
-        
-        self.thumbnail_inprogress = False
+
+    def read_thumbnail(self, file_name, toolpath=True):
+        # Prefer the PNG Moonraker already extracted, parse the G-code otherwise
+        # and draw the toolpath if the file has no thumbnail at all
+        path = self.printer.GetThumbnailPath(file_name, thumbnail.THUMBNAIL_WIDTH, thumbnail.THUMBNAIL_HEIGHT)
+        if path:
+            try:
+                with open(path, 'rb') as f:
+                    return f.read()
+            except OSError as e:
+                print("Thumbnail %s could not be read: %s" % (path, e))
+        file = self.printer.file_path + "/" + file_name
+        img = thumbnail.read_gcode_thumbnail(file)
+        if img is None and toolpath:
+            print("No thumbnail in %s, drawing its toolpath" % file)
+            img = self.lcd.render_toolpath(file)
+        return img
+
+    def prefetch_thumbnails(self, files):
+        # Encode thumbnails for the listed files into the cache ahead of them
+        # being selected, None cancels a prefetch in progress
+        self.thumbnail_prefetch.set()
+        if files and self.printer.file_path:
+            cancel = Event()
+            self.thumbnail_prefetch = cancel
+            Thread(target=self.thumbnail_prefetch_worker, args=(files, cancel), daemon=True).start()
+
+    def thumbnail_prefetch_worker(self, files, cancel):
+        for file_name in files:
+            if cancel.is_set():
+                return
+            file = self.printer.file_path + "/" + file_name
+            key = self.thumbnail_cache.key(file, self.lcd.thumbnail_settings())
+            if self.thumbnail_cache.contains(key):
+                continue
+            # Toolpaths take seconds to draw, those are left until selected.
+            # The cancel check right before handing work to the pool keeps a
+            # dropped prefetch from starting anything new.
+            try:
+                img = self.read_thumbnail(file_name, toolpath=False)
+                if img and not cancel.is_set():
+                    self.thumbnail_cache.put(key, list(self.lcd.encode_thumbnail(img, prefetch=True)))
+            except Exception as e:
+                print("Thumbnail prefetch failed for %s: %s" % (file, e))
+
+    def thumbnail_worker(self):
+        # Show thumbnails until the latest request has been taken on, a file
+        # selected while another thumbnail is being written replaces that one
+        while True:
+            with self.thumbnail_lock:
+                if self.thumbnail_shown == self.lcd.thumbnail_request:
+                    self.thumbnail_inprogress = False
+                    return
+                request = self.thumbnail_shown = self.lcd.thumbnail_request
+            try:
+                self.show_thumbnail(request)
+            except Exception as e:
+                print("Thumbnail failed: %s" % e)
 
     def lcd_callback(self, evt, data=None):
         if evt == self.lcd.evt.HOME:
@@ -158,12 +209,15 @@ class KlipperLCD ():
             return files
         elif evt == self.lcd.evt.PRINT_START:
             self.printer.openAndPrintFile(data)
-            if self.thumbnail_inprogress == False:
-                self.thumbnail_inprogress = True
         elif evt == self.lcd.evt.THUMBNAIL:
-            if self.thumbnail_inprogress == False:
-                self.thumbnail_inprogress = True
-                Thread(target=self.show_thumbnail).start()
+            with self.thumbnail_lock:
+                # A newer request stops the transfer of the one before it
+                self.lcd.thumbnail_request += 1
+                if self.thumbnail_inprogress == False:
+                    self.thumbnail_inprogress = True
+                    Thread(target=self.thumbnail_worker).start()
+        elif evt == self.lcd.evt.THUMBNAIL_PREFETCH:
+            self.prefetch_thumbnails(data)
         elif evt == self.lcd.evt.PRINT_STATUS:
             pass
         elif evt == self.lcd.evt.PRINT_STOP:
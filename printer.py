@@ -9,6 +9,9 @@ from requests.exceptions import ConnectionError
 import atexit
 import time
 import asyncio
+import os
+from urllib.parse import quote
+from thumbnail import closest_thumbnail
 
 class xyze_t:
 	x = 0.0
@@ -257,6 +260,7 @@ class PrinterData:
 		self.max_accel              = None
 		self.max_accel_to_decel     = None
 		self.square_corner_velocity = None
+		self.metadata               = {}
 		
 		self.op = MoonrakerSocket(URL, 80, API_Key)
 		print(self.op.base_address)
@@ -476,6 +480,38 @@ class PrinterData:
 			names.append(fl["path"])
 		return names
 
+	def GetMetadata(self, filename):
+		# Moonraker file metadata, cached until the file list shows a new modification time
+		modified = None
+		for fl in self.files or []:
+			if fl['path'] == filename:
+				modified = fl.get('modified')
+		cached = self.metadata.get(filename)
+		if cached and (modified is None or cached.get('modified') == modified):
+			return cached
+		try:
+			metadata = self.getREST('/server/files/metadata?filename=%s' % quote(filename))['result']
+		except:
+			print("Metadata read failed: %s" % filename)
+			return None
+		self.metadata[filename] = metadata
+		return metadata
+
+	def GetThumbnailPath(self, filename, width=160, height=160):
+		# Local path of the thumbnail Moonraker extracted for a G-code file,
+		# the smallest one that still covers width x height
+		if not self.file_path:
+			return None
+		metadata = self.GetMetadata(filename)
+		if not metadata or not metadata.get('thumbnails'):
+			return None
+		thumbnails = [(t['width'], t['height'], t['relative_path']) for t in metadata['thumbnails']
+			if t.get('relative_path', '').lower().endswith('.png')]
+		best = closest_thumbnail(thumbnails, width, height)
+		if not best:
+			return None
+		return os.path.join(self.file_path, os.path.dirname(filename), best[2])
+
 	def update_variable(self):
 		if self.ks.connected == False:
 			self.ks.klippyExit()
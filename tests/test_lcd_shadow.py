@@ -0,0 +1,85 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lcd
+
+
+class RecordingPort:
+    # Stands in for the serial port, keeps every command written
+    def __init__(self):
+        self.baudrate = lcd.BAUD_DEFAULT
+        self.is_open = False
+        self.commands = []
+
+    def write(self, data):
+        self.commands.extend(bytes(data).split(b'\xff\xff\xff')[:-1])
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def make_lcd():
+    display = lcd.LCD(None, thumbnail_workers=0)
+    display.ser = RecordingPort()
+    return display
+
+
+def test_repeated_literal_is_dropped():
+    display = make_lcd()
+    display.write('printpause.printvalue.txt="42"')
+    display.write('printpause.printvalue.txt="42"')
+    display.write('printpause.printprocess.val=42')
+    display.write('printpause.printprocess.val=42')
+    assert display.ser.commands == [b'printpause.printvalue.txt="42"', b'printpause.printprocess.val=42']
+    assert display.shadow_dropped == 2
+
+
+def test_copy_from_widget_is_always_sent():
+    display = make_lcd()
+    display.write_console('< ok')
+    display.write_console('< ok')
+    assert display.ser.commands.count(b'console.slt0.txt=console.buf.txt') == 2
+    assert display.shadow_dropped == 0
+
+
+def test_state_variables_are_always_sent():
+    display = make_lcd()
+    display.write('adjusttemp.va1.val=3')
+    display.write('adjusttemp.va1.val=3')
+    display.write('va0.txt="x"')
+    display.write('va0.txt="x"')
+    assert len(display.ser.commands) == 4
+    assert display.shadow_dropped == 0
+
+
+def test_invalidate():
+    display = make_lcd()
+    commands = ['main.t0.txt="a"', 'main.n0.val=1', 'leveling.n0.val=1', 't1.txt="b"']
+    for cmd in commands:
+        display.write(cmd)
+
+    display.invalidate(suffix='.val')
+    assert set(display.shadow) == {'main.t0.txt', 't1.txt'}
+    display.invalidate(local=True)
+    assert set(display.shadow) == {'main.t0.txt'}
+    display.invalidate('main.')
+    assert not display.shadow
+
+    for cmd in commands:
+        display.write(cmd)
+    display.invalidate()
+    assert not display.shadow
+    assert display.shadow_dropped == 0
+
+
+def test_touch_event_resends_values():
+    display = make_lcd()
+    display.write('multiset.plrbutton.val=1')
+    display._call_handler(0x1098, bytearray([0xff])) # _StoreMemory only logs
+    display.write('multiset.plrbutton.val=1')
+    assert display.ser.commands.count(b'multiset.plrbutton.val=1') == 2
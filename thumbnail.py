@@ -0,0 +1,440 @@
+import base64
+import hashlib
+import math
+import os
+import re
+import sys
+import time
+from array import array
+from io import BytesIO
+from queue import Queue
+from threading import Lock, Thread
+from urllib.request import urlopen
+from PIL import Image, ImageChops, ImageDraw, ImageOps
+import lib_col_pic
+
+THUMBNAIL_WIDTH  = 160
+THUMBNAIL_HEIGHT = 160
+ENCODE_BUFFER_SIZE = THUMBNAIL_WIDTH * THUMBNAIL_HEIGHT * 10
+
+# Encoded text is sent to the display in chunks of this many bytes
+CHUNK_SIZE = 512
+
+CACHE_SUFFIX = '.colpic'
+
+# Thumbnails are only looked for this far into a G-code file
+HEADER_MAX_BYTES = 4 * 1024 * 1024
+_THUMBNAIL_SIZE = re.compile(rb'thumbnail begin (\d+)x(\d+)')
+
+# Files without a thumbnail get a drawing of their toolpath, parsing stops
+# after this many bytes or seconds and draws what was read so far
+TOOLPATH_MAX_BYTES = 64 * 1024 * 1024
+TOOLPATH_MAX_TIME = 10.0
+TOOLPATH_MARGIN = 4
+TOOLPATH_ARC_STEP = math.radians(15) # Arcs are drawn as lines over at most this angle
+_MOVE = re.compile(rb'G([0-3])(?:\s|$)')
+_AXIS = re.compile(rb'([XYZEIJ])\s*([-+]?\d*\.?\d+)')
+
+# Camera frames are mapped onto the palette of an earlier frame, a new one
+# is only built every PALETTE_REFRESH frames
+CAMERA_COLORS = 64
+PALETTE_REFRESH = 10
+SNAPSHOT_TIMEOUT = 5
+
+# The display treats 0x0000 as transparent, pure black is drawn as 0x4AF0
+BLACK_RGB565 = 0x4AF0
+
+# Per channel lookup tables splitting RGB565 into its low and high byte
+_R_HI = [v & 0xF8 for v in range(256)]
+_G_HI = [v >> 5 for v in range(256)]
+_G_LO = [((v >> 2) & 0x07) << 5 for v in range(256)]
+_B_LO = [v >> 3 for v in range(256)]
+_ZERO_MASK = [255] + [0] * 255
+
+# Integer downscaling is done first until the image is at most this many
+# times the display size, the chosen filter does the rest
+REDUCING_GAP = 2.0
+
+# Optional PIL quantizers, these reduce the image to at most 256 colours
+# before RGB565 conversion instead of leaving it to the ColPic encoder
+QUANTIZERS = {
+    'mediancut': Image.MEDIANCUT,
+    'octree':    Image.FASTOCTREE,
+}
+
+
+def image_to_color16(im, colorsmax=1024, quantizer=None, resample=None):
+    # Convert a PIL image to a row major array('H') of RGB565 pixels. Display
+    # sized images are never resampled. resample None keeps PIL's default
+    # filter, any other filter also shrinks large images by an integer factor
+    # first, which is much cheaper than resampling from the full size.
+    size = (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+    if im.size != size:
+        # JPEG can decode straight at a reduced scale, other formats ignore this
+        im.draft('RGB', size)
+    if im.mode not in ('RGB', 'RGBA'):
+        im = im.convert('RGBA')
+    if im.size != size:
+        if resample is None:
+            im = im.resize(size)
+        else:
+            im = im.resize(size, resample, reducing_gap=REDUCING_GAP)
+    if im.mode != 'RGB':
+        im = im.convert('RGB')
+    if quantizer:
+        im = im.quantize(min(colorsmax, 256), QUANTIZERS[quantizer]).convert('RGB')
+
+    r, g, b = im.split()
+    hi = ImageChops.add(r.point(_R_HI), g.point(_G_HI))
+    lo = ImageChops.add(g.point(_G_LO), b.point(_B_LO))
+
+    black = ImageChops.lighter(hi, lo).point(_ZERO_MASK)
+    if black.getbbox():
+        hi.paste(BLACK_RGB565 >> 8, mask=black)
+        lo.paste(BLACK_RGB565 & 0xFF, mask=black)
+
+    color16 = array('H')
+    color16.frombytes(Image.merge('LA', (lo, hi)).tobytes())
+    if sys.byteorder == 'big':
+        color16.byteswap()
+    return color16
+
+
+def gcode_thumbnails(file, max_bytes=HEADER_MAX_BYTES):
+    # (width, height, base64 data) of every thumbnail in the G-code header.
+    # Reading stops at the first G-code command or after max_bytes.
+    thumbnails = []
+    block = None
+    read = 0
+    with open(file, 'rb') as f:
+        for line in f:
+            read += len(line)
+            if block is not None:
+                if b'thumbnail end' in line:
+                    thumbnails.append((width, height, b''.join(block)))
+                    block = None
+                else:
+                    block.append(line.strip(b' \t\n\r;'))
+            elif b'thumbnail begin' in line:
+                size = _THUMBNAIL_SIZE.search(line)
+                width, height = (int(size.group(1)), int(size.group(2))) if size else (0, 0)
+                block = []
+            else:
+                command = line.lstrip()
+                if command and not command.startswith(b';'):
+                    break
+            if read >= max_bytes:
+                break
+    return thumbnails
+
+
+def read_gcode_thumbnail(file, width=THUMBNAIL_WIDTH, height=THUMBNAIL_HEIGHT):
+    # Decoded image of the embedded thumbnail closest to width x height
+    best = closest_thumbnail(gcode_thumbnails(file), width, height)
+    if not best or not best[2]:
+        return None
+    return base64.b64decode(best[2])
+
+
+def _arc_points(x0, y0, x1, y1, cx, cy, clockwise):
+    # Points along a G2 (clockwise) or G3 arc around (cx, cy) after its start,
+    # ending at its end point. A start equal to the end is a full circle.
+    a0 = math.atan2(y0 - cy, x0 - cx)
+    sweep = math.atan2(y1 - cy, x1 - cx) - a0
+    if clockwise and sweep >= 0:
+        sweep -= 2 * math.pi
+    elif not clockwise and sweep <= 0:
+        sweep += 2 * math.pi
+    r = math.hypot(x0 - cx, y0 - cy)
+    steps = max(1, int(math.ceil(abs(sweep) / TOOLPATH_ARC_STEP)))
+    points = [(cx + r * math.cos(a0 + sweep * k / steps), cy + r * math.sin(a0 + sweep * k / steps))
+              for k in range(1, steps)]
+    points.append((x1, y1))
+    return points
+
+
+def render_toolpath(file, width=THUMBNAIL_WIDTH, height=THUMBNAIL_HEIGHT, max_bytes=TOOLPATH_MAX_BYTES,
+                    max_time=TOOLPATH_MAX_TIME):
+    # PNG of the extruding moves seen from above, higher layers drawn lighter
+    # and on top. None if no extrusion was found.
+    paths = [] # (z, [x0, y0, x1, y1, ...]) runs of connected extruding moves
+    path = None
+    x = y = z = e = 0.0
+    relative = relative_e = False
+    minx = miny = float('inf')
+    maxx = maxy = maxz = float('-inf')
+    deadline = time.monotonic() + max_time
+    read = 0
+    with open(file, 'rb') as f:
+        for n, line in enumerate(f):
+            read += len(line)
+            if read > max_bytes or (n & 0xFFF == 0 and time.monotonic() > deadline):
+                print("Toolpath of %s drawn from the first %d bytes" % (file, read))
+                break
+            line = line.split(b';', 1)[0].strip()
+            move = _MOVE.match(line)
+            if move:
+                nx, ny, nz, ne = x, y, z, None
+                i = j = 0.0
+                for axis, value in _AXIS.findall(line):
+                    v = float(value)
+                    if axis == b'X':
+                        nx = x + v if relative else v
+                    elif axis == b'Y':
+                        ny = y + v if relative else v
+                    elif axis == b'Z':
+                        nz = z + v if relative else v
+                    elif axis == b'I':
+                        i = v
+                    elif axis == b'J':
+                        j = v
+                    else:
+                        ne = v if relative or relative_e else v - e
+                if ne is not None:
+                    e += ne
+                if move.group(1) in b'23' and (i or j):
+                    points = _arc_points(x, y, nx, ny, x + i, y + j, move.group(1) == b'2')
+                else:
+                    # Arcs given by a radius are drawn as their chord
+                    points = [(nx, ny)]
+                if ne and ne > 0 and (nx != x or ny != y or len(points) > 1):
+                    if path is None or nz != z:
+                        path = [x, y]
+                        paths.append((nz, path))
+                        minx, maxx = min(minx, x), max(maxx, x)
+                        miny, maxy = min(miny, y), max(maxy, y)
+                        maxz = max(maxz, nz)
+                    for px, py in points:
+                        path += (px, py)
+                        minx, maxx = min(minx, px), max(maxx, px)
+                        miny, maxy = min(miny, py), max(maxy, py)
+                elif nx != x or ny != y or nz != z:
+                    path = None
+                x, y, z = nx, ny, nz
+            elif line.startswith(b'G92'):
+                for axis, value in _AXIS.findall(line):
+                    if axis == b'E':
+                        e = float(value)
+            elif line.startswith(b'G90'):
+                relative = False
+            elif line.startswith(b'G91'):
+                relative = True
+            elif line.startswith(b'M82'):
+                relative_e = False
+            elif line.startswith(b'M83'):
+                relative_e = True
+    if not paths:
+        return None
+
+    # Fit the part into the image keeping its aspect ratio, G-code Y points up
+    scale = min((width - 2 * TOOLPATH_MARGIN) / max(maxx - minx, 1e-3),
+                (height - 2 * TOOLPATH_MARGIN) / max(maxy - miny, 1e-3))
+    ox = (width - (maxx - minx) * scale) / 2 - minx * scale
+    oy = (height + (maxy - miny) * scale) / 2 + miny * scale
+    im = Image.new('RGBA', (width, height))
+    draw = ImageDraw.Draw(im)
+    for z, path in paths:
+        shade = 0.4 + 0.6 * z / maxz if maxz > 0 else 1.0
+        xy = path[:]
+        xy[0::2] = [v * scale + ox for v in path[0::2]]
+        xy[1::2] = [oy - v * scale for v in path[1::2]]
+        draw.line(xy, fill=(int(255 * shade), int(140 * shade), int(40 * shade), 255))
+    out = BytesIO()
+    im.save(out, 'PNG')
+    return out.getvalue()
+
+
+def closest_thumbnail(thumbnails, width=THUMBNAIL_WIDTH, height=THUMBNAIL_HEIGHT):
+    # Pick from (width, height, ...) tuples the smallest one that is not
+    # smaller than width x height, or else the largest one
+    if not thumbnails:
+        return None
+    fits = [t for t in thumbnails if t[0] >= width and t[1] >= height]
+    if fits:
+        return min(fits, key=lambda t: t[0] * t[1])
+    return max(thumbnails, key=lambda t: t[0] * t[1])
+
+
+def encode_thumbnail(img, colorsmax=1024, quantizer=None, chunksize=CHUNK_SIZE, budget=None, resample=None):
+    # Decode PNG data and yield ColPic text chunks ready for the display. With
+    # a byte budget the palette is cut down until the encoded text fits.
+    im = Image.open(BytesIO(img))
+    color16 = image_to_color16(im, colorsmax, quantizer, resample)
+    if budget:
+        if quantizer is None and len(set(color16)) > 1024:
+            # Colours past the first 1024 are never remapped by the encoder,
+            # so the palette size alone can not shrink this image
+            color16 = image_to_color16(im, colorsmax, 'octree', resample)
+        colorsmax = lib_col_pic.ColPic_FitColors(color16, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT,
+                                                 ENCODE_BUFFER_SIZE, colorsmax, budget)
+    yield from lib_col_pic.ColPic_EncodeIter(color16, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT,
+                                             ENCODE_BUFFER_SIZE, colorsmax, chunksize)
+
+
+def encode_thumbnail_chunks(img, colorsmax=1024, quantizer=None, chunksize=CHUNK_SIZE, budget=None, resample=None):
+    # Entry point for encoding in a worker process, returns all chunks at once
+    return list(encode_thumbnail(img, colorsmax, quantizer, chunksize, budget, resample))
+
+
+def encode_in_pool(pool, img, colorsmax=1024, quantizer=None, chunksize=CHUNK_SIZE, budget=None, resample=None):
+    # Start encoding in a process pool right away and return an iterator that
+    # waits for the worker on first use. The worker sends all chunks back at
+    # once, so nothing is streamed, see iter_in_background for that.
+    future = pool.submit(encode_thumbnail_chunks, img, colorsmax, quantizer, chunksize, budget, resample)
+    return _iter_future(future)
+
+
+def _iter_future(future):
+    yield from future.result()
+
+
+def iter_in_background(iterable):
+    # Run an iterator on its own thread and hand over its items in order, so
+    # the consumer can start working on the first item while the rest is made
+    items = Queue()
+    done = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                items.put(item)
+        except Exception as e:
+            items.put(e)
+        items.put(done)
+
+    Thread(target=produce, daemon=True).start()
+    while True:
+        item = items.get()
+        if item is done:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def read_snapshot(source, frame=0, timeout=SNAPSHOT_TIMEOUT):
+    # Image data from a camera snapshot URL or an image file. A directory
+    # stands in for a camera, frame picks one of its images in a loop.
+    if '://' in source:
+        with urlopen(source, timeout=timeout) as r:
+            return r.read()
+    if os.path.isdir(source):
+        names = sorted(n for n in os.listdir(source) if not n.startswith('.'))
+        if not names:
+            return None
+        source = os.path.join(source, names[frame % len(names)])
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+class FrameEncoder:
+    # Encodes a stream of camera frames cropped to the thumbnail area. Frames
+    # in between palette refreshes skip building a palette and reuse the last
+    # one. A frame that comes out larger than the byte budget halves the
+    # colours from the next palette on.
+    def __init__(self, colors=CAMERA_COLORS, refresh=PALETTE_REFRESH, chunksize=CHUNK_SIZE):
+        self.colors = colors
+        self.refresh = refresh
+        self.chunksize = chunksize
+        self.palette = None
+        self.frame = 0
+
+    def encode(self, img, budget=None):
+        size = (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+        im = Image.open(BytesIO(img))
+        im.draft('RGB', size)
+        im = ImageOps.fit(im.convert('RGB'), size, Image.BILINEAR)
+        if self.palette is None or self.frame % self.refresh == 0:
+            self.palette = im.quantize(self.colors, Image.FASTOCTREE)
+            im = self.palette
+        else:
+            im = im.quantize(palette=self.palette, dither=Image.NONE)
+        self.frame += 1
+
+        color16 = image_to_color16(im.convert('RGB'))
+        chunks = list(lib_col_pic.ColPic_EncodeIter(color16, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT,
+                                                    ENCODE_BUFFER_SIZE, self.colors, self.chunksize))
+        if budget and sum(map(len, chunks)) > budget and self.colors > 2:
+            self.colors //= 2
+            self.palette = None
+        return chunks
+
+
+class ThumbnailCache:
+    # Encoded thumbnail chunks on disk, keyed by G-code file path, size,
+    # mtime and encoder settings. The least recently used entries are
+    # removed once the cache grows past max_size bytes.
+    def __init__(self, path, max_size=16 * 1024 * 1024):
+        self.path = path
+        self.max_size = max_size
+        self.lock = Lock()
+        try:
+            os.makedirs(self.path, exist_ok=True)
+        except OSError as e:
+            print("Thumbnail cache disabled: %s" % e)
+            self.path = None
+
+    def key(self, file, settings=()):
+        try:
+            st = os.stat(file)
+        except OSError:
+            return None
+        ident = repr((os.path.abspath(file), st.st_size, st.st_mtime_ns, tuple(settings)))
+        return hashlib.sha1(ident.encode()).hexdigest()
+
+    def contains(self, key):
+        return bool(self.path and key) and os.path.exists(os.path.join(self.path, key + CACHE_SUFFIX))
+
+    def get(self, key):
+        if not self.path or not key:
+            return None
+        entry = os.path.join(self.path, key + CACHE_SUFFIX)
+        try:
+            with open(entry, 'rb') as f:
+                data = f.read()
+            os.utime(entry) # Mark as recently used
+        except OSError:
+            return None
+        return data.split(b'\n') if data else []
+
+    def put(self, key, chunks):
+        if not self.path or not key:
+            return
+        entry = os.path.join(self.path, key + CACHE_SUFFIX)
+        tmp = entry + '.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(b'\n'.join(chunks))
+            os.replace(tmp, entry)
+        except OSError as e:
+            print("Thumbnail cache write failed: %s" % e)
+            return
+        self.evict()
+
+    def fill(self, key, chunks):
+        # Pass chunks through and store them once the last one has been seen
+        stored = []
+        for chunk in chunks:
+            stored.append(chunk)
+            yield chunk
+        self.put(key, stored)
+
+    def evict(self):
+        with self.lock:
+            entries = []
+            total = 0
+            with os.scandir(self.path) as it:
+                for e in it:
+                    if e.name.endswith(CACHE_SUFFIX):
+                        st = e.stat()
+                        entries.append((st.st_mtime, st.st_size, e.path))
+                        total += st.st_size
+            entries.sort()
+            for mtime, size, path in entries:
+                if total <= self.max_size:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size